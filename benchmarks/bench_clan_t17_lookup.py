@@ -0,0 +1,101 @@
+"""Micro-benchmark for resolving a large clan role through ClanT17Lookup.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_clan_t17_lookup [--members 1000] [--rounds 5]
+
+The backend is a stub, so the numbers cover name normalisation, the mapping
+indexes and state store writes only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from types import SimpleNamespace
+
+import clan_t17_lookup
+from clan_t17_lookup import DEFAULT_RANK_PREFIXES, ClanT17Lookup
+from state_store import StateStore
+
+
+class _StubBackend:
+    async def resolve_player_id_by_name(self, name: str) -> str:
+        return f"t17-{name.lower()}"
+
+
+def _members(count: int, generation: int) -> list[SimpleNamespace]:
+    guild = SimpleNamespace(id=1)
+    members = []
+    for index in range(count):
+        rank = DEFAULT_RANK_PREFIXES[(index + generation) % len(DEFAULT_RANK_PREFIXES)]
+        members.append(
+            SimpleNamespace(
+                guild=guild,
+                id=10_000 + index,
+                name=f"player{index}",
+                display_name=f"{rank} Player{index} #{generation}",
+                global_name=f"Player {index}",
+            )
+        )
+    return members
+
+
+async def _run(member_count: int, rounds: int) -> list[tuple[str, float]]:
+    logger = logging.getLogger("ClanT17LookupBench")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clan_t17_lookup.CLAN_T17_MAP_FILE = os.path.join(tmp, "clan_t17_map.json")
+        store = StateStore(os.path.join(tmp, "state.sqlite3"))
+        lookup = ClanT17Lookup(_StubBackend(), logger=logger, store=store)
+        results: list[tuple[str, float]] = []
+
+        started = time.perf_counter()
+        await lookup.resolve_members_for_role(_members(member_count, 0), role_name="Clan")
+        results.append(("cold resolve", time.perf_counter() - started))
+
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            await lookup.resolve_members_for_role(_members(member_count, 0), role_name="Clan")
+            timings.append(time.perf_counter() - started)
+        results.append(("warm resolve", statistics.median(timings)))
+
+        timings = []
+        for generation in range(1, rounds + 1):
+            members = _members(member_count, generation)
+            started = time.perf_counter()
+            await lookup.resolve_members_for_role(members, role_name="Clan")
+            timings.append(time.perf_counter() - started)
+        results.append(("nickname churn", statistics.median(timings)))
+
+        store.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--output", help="also append the results to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.members, args.rounds))
+    lines = [f"clan_t17_lookup members={args.members} rounds={args.rounds}"]
+    lines.extend(f"  {label:<16} {seconds * 1000:9.2f} ms" for label, seconds in results)
+    report = "\n".join(lines)
+    print(report)
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from logging.handlers import RotatingFileHandler
 from typing import Any
 
@@ -12,9 +12,11 @@ import discord
 
 from data_paths import data_path
 from hll_API_backend import HLLBackendClient, HLLBackendConfigError, get_hll_backend_client
-from state_io import atomic_json_dump
+from state_store import StateNamespace, StateStore, get_state_store
 
-CLAN_T17_MAP_FILE = data_path("clan_t17_map.json")
+CLAN_T17_MAP_FILE = data_path("clan_t17_map.json")  # legacy JSON, migrated into the state store
+CLAN_T17_MAP_NAMESPACE = "clan_t17_map"
+CLAN_T17_MAP_SECTIONS = ("manual_overrides", "name_cache", "resolved_members")
 T17_LOG_FILE = data_path("t17_lookup.log")
 PLAYER_LOOKUP_CACHE_TTL_SECONDS = 3600
 PLAYER_LOOKUP_NEGATIVE_CACHE_TTL_SECONDS = 120
@@ -42,6 +44,12 @@ DEFAULT_RANK_ORDER: list[tuple[str, list[str]]] = [
     ("PTE", ["Private", "Pte", "Pte."]),
 ]
 DEFAULT_RANK_PREFIXES: list[str] = [variant for _code, variants in DEFAULT_RANK_ORDER for variant in variants]
+# Alternation order follows DEFAULT_RANK_ORDER, so longer variants listed first keep precedence.
+RANK_PREFIX_PATTERN = re.compile(
+    r"^(?:" + "|".join(re.escape(prefix) for prefix in DEFAULT_RANK_PREFIXES) + r")\.?\s+",
+    re.IGNORECASE,
+)
+NORMALIZED_NAME_CACHE_SIZE = 8192
 
 
 def utc_now() -> datetime:
@@ -71,9 +79,220 @@ def get_t17_logger() -> logging.Logger:
     return logger
 
 
+def empty_mapping() -> dict[str, Any]:
+    return {
+        "manual_overrides": {},
+        "name_cache": {},
+        "resolved_members": {},
+        "updated_at": None,
+    }
+
+
+def _parse_legacy_mapping(raw: dict[str, Any]) -> dict[str, Any]:
+    mapping = empty_mapping()
+
+    if set(raw.keys()) >= {"manual_overrides", "name_cache", "resolved_members"}:
+        mapping.update(raw)
+        return mapping
+
+    for key, value in raw.items():
+        if isinstance(value, str):
+            mapping["name_cache"][key] = {
+                "t17_id": value,
+                "source": "legacy",
+                "updated_at": None,
+            }
+
+    if raw:
+        mapping["updated_at"] = utc_now_iso()
+    return mapping
+
+
+def cut_at_hash(text: str) -> str:
+    value = (text or "").strip()
+    if not value:
+        return ""
+    if "#" in value:
+        value = value.split("#", 1)[0].strip()
+    return " ".join(value.split())
+
+
+@lru_cache(maxsize=NORMALIZED_NAME_CACHE_SIZE)
+def normalize_discord_username(name: str, *, strip_rank_prefix: bool = False) -> str:
+    normalized = cut_at_hash(name)
+    normalized = normalized.replace("%", " ")
+    normalized = " ".join(normalized.split())
+
+    if strip_rank_prefix:
+        normalized = RANK_PREFIX_PATTERN.sub("", normalized, count=1).strip()
+
+    return normalized
+
+
+def _without_timestamp(entry: Any) -> Any:
+    if isinstance(entry, dict):
+        return {key: value for key, value in entry.items() if key != "updated_at"}
+    return entry
+
+
+class ClanT17Mapping:
+    """In-memory clan T17 mapping, loaded once and persisted per changed entry.
+
+    Sections mirror the legacy JSON layout (``manual_overrides``,
+    ``name_cache``, ``resolved_members``) and ``get`` returns them like the
+    old mapping dict. Resolved members are indexed by (guild, role) and by
+    user id, and name-cache keys by their lowercased query, so role-wide
+    lookups and pruning do not scan the whole mapping.
+    """
+
+    def __init__(self, store: StateStore) -> None:
+        self.store = store
+        self.sections: dict[str, dict[str, Any]] = {section: {} for section in CLAN_T17_MAP_SECTIONS}
+        self.updated_at: str | None = None
+        self._dirty: dict[str, set[str]] = {section: set() for section in CLAN_T17_MAP_SECTIONS}
+        self._by_guild_role: dict[tuple[Any, Any], set[str]] = {}
+        self._by_user: dict[Any, set[str]] = {}
+        self._name_keys: dict[str, str] = {}
+        self._loaded = False
+
+    def _namespace(self, section: str) -> StateNamespace:
+        return self.store.namespace(f"{CLAN_T17_MAP_NAMESPACE}.{section}")
+
+    def ensure_loaded(self) -> ClanT17Mapping:
+        if self._loaded:
+            return self
+
+        legacy: dict[str, Any] | None = None
+
+        def extract(raw: Any, section: str) -> dict[str, Any]:
+            nonlocal legacy
+            if legacy is None:
+                legacy = _parse_legacy_mapping(raw if isinstance(raw, dict) else {})
+            if section == "meta":
+                return {"updated_at": legacy.get("updated_at")}
+            value = legacy.get(section)
+            return value if isinstance(value, dict) else {}
+
+        for section in (*CLAN_T17_MAP_SECTIONS, "meta"):
+            self._namespace(section).migrate_from_json(
+                CLAN_T17_MAP_FILE,
+                lambda raw, section=section: extract(raw, section),
+            )
+
+        for section in CLAN_T17_MAP_SECTIONS:
+            self.sections[section] = self._namespace(section).items()
+        self.updated_at = self._namespace("meta").get("updated_at")
+        for key, entry in self.sections["resolved_members"].items():
+            self._index_resolved(key, entry)
+        for key in self.sections["name_cache"]:
+            self._name_keys.setdefault(key.lower(), key)
+        self._loaded = True
+        return self
+
+    def get(self, section: str, default: Any = None) -> Any:
+        if section == "updated_at":
+            return self.updated_at
+        return self.sections.get(section, default)
+
+    def _index_resolved(self, key: str, entry: Any) -> None:
+        if not isinstance(entry, dict):
+            return
+        self._by_guild_role.setdefault((entry.get("guild_id"), entry.get("role_name")), set()).add(key)
+        self._by_user.setdefault(entry.get("user_id"), set()).add(key)
+
+    def _unindex_resolved(self, key: str, entry: Any) -> None:
+        if not isinstance(entry, dict):
+            return
+        role_keys = self._by_guild_role.get((entry.get("guild_id"), entry.get("role_name")))
+        if role_keys is not None:
+            role_keys.discard(key)
+        user_keys = self._by_user.get(entry.get("user_id"))
+        if user_keys is not None:
+            user_keys.discard(key)
+
+    def set_entry(self, section: str, key: str, value: Any) -> None:
+        entries = self.sections[section]
+        previous = entries.get(key)
+        if previous is not None and _without_timestamp(previous) == _without_timestamp(value):
+            return
+        if section == "resolved_members":
+            self._unindex_resolved(key, previous)
+            self._index_resolved(key, value)
+        elif section == "name_cache":
+            self._name_keys[key.lower()] = key
+        entries[key] = value
+        self._dirty[section].add(key)
+
+    def delete_entry(self, section: str, key: str) -> None:
+        entries = self.sections[section]
+        if key not in entries:
+            return
+        previous = entries.pop(key)
+        if section == "resolved_members":
+            self._unindex_resolved(key, previous)
+        elif section == "name_cache" and self._name_keys.get(key.lower()) == key:
+            self._name_keys.pop(key.lower(), None)
+        self._dirty[section].add(key)
+
+    def name_cache_entry(self, query: str) -> Any:
+        key = self._name_keys.get(query.lower())
+        return self.sections["name_cache"].get(key) if key is not None else None
+
+    def resolved_keys_for_role(self, guild_id: int, role_name: str) -> set[str]:
+        return set(self._by_guild_role.get((guild_id, role_name), ()))
+
+    def resolved_entries_for_user(self, user_id: int) -> list[dict[str, Any]]:
+        entries = self.sections["resolved_members"]
+        return [entries[key] for key in self._by_user.get(user_id, ()) if key in entries]
+
+    async def flush(self) -> int:
+        """Write changed entries; the commits run on the state I/O thread."""
+
+        changed = 0
+        for section in CLAN_T17_MAP_SECTIONS:
+            keys = self._dirty[section]
+            if not keys:
+                continue
+            # Taken before awaiting so keys dirtied meanwhile wait for the next flush.
+            pending = set(keys)
+            keys.clear()
+            entries = self.sections[section]
+            namespace = self._namespace(section)
+            try:
+                await namespace.set_many_async({key: entries[key] for key in pending if key in entries})
+                await namespace.delete_many_async(key for key in pending if key not in entries)
+            except BaseException:
+                keys.update(pending)
+                raise
+            changed += len(pending)
+        if changed:
+            self.updated_at = utc_now_iso()
+            await self._namespace("meta").set_async("updated_at", self.updated_at)
+        return changed
+
+
+_shared_mapping: ClanT17Mapping | None = None
+
+
+def get_clan_t17_mapping() -> ClanT17Mapping:
+    """Return the process-wide mapping shared by every ClanT17Lookup."""
+
+    global _shared_mapping
+    if _shared_mapping is None:
+        _shared_mapping = ClanT17Mapping(get_state_store())
+    return _shared_mapping.ensure_loaded()
+
+
 class ClanT17Lookup:
-    def __init__(self, backend: HLLBackendClient | None = None, *, logger: logging.Logger | None = None):
+    def __init__(
+        self,
+        backend: HLLBackendClient | None = None,
+        *,
+        logger: logging.Logger | None = None,
+        store: StateStore | None = None,
+    ):
         self.logger = logger or get_t17_logger()
+        self._mapping = ClanT17Mapping(store) if store is not None else None
         self._backend = backend
         self._backend_config_error: str | None = None
         self._backend_unavailable_logged = False
@@ -104,48 +323,16 @@ class ClanT17Lookup:
         value = str(provider).strip().lower()
         return value or "backend"
 
-    def _load_json_file(self, path: str) -> dict[str, Any]:
-        try:
-            with open(path, "r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            return data if isinstance(data, dict) else {}
-        except (FileNotFoundError, json.JSONDecodeError):
-            return {}
-
-    def _save_json_file(self, path: str, data: dict[str, Any]) -> None:
-        atomic_json_dump(path, data, sort_keys=True)
-
     def empty_mapping(self) -> dict[str, Any]:
-        return {
-            "manual_overrides": {},
-            "name_cache": {},
-            "resolved_members": {},
-            "updated_at": None,
-        }
-
-    def load_mapping(self) -> dict[str, Any]:
-        raw = self._load_json_file(CLAN_T17_MAP_FILE)
-        mapping = self.empty_mapping()
-
-        if set(raw.keys()) >= {"manual_overrides", "name_cache", "resolved_members"}:
-            mapping.update(raw)
-            return mapping
-
-        for key, value in raw.items():
-            if isinstance(value, str):
-                mapping["name_cache"][key] = {
-                    "t17_id": value,
-                    "source": "legacy",
-                    "updated_at": None,
-                }
+        return empty_mapping()
 
-        if raw:
-            mapping["updated_at"] = utc_now_iso()
-        return mapping
+    def load_mapping(self) -> ClanT17Mapping:
+        if self._mapping is not None:
+            return self._mapping.ensure_loaded()
+        return get_clan_t17_mapping()
 
-    def save_mapping(self, mapping: dict[str, Any]) -> None:
-        mapping["updated_at"] = utc_now_iso()
-        self._save_json_file(CLAN_T17_MAP_FILE, mapping)
+    async def save_mapping(self, mapping: ClanT17Mapping) -> None:
+        await mapping.flush()
 
     def member_key(self, guild_id: int, user_id: int) -> str:
         return f"{guild_id}:{user_id}"
@@ -154,23 +341,10 @@ class ClanT17Lookup:
         return f"{guild_id}:{role_name}:{user_id}"
 
     def cut_at_hash(self, text: str) -> str:
-        value = (text or "").strip()
-        if not value:
-            return ""
-        if "#" in value:
-            value = value.split("#", 1)[0].strip()
-        return " ".join(value.split())
+        return cut_at_hash(text)
 
     def normalize_discord_username(self, name: str, *, strip_rank_prefix: bool = False) -> str:
-        normalized = self.cut_at_hash(name)
-        normalized = normalized.replace("%", " ")
-        normalized = " ".join(normalized.split())
-
-        if strip_rank_prefix:
-            rank_pattern = r"^(?:" + "|".join(re.escape(prefix) for prefix in DEFAULT_RANK_PREFIXES) + r")\.?\s+"
-            normalized = re.sub(rank_pattern, "", normalized, flags=re.IGNORECASE).strip()
-
-        return normalized
+        return normalize_discord_username(name or "", strip_rank_prefix=strip_rank_prefix)
 
     def build_lookup_queries(
         self,
@@ -253,8 +427,8 @@ class ClanT17Lookup:
         self._player_id_cache[key] = (player_id, now)
         return player_id, True
 
-    def read_name_cache(self, mapping: dict[str, Any], query: str) -> str | None:
-        entry = mapping.get("name_cache", {}).get(query.lower())
+    def read_name_cache(self, mapping: ClanT17Mapping, query: str) -> str | None:
+        entry = mapping.name_cache_entry(query)
         if isinstance(entry, str):
             return entry
         if isinstance(entry, dict):
@@ -262,17 +436,21 @@ class ClanT17Lookup:
             return str(t17_id) if t17_id else None
         return None
 
-    def write_name_cache(self, mapping: dict[str, Any], queries: list[str], t17_id: str, source: str) -> None:
+    def write_name_cache(self, mapping: ClanT17Mapping, queries: list[str], t17_id: str, source: str) -> None:
         for query in queries:
-            mapping["name_cache"][query.lower()] = {
-                "t17_id": t17_id,
-                "source": source,
-                "updated_at": utc_now_iso(),
-            }
+            mapping.set_entry(
+                "name_cache",
+                query.lower(),
+                {
+                    "t17_id": t17_id,
+                    "source": source,
+                    "updated_at": utc_now_iso(),
+                },
+            )
 
     def store_resolved_member(
         self,
-        mapping: dict[str, Any],
+        mapping: ClanT17Mapping,
         member: discord.Member,
         *,
         role_name: str,
@@ -280,39 +458,35 @@ class ClanT17Lookup:
         source: str,
         queries: list[str],
     ) -> None:
-        mapping["resolved_members"][self.resolved_member_key(member.guild.id, member.id, role_name)] = {
-            "guild_id": member.guild.id,
-            "role_name": role_name,
-            "user_id": member.id,
-            "display_name": member.display_name,
-            "username": member.name,
-            "global_name": getattr(member, "global_name", None),
-            "t17_id": t17_id,
-            "source": source,
-            "lookup_queries": queries,
-            "updated_at": utc_now_iso(),
-        }
+        mapping.set_entry(
+            "resolved_members",
+            self.resolved_member_key(member.guild.id, member.id, role_name),
+            {
+                "guild_id": member.guild.id,
+                "role_name": role_name,
+                "user_id": member.id,
+                "display_name": member.display_name,
+                "username": member.name,
+                "global_name": getattr(member, "global_name", None),
+                "t17_id": t17_id,
+                "source": source,
+                "lookup_queries": queries,
+                "updated_at": utc_now_iso(),
+            },
+        )
 
     def prune_resolved_members(
-        self, mapping: dict[str, Any], guild_id: int, role_name: str, active_member_ids: set[int]
+        self, mapping: ClanT17Mapping, guild_id: int, role_name: str, active_member_ids: set[int]
     ) -> None:
-        keep: dict[str, Any] = {}
-        for key, value in mapping.get("resolved_members", {}).items():
-            if not isinstance(value, dict):
-                continue
-            if value.get("guild_id") != guild_id or value.get("role_name") != role_name:
-                keep[key] = value
-                continue
-
-            user_id = value.get("user_id")
-            if isinstance(user_id, int) and user_id in active_member_ids:
-                keep[key] = value
-
-        mapping["resolved_members"] = keep
+        resolved = mapping.get("resolved_members", {})
+        for key in mapping.resolved_keys_for_role(guild_id, role_name):
+            user_id = resolved.get(key, {}).get("user_id")
+            if not isinstance(user_id, int) or user_id not in active_member_ids:
+                mapping.delete_entry("resolved_members", key)
 
     async def resolve_member_with_mapping(
         self,
-        mapping: dict[str, Any],
+        mapping: ClanT17Mapping,
         member: discord.Member,
         *,
         role_name: str,
@@ -448,7 +622,7 @@ class ClanT17Lookup:
             include_username=include_username,
             include_global_name=include_global_name,
         )
-        self.save_mapping(mapping)
+        await self.save_mapping(mapping)
         return result
 
     async def resolve_members_for_role(
@@ -458,7 +632,7 @@ class ClanT17Lookup:
         role_name: str,
         include_username: bool = True,
         include_global_name: bool = True,
-    ) -> tuple[list[dict[str, Any]], dict[str, Any], list[str]]:
+    ) -> tuple[list[dict[str, Any]], ClanT17Mapping, list[str]]:
         mapping = self.load_mapping()
         guild_id = members[0].guild.id if members else None
         if guild_id is not None:
@@ -488,21 +662,17 @@ class ClanT17Lookup:
                 }
             )
 
-        self.save_mapping(mapping)
+        await self.save_mapping(mapping)
         return targets, mapping, unresolved
 
     def resolved_members_for_role(self, guild_id: int, role_name: str) -> list[dict[str, Any]]:
         mapping = self.load_mapping()
-        members: list[dict[str, Any]] = []
-        for entry in mapping.get("resolved_members", {}).values():
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("guild_id") != guild_id:
-                continue
-            if entry.get("role_name") != role_name:
-                continue
-            members.append(entry)
-
+        resolved = mapping.get("resolved_members", {})
+        members = [
+            entry
+            for key in mapping.resolved_keys_for_role(guild_id, role_name)
+            if isinstance(entry := resolved.get(key), dict)
+        ]
         members.sort(key=lambda item: str(item.get("display_name") or item.get("username") or "").lower())
         return members
 
@@ -515,11 +685,15 @@ class ClanT17Lookup:
             return None
         return entry
 
-    def set_manual_override(self, guild_id: int, user_id: int, t17_id: str, *, updated_by: int) -> None:
+    async def set_manual_override(self, guild_id: int, user_id: int, t17_id: str, *, updated_by: int) -> None:
         mapping = self.load_mapping()
-        mapping.setdefault("manual_overrides", {})[self.member_key(guild_id, user_id)] = {
-            "t17_id": t17_id,
-            "updated_at": utc_now_iso(),
-            "updated_by": updated_by,
-        }
-        self.save_mapping(mapping)
+        mapping.set_entry(
+            "manual_overrides",
+            self.member_key(guild_id, user_id),
+            {
+                "t17_id": t17_id,
+                "updated_at": utc_now_iso(),
+                "updated_by": updated_by,
+            },
+        )
+        await self.save_mapping(mapping)
@@ -1,6 +1,6 @@
 import discord
 from discord.ext import commands
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 import json
 import os
 
@@ -19,8 +19,8 @@ def load_data():
         return json.load(f)
 
 
-def save_data(data):
-    atomic_json_dump(DATA_FILE, data, indent=4)
+async def save_data(data):
+    await atomic_json_dump_async(DATA_FILE, data, indent=4)
 
 
 class EmbedManager(commands.Cog):
@@ -250,7 +250,7 @@ class EmbedManager(commands.Cog):
             self.data[key] = new_msg.id
             print(f"[EmbedManager] Posted new embed '{key}' to channel {channel.id}")
 
-        save_data(self.data)
+        await save_data(self.data)
 
     async def sync_all_embeds(self):
         blocks = self.get_embed_blocks()
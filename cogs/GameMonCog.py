@@ -1,7 +1,8 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async, run_state_io
+from state_store import get_state_store
 import json
 import os
 import asyncio
@@ -69,7 +70,8 @@ GAME_GIF_URLS = {
 GIF_AS_THUMBNAIL = True
 
 PREFS_FILE = data_path("game_prefs.json")
-FEED_STATE_FILE = data_path("game_feed_state.json")
+FEED_STATE_FILE = data_path("game_feed_state.json")  # legacy JSON, migrated into the state store
+FEED_MESSAGES_NAMESPACE = "game_feed_messages"
 DEFAULT_PREFERENCE = "opt_in"  # Default preference for users (opt_in or opt_out)
 # Admin-only slash commands are gated by this role ID.
 ADMIN_ROLE_ID = 1213495462632361994
@@ -186,14 +188,14 @@ class PreferenceView(discord.ui.View):
 class GameMonCog(commands.Cog, name="GameMonCog"):
     def __init__(self, bot):
         self.bot = bot
-        self.prefs = self.load_json(PREFS_FILE)
+        # Loaded off the event loop in cog_load.
+        self.prefs = {}
+
+        # Feed post context is stored one row per message id, so posting or
+        # editing one feed message never rewrites the whole map.
+        self.feed_messages = get_state_store().namespace(FEED_MESSAGES_NAMESPACE)
+        self.feed_state = {"messages": {}}
 
-        self.feed_state = self.load_json(FEED_STATE_FILE)
-        if not isinstance(self.feed_state, dict):
-            self.feed_state = {}
-        if "messages" not in self.feed_state or not isinstance(self.feed_state.get("messages"), dict):
-            self.feed_state["messages"] = {}
-            
         # File lock to prevent race conditions
         self.file_lock = asyncio.Lock()
 
@@ -627,6 +629,18 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
 
         return False
 
+    async def cog_load(self):
+        """Load persisted state on the state I/O thread"""
+        self.prefs = await run_state_io(self.load_json, PREFS_FILE)
+        self.feed_state["messages"] = await run_state_io(self._load_feed_messages)
+
+    def _load_feed_messages(self):
+        self.feed_messages.migrate_from_json(
+            FEED_STATE_FILE,
+            lambda data: data.get("messages") if isinstance(data, dict) and isinstance(data.get("messages"), dict) else {},
+        )
+        return self.feed_messages.items()
+
     def cog_unload(self):
         """Clean up when cog is unloaded"""
         logger.info("GameMonCog unloaded, background tasks stopped")
@@ -652,12 +666,30 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
         """Save JSON with error handling and file locking"""
         async with self.file_lock:
             try:
-                atomic_json_dump(filename, data, indent=4)
+                await atomic_json_dump_async(filename, data, indent=4)
                 return True
             except Exception as e:
                 logger.error(f"Error saving {filename}: {e}")
                 return False
 
+    async def save_feed_message(self, msg_id, ctx):
+        """Persist the context for a single feed message"""
+        try:
+            await self.feed_messages.set_async(str(msg_id), ctx)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving feed message {msg_id}: {e}")
+            return False
+
+    async def delete_feed_messages(self, msg_ids):
+        """Forget the stored context for pruned feed messages"""
+        try:
+            await self.feed_messages.delete_many_async(str(msg_id) for msg_id in msg_ids)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting feed messages {msg_ids}: {e}")
+            return False
+
     # ---------- Game Name Normalization ----------
     def normalize_game_name(self, game_name):
         """Normalize game names by removing special characters and standardizing case"""
@@ -1151,13 +1183,13 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
                 return
 
             to_delete = bot_messages[KEEP_LAST_MESSAGES:]
-            state_changed = False
+            removed_ids = []
             for msg in to_delete:
                 try:
                     await msg.delete()
                     if str(msg.id) in self.feed_state.get("messages", {}):
                         self.feed_state["messages"].pop(str(msg.id), None)
-                        state_changed = True
+                        removed_ids.append(str(msg.id))
                     # Small spacing helps avoid hitting per-route limits when lots of deletes happen
                     await asyncio.sleep(0.25)
                 except discord.Forbidden:
@@ -1169,8 +1201,8 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
                     logger.error(f"HTTP error deleting message during prune: {e}")
                     return
 
-            if state_changed:
-                await self.save_json(FEED_STATE_FILE, self.feed_state)
+            if removed_ids:
+                await self.delete_feed_messages(removed_ids)
 
     async def enqueue_feed_event(self, member: discord.Member, game_name: str) -> None:
         await self.enqueue_feed_event_custom(
@@ -1242,7 +1274,7 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
         if msg:
             self.feed_state.setdefault("messages", {})
             self.feed_state["messages"][str(msg.id)] = ctx
-            await self.save_json(FEED_STATE_FILE, self.feed_state)
+            await self.save_feed_message(msg.id, ctx)
 
     async def _schedule_feed_post(self) -> None:
         async with self._feed_post_lock:
@@ -1287,7 +1319,7 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
 
                         if msg:
                             self.feed_state["messages"][str(msg.id)] = ctx
-                            await self.save_json(FEED_STATE_FILE, self.feed_state)
+                            await self.save_feed_message(msg.id, ctx)
                     finally:
                         self._last_feed_post = asyncio.get_event_loop().time()
                         self._feed_post_task = None
@@ -1363,7 +1395,7 @@ class GameMonCog(commands.Cog, name="GameMonCog"):
             await message.edit(embed=embed, view=PreferenceView(self))
 
             self.feed_state["messages"][msg_id] = ctx
-            await self.save_json(FEED_STATE_FILE, self.feed_state)
+            await self.save_feed_message(msg_id, ctx)
         except Exception as e:
             logger.error(f"Error handling LFS select: {e}")
             try:
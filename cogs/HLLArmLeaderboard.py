@@ -1,15 +1,18 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Select, Modal, TextInput, UserSelect
-import aiosqlite
 import random
 import datetime
+import functools
 import math
 from typing import Optional
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
+from database_service import get_database
+from deadline_scheduler import DeadlineScheduler
+from live_message import live_messages
 
 # ---------------- Config ----------------
 GUILD_ID = MAIN_GUILD_ID
@@ -26,10 +29,14 @@ ADMIN_ROLE_IDS = {
 }
 
 DB_FILE = data_path("armleaderboard.db")
+database = get_database(DB_FILE)
 
 # Minutes allowed to provide a screenshot when one is required
 PROOF_TIMEOUT_MINUTES = 5
 
+# Entries shown per stat on the leaderboard
+LEADERBOARD_TOP_N = 5
+
 # Armour crew stats (adjust as needed)
 OLD_LIFE_STAT_NAME = "Longest Life HH:MM"
 LIFE_STAT_NAME = "Longest Life HH:MM:SS"
@@ -121,9 +128,68 @@ def format_seconds_as_hhmmss(total_seconds: int) -> str:
     s = rem % 60
     return f"{h}:{m:02d}:{s:02d}"
 
-# ---------------- Database (async with aiosqlite) ----------------
+# ---------------- Database (shared connections from database_service) ----------------
+def _refresh_best_sql(row: str) -> str:
+    """Recompute one (stat, crew) row of best_scores_arm from its verified submissions."""
+    return f"""
+        DELETE FROM best_scores_arm WHERE stat = {row}.stat AND crew_key = {row}.crew_key;
+        INSERT INTO best_scores_arm (stat, crew_key, best, first_achieved_at)
+        SELECT stat, crew_key, value, MIN(submitted_at)
+        FROM submissions_arm
+        WHERE stat = {row}.stat AND crew_key = {row}.crew_key AND proof_verified = 1
+          AND value = (
+              SELECT MAX(value) FROM submissions_arm
+              WHERE stat = {row}.stat AND crew_key = {row}.crew_key AND proof_verified = 1
+          )
+        GROUP BY stat, crew_key;
+    """
+
+
+# Versioned schema changes, applied in order via PRAGMA user_version. Append only.
+SCHEMA_MIGRATIONS: list[tuple[str, ...]] = [
+    (
+        # Covers the per-crew best lookups and the monthly range filter.
+        "CREATE INDEX IF NOT EXISTS idx_submissions_arm_stat_verified_crew "
+        "ON submissions_arm (stat, proof_verified, crew_key, value, submitted_at)",
+        # Pending proofs are few; keep their lookups off the main index.
+        "CREATE INDEX IF NOT EXISTS idx_submissions_arm_pending "
+        "ON submissions_arm (submitter_id, submitted_at) WHERE needs_proof = 1 AND proof_verified = 0",
+        # Materialised best verified score per (stat, crew), kept current by triggers.
+        """
+        CREATE TABLE IF NOT EXISTS best_scores_arm (
+            stat TEXT NOT NULL,
+            crew_key TEXT NOT NULL,
+            best INTEGER NOT NULL,
+            first_achieved_at TEXT,
+            PRIMARY KEY (stat, crew_key)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_best_scores_arm_rank "
+        "ON best_scores_arm (stat, best DESC, first_achieved_at, crew_key)",
+        f"CREATE TRIGGER IF NOT EXISTS best_scores_arm_after_insert AFTER INSERT ON submissions_arm BEGIN {_refresh_best_sql('NEW')} END",
+        f"CREATE TRIGGER IF NOT EXISTS best_scores_arm_after_delete AFTER DELETE ON submissions_arm BEGIN {_refresh_best_sql('OLD')} END",
+        "CREATE TRIGGER IF NOT EXISTS best_scores_arm_after_update "
+        "AFTER UPDATE OF crew_key, stat, value, submitted_at, proof_verified ON submissions_arm "
+        f"BEGIN {_refresh_best_sql('OLD')} {_refresh_best_sql('NEW')} END",
+        """
+        INSERT OR REPLACE INTO best_scores_arm (stat, crew_key, best, first_achieved_at)
+        SELECT s.stat, s.crew_key, s.value, MIN(s.submitted_at)
+        FROM submissions_arm s
+        JOIN (
+            SELECT stat, crew_key, MAX(value) AS best
+            FROM submissions_arm
+            WHERE proof_verified = 1
+            GROUP BY stat, crew_key
+        ) b ON b.stat = s.stat AND b.crew_key = s.crew_key AND b.best = s.value
+        WHERE s.proof_verified = 1
+        GROUP BY s.stat, s.crew_key
+        """,
+    ),
+]
+
+
 async def init_db():
-    async with aiosqlite.connect(DB_FILE) as db:
+    async with database.write() as db:
         # Crew-based armour submissions table (unique to this cog)
         await db.execute("""
             CREATE TABLE IF NOT EXISTS submissions_arm (
@@ -144,7 +210,7 @@ async def init_db():
                 value TEXT
             )
         """)
-        await db.commit()
+    await database.migrate(SCHEMA_MIGRATIONS)
 
 async def migrate_life_stat_to_seconds():
     """
@@ -152,22 +218,27 @@ async def migrate_life_stat_to_seconds():
     Safe to run multiple times.
     """
     try:
-        async with aiosqlite.connect(DB_FILE) as db:
-            await db.execute(
-                "UPDATE submissions_arm SET value = value * 60, stat = ? WHERE stat = ?",
-                (LIFE_STAT_NAME, OLD_LIFE_STAT_NAME),
-            )
-            await db.commit()
+        await database.execute(
+            "UPDATE submissions_arm SET value = value * 60, stat = ? WHERE stat = ?",
+            (LIFE_STAT_NAME, OLD_LIFE_STAT_NAME),
+        )
     except Exception as e:
         print(f"HLLArmLeaderboard: migration failed: {e}")
 
+# The "Last updated" footer changes on every render without the standings changing.
+LEADERBOARD_VOLATILE_EMBED_KEYS = ("footer", "timestamp")
+
 # ---------------- Cog ----------------
 class HLLArmLeaderboard(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._db_initialized = False
         self._view_registered = False
-        self._cleanup_started = False
+        self._pending_proofs_scheduled = False
+        self._proof_expiries = DeadlineScheduler("HLLArmLeaderboard proofs")
+
+    async def cog_unload(self):
+        await self._proof_expiries.close()
 
     async def _get_channel(self, channel_id: int):
         channel = self.bot.get_channel(channel_id)
@@ -189,30 +260,81 @@ class HLLArmLeaderboard(commands.Cog):
         return channel
 
     # ---------- Metadata for armour leaderboard message ----------
+    async def _leaderboard_message_id(self):
+        row = await database.fetchone("SELECT value FROM metadata WHERE key = ?", ("arm_leaderboard_message_id",))
+        return int(row[0]) if row else None
+
     async def get_leaderboard_message(self):
-        async with aiosqlite.connect(DB_FILE) as db:
-            cur = await db.execute("SELECT value FROM metadata WHERE key = ?", ("arm_leaderboard_message_id",))
-            row = await cur.fetchone()
-        if not row:
+        message_id = await self._leaderboard_message_id()
+        if message_id is None:
             return None
         channel = await self._get_leaderboard_target()
         if not channel:
             return None
         try:
-            return await channel.fetch_message(int(row[0]))
+            return await channel.fetch_message(message_id)
         except Exception:
             return None
 
     async def set_leaderboard_message(self, message_id: int):
-        async with aiosqlite.connect(DB_FILE) as db:
-            await db.execute(
-                "INSERT INTO metadata(key, value) VALUES(?, ?) "
-                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-                ("arm_leaderboard_message_id", str(message_id)),
-            )
-            await db.commit()
+        await database.execute(
+            "INSERT INTO metadata(key, value) VALUES(?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            ("arm_leaderboard_message_id", str(message_id)),
+        )
 
     # ---------- Build embeds ----------
+    async def fetch_top_scores(self, monthly: bool = False) -> dict[str, list[tuple]]:
+        """Top LEADERBOARD_TOP_N verified crew bests for every stat, in a single query."""
+        if monthly:
+            now = datetime.datetime.utcnow()
+            start_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
+            query = """
+            WITH bests AS (
+                SELECT stat, crew_key, MAX(value) AS best
+                FROM submissions_arm
+                WHERE proof_verified = 1 AND submitted_at >= ?
+                GROUP BY stat, crew_key
+            ),
+            achieved AS (
+                SELECT s.stat, s.crew_key, b.best,
+                       MIN(s.submitted_at) AS first_achieved_at
+                FROM submissions_arm s
+                JOIN bests b
+                  ON b.stat = s.stat
+                 AND b.crew_key = s.crew_key
+                 AND s.value = b.best
+                WHERE s.proof_verified = 1 AND s.submitted_at >= ?
+                GROUP BY s.stat, s.crew_key
+            ),
+            ranked AS (
+                SELECT stat, crew_key, best, first_achieved_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY stat ORDER BY best DESC, first_achieved_at ASC, crew_key ASC
+                       ) AS position
+                FROM achieved
+            )
+            SELECT stat, crew_key, best, first_achieved_at
+            FROM ranked
+            WHERE position <= ?
+            ORDER BY stat, position
+            """
+            params = (start_month, start_month, LEADERBOARD_TOP_N)
+        else:
+            # All-time: one LIMITed range read per stat on the rank index, so
+            # only the top rows of each stat are visited.
+            per_stat = (
+                "SELECT * FROM (SELECT stat, crew_key, best, first_achieved_at FROM best_scores_arm "
+                "WHERE stat = ? ORDER BY best DESC, first_achieved_at ASC, crew_key ASC LIMIT ?)"
+            )
+            query = " UNION ALL ".join([per_stat] * len(STATS_ARM))
+            params = tuple(value for stat in STATS_ARM for value in (stat, LEADERBOARD_TOP_N))
+
+        top_scores: dict[str, list[tuple]] = {}
+        for stat, crew_key, best, first_achieved_at in await database.fetchall(query, params):
+            top_scores.setdefault(stat, []).append((crew_key, best, first_achieved_at))
+        return top_scores
+
     async def build_leaderboard_embed(self, monthly: bool = False):
         embed = discord.Embed(
             title="Hell Let Loose Armour Leaderboard" + (" - This Month" if monthly else ""),
@@ -220,78 +342,25 @@ class HLLArmLeaderboard(commands.Cog):
         )
         embed.description = LEADERBOARD_DESCRIPTION_MONTHLY if monthly else LEADERBOARD_DESCRIPTION
 
-        async with aiosqlite.connect(DB_FILE) as db:
-            for stat in STATS_ARM:
-                if monthly:
-                    now = datetime.datetime.utcnow()
-                    start_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
-                    query = """
-                    WITH bests AS (
-                        SELECT crew_key, MAX(value) AS best
-                        FROM submissions_arm
-                        WHERE stat = ? AND proof_verified = 1 AND submitted_at >= ?
-                        GROUP BY crew_key
-                    ),
-                    achieved AS (
-                        SELECT s.crew_key, b.best,
-                               MIN(s.submitted_at) AS first_achieved_at
-                        FROM submissions_arm s
-                        JOIN bests b
-                          ON b.crew_key = s.crew_key
-                         AND s.value = b.best
-                        WHERE s.stat = ? AND s.proof_verified = 1 AND s.submitted_at >= ?
-                        GROUP BY s.crew_key
-                    )
-                    SELECT crew_key, best, first_achieved_at
-                    FROM achieved
-                    ORDER BY best DESC, first_achieved_at ASC, crew_key ASC
-                    LIMIT 5
-                    """
-                    params = (stat, start_month, stat, start_month)
-                else:
-                    query = """
-                    WITH bests AS (
-                        SELECT crew_key, MAX(value) AS best
-                        FROM submissions_arm
-                        WHERE stat = ? AND proof_verified = 1
-                        GROUP BY crew_key
-                    ),
-                    achieved AS (
-                        SELECT s.crew_key, b.best,
-                               MIN(s.submitted_at) AS first_achieved_at
-                        FROM submissions_arm s
-                        JOIN bests b
-                          ON b.crew_key = s.crew_key
-                         AND s.value = b.best
-                        WHERE s.stat = ? AND s.proof_verified = 1
-                        GROUP BY s.crew_key
-                    )
-                    SELECT crew_key, best, first_achieved_at
-                    FROM achieved
-                    ORDER BY best DESC, first_achieved_at ASC, crew_key ASC
-                    LIMIT 5
-                    """
-                    params = (stat, stat)
-
-                cur = await db.execute(query, params)
-                rows = await cur.fetchall()
-
-                if rows:
-                    lines = []
-                    for idx, (crew_key, best, first_achieved_at) in enumerate(rows, 1):
-                        crew_str = crew_mentions_from_key(self.bot, crew_key)
-                        achieved_str = ""
-                        if first_achieved_at:
-                            try:
-                                dt = datetime.datetime.fromisoformat(first_achieved_at)
-                                achieved_str = f" ({dt.strftime('%d/%m/%y')})"
-                            except Exception:
-                                pass
-                        display_val = format_seconds_as_hhmmss(best) if is_life_stat(stat) else str(best)
-                        lines.append(f"**{idx}.** {crew_str} — {display_val}{achieved_str}")
-                    embed.add_field(name=stat, value="\n".join(lines), inline=False)
-                else:
-                    embed.add_field(name=stat, value="No data yet", inline=False)
+        top_scores = await self.fetch_top_scores(monthly=monthly)
+        for stat in STATS_ARM:
+            rows = top_scores.get(stat)
+            if rows:
+                lines = []
+                for idx, (crew_key, best, first_achieved_at) in enumerate(rows, 1):
+                    crew_str = crew_mentions_from_key(self.bot, crew_key)
+                    achieved_str = ""
+                    if first_achieved_at:
+                        try:
+                            dt = datetime.datetime.fromisoformat(first_achieved_at)
+                            achieved_str = f" ({dt.strftime('%d/%m/%y')})"
+                        except Exception:
+                            pass
+                    display_val = format_seconds_as_hhmmss(best) if is_life_stat(stat) else str(best)
+                    lines.append(f"**{idx}.** {crew_str} — {display_val}{achieved_str}")
+                embed.add_field(name=stat, value="\n".join(lines), inline=False)
+            else:
+                embed.add_field(name=stat, value="No data yet", inline=False)
 
         now_str = datetime.datetime.utcnow().strftime("%d/%m/%y %H:%M GMT")
         embed.set_footer(text=f"Last updated: {now_str}")
@@ -301,22 +370,31 @@ class HLLArmLeaderboard(commands.Cog):
         if ARM_LEADERBOARD_CHANNEL_ID == 0:
             print("HLLArmLeaderboard: ARM_LEADERBOARD_CHANNEL_ID not set. Skipping update.")
             return
+
+        embed = await self.build_leaderboard_embed(monthly=False)
+        view = ArmLeaderboardView(self)
         channel = await self._get_leaderboard_target()
         if not channel:
             print("HLLArmLeaderboard: ARM_LEADERBOARD_CHANNEL_ID not found. Skipping update.")
             return
 
-        embed = await self.build_leaderboard_embed(monthly=False)
+        # Fetch before comparing hashes: if the message was deleted by hand,
+        # the remembered hash must not stop it from being reposted.
         msg = await self.get_leaderboard_message()
 
         if msg:
             try:
-                await msg.edit(embed=embed, view=ArmLeaderboardView(self))
+                # No-op (no PATCH) when the rendered leaderboard is unchanged.
+                await live_messages.edit(msg, embed=embed, view=view, volatile=LEADERBOARD_VOLATILE_EMBED_KEYS)
             except Exception as e:
                 print(f"HLLArmLeaderboard: Failed to edit leaderboard message: {e}")
         else:
+            stale_id = await self._leaderboard_message_id()
+            if stale_id is not None:
+                live_messages.forget(stale_id)
             try:
-                new_msg = await channel.send(embed=embed, view=ArmLeaderboardView(self))
+                new_msg = await channel.send(embed=embed, view=view)
+                live_messages.record(new_msg, embed=embed, view=view, volatile=LEADERBOARD_VOLATILE_EMBED_KEYS)
                 await self.set_leaderboard_message(new_msg.id)
             except Exception as e:
                 print(f"HLLArmLeaderboard: Failed to send leaderboard message: {e}")
@@ -324,18 +402,16 @@ class HLLArmLeaderboard(commands.Cog):
     # ---------- Pending proof helper ----------
     async def get_active_pending_proof(self, submitter_id: int):
         now_iso = datetime.datetime.utcnow().isoformat()
-        async with aiosqlite.connect(DB_FILE) as db:
-            cur = await db.execute(
-                """
-                SELECT id, proof_deadline FROM submissions_arm
-                WHERE submitter_id=? AND needs_proof=1 AND proof_verified=0
-                  AND (proof_deadline IS NULL OR proof_deadline >= ?)
-                ORDER BY submitted_at ASC
-                LIMIT 1
-                """,
-                (submitter_id, now_iso),
-            )
-            return await cur.fetchone()
+        return await database.fetchone(
+            """
+            SELECT id, proof_deadline FROM submissions_arm
+            WHERE submitter_id=? AND needs_proof=1 AND proof_verified=0
+              AND (proof_deadline IS NULL OR proof_deadline >= ?)
+            ORDER BY submitted_at ASC
+            LIMIT 1
+            """,
+            (submitter_id, now_iso),
+        )
 
     # ---------- Bot lifecycle ----------
     @commands.Cog.listener()
@@ -360,12 +436,12 @@ class HLLArmLeaderboard(commands.Cog):
             except Exception as e:
                 print(f"HLLArmLeaderboard: Failed to register persistent view: {e}")
 
-        if not self._cleanup_started:
+        if not self._pending_proofs_scheduled:
             try:
-                self.proof_cleanup.start()
-                self._cleanup_started = True
+                await self._schedule_pending_proofs()
+                self._pending_proofs_scheduled = True
             except Exception as e:
-                print(f"HLLArmLeaderboard: Failed to start cleanup loop: {e}")
+                print(f"HLLArmLeaderboard: Failed to schedule pending proofs: {e}")
 
         await self.update_leaderboard()
 
@@ -438,7 +514,7 @@ class HLLArmLeaderboard(commands.Cog):
         crew_key = crew_key_from_ids(crew_ids)
 
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 # Capture previous verified best for this crew+stat
                 cur = await db.execute(
                     "SELECT MAX(value) FROM submissions_arm WHERE crew_key=? AND stat=? AND proof_verified=1",
@@ -448,33 +524,29 @@ class HLLArmLeaderboard(commands.Cog):
                 prev_best = row[0] if row and row[0] is not None else 0
                 prev_best_display = format_seconds_as_hhmmss(prev_best) if is_life_stat(stat) else str(prev_best)
 
-                # If parsed_value is 0, remove crew from this stat's leaderboard (delete all, do not insert)
-                if parsed_value == 0:
-                    await db.execute("DELETE FROM submissions_arm WHERE crew_key=? AND stat=?", (crew_key, stat))
-                    await db.commit()
-                    await self.update_leaderboard()
-                    crew_str = ", ".join(m.mention for m in [user1, user2, user3] if m)
-                    await interaction.response.send_message(
-                        f"Removed {crew_str} from the {stat} leaderboard. Previous verified best was {prev_best_display}.",
-                        ephemeral=True,
-                    )
-                    return
-
                 # Overwrite existing rows for this crew+stat
                 await db.execute("DELETE FROM submissions_arm WHERE crew_key=? AND stat=?", (crew_key, stat))
-                now_iso = datetime.datetime.utcnow().isoformat()
-                # Use invoker as submitter_id for admin action
-                await db.execute(
-                    "INSERT INTO submissions_arm(submitter_id, crew_key, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, ?, ?, ?, ?, 0, 1)",
-                    (invoker.id, crew_key, stat, int(parsed_value), now_iso),
-                )
-                await db.commit()
+
+                # A parsed_value of 0 removes the crew from this stat's leaderboard (delete all, do not insert)
+                if parsed_value != 0:
+                    now_iso = datetime.datetime.utcnow().isoformat()
+                    # Use invoker as submitter_id for admin action
+                    await db.execute(
+                        "INSERT INTO submissions_arm(submitter_id, crew_key, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, ?, ?, ?, ?, 0, 1)",
+                        (invoker.id, crew_key, stat, int(parsed_value), now_iso),
+                    )
         except Exception as e:
             await interaction.response.send_message(f"Failed to set high score: {e}", ephemeral=True)
             return
 
         await self.update_leaderboard()
         crew_str = ", ".join(m.mention for m in [user1, user2, user3] if m)
+        if parsed_value == 0:
+            await interaction.response.send_message(
+                f"Removed {crew_str} from the {stat} leaderboard. Previous verified best was {prev_best_display}.",
+                ephemeral=True,
+            )
+            return
         new_val_display = format_seconds_as_hhmmss(parsed_value) if is_life_stat(stat) else str(parsed_value)
         await interaction.response.send_message(
             f"Set {crew_str}'s {stat} high score to {new_val_display}. Previous verified best was {prev_best_display}.",
@@ -516,7 +588,7 @@ class HLLArmLeaderboard(commands.Cog):
 
         try:
             now_iso = datetime.datetime.utcnow().isoformat()
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 cur = await db.execute(
                     """
                     SELECT id FROM submissions_arm
@@ -536,7 +608,6 @@ class HLLArmLeaderboard(commands.Cog):
                     "UPDATE submissions_arm SET needs_proof=0, proof_verified=1 WHERE id=?",
                     (submission_id,),
                 )
-                await db.commit()
 
             try:
                 await message.add_reaction("✅")
@@ -546,50 +617,60 @@ class HLLArmLeaderboard(commands.Cog):
             except Exception:
                 pass
 
+            self._proof_expiries.cancel(submission_id)
+
             await self.update_leaderboard()
 
         except Exception as e:
             print(f"HLLArmLeaderboard: on_message proof handling failed: {e}")
 
-    # ---------- Background: Cleanup expired pending proofs ----------
-    @tasks.loop(minutes=1)
-    async def proof_cleanup(self):
+    # ---------- Pending proof expiry ----------
+    async def _schedule_pending_proofs(self):
+        rows = await database.fetchall(
+            "SELECT id, proof_deadline FROM submissions_arm "
+            "WHERE needs_proof=1 AND proof_verified=0 AND proof_deadline IS NOT NULL"
+        )
+        for submission_id, deadline_iso in rows:
+            self.schedule_proof_expiry(submission_id, deadline_iso)
+
+    def schedule_proof_expiry(self, submission_id: int, deadline_iso: str):
+        """Expire the submission at its proof deadline unless a screenshot verifies it first."""
+        deadline = datetime.datetime.fromisoformat(deadline_iso).replace(tzinfo=datetime.timezone.utc)
+        self._proof_expiries.schedule(
+            submission_id, deadline.timestamp(), functools.partial(self._expire_proof, submission_id)
+        )
+
+    async def _expire_proof(self, submission_id: int):
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
-                now_iso = datetime.datetime.utcnow().isoformat()
+            async with database.write() as db:
                 cur = await db.execute(
                     """
                     SELECT id, submitter_id, stat, value
                     FROM submissions_arm
-                    WHERE needs_proof=1 AND proof_verified=0 AND proof_deadline IS NOT NULL AND proof_deadline < ?
+                    WHERE id=? AND needs_proof=1 AND proof_verified=0
                     """,
-                    (now_iso,),
+                    (submission_id,),
                 )
-                rows = await cur.fetchall()
-
-                if rows:
-                    await db.executemany("DELETE FROM submissions_arm WHERE id=?", [(r[0],) for r in rows])
-                    await db.commit()
-
-                    channel = await self._get_channel(ARM_SUBMISSIONS_CHANNEL_ID)
-                    if channel:
-                        for sid, uid, stat, val in rows:
-                            try:
-                                val_display = format_seconds_as_hhmmss(val) if is_life_stat(stat) else str(val)
-                                await channel.send(
-                                    f"<@{uid}> your armour crew submission #{sid} ({val_display} {stat}) was removed "
-                                    f"due to missing screenshot within {PROOF_TIMEOUT_MINUTES} minutes."
-                                )
-                            except Exception:
-                                pass
-
-                    await self.update_leaderboard()
-        except Exception as e:
-            print(f"HLLArmLeaderboard: proof cleanup failed: {e}")
+                row = await cur.fetchone()
+                if row:
+                    await db.execute("DELETE FROM submissions_arm WHERE id=?", (submission_id,))
+
+            if row:
+                sid, uid, stat, val = row
+                channel = await self._get_channel(ARM_SUBMISSIONS_CHANNEL_ID)
+                if channel:
+                    try:
+                        val_display = format_seconds_as_hhmmss(val) if is_life_stat(stat) else str(val)
+                        await channel.send(
+                            f"<@{uid}> your armour crew submission #{sid} ({val_display} {stat}) was removed "
+                            f"due to missing screenshot within {PROOF_TIMEOUT_MINUTES} minutes."
+                        )
+                    except Exception:
+                        pass
 
-    @proof_cleanup.before_loop
-    async def before_proof_cleanup(self):
-        await self.bot.wait_until_ready()
+                await self.update_leaderboard()
+        except Exception as e:
+            print(f"HLLArmLeaderboard: proof expiry failed for #{submission_id}: {e}")
 
 # ---------------- Submission Modal ----------------
 class ArmSubmissionModal(Modal):
@@ -648,7 +729,7 @@ class ArmSubmissionModal(Modal):
 
         # Insert submission as verified; may be flipped to pending if proof required
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 cur = await db.execute(
                     """
                     INSERT INTO submissions_arm(submitter_id, crew_key, stat, value, submitted_at, needs_proof, proof_verified)
@@ -657,7 +738,6 @@ class ArmSubmissionModal(Modal):
                     (self.submitter.id, self.crew_key, self.stat, value, datetime.datetime.utcnow().isoformat()),
                 )
                 submission_id = cur.lastrowid
-                await db.commit()
         except Exception as e:
             await interaction.followup.send(f"Failed to record submission: {e}", ephemeral=True)
             return
@@ -674,12 +754,11 @@ class ArmSubmissionModal(Modal):
                 if require_ss:
                     deadline = datetime.datetime.utcnow() + datetime.timedelta(minutes=PROOF_TIMEOUT_MINUTES)
                     try:
-                        async with aiosqlite.connect(DB_FILE) as db:
-                            await db.execute(
-                                "UPDATE submissions_arm SET needs_proof=1, proof_verified=0, proof_deadline=? WHERE id=?",
-                                (deadline.isoformat(), submission_id),
-                            )
-                            await db.commit()
+                        await database.execute(
+                            "UPDATE submissions_arm SET needs_proof=1, proof_verified=0, proof_deadline=? WHERE id=?",
+                            (deadline.isoformat(), submission_id),
+                        )
+                        self.cog.schedule_proof_expiry(submission_id, deadline.isoformat())
                     except Exception:
                         pass
 
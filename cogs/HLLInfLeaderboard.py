@@ -1,14 +1,17 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord import app_commands
 from discord.ui import View, Select, Modal, TextInput
-import aiosqlite
 import random
 import datetime
+import functools
 import math
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
+from database_service import get_database
+from deadline_scheduler import DeadlineScheduler
+from live_message import live_messages
 
 # ---------------- Config ----------------
 GUILD_ID = MAIN_GUILD_ID
@@ -23,10 +26,14 @@ ADMIN_ROLE_IDS = {
 }
 
 DB_FILE = data_path("leaderboard.db")
+database = get_database(DB_FILE)
 
 # Minutes allowed to provide a screenshot when one is required
 PROOF_TIMEOUT_MINUTES = 5
 
+# Entries shown per stat on the leaderboard
+LEADERBOARD_TOP_N = 5
+
 STATS = ["Most Kills", "Most Artillery Kills", "Most Vehicles Destroyed", "Most Killstreak", "Most Satchel Kills", "Most OPs Destroyed", "Most Garrisons Destroyed", "Most Melee Kills", "Most Sniper Kills", "Longest Sniper Kill", "Most Nodes Destroyed", "HLL Time Played (Hours)", "Longest Pistol Kill (BigDaddy Award)"]
 
 # Text shown under the embed title
@@ -41,9 +48,68 @@ LEADERBOARD_DESCRIPTION_MONTHLY = (
     "Showing highest single verified submissions for the current month. Use /hllhighs-inftopscores to view all-time leaders."
 )
 
-# ---------------- Database (async with aiosqlite) ----------------
+# ---------------- Database (shared connections from database_service) ----------------
+def _refresh_best_sql(row: str) -> str:
+    """Recompute one (stat, user) row of best_scores from its verified submissions."""
+    return f"""
+        DELETE FROM best_scores WHERE stat = {row}.stat AND user_id = {row}.user_id;
+        INSERT INTO best_scores (stat, user_id, best, first_achieved_at)
+        SELECT stat, user_id, value, MIN(submitted_at)
+        FROM submissions
+        WHERE stat = {row}.stat AND user_id = {row}.user_id AND proof_verified = 1
+          AND value = (
+              SELECT MAX(value) FROM submissions
+              WHERE stat = {row}.stat AND user_id = {row}.user_id AND proof_verified = 1
+          )
+        GROUP BY stat, user_id;
+    """
+
+
+# Versioned schema changes, applied in order via PRAGMA user_version. Append only.
+SCHEMA_MIGRATIONS: list[tuple[str, ...]] = [
+    (
+        # Covers the per-user best lookups and the monthly range filter.
+        "CREATE INDEX IF NOT EXISTS idx_submissions_stat_verified_user "
+        "ON submissions (stat, proof_verified, user_id, value, submitted_at)",
+        # Pending proofs are few; keep their lookups off the main index.
+        "CREATE INDEX IF NOT EXISTS idx_submissions_pending "
+        "ON submissions (user_id, submitted_at) WHERE needs_proof = 1 AND proof_verified = 0",
+        # Materialised best verified score per (stat, user), kept current by triggers.
+        """
+        CREATE TABLE IF NOT EXISTS best_scores (
+            stat TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            best INTEGER NOT NULL,
+            first_achieved_at TEXT,
+            PRIMARY KEY (stat, user_id)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_best_scores_rank "
+        "ON best_scores (stat, best DESC, first_achieved_at, user_id)",
+        f"CREATE TRIGGER IF NOT EXISTS best_scores_after_insert AFTER INSERT ON submissions BEGIN {_refresh_best_sql('NEW')} END",
+        f"CREATE TRIGGER IF NOT EXISTS best_scores_after_delete AFTER DELETE ON submissions BEGIN {_refresh_best_sql('OLD')} END",
+        "CREATE TRIGGER IF NOT EXISTS best_scores_after_update "
+        "AFTER UPDATE OF user_id, stat, value, submitted_at, proof_verified ON submissions "
+        f"BEGIN {_refresh_best_sql('OLD')} {_refresh_best_sql('NEW')} END",
+        """
+        INSERT OR REPLACE INTO best_scores (stat, user_id, best, first_achieved_at)
+        SELECT s.stat, s.user_id, s.value, MIN(s.submitted_at)
+        FROM submissions s
+        JOIN (
+            SELECT stat, user_id, MAX(value) AS best
+            FROM submissions
+            WHERE proof_verified = 1
+            GROUP BY stat, user_id
+        ) b ON b.stat = s.stat AND b.user_id = s.user_id AND b.best = s.value
+        WHERE s.proof_verified = 1
+        GROUP BY s.stat, s.user_id
+        """,
+    ),
+]
+
+
 async def init_db():
-    async with aiosqlite.connect(DB_FILE) as db:
+    async with database.write() as db:
         await db.execute("""
             CREATE TABLE IF NOT EXISTS submissions (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -72,7 +138,10 @@ async def init_db():
             await db.execute("ALTER TABLE submissions ADD COLUMN proof_deadline TEXT")
         except Exception:
             pass
-        await db.commit()
+    await database.migrate(SCHEMA_MIGRATIONS)
+
+# The "Last updated" footer changes on every render without the standings changing.
+LEADERBOARD_VOLATILE_EMBED_KEYS = ("footer", "timestamp")
 
 # ---------------- Cog ----------------
 class HLLInfLeaderboard(commands.Cog):
@@ -80,7 +149,11 @@ class HLLInfLeaderboard(commands.Cog):
         self.bot = bot
         self._db_initialized = False
         self._view_registered = False  # persistent view registered once
-        self._cleanup_started = False  # start proof cleanup loop once
+        self._pending_proofs_scheduled = False  # load pending proof deadlines once
+        self._proof_expiries = DeadlineScheduler("HLLInfLeaderboard proofs")
+
+    async def cog_unload(self):
+        await self._proof_expiries.close()
 
     async def _get_channel(self, channel_id: int):
         """Try cache first, then API as a fallback."""
@@ -102,12 +175,14 @@ class HLLInfLeaderboard(commands.Cog):
                 pass
         return channel
 
+    async def _leaderboard_message_id(self):
+        row = await database.fetchone("SELECT value FROM metadata WHERE key = ?", ("leaderboard_message_id",))
+        return int(row[0]) if row else None
+
     async def get_leaderboard_message(self):
-        async with aiosqlite.connect(DB_FILE) as db:
-            cursor = await db.execute("SELECT value FROM metadata WHERE key = ?", ("leaderboard_message_id",))
-            row = await cursor.fetchone()
+        message_id = await self._leaderboard_message_id()
 
-        if not row:
+        if message_id is None:
             return None
 
         channel = await self._get_leaderboard_target()
@@ -115,18 +190,68 @@ class HLLInfLeaderboard(commands.Cog):
             return None
 
         try:
-            return await channel.fetch_message(int(row[0]))
+            return await channel.fetch_message(message_id)
         except Exception:
             return None
 
     async def set_leaderboard_message(self, message_id: int):
-        async with aiosqlite.connect(DB_FILE) as db:
-            await db.execute(
-                "INSERT INTO metadata(key, value) VALUES(?, ?) "
-                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-                ("leaderboard_message_id", str(message_id)),
+        await database.execute(
+            "INSERT INTO metadata(key, value) VALUES(?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            ("leaderboard_message_id", str(message_id)),
+        )
+
+    async def fetch_top_scores(self, monthly: bool = False) -> dict[str, list[tuple]]:
+        """Top LEADERBOARD_TOP_N verified bests for every stat, in a single query."""
+        if monthly:
+            now = datetime.datetime.utcnow()
+            start_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
+            # Count only verified submissions this month; tie-break by earliest achievement, then user_id
+            query = """
+            WITH bests AS (
+                SELECT stat, user_id, MAX(value) AS best
+                FROM submissions
+                WHERE proof_verified = 1 AND submitted_at >= ?
+                GROUP BY stat, user_id
+            ),
+            achieved AS (
+                SELECT s.stat, s.user_id, b.best,
+                       MIN(s.submitted_at) AS first_achieved_at
+                FROM submissions s
+                JOIN bests b
+                  ON b.stat = s.stat
+                 AND b.user_id = s.user_id
+                 AND s.value = b.best
+                WHERE s.proof_verified = 1 AND s.submitted_at >= ?
+                GROUP BY s.stat, s.user_id
+            ),
+            ranked AS (
+                SELECT stat, user_id, best, first_achieved_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY stat ORDER BY best DESC, first_achieved_at ASC, user_id ASC
+                       ) AS position
+                FROM achieved
+            )
+            SELECT stat, user_id, best, first_achieved_at
+            FROM ranked
+            WHERE position <= ?
+            ORDER BY stat, position
+            """
+            params = (start_month, start_month, LEADERBOARD_TOP_N)
+        else:
+            # All-time: one LIMITed range read per stat on the rank index, so
+            # only the top rows of each stat are visited.
+            per_stat = (
+                "SELECT * FROM (SELECT stat, user_id, best, first_achieved_at FROM best_scores "
+                "WHERE stat = ? ORDER BY best DESC, first_achieved_at ASC, user_id ASC LIMIT ?)"
             )
-            await db.commit()
+            query = " UNION ALL ".join([per_stat] * len(STATS))
+            params = tuple(value for stat in STATS for value in (stat, LEADERBOARD_TOP_N))
+
+        top_scores: dict[str, list[tuple]] = {}
+        for stat, user_id, best, first_achieved_at in await database.fetchall(query, params):
+            top_scores.setdefault(stat, []).append((user_id, best, first_achieved_at))
+        return top_scores
 
     async def build_leaderboard_embed(self, monthly: bool = False):
         embed = discord.Embed(
@@ -136,102 +261,55 @@ class HLLInfLeaderboard(commands.Cog):
         # Add descriptive text under the title
         embed.description = LEADERBOARD_DESCRIPTION_MONTHLY if monthly else LEADERBOARD_DESCRIPTION
 
-        async with aiosqlite.connect(DB_FILE) as db:
-            for stat in STATS:
-                if monthly:
-                    now = datetime.datetime.utcnow()
-                    start_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
-                    # Count only verified submissions; tie-break by earliest achievement, then user_id
-                    query = """
-                    WITH bests AS (
-                        SELECT user_id, MAX(value) AS best
-                        FROM submissions
-                        WHERE stat = ? AND proof_verified = 1 AND submitted_at >= ?
-                        GROUP BY user_id
-                    ),
-                    achieved AS (
-                        SELECT s.user_id, b.best,
-                               MIN(s.submitted_at) AS first_achieved_at
-                        FROM submissions s
-                        JOIN bests b
-                          ON b.user_id = s.user_id
-                         AND s.value = b.best
-                        WHERE s.stat = ? AND s.proof_verified = 1 AND s.submitted_at >= ?
-                        GROUP BY s.user_id
-                    )
-                    SELECT user_id, best, first_achieved_at
-                    FROM achieved
-                    ORDER BY best DESC, first_achieved_at ASC, user_id ASC
-                    LIMIT 5
-                    """
-                    params = (stat, start_month, stat, start_month)
-                else:
-                    # All-time: only verified; tie-break by earliest achievement, then user_id
-                    query = """
-                    WITH bests AS (
-                        SELECT user_id, MAX(value) AS best
-                        FROM submissions
-                        WHERE stat = ? AND proof_verified = 1
-                        GROUP BY user_id
-                    ),
-                    achieved AS (
-                        SELECT s.user_id, b.best,
-                               MIN(s.submitted_at) AS first_achieved_at
-                        FROM submissions s
-                        JOIN bests b
-                          ON b.user_id = s.user_id
-                         AND s.value = b.best
-                        WHERE s.stat = ? AND s.proof_verified = 1
-                        GROUP BY s.user_id
-                    )
-                    SELECT user_id, best, first_achieved_at
-                    FROM achieved
-                    ORDER BY best DESC, first_achieved_at ASC, user_id ASC
-                    LIMIT 5
-                    """
-                    params = (stat, stat)
-
-                cursor = await db.execute(query, params)
-                rows = await cursor.fetchall()
-
-                if rows:
-                    lines = []
-                    for idx, (user_id, best, first_achieved_at) in enumerate(rows, 1):
-                        user = self.bot.get_user(user_id)
-                        name = user.mention if user else f"<@{user_id}>"
-                        achieved_str = ""
-                        if first_achieved_at:
-                            try:
-                                dt = datetime.datetime.fromisoformat(first_achieved_at)
-                                achieved_str = f" ({dt.strftime('%d/%m/%y')})"
-                            except Exception:
-                                pass
-                        lines.append(f"**{idx}.** {name} — {best}{achieved_str}")
-                    embed.add_field(name=stat, value="\n".join(lines), inline=False)
-                else:
-                    embed.add_field(name=stat, value="No data yet", inline=False)
+        top_scores = await self.fetch_top_scores(monthly=monthly)
+        for stat in STATS:
+            rows = top_scores.get(stat)
+            if rows:
+                lines = []
+                for idx, (user_id, best, first_achieved_at) in enumerate(rows, 1):
+                    user = self.bot.get_user(user_id)
+                    name = user.mention if user else f"<@{user_id}>"
+                    achieved_str = ""
+                    if first_achieved_at:
+                        try:
+                            dt = datetime.datetime.fromisoformat(first_achieved_at)
+                            achieved_str = f" ({dt.strftime('%d/%m/%y')})"
+                        except Exception:
+                            pass
+                    lines.append(f"**{idx}.** {name} — {best}{achieved_str}")
+                embed.add_field(name=stat, value="\n".join(lines), inline=False)
+            else:
+                embed.add_field(name=stat, value="No data yet", inline=False)
 
         now_str = datetime.datetime.utcnow().strftime("%d/%m/%y %H:%M GMT")
         embed.set_footer(text=f"Last updated: {now_str}")
         return embed
 
     async def update_leaderboard(self):
+        embed = await self.build_leaderboard_embed(monthly=False)
+        view = LeaderboardView(self)
         channel = await self._get_leaderboard_target()
         if not channel:
             print("HLLInfLeaderboard: LEADERBOARD_CHANNEL_ID not found. Skipping update.")
             return
 
-        embed = await self.build_leaderboard_embed(monthly=False)
+        # Fetch before comparing hashes: if the message was deleted by hand,
+        # the remembered hash must not stop it from being reposted.
         msg = await self.get_leaderboard_message()
 
         if msg:
             try:
-                await msg.edit(embed=embed, view=LeaderboardView(self))
+                # No-op (no PATCH) when the rendered leaderboard is unchanged.
+                await live_messages.edit(msg, embed=embed, view=view, volatile=LEADERBOARD_VOLATILE_EMBED_KEYS)
             except Exception as e:
                 print(f"HLLInfLeaderboard: Failed to edit leaderboard message: {e}")
         else:
+            stale_id = await self._leaderboard_message_id()
+            if stale_id is not None:
+                live_messages.forget(stale_id)
             try:
-                new_msg = await channel.send(embed=embed, view=LeaderboardView(self))
+                new_msg = await channel.send(embed=embed, view=view)
+                live_messages.record(new_msg, embed=embed, view=view, volatile=LEADERBOARD_VOLATILE_EMBED_KEYS)
                 await self.set_leaderboard_message(new_msg.id)
             except Exception as e:
                 print(f"HLLInfLeaderboard: Failed to send leaderboard message: {e}")
@@ -239,18 +317,16 @@ class HLLInfLeaderboard(commands.Cog):
     # Helper: Check for an active (non-expired) pending proof for a user
     async def get_active_pending_proof(self, user_id: int):
         now_iso = datetime.datetime.utcnow().isoformat()
-        async with aiosqlite.connect(DB_FILE) as db:
-            cursor = await db.execute(
-                """
-                SELECT id, proof_deadline FROM submissions
-                WHERE user_id=? AND needs_proof=1 AND proof_verified=0
-                  AND (proof_deadline IS NULL OR proof_deadline >= ?)
-                ORDER BY submitted_at ASC
-                LIMIT 1
-                """,
-                (user_id, now_iso),
-            )
-            return await cursor.fetchone()
+        return await database.fetchone(
+            """
+            SELECT id, proof_deadline FROM submissions
+            WHERE user_id=? AND needs_proof=1 AND proof_verified=0
+              AND (proof_deadline IS NULL OR proof_deadline >= ?)
+            ORDER BY submitted_at ASC
+            LIMIT 1
+            """,
+            (user_id, now_iso),
+        )
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -270,13 +346,13 @@ class HLLInfLeaderboard(commands.Cog):
             except Exception as e:
                 print(f"HLLInfLeaderboard: Failed to register persistent view: {e}")
 
-        # Start cleanup loop
-        if not self._cleanup_started:
+        # Schedule expiry of proofs still pending from before the restart
+        if not self._pending_proofs_scheduled:
             try:
-                self.proof_cleanup.start()
-                self._cleanup_started = True
+                await self._schedule_pending_proofs()
+                self._pending_proofs_scheduled = True
             except Exception as e:
-                print(f"HLLInfLeaderboard: Failed to start cleanup loop: {e}")
+                print(f"HLLInfLeaderboard: Failed to schedule pending proofs: {e}")
 
         await self.update_leaderboard()
 
@@ -318,7 +394,7 @@ class HLLInfLeaderboard(commands.Cog):
             return
 
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 # Capture prev best (verified) for info
                 cursor = await db.execute(
                     "SELECT MAX(value) FROM submissions WHERE user_id=? AND stat=? AND proof_verified=1",
@@ -327,27 +403,17 @@ class HLLInfLeaderboard(commands.Cog):
                 row = await cursor.fetchone()
                 prev_best = row[0] if row and row[0] is not None else 0
 
-                # If value is 0, remove the user from this stat's leaderboard (delete all records, do not insert)
-                if value == 0:
-                    await db.execute("DELETE FROM submissions WHERE user_id=? AND stat=?", (user.id, stat))
-                    await db.commit()
-                    await self.update_leaderboard()
-                    await interaction.response.send_message(
-                        f"Removed {user.mention} from the {stat} leaderboard. Previous verified best was {prev_best}.",
-                        ephemeral=True,
-                    )
-                    return
-
                 # Overwrite: delete all existing rows (verified or pending) for this user+stat
                 await db.execute("DELETE FROM submissions WHERE user_id=? AND stat=?", (user.id, stat))
 
-                # Insert the new authoritative verified record
-                now_iso = datetime.datetime.utcnow().isoformat()
-                await db.execute(
-                    "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, ?, ?, ?, 0, 1)",
-                    (user.id, stat, int(value), now_iso),
-                )
-                await db.commit()
+                # A value of 0 removes the user from this stat's leaderboard (delete all records, do not insert)
+                if value != 0:
+                    # Insert the new authoritative verified record
+                    now_iso = datetime.datetime.utcnow().isoformat()
+                    await db.execute(
+                        "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, ?, ?, ?, 0, 1)",
+                        (user.id, stat, int(value), now_iso),
+                    )
 
         except Exception as e:
             await interaction.response.send_message(f"Failed to set high score: {e}", ephemeral=True)
@@ -355,6 +421,13 @@ class HLLInfLeaderboard(commands.Cog):
 
         await self.update_leaderboard()
 
+        if value == 0:
+            await interaction.response.send_message(
+                f"Removed {user.mention} from the {stat} leaderboard. Previous verified best was {prev_best}.",
+                ephemeral=True,
+            )
+            return
+
         await interaction.response.send_message(
             f"Set {user.mention}'s {stat} high score to {value}. Previous verified best was {prev_best}.",
             ephemeral=True,
@@ -384,7 +457,7 @@ class HLLInfLeaderboard(commands.Cog):
 
         try:
             now_iso = datetime.datetime.utcnow().isoformat()
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 # Oldest pending submission still within deadline
                 cursor = await db.execute(
                     """
@@ -405,7 +478,6 @@ class HLLInfLeaderboard(commands.Cog):
                     "UPDATE submissions SET needs_proof=0, proof_verified=1 WHERE id=?",
                     (submission_id,),
                 )
-                await db.commit()
 
             try:
                 await message.add_reaction("✅")
@@ -415,52 +487,61 @@ class HLLInfLeaderboard(commands.Cog):
             except Exception:
                 pass
 
+            self._proof_expiries.cancel(submission_id)
+
             # Refresh leaderboard (only verified count now, so this matters)
             await self.update_leaderboard()
 
         except Exception as e:
             print(f"HLLInfLeaderboard: on_message proof handling failed: {e}")
 
-    # ---------------- Background: Cleanup expired pending proofs ----------------
-    @tasks.loop(minutes=1)
-    async def proof_cleanup(self):
+    # ---------------- Pending proof expiry ----------------
+    async def _schedule_pending_proofs(self):
+        rows = await database.fetchall(
+            "SELECT id, proof_deadline FROM submissions "
+            "WHERE needs_proof=1 AND proof_verified=0 AND proof_deadline IS NOT NULL"
+        )
+        for submission_id, deadline_iso in rows:
+            self.schedule_proof_expiry(submission_id, deadline_iso)
+
+    def schedule_proof_expiry(self, submission_id: int, deadline_iso: str):
+        """Expire the submission at its proof deadline unless a screenshot verifies it first."""
+        deadline = datetime.datetime.fromisoformat(deadline_iso).replace(tzinfo=datetime.timezone.utc)
+        self._proof_expiries.schedule(
+            submission_id, deadline.timestamp(), functools.partial(self._expire_proof, submission_id)
+        )
+
+    async def _expire_proof(self, submission_id: int):
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
-                now_iso = datetime.datetime.utcnow().isoformat()
+            async with database.write() as db:
                 cursor = await db.execute(
                     """
                     SELECT id, user_id, stat, value
                     FROM submissions
-                    WHERE needs_proof=1 AND proof_verified=0 AND proof_deadline IS NOT NULL AND proof_deadline < ?
+                    WHERE id=? AND needs_proof=1 AND proof_verified=0
                     """,
-                    (now_iso,),
+                    (submission_id,),
                 )
-                rows = await cursor.fetchall()
-
-                if rows:
-                    # Delete expired pending submissions
-                    await db.executemany("DELETE FROM submissions WHERE id=?", [(r[0],) for r in rows])
-                    await db.commit()
-
-                    # Notify channel and refresh leaderboard
-                    channel = await self._get_channel(SUBMISSIONS_CHANNEL_ID)
-                    if channel:
-                        for sid, uid, stat, val in rows:
-                            try:
-                                await channel.send(
-                                    f"<@{uid}> your submission #{sid} ({val} {stat}) was removed "
-                                    f"due to missing screenshot within {PROOF_TIMEOUT_MINUTES} minutes."
-                                )
-                            except Exception:
-                                pass
-
-                    await self.update_leaderboard()
-        except Exception as e:
-            print(f"HLLInfLeaderboard: proof cleanup failed: {e}")
+                row = await cursor.fetchone()
+                if row:
+                    await db.execute("DELETE FROM submissions WHERE id=?", (submission_id,))
+
+            if row:
+                # Notify channel and refresh leaderboard
+                sid, uid, stat, val = row
+                channel = await self._get_channel(SUBMISSIONS_CHANNEL_ID)
+                if channel:
+                    try:
+                        await channel.send(
+                            f"<@{uid}> your submission #{sid} ({val} {stat}) was removed "
+                            f"due to missing screenshot within {PROOF_TIMEOUT_MINUTES} minutes."
+                        )
+                    except Exception:
+                        pass
 
-    @proof_cleanup.before_loop
-    async def before_proof_cleanup(self):
-        await self.bot.wait_until_ready()
+                await self.update_leaderboard()
+        except Exception as e:
+            print(f"HLLInfLeaderboard: proof expiry failed for #{submission_id}: {e}")
 
 # ---------------- Submission Modal ----------------
 class SubmissionModal(Modal):
@@ -506,7 +587,7 @@ class SubmissionModal(Modal):
 
         # Insert into DB (async) and get submission ID (insert verified, then maybe flip to pending)
         try:
-            async with aiosqlite.connect(DB_FILE) as db:
+            async with database.write() as db:
                 cursor = await db.execute(
                     """
                     INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified)
@@ -515,7 +596,6 @@ class SubmissionModal(Modal):
                     (self.user.id, self.stat, value, datetime.datetime.utcnow().isoformat()),
                 )
                 submission_id = cursor.lastrowid
-                await db.commit()
         except Exception as e:
             await interaction.followup.send(f"Failed to record submission: {e}", ephemeral=True)
             return
@@ -533,12 +613,11 @@ class SubmissionModal(Modal):
                     # Mark as needing proof with a deadline (flip to unverified until proof arrives)
                     deadline = datetime.datetime.utcnow() + datetime.timedelta(minutes=PROOF_TIMEOUT_MINUTES)
                     try:
-                        async with aiosqlite.connect(DB_FILE) as db:
-                            await db.execute(
-                                "UPDATE submissions SET needs_proof=1, proof_verified=0, proof_deadline=? WHERE id=?",
-                                (deadline.isoformat(), submission_id),
-                            )
-                            await db.commit()
+                        await database.execute(
+                            "UPDATE submissions SET needs_proof=1, proof_verified=0, proof_deadline=? WHERE id=?",
+                            (deadline.isoformat(), submission_id),
+                        )
+                        self.cog.schedule_proof_expiry(submission_id, deadline.isoformat())
                     except Exception:
                         pass
 
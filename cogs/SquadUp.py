@@ -1,12 +1,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump, flush_pending_async, mark_dirty, run_state_io
 import json
 import os
 from typing import Optional, Dict, List, Union
 import asyncio
-import time
 
 from config.common import SQUADUP_CONFIG_PATH
 from data_paths import data_path
@@ -19,8 +18,6 @@ CONFIG_FILE = SQUADUP_CONFIG_PATH
 POST_CACHE = {}
 CONFIG_CACHE = None
 SAVE_INTERVAL = 60  # seconds between writes to disk
-last_save_time = 0
-dirty_cache = False  # Flag to track if cache has unsaved changes
 
 NATO_SQUAD_NAMES = [
     "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot",
@@ -86,32 +83,22 @@ def get_post_data(message_id: str) -> dict:
     
     return POST_CACHE.get(message_id, None)
 
+def _post_cache_snapshot() -> dict:
+    return POST_CACHE
+
 def update_post_data(message_id: str, post_data: dict):
     """Update post in cache and schedule save to disk"""
-    global POST_CACHE, dirty_cache
-    
     message_id = str(message_id)  # Ensure string format
     POST_CACHE[message_id] = post_data
-    dirty_cache = True  # Mark cache as needing save
+    mark_dirty(POSTS_FILE, _post_cache_snapshot, delay=SAVE_INTERVAL, indent=4)
 
-def check_and_save_posts():
-    """Check if posts need saving and save if necessary"""
-    global last_save_time, dirty_cache
-    
-    current_time = time.time()
-    if dirty_cache and current_time - last_save_time > SAVE_INTERVAL:
-        save_all_posts()
-        last_save_time = current_time
-        dirty_cache = False
-
-def save_all_posts():
+async def save_all_posts():
     """Force save all cached posts to disk"""
-    global POST_CACHE
-    
     if not POST_CACHE:
         return  # Nothing to save
     
-    atomic_json_dump(POSTS_FILE, POST_CACHE, indent=4)
+    mark_dirty(POSTS_FILE, _post_cache_snapshot, delay=0, indent=4)
+    await flush_pending_async(POSTS_FILE)
 
 def is_role_based(post: dict) -> bool:
     return post.get("role_based", False) or (
@@ -335,7 +322,7 @@ class CloseButton(discord.ui.Button):
 
         post["closed"] = True
         update_post_data(view.message_id, post)
-        save_all_posts()  # Immediately save closed posts
+        await save_all_posts()  # Immediately save closed posts
         
         for child in view.children:
             child.disabled = True
@@ -588,18 +575,22 @@ class SquadSignupView(discord.ui.View):
 class SquadUp(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        # Initialize caches
-        self.config_data = ensure_file_exists(CONFIG_FILE, {"allowed_roles": ["Squad Leader", "Admin"], "default_squad_size": 6})
+        self.config_data = {}
+        self.bg_task = None
+
+    async def cog_load(self):
+        # Initialize caches; the files are read on the state I/O thread
+        self.config_data = await run_state_io(ensure_file_exists, CONFIG_FILE, {"allowed_roles": ["Squad Leader", "Admin"], "default_squad_size": 6})
         
         # Load all posts into cache for faster access
         global POST_CACHE
-        POST_CACHE = ensure_file_exists(POSTS_FILE, {})
+        POST_CACHE = await run_state_io(ensure_file_exists, POSTS_FILE, {})
         
         # Set up periodic tasks
-        self.bg_task = bot.loop.create_task(self._background_tasks())
+        self.bg_task = asyncio.create_task(self._background_tasks())
         
     async def _background_tasks(self):
-        """Background task to handle periodic saving and view registration"""
+        """Background task to register persistent views"""
         await self.bot.wait_until_ready()
         
         # Register persistent views
@@ -611,16 +602,11 @@ class SquadUp(commands.Cog):
                 else:
                     view = get_or_create_view(self.bot, int(msg_id), post["op_id"], multi=False)
                 self.bot.add_view(view, message_id=int(msg_id))
-        
-        # Periodic save task
-        while not self.bot.is_closed():
-            check_and_save_posts()
-            await asyncio.sleep(10)  # Check every 10 seconds
 
-    def cog_unload(self):
+    async def cog_unload(self):
         """Called when cog is unloaded"""
         # Save all data before unloading
-        save_all_posts()
+        await flush_pending_async(POSTS_FILE)
         if self.bg_task:
             self.bg_task.cancel()
 
@@ -710,7 +696,7 @@ class SquadUp(commands.Cog):
         view.message_id = message.id
 
         update_post_data(message.id, post_data)
-        save_all_posts()  # Force save new posts immediately
+        await save_all_posts()  # Force save new posts immediately
         await interaction.response.send_message("✅ SquadUp post created.", ephemeral=True)
 
     @app_commands.command(name="squadupmulti", description="Create multi-squad signup")
@@ -758,7 +744,7 @@ class SquadUp(commands.Cog):
         view.message_id = message.id
 
         update_post_data(message.id, post_data)
-        save_all_posts()  # Force save new posts immediately
+        await save_all_posts()  # Force save new posts immediately
         await interaction.response.send_message("✅ Multi-squad post created.", ephemeral=True)
 
     @app_commands.command(name="crewup", description="Create tank crew signups where each tank has TC, Gunner, and Driver roles")
@@ -835,7 +821,7 @@ class SquadUp(commands.Cog):
         view.message_id = message.id
 
         update_post_data(message.id, post_data)
-        save_all_posts()  # Force save new posts immediately
+        await save_all_posts()  # Force save new posts immediately
         await interaction.response.send_message("✅ CrewUp post created.", ephemeral=True)
 
 async def setup(bot):
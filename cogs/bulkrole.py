@@ -5,7 +5,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands, Embed
 from discord.utils import get
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump, run_state_io
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
@@ -165,12 +165,12 @@ class BulkRole(commands.Cog):
             elif state["step"] == "confirm":
                 answer = content.lower()
                 if answer == "confirm":
-                    presets = load_presets()
+                    presets = await run_state_io(load_presets)
                     presets[state["preset_name"]] = {
                         "add": state["add_roles"],
                         "remove": state["remove_roles"]
                     }
-                    save_presets(presets)
+                    await run_state_io(save_presets, presets)
                     await send_embed(message.channel, "Preset Saved", f"✅ Preset `{state['preset_name']}` saved.", discord.Color.green())
                     self.dm_wizards.pop(message.author.id, None)
                 elif answer == "cancel":
@@ -181,7 +181,7 @@ class BulkRole(commands.Cog):
                 return
 
     async def preset_autocomplete(self, interaction: discord.Interaction, current: str):
-        presets = load_presets()
+        presets = await run_state_io(load_presets)
         return [
             app_commands.Choice(name=name, value=name)
             for name in presets if current.lower() in name.lower()
@@ -206,7 +206,7 @@ class BulkRole(commands.Cog):
                 ephemeral=True,
             )
             return
-        presets = load_presets()
+        presets = await run_state_io(load_presets)
         if preset not in presets:
             await interaction.followup.send(f"❌ Preset `{preset}` not found.", ephemeral=True)
             return
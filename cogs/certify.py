@@ -1,11 +1,40 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from PIL import Image, ImageDraw, ImageFont
+from PIL import ImageDraw
 from io import BytesIO
+import asyncio
+import logging
 import os
+import re
+import zipfile
+from typing import Optional
 
 from config.common import CERTIFICATE_BOLD_FONT_PATH, CERTIFICATE_REGULAR_FONT_PATH
+from image_render import load_font, load_image, register_warmup, render as render_image, start_render_workers, unregister_warmup
+
+log = logging.getLogger(__name__)
+
+ALLOWED_ROLE_NAMES = {"Assistant","7DR-NCO","7DR-SNCO","Admin Core"}  # <-- Set your allowed role names here
+
+# Font paths
+CERT_FONT_PATH = CERTIFICATE_BOLD_FONT_PATH
+PERSON_FONT_PATH = CERTIFICATE_REGULAR_FONT_PATH
+OFFICER_FONT_PATH = CERTIFICATE_REGULAR_FONT_PATH
+
+# Font sizes
+CERT_FONT_SIZE = 76
+PERSON_FONT_SIZE = 46   # Change as desired
+OFFICER_FONT_SIZE = 46  # Change as desired
+
+# Spacing
+CERT_SPACING = 22
+PERSON_SPACING = 22
+OFFICER_SPACING = 22
+
+# Batch certificates
+BATCH_MAX_CERTIFICATES = 60
+ATTACHMENTS_PER_MESSAGE = 10  # Discord's per-message attachment limit
 
 def draw_spaced_text(draw, position, text, font, fill, spacing):
     x, y = position
@@ -25,10 +54,115 @@ def get_spaced_text_width(text, font, spacing):
             width += spacing
     return width
 
+def render_certificate(template_path, person_name, certificate_name, officer_name):
+    """Draw the names onto the certificate template; runs in the shared render pool."""
+    img = load_image(template_path)
+    draw = ImageDraw.Draw(img)
+
+    cert_font = load_font(CERT_FONT_PATH, CERT_FONT_SIZE)
+    person_font = load_font(PERSON_FONT_PATH, PERSON_FONT_SIZE)
+    officer_font = load_font(OFFICER_FONT_PATH, OFFICER_FONT_SIZE)
+
+    # Center the certificate name about a given pixel (e.g., x=700)
+    center_x = 700
+    y_cert = 1000
+
+    cert_width = get_spaced_text_width(certificate_name, cert_font, CERT_SPACING)
+    cert_start_x = center_x - (cert_width // 2)
+    draw_spaced_text(draw, (cert_start_x, y_cert), certificate_name, cert_font, "black", CERT_SPACING)
+
+    # The other fields use fixed positions
+    draw_spaced_text(draw, (575, 1382), person_name, person_font, "black", PERSON_SPACING)
+    draw_spaced_text(draw, (420, 1451), officer_name, officer_font, "black", OFFICER_SPACING)
+
+    output_buffer = BytesIO()
+    img.save(output_buffer, format="PNG")
+    return output_buffer.getvalue()
+
+def preload_certificate_assets(template_path):
+    """Decode the template and load the fonts into a render worker's caches."""
+    load_image(template_path)
+    load_font(CERT_FONT_PATH, CERT_FONT_SIZE)
+    load_font(PERSON_FONT_PATH, PERSON_FONT_SIZE)
+    load_font(OFFICER_FONT_PATH, OFFICER_FONT_SIZE)
+
+def parse_names(text):
+    """Split pasted names on newlines, commas or semicolons, dropping blanks and repeats."""
+    names = []
+    for part in re.split(r"[\n,;]+", text or ""):
+        name = part.strip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+def certificate_filename(person_name, used):
+    stem = re.sub(r"[^A-Za-z0-9]+", "_", person_name).strip("_") or "unnamed"
+    filename = f"certificate_{stem}.png"
+    suffix = 2
+    while filename in used:
+        filename = f"certificate_{stem}_{suffix}.png"
+        suffix += 1
+    used.add(filename)
+    return filename
+
+def group_attachments(files, max_bytes, per_message=ATTACHMENTS_PER_MESSAGE):
+    """Group (filename, bytes) pairs into messages under the attachment count and upload size limits."""
+    groups = []
+    current = []
+    current_bytes = 0
+    for filename, data in files:
+        if current and (len(current) >= per_message or current_bytes + len(data) > max_bytes):
+            groups.append(current)
+            current = []
+            current_bytes = 0
+        current.append((filename, data))
+        current_bytes += len(data)
+    if current:
+        groups.append(current)
+    return groups
+
+def zip_certificates(files):
+    buffer = BytesIO()
+    # PNGs are already compressed; storing them keeps zipping instant.
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, data in files:
+            archive.writestr(filename, data)
+    return buffer.getvalue()
+
+def _is_allowed(member):
+    return hasattr(member, "roles") and any(role.name in ALLOWED_ROLE_NAMES for role in member.roles)
+
 class Certify(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.template_path = self._find_template()
+        self._warmup_task = None
+
+    async def cog_load(self):
+        # Every render worker runs this as it starts, so each has the
+        # template and fonts cached before the first /certify.
+        register_warmup(preload_certificate_assets, template_path=self.template_path)
+        self._warmup_task = asyncio.create_task(self._warm_render_workers())
+
+    def cog_unload(self):
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        unregister_warmup(preload_certificate_assets)
+
+    async def _warm_render_workers(self):
+        try:
+            await start_render_workers()
+        except Exception as e:
+            log.warning("certificate_preload_failed error=%s", e)
+
+    async def _warn_missing_fonts(self, interaction):
+        for label, font_path in (
+            ("Certificate title", CERT_FONT_PATH),
+            ("Person", PERSON_FONT_PATH),
+            ("Officer", OFFICER_FONT_PATH),
+        ):
+            if not os.path.isfile(font_path):
+                await interaction.followup.send(f"⚠️ {label} font not found. Using default font.")
 
     def _find_template(self):
         folder = os.path.dirname(__file__)
@@ -50,79 +184,115 @@ class Certify(commands.Cog):
                       officer_name: str):
 
         # --- Role check block ---
-        allowed_roles = {"Assistant","7DR-NCO","7DR-SNCO","Admin Core"}  # <-- Set your allowed role names here
         member = interaction.user if hasattr(interaction, "user") else interaction.author
-        if not hasattr(member, "roles") or not any(role.name in allowed_roles for role in member.roles):
+        if not _is_allowed(member):
             await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
             return
         # --- End role check ---
 
         await interaction.response.defer()
+        await self._warn_missing_fonts(interaction)
 
-        # Open the image template
         try:
-            img = Image.open(self.template_path).convert("RGBA")
+            image_bytes = await render_image(
+                render_certificate,
+                template_path=self.template_path,
+                person_name=person_name,
+                certificate_name=certificate_name,
+                officer_name=officer_name,
+            )
         except Exception as e:
-            await interaction.followup.send(f"❌ Failed to open image template: {e}")
+            await interaction.followup.send(f"❌ Failed to render certificate: {e}")
             return
 
-        draw = ImageDraw.Draw(img)
-
-        # Font paths
-        cert_font_path = CERTIFICATE_BOLD_FONT_PATH
-        person_font_path = CERTIFICATE_REGULAR_FONT_PATH
-        officer_font_path = CERTIFICATE_REGULAR_FONT_PATH
+        await interaction.followup.send(
+            "🎖️ Certificate generated!",
+            file=discord.File(fp=BytesIO(image_bytes), filename="certificate.png")
+        )
 
-        # Font sizes
-        cert_font_size = 76
-        person_font_size = 46   # Change as desired
-        officer_font_size = 46  # Change as desired
+    @app_commands.command(name="certify_batch", description="Generate certificates for several people at once")
+    @app_commands.describe(
+        certificate_name="Certificate title",
+        officer_name="Officer's name",
+        names="Names separated by commas, semicolons or new lines",
+        role="Certify every member with this role",
+        as_zip="Send one zip file instead of image attachments"
+    )
+    async def certify_batch(self, interaction: discord.Interaction,
+                            certificate_name: str,
+                            officer_name: str,
+                            names: Optional[str] = None,
+                            role: Optional[discord.Role] = None,
+                            as_zip: bool = False):
 
-        # Load fonts
-        try:
-            cert_font = ImageFont.truetype(cert_font_path, size=cert_font_size)
-        except:
-            cert_font = ImageFont.load_default()
-            await interaction.followup.send("⚠️ Certificate title font not found. Using default font.")
+        if not _is_allowed(interaction.user):
+            await interaction.response.send_message("❌ You do not have permission to use this command.", ephemeral=True)
+            return
 
-        try:
-            person_font = ImageFont.truetype(person_font_path, size=person_font_size)
-        except:
-            person_font = ImageFont.load_default()
-            await interaction.followup.send("⚠️ Person font not found. Using default font.")
+        people = parse_names(names)
+        if role is not None:
+            for role_member in sorted(role.members, key=lambda m: m.display_name.lower()):
+                if not role_member.bot and role_member.display_name not in people:
+                    people.append(role_member.display_name)
 
-        try:
-            officer_font = ImageFont.truetype(officer_font_path, size=officer_font_size)
-        except:
-            officer_font = ImageFont.load_default()
-            await interaction.followup.send("⚠️ Officer font not found. Using default font.")
+        if not people:
+            await interaction.response.send_message("❌ Give some names or a role to certify.", ephemeral=True)
+            return
+        if len(people) > BATCH_MAX_CERTIFICATES:
+            await interaction.response.send_message(
+                f"❌ That is {len(people)} certificates; the limit per batch is {BATCH_MAX_CERTIFICATES}.", ephemeral=True
+            )
+            return
 
-        # Spacing
-        cert_spacing = 22
-        person_spacing = 22
-        officer_spacing = 22
+        await interaction.response.defer()
+        await self._warn_missing_fonts(interaction)
 
-        # Center the certificate name about a given pixel (e.g., x=700)
-        center_x = 700
-        y_cert = 1000
+        results = await asyncio.gather(
+            *(
+                render_image(
+                    render_certificate,
+                    template_path=self.template_path,
+                    person_name=person_name,
+                    certificate_name=certificate_name,
+                    officer_name=officer_name,
+                )
+                for person_name in people
+            ),
+            return_exceptions=True,
+        )
 
-        cert_width = get_spaced_text_width(certificate_name, cert_font, cert_spacing)
-        cert_start_x = center_x - (cert_width // 2)
-        draw_spaced_text(draw, (cert_start_x, y_cert), certificate_name, cert_font, "black", cert_spacing)
+        used_filenames = set()
+        files = []
+        failed = []
+        for person_name, result in zip(people, results):
+            if isinstance(result, Exception):
+                log.warning("certificate_render_failed person=%s error=%s", person_name, result)
+                failed.append(person_name)
+            else:
+                files.append((certificate_filename(person_name, used_filenames), result))
 
-        # The other fields use fixed positions
-        draw_spaced_text(draw, (575, 1382), person_name, person_font, "black", person_spacing)
-        draw_spaced_text(draw, (420, 1451), officer_name, officer_font, "black", officer_spacing)
+        if failed:
+            await interaction.followup.send(f"❌ Failed to render certificates for: {', '.join(failed)}")
+        if not files:
+            return
 
-        # Save to buffer
-        output_buffer = BytesIO()
-        img.save(output_buffer, format="PNG")
-        output_buffer.seek(0)
+        max_bytes = interaction.guild.filesize_limit if interaction.guild else discord.utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+        if as_zip:
+            archive = zip_certificates(files)
+            if len(archive) <= max_bytes:
+                await interaction.followup.send(
+                    f"🎖️ {len(files)} certificates generated!",
+                    file=discord.File(fp=BytesIO(archive), filename="certificates.zip")
+                )
+                return
+            await interaction.followup.send("⚠️ The zip is over the upload limit, sending the images instead.")
 
-        await interaction.followup.send(
-            "🎖️ Certificate generated!",
-            file=discord.File(fp=output_buffer, filename="certificate.png")
-        )
+        groups = group_attachments(files, max_bytes)
+        for index, group in enumerate(groups, start=1):
+            await interaction.followup.send(
+                f"🎖️ Certificates {index}/{len(groups)}" if len(groups) > 1 else f"🎖️ {len(files)} certificates generated!",
+                files=[discord.File(fp=BytesIO(data), filename=filename) for filename, data in group]
+            )
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(Certify(bot))
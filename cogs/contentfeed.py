@@ -10,7 +10,7 @@ from datetime import datetime, time, timezone
 from xml.etree import ElementTree
 
 from config import MAIN_GUILD_ID
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump, atomic_json_dump_async
 
 # ================== CONFIG ==================
 
@@ -77,6 +77,10 @@ def save_json(path, data):
     atomic_json_dump(path, data)
 
 
+async def save_json_async(path, data):
+    await atomic_json_dump_async(path, data)
+
+
 class YouTubeFeed(commands.Cog, name="YouTubeFeed"):
     def __init__(self, bot):
         self.bot = bot
@@ -107,8 +111,8 @@ class YouTubeFeed(commands.Cog, name="YouTubeFeed"):
             for creator in CREATORS:
                 await self.fetch_creator_feed(session, creator)
 
-        save_json(KNOWN_VIDEOS_FILE, self.known_videos)
-        save_json(LAST_SEEN_FILE, self.last_seen)
+        await save_json_async(KNOWN_VIDEOS_FILE, self.known_videos)
+        await save_json_async(LAST_SEEN_FILE, self.last_seen)
 
     async def fetch_creator_feed(self, session, creator):
         rss_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={creator['channel_id']}"
@@ -320,7 +324,7 @@ class YouTubeFeed(commands.Cog, name="YouTubeFeed"):
         try:
             await channel.send(f"📺 **{video['creator']}**\n{video['url']}")
             self.last_posted[video["url"]] = now.isoformat()
-            save_json(LAST_POSTED_FILE, self.last_posted)
+            await save_json_async(LAST_POSTED_FILE, self.last_posted)
             logger.info(f"Successfully posted video: {video['url']} at {now}")
         except discord.Forbidden:
             logger.error("Missing permissions to post in target channel")
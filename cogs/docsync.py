@@ -14,7 +14,7 @@ from discord.ext import commands, tasks
 
 from config import DOCS_FORUM_CHANNEL_ID, DOCS_FORUM_TAG_NAME, MAIN_GUILD_ID
 from data_paths import data_path
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 
 
 GUILD_ID = MAIN_GUILD_ID
@@ -80,8 +80,8 @@ class DocSync(commands.Cog):
             self.logger.exception("Failed to load ratbot guide state")
             return {}
 
-    def _save_state(self) -> None:
-        atomic_json_dump(STATE_FILE, self._state)
+    async def _save_state(self) -> None:
+        await atomic_json_dump_async(STATE_FILE, self._state)
 
     def _read_text(self, path: str) -> str:
         with open(path, "r", encoding="utf-8") as f:
@@ -290,7 +290,7 @@ class DocSync(commands.Cog):
         self._state["thread_id"] = thread.id
         if message is not None:
             self._state["starter_message_id"] = message.id
-        self._save_state()
+        await self._save_state()
         return thread, message
 
     async def sync_docs(self, *, force: bool = False) -> tuple[bool, str]:
@@ -352,7 +352,7 @@ class DocSync(commands.Cog):
 
             self._state["message_ids"] = message_ids
             self._state["source_hashes"] = {"readme": readme_hash, "howto": howto_hash}
-            self._save_state()
+            await self._save_state()
             return True, f"Ratbot Guide synced to {thread.jump_url}"
 
     @commands.Cog.listener()
@@ -13,7 +13,7 @@ from discord.ext import commands
 from clan_t17_lookup import ClanT17Lookup
 from data_paths import data_path
 from hll_API_backend import HLLBackendError, get_hll_backend_client
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump, atomic_json_dump_async
 
 
 LOGGER = logging.getLogger("EventMapRequests")
@@ -774,7 +774,7 @@ class EventMapRequests(commands.Cog):
             return
 
         self._panel_state = {"channel_id": channel.id, "message_id": message.id}
-        atomic_json_dump(PANEL_STATE_PATH, self._panel_state, indent=2)
+        await atomic_json_dump_async(PANEL_STATE_PATH, self._panel_state, indent=2)
 
     async def _refresh_panel_embed(self) -> None:
         channel_id = int(self._panel_state.get("channel_id") or REQUEST_CHANNEL_ID)
@@ -836,7 +836,7 @@ class EventMapRequests(commands.Cog):
             )
             if not maps:
                 raise HLLBackendError("Bifrost returned no valid HLL maps")
-            atomic_json_dump(
+            await atomic_json_dump_async(
                 MAP_CACHE_PATH,
                 {
                     "fetched_at": datetime.now(timezone.utc).isoformat(),
@@ -919,7 +919,7 @@ class EventMapRequests(commands.Cog):
             request["approval_channel_id"] = approval_channel.id
             request["approval_message_id"] = approval_message.id
             self._requests[str(approval_message.id)] = request
-            atomic_json_dump(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
+            await atomic_json_dump_async(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
 
         await interaction.followup.send(
             f"Your request for **{map_data['friendly_name']} — {_variant_label(map_data)}** "
@@ -1040,7 +1040,7 @@ class EventMapRequests(commands.Cog):
             request["approval_channel_id"] = approval_channel.id
             request["approval_message_id"] = approval_message.id
             self._requests[str(approval_message.id)] = request
-            atomic_json_dump(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
+            await atomic_json_dump_async(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
 
         await interaction.followup.send(
             f"Your **{server_label}** admin cam request for **{duration_hours} hour(s)** "
@@ -1118,7 +1118,7 @@ class EventMapRequests(commands.Cog):
             if not approved:
                 request["resolved_by"] = interaction.user.id
                 request["resolved_at"] = datetime.now(timezone.utc).isoformat()
-            atomic_json_dump(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
+            await atomic_json_dump_async(REQUEST_STATE_PATH, self._requests, indent=2, ensure_ascii=False)
 
         if approved:
             request_type = str(request.get("request_type") or "map")
@@ -1135,7 +1135,7 @@ class EventMapRequests(commands.Cog):
                         current["status"] = "pending"
                         current["backend_error"] = error_message
                         current["backend_error_at"] = datetime.now(timezone.utc).isoformat()
-                        atomic_json_dump(
+                        await atomic_json_dump_async(
                             REQUEST_STATE_PATH,
                             self._requests,
                             indent=2,
@@ -1179,7 +1179,7 @@ class EventMapRequests(commands.Cog):
                     request["backend_message"] = "Temporary Spectator admin cam access granted."
                 else:
                     request["backend_message"] = str(result.get("message") or "Map change initiated.")
-                atomic_json_dump(
+                await atomic_json_dump_async(
                     REQUEST_STATE_PATH,
                     self._requests,
                     indent=2,
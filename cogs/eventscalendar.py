@@ -14,10 +14,13 @@ from datetime import datetime, timedelta, timezone
 import discord
 from discord.http import Route
 from discord.ext import commands, tasks
-from state_io import atomic_json_dump
+from live_message import live_messages
+from state_io import atomic_json_dump_async
 
 from config.common import SCOREBOARD_FONT_PATH
 from data_paths import data_path
+from image_render import fitted_background, render as render_image
+from text_layout import fit_wrapped_font
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +92,53 @@ KEYWORD_EMOJI_TAGS: dict[str, str] = {
 }
 
 
+def render_event_cover_image(*, title: str, date_text: str, background_path: Optional[str]) -> bytes:
+    """Render an event notification cover; runs in the shared render pool."""
+    from PIL import Image, ImageDraw  # pyright: ignore[reportMissingImports]
+
+    width, height = EVENT_NOTIFICATION_IMAGE_SIZE
+
+    if background_path:
+        try:
+            base = fitted_background(background_path, (width, height))
+        except Exception:
+            logger.warning("Failed to render event background from %s", background_path, exc_info=True)
+            base = Image.new("RGBA", (width, height), (18, 24, 38, 255))
+    else:
+        base = Image.new("RGBA", (width, height), (18, 24, 38, 255))
+
+    overlay = Image.new("RGBA", (width, height), (8, 12, 20, 145))
+    base = Image.alpha_composite(base, overlay)
+    draw = ImageDraw.Draw(base)
+    text_fill = (255, 255, 255, 255)
+    content_width = width - 220
+    title_top = 170
+
+    def line_spacing(size: int) -> int:
+        return max(10, size // 5)
+
+    title_font, wrapped_title, title_spacing = fit_wrapped_font(EVENT_IMAGE_FONT_PATH, title, content_width, 360, 110, 38, spacing=line_spacing)
+    title_text = "\n".join(wrapped_title)
+    title_bbox = draw.multiline_textbbox((0, 0), title_text, font=title_font, spacing=title_spacing, align="center")
+    title_height = title_bbox[3] - title_bbox[1]
+
+    date_font, wrapped_date, date_spacing = fit_wrapped_font(EVENT_IMAGE_FONT_PATH, date_text, content_width, 140, 62, 24, spacing=line_spacing)
+    date_render = "\n".join(wrapped_date)
+    date_bbox = draw.multiline_textbbox((0, 0), date_render, font=date_font, spacing=date_spacing, align="center")
+    date_height = date_bbox[3] - date_bbox[1]
+
+    title_y = max(title_top, (height - title_height - date_height - 80) // 2)
+    date_y = min(height - 180 - date_height, title_y + title_height + 60)
+
+    draw.multiline_text((width // 2, title_y), title_text, font=title_font, fill=text_fill, anchor="ma", align="center", spacing=title_spacing)
+    draw.multiline_text((width // 2, date_y), date_render, font=date_font, fill=text_fill, anchor="ma", align="center", spacing=date_spacing)
+
+    out = io.BytesIO()
+    base.save(out, format="PNG")
+    out.seek(0)
+    return out.getvalue()
+
+
 class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
     """
     A cog that reads Discord scheduled events and displays them in an embed.
@@ -172,10 +222,10 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
             logger.warning("Could not read event notification state; will recreate it.", exc_info=True)
             return {"events": {}}
 
-    def _save_notification_state(self) -> None:
+    async def _save_notification_state(self) -> None:
         try:
             self._notification_state["updated_at"] = datetime.utcnow().isoformat()
-            atomic_json_dump(EVENTS_NOTIFICATION_STATE_PATH, self._notification_state, ensure_ascii=False)
+            await atomic_json_dump_async(EVENTS_NOTIFICATION_STATE_PATH, self._notification_state, ensure_ascii=False)
         except Exception:
             logger.warning("Failed to persist event notification state.", exc_info=True)
 
@@ -196,7 +246,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
             self._target_guild_id = guild.id
             current_events = await guild.fetch_scheduled_events(with_counts=False)
             await self._sync_event_notifications(guild, current_events)
-            self._save_notification_state()
+            await self._save_notification_state()
         except Exception:
             logger.warning("Startup event notification sync failed.", exc_info=True)
 
@@ -543,84 +593,12 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
         end_time: Optional[datetime],
         background_path: Optional[str],
     ) -> bytes:
-        from PIL import Image, ImageDraw, ImageFont, ImageOps  # pyright: ignore[reportMissingImports]
-
-        width, height = EVENT_NOTIFICATION_IMAGE_SIZE
-
-        if background_path:
-            try:
-                with Image.open(background_path) as source_image:
-                    base = ImageOps.fit(source_image.convert("RGBA"), (width, height), method=Image.Resampling.LANCZOS)
-            except Exception:
-                logger.warning("Failed to render event background from %s", background_path, exc_info=True)
-                base = Image.new("RGBA", (width, height), (18, 24, 38, 255))
-        else:
-            base = Image.new("RGBA", (width, height), (18, 24, 38, 255))
-
-        overlay = Image.new("RGBA", (width, height), (8, 12, 20, 145))
-        base = Image.alpha_composite(base, overlay)
-        draw = ImageDraw.Draw(base)
-        text_fill = (255, 255, 255, 255)
-        content_width = width - 220
-        title_top = 170
-
-        def load_font(size: int):
-            try:
-                return ImageFont.truetype(EVENT_IMAGE_FONT_PATH, size)
-            except Exception:
-                return ImageFont.load_default()
-
-        def wrap_text(text: str, font, max_width: int) -> list[str]:
-            words = text.split()
-            if not words:
-                return [""]
-
-            lines: list[str] = []
-            current = words[0]
-            for word in words[1:]:
-                candidate = f"{current} {word}".strip()
-                bbox = draw.textbbox((0, 0), candidate, font=font)
-                if (bbox[2] - bbox[0]) <= max_width:
-                    current = candidate
-                else:
-                    lines.append(current)
-                    current = word
-            lines.append(current)
-            return lines
-
-        def fit_multiline_font(text: str, max_width: int, max_height: int, start_size: int, min_size: int):
-            for size in range(start_size, min_size - 1, -2):
-                font = load_font(size)
-                lines = wrap_text(text, font, max_width)
-                spacing = max(10, size // 5)
-                bbox = draw.multiline_textbbox((0, 0), "\n".join(lines), font=font, spacing=spacing, align="center")
-                if (bbox[2] - bbox[0]) <= max_width and (bbox[3] - bbox[1]) <= max_height:
-                    return font, lines, spacing
-            font = load_font(min_size)
-            lines = wrap_text(text, font, max_width)
-            return font, lines, max(8, min_size // 5)
-
-        title_font, wrapped_title, title_spacing = fit_multiline_font(title, content_width, 360, 110, 38)
-        title_text = "\n".join(wrapped_title)
-        title_bbox = draw.multiline_textbbox((0, 0), title_text, font=title_font, spacing=title_spacing, align="center")
-        title_height = title_bbox[3] - title_bbox[1]
-
-        date_text = self._format_event_datetime_text(start_time, end_time)
-        date_font, wrapped_date, date_spacing = fit_multiline_font(date_text, content_width, 140, 62, 24)
-        date_render = "\n".join(wrapped_date)
-        date_bbox = draw.multiline_textbbox((0, 0), date_render, font=date_font, spacing=date_spacing, align="center")
-        date_height = date_bbox[3] - date_bbox[1]
-
-        title_y = max(title_top, (height - title_height - date_height - 80) // 2)
-        date_y = min(height - 180 - date_height, title_y + title_height + 60)
-
-        draw.multiline_text((width // 2, title_y), title_text, font=title_font, fill=text_fill, anchor="ma", align="center", spacing=title_spacing)
-        draw.multiline_text((width // 2, date_y), date_render, font=date_font, fill=text_fill, anchor="ma", align="center", spacing=date_spacing)
-
-        out = io.BytesIO()
-        base.save(out, format="PNG")
-        out.seek(0)
-        return out.getvalue()
+        return await render_image(
+            render_event_cover_image,
+            title=title,
+            date_text=self._format_event_datetime_text(start_time, end_time),
+            background_path=background_path,
+        )
 
     def _event_update_cutoff(
         self,
@@ -781,14 +759,14 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
             logger.warning("Could not read events display state; will create a new message.", exc_info=True)
             return None
 
-    def _save_display_message_id(self) -> None:
+    async def _save_display_message_id(self) -> None:
         try:
             state = {
                 "channel_id": EVENT_DISPLAY_CHANNEL_ID,
                 "message_id": self.display_message_id,
                 "updated_at": datetime.utcnow().isoformat(),
             }
-            atomic_json_dump(EVENTS_DISPLAY_STATE_PATH, state, ensure_ascii=False)
+            await atomic_json_dump_async(EVENTS_DISPLAY_STATE_PATH, state, ensure_ascii=False)
         except Exception:
             logger.warning("Failed to persist events display state.", exc_info=True)
 
@@ -925,7 +903,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
                 # Save all events (not just filtered ones) to JSON
                 await self.save_events_to_json(events)
                 await self._sync_event_notifications(guild, events)
-                self._save_notification_state()
+                await self._save_notification_state()
 
                 # Edit existing display message if possible (persists across restarts)
                 message: Optional[discord.Message] = None
@@ -936,6 +914,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
                             lambda: channel.fetch_message(self.display_message_id),
                         )
                     except discord.NotFound:
+                        live_messages.forget(self.display_message_id)
                         message = None
                     except discord.Forbidden:
                         logger.warning("No permission to fetch the existing events message; will create a new one.")
@@ -946,11 +925,15 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
 
                 if message is not None:
                     try:
-                        await self._retry_discord_request(
+                        # live_messages skips the edit when the event list is unchanged
+                        sent = await self._retry_discord_request(
                             "editing the existing events display message",
-                            lambda: message.edit(embed=embed),
+                            lambda: live_messages.edit(message, embed=embed),
                         )
-                        logger.info(f"Refreshed events display ({reason}) with {len(sorted_events)} events")
+                        if sent:
+                            logger.info(f"Refreshed events display ({reason}) with {len(sorted_events)} events")
+                        else:
+                            logger.debug(f"Events display unchanged ({reason}); skipping edit")
                         return
                     except discord.Forbidden:
                         logger.warning("No permission to edit the existing events message; will create a new one.")
@@ -958,9 +941,12 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
                         logger.warning("Failed to edit the existing events message; will create a new one.", exc_info=True)
 
                 # Fallback: send a new message and persist its id
+                if self.display_message_id:
+                    live_messages.forget(self.display_message_id)
                 new_message = await channel.send(embed=embed)
+                live_messages.record(new_message, embed=embed)
                 self.display_message_id = new_message.id
-                self._save_display_message_id()
+                await self._save_display_message_id()
                 logger.info(f"Posted new events display ({reason}) with {len(sorted_events)} events")
 
             except Exception as e:
@@ -989,7 +975,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
                 [scheduled_event],
                 allow_new_events=True,
             )
-            self._save_notification_state()
+            await self._save_notification_state()
 
         self._debounced_refresh()
 
@@ -1001,7 +987,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
         state = self._notification_state.get("events", {}).get(str(scheduled_event.id))
         if isinstance(state, dict):
             state["deleted_at"] = datetime.utcnow().isoformat()
-            self._save_notification_state()
+            await self._save_notification_state()
 
         self._debounced_refresh()
 
@@ -1013,7 +999,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
 
         if after and after.guild is not None:
             await self._sync_event_notifications(after.guild, [after])
-            self._save_notification_state()
+            await self._save_notification_state()
 
         self._debounced_refresh()
 
@@ -1054,7 +1040,7 @@ class EventDisplayCog(commands.Cog, name="EventDisplayCog"):
                 existing_data[str(event.id)] = event_data
             
             # Save to file
-            atomic_json_dump(EVENTS_JSON_PATH, existing_data, ensure_ascii=False)
+            await atomic_json_dump_async(EVENTS_JSON_PATH, existing_data, ensure_ascii=False)
             
             logger.debug(f"Saved {len(events)} events to JSON")
             
@@ -4,24 +4,26 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from logging.handlers import RotatingFileHandler
 from typing import Any, Optional
 
+import aiohttp
 import discord
-import requests
 from bs4 import BeautifulSoup
 from discord import app_commands
 from discord.ext import commands, tasks
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from clan_t17_lookup import ClanT17Lookup, DEFAULT_RANK_ORDER
 from config import MAIN_GUILD_ID, data_log_path
 from data_paths import data_path
-from state_io import atomic_json_dump
+from state_io import flush_pending_async, mark_dirty
 
 GUILD_ID = MAIN_GUILD_ID
 POST_CHANNEL_ID = 1500946848779862218  # channel or thread for the leaderboard message
@@ -32,7 +34,13 @@ STATE_FILE = data_path("hellor_leaderboard_state.json")
 LOG_FILE = data_log_path("hellor_leaderboard.log")
 
 UPDATE_INTERVAL_SECONDS = 7 * 24 * 3600
-REQUEST_PACE_SECONDS = 4
+REQUEST_PACE_SECONDS = 1.0  # minimum gap between request starts to hellor.pro, shared by all workers
+FETCH_CONCURRENCY = 4
+FETCH_TIMEOUT_SECONDS = 10
+FETCH_RETRIES = 3
+FETCH_BACKOFF_SECONDS = 0.5
+FETCH_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+PARSE_WORKERS = 2
 SCORE_REFRESH_INTERVAL_SECONDS = 7 * 24 * 3600
 
 BASE_HELLOR_URL = "https://hellor.pro/player/{}"
@@ -52,19 +60,40 @@ def utc_now_iso() -> str:
     return utc_now().isoformat()
 
 
-def make_session(retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
-    session = requests.Session()
-    retry = Retry(
-        total=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=(429, 500, 502, 503, 504),
-        allowed_methods=frozenset(["GET"]),
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
-    session.headers.update(HEADERS)
-    return session
+def retry_after_seconds(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - utc_now()).total_seconds())
+
+
+class RequestPacer:
+    """Spaces request starts at least ``interval`` seconds apart across concurrent workers."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def wait(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_at = loop.time() + self.interval
+
+    def back_off(self, seconds: float) -> None:
+        self._next_at = max(self._next_at, asyncio.get_running_loop().time() + seconds)
 
 
 def extract_label_info_from_text(text: str, label: str) -> Optional[tuple[str, str]]:
@@ -118,17 +147,26 @@ def score_as_int(value: str) -> int:
 class HellorLeaderboard(commands.Cog, name="HellorLeaderboard"):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.session = make_session()
+        self._session: aiohttp.ClientSession | None = None
+        self._pacer = RequestPacer(REQUEST_PACE_SECONDS)
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._state: dict[str, Any] | None = None
         self._update_lock = asyncio.Lock()
         self._initial_posted = False
         self.logger = self._build_logger()
         self.lookup = ClanT17Lookup(logger=self.logger)
         self.leaderboard_message_id = self._load_leaderboard_message_id()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         if self.post_leaderboard.is_running():
             self.post_leaderboard.cancel()
-        self.session.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        await flush_pending_async(STATE_FILE)
 
     def _build_logger(self) -> logging.Logger:
         logger = logging.getLogger("HellorLeaderboard")
@@ -156,14 +194,14 @@ class HellorLeaderboard(commands.Cog, name="HellorLeaderboard"):
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
-    def _save_json_file(self, path: str, data: dict[str, Any]) -> None:
-        atomic_json_dump(path, data, sort_keys=True)
-
     def _load_state(self) -> dict[str, Any]:
-        return self._load_json_file(STATE_FILE)
+        if self._state is None:
+            self._state = self._load_json_file(STATE_FILE)
+        return self._state
 
     def _save_state(self, state: dict[str, Any]) -> None:
-        self._save_json_file(STATE_FILE, state)
+        self._state = state
+        mark_dirty(STATE_FILE, state, sort_keys=True)
 
     def _load_leaderboard_message_id(self) -> Optional[int]:
         state = self._load_state()
@@ -265,7 +303,7 @@ class HellorLeaderboard(commands.Cog, name="HellorLeaderboard"):
         cached_scores, updated_at = self._load_cached_member_scores()
 
         if force_refresh or not cached_scores or (self._cached_scores_stale(updated_at) and not allow_stale_cache):
-            member_scores = await self._fetch_member_scores(targets)
+            member_scores = await self._fetch_member_scores(targets, cached_scores)
             self._save_cached_member_scores(member_scores)
             self.logger.info(
                 "hellor_scores_refreshed guild_id=%s resolved_targets=%s parsed_profiles=%s",
@@ -288,46 +326,83 @@ class HellorLeaderboard(commands.Cog, name="HellorLeaderboard"):
     async def _fetch_single_member_score(
         self, member: discord.Member, t17_id: str, *, source: str, queries: list[str]
     ) -> dict[str, Any] | None:
-        self.logger.info(
-            "hellor_single_fetch_start member_id=%s display_name=%r t17_id=%s",
-            member.id,
-            member.display_name,
-            t17_id,
-        )
-        try:
-            html = await asyncio.to_thread(self._fetch_hellor_html, t17_id)
-            scores = parse_scores(html)
-        except Exception as exc:
-            self.logger.exception(
-                "hellor_single_fetch_failed member_id=%s display_name=%r t17_id=%s error=%s",
-                member.id,
-                member.display_name,
-                t17_id,
-                exc,
-            )
-            return None
-
-        result = {
+        cached_scores, _updated_at = self._load_cached_member_scores()
+        target = {
             "member_id": member.id,
             "display_name": member.display_name,
             "t17_id": t17_id,
             "source": source,
             "queries": queries,
-            "scores": scores,
         }
-        self.logger.info(
-            "hellor_single_fetch_result member_id=%s display_name=%r t17_id=%s scores=%s",
-            member.id,
-            member.display_name,
-            t17_id,
-            scores,
-        )
-        return result
-
-    def _fetch_hellor_html(self, t17_id: str) -> str:
-        response = self.session.get(BASE_HELLOR_URL.format(t17_id), timeout=10)
-        response.raise_for_status()
-        return response.text
+        return await self._fetch_target_score(target, self._cached_scores_by_t17(cached_scores).get(t17_id))
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=HEADERS,
+                timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT_SECONDS),
+                connector=aiohttp.TCPConnector(limit_per_host=FETCH_CONCURRENCY),
+            )
+        return self._session
+
+    async def _fetch_hellor_page(
+        self, t17_id: str, cached: dict[str, Any] | None = None
+    ) -> tuple[str | None, dict[str, str | None]]:
+        """Fetch a profile page, returning ``(None, validators)`` when hellor.pro answers 304."""
+
+        headers: dict[str, str] = {}
+        if cached and isinstance(cached.get("scores"), dict):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        url = BASE_HELLOR_URL.format(t17_id)
+        for attempt in range(FETCH_RETRIES + 1):
+            await self._pacer.wait()
+            backoff = FETCH_BACKOFF_SECONDS * 2**attempt
+            try:
+                async with self._get_session().get(url, headers=headers) as response:
+                    if response.status == 304 and headers:
+                        return None, {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+                    if response.status in FETCH_RETRY_STATUSES and attempt < FETCH_RETRIES:
+                        delay = retry_after_seconds(response.headers.get("Retry-After")) or backoff
+                        if response.status == 429:
+                            self._pacer.back_off(delay)
+                        self.logger.warning(
+                            "hellor_fetch_retry t17_id=%s status=%s attempt=%s delay=%.1f",
+                            t17_id,
+                            response.status,
+                            attempt + 1,
+                            delay,
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    response.raise_for_status()
+                    html = await response.text()
+                    return html, {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                    }
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= FETCH_RETRIES:
+                    raise
+                await asyncio.sleep(backoff)
+
+        raise RuntimeError(f"hellor.pro request for {t17_id} was not attempted")
+
+    async def _parse_scores(self, html: str) -> dict[str, dict[str, str]]:
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._parse_pool, parse_scores, html)
+        except BrokenProcessPool:
+            self.logger.warning("hellor_parse_pool_broken falling back to a worker thread")
+            self._parse_pool = None
+            return await asyncio.to_thread(parse_scores, html)
 
     async def _get_post_channel(self) -> Optional[discord.abc.Messageable]:
         channel = self.bot.get_channel(POST_CHANNEL_ID)
@@ -375,41 +450,97 @@ class HellorLeaderboard(commands.Cog, name="HellorLeaderboard"):
 
         return targets
 
-    async def _fetch_member_scores(self, targets: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        results: list[dict[str, Any]] = []
-
-        for index, target in enumerate(targets):
-            if index:
-                await asyncio.sleep(REQUEST_PACE_SECONDS)
+    def _cached_scores_by_t17(self, cached_scores: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        return {
+            item["t17_id"]: item
+            for item in cached_scores
+            if isinstance(item.get("t17_id"), str) and item["t17_id"]
+        }
 
-            self.logger.info(
-                "hellor_fetch_start member_id=%s display_name=%r t17_id=%s",
-                target["member_id"],
-                target["display_name"],
-                target["t17_id"],
-            )
-            try:
-                html = await asyncio.to_thread(self._fetch_hellor_html, target["t17_id"])
-                scores = parse_scores(html)
-            except Exception as exc:
-                self.logger.exception(
-                    "hellor_fetch_failed member_id=%s display_name=%r t17_id=%s error=%s",
+    async def _fetch_target_score(
+        self, target: dict[str, Any], cached: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        self.logger.info(
+            "hellor_fetch_start member_id=%s display_name=%r t17_id=%s",
+            target["member_id"],
+            target["display_name"],
+            target["t17_id"],
+        )
+        try:
+            html, validators = await self._fetch_hellor_page(target["t17_id"], cached)
+            if html is None:
+                self.logger.info(
+                    "hellor_not_modified member_id=%s display_name=%r t17_id=%s",
                     target["member_id"],
                     target["display_name"],
                     target["t17_id"],
-                    exc,
                 )
-                continue
-
-            self.logger.info(
-                "hellor_parse_result member_id=%s display_name=%r t17_id=%s scores=%s",
+                return {**target, "scores": cached["scores"], **validators}
+            scores = await self._parse_scores(html)
+        except Exception as exc:
+            self.logger.exception(
+                "hellor_fetch_failed member_id=%s display_name=%r t17_id=%s error=%s",
                 target["member_id"],
                 target["display_name"],
                 target["t17_id"],
-                scores,
+                exc,
             )
-            results.append({**target, "scores": scores})
+            return None
+
+        self.logger.info(
+            "hellor_parse_result member_id=%s display_name=%r t17_id=%s scores=%s",
+            target["member_id"],
+            target["display_name"],
+            target["t17_id"],
+            scores,
+        )
+        return {**target, "scores": scores, **validators}
+
+    async def _fetch_member_scores(
+        self, targets: list[dict[str, Any]], cached_scores: list[dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
+        """Fetch every target with bounded concurrency, caching each score as it arrives.
+
+        Members whose fetch fails keep their previously cached scores, so an
+        interrupted or partly failed refresh still moves the leaderboard forward.
+        """
+
+        cached_by_t17 = self._cached_scores_by_t17(cached_scores or [])
+        semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+        async def fetch(target: dict[str, Any]) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self._fetch_target_score(target, cached_by_t17.get(target["t17_id"]))
 
+        tasks = [asyncio.create_task(fetch(target)) for target in targets]
+        fetched: dict[Any, dict[str, Any]] = {}
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if result is None:
+                    continue
+                fetched[result["member_id"]] = result
+                self._upsert_cached_member_score(result)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        results: list[dict[str, Any]] = []
+        for target in targets:
+            result = fetched.get(target["member_id"])
+            if result is None:
+                cached = cached_by_t17.get(target["t17_id"])
+                if cached is None or not isinstance(cached.get("scores"), dict):
+                    continue
+                result = {**cached, **target}
+            results.append(result)
+
+        self.logger.info(
+            "hellor_fetch_summary targets=%s fetched=%s reused=%s",
+            len(targets),
+            len(fetched),
+            len(results) - len(fetched),
+        )
         return results
 
     def _build_leaderboard_embed(self, guild: discord.Guild, member_scores: list[dict[str, Any]]) -> discord.Embed:
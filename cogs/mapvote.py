@@ -7,12 +7,13 @@ import json
 import random
 import logging
 from dotenv import load_dotenv
-from state_io import atomic_json_dump
+from live_message import live_messages
+from state_io import flush_pending_async, mark_dirty, run_state_io
 from datetime import datetime, timezone, timedelta
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
-from hll_API_backend import HLLBackendError, get_hll_backend_client
+from hll_API_backend import HLLBackendError, LogCursor, get_hll_backend_client
 
 load_dotenv()
 
@@ -31,14 +32,23 @@ MAPVOTE_ADMIN_ROLE_ID = 1279832920479109160  # set this to your role ID
 # Vote ends this many seconds before match end
 VOTE_END_OFFSET_SECONDS = 120
 
-# Embed update speed
+# Embed update speed while a vote is open (the embed shows its countdown)
 EMBED_UPDATE_INTERVAL = 10
 
+# Slower tick cadences for phases where nothing on the embed is counting down.
+# A live match without an open vote only needs to notice the next match start,
+# which the cached gamestate cannot show any sooner than GAMESTATE_FETCH_INTERVAL.
+MATCH_TICK_INTERVAL = 30
+# Server offline or map vote disabled.
+IDLE_TICK_INTERVAL = 120
+
 # Bifrost allows guildGetGameState once every 30 seconds per server.
 GAMESTATE_FETCH_INTERVAL = 30
 
 # Match event audit-log checks can run much slower than the embed redraw loop.
 MATCH_LOG_CHECK_INTERVAL = 30
+# Log actions the map vote reacts to (case-insensitive substring match).
+MATCH_LOG_ACTIONS = ("Match Start", "Match Ended", "Match")
 
 # Bifrost advised spacing set-server-rotation and set-next-map apart.
 ROTATION_TO_NEXT_MAP_DELAY_SECONDS = 60
@@ -357,16 +367,13 @@ def load_persistent_state() -> dict:
         return {}
 
 
-def save_persistent_state(data: dict):
-    try:
-        atomic_json_dump(MAPVOTE_STATE_FILE, data, indent=4)
-    except Exception as e:
-        print("[MapVote] Failed to save state file:", e)
-
-
-async def fetch_gamestate():
+async def fetch_gamestate(*, fresh: bool = False):
     try:
-        data = await _get_mapvote_backend().get_mapvote_game_state()
+        backend = _get_mapvote_backend()
+        if fresh:
+            # Skip the backend's shared read cache so the caller sees live state.
+            backend.invalidate_cached_reads()
+        data = await backend.get_mapvote_game_state()
     except HLLBackendError as e:
         _set_last_gamestate_error(str(e))
         MAPVOTE_LOGGER.warning("Mapvote gamestate read failed: %s", e)
@@ -639,15 +646,8 @@ class MapVote(commands.Cog, name="[API] MapVote"):
         self.bot = bot
         self.state = VoteState()
 
-        # Persisted data
-        persisted = load_persistent_state()
-        self.saved_message_id: int | None = persisted.get("message_id")
-        self.saved_channel_id: int | None = persisted.get("channel_id")
-        self.mapvote_enabled: bool = persisted.get("mapvote_enabled", True)
-        self.last_processed_log_id: int | None = persisted.get("last_processed_log_id")
-        # If previously stored small incremental IDs, reset to None so we don't skip timestamp_ms logs
-        if self.last_processed_log_id and self.last_processed_log_id < 10_000_000_000:
-            self.last_processed_log_id = None
+        # Persisted data; read off the loop in cog_load
+        self._apply_persistent_state({})
 
         # Embed-only notices (replaces standalone Discord messages)
         self._embed_vote_notice: str | None = None
@@ -668,60 +668,81 @@ class MapVote(commands.Cog, name="[API] MapVote"):
         self._broadcast_start_scheduled_for_match_id: int | None = None
         self._broadcast_start_sent_for_match_id: int | None = None
         self._set_next_map_task: asyncio.Task | None = None
+        # ENDING_SOON broadcast + vote close, timed from state.vote_end_at
+        self._vote_deadline_task: asyncio.Task | None = None
+
+    async def cog_load(self):
+        self._apply_persistent_state(await run_state_io(load_persistent_state))
+
+    def _apply_persistent_state(self, persisted: dict) -> None:
+        self.saved_message_id: int | None = persisted.get("message_id")
+        self.saved_channel_id: int | None = persisted.get("channel_id")
+        self.mapvote_enabled: bool = persisted.get("mapvote_enabled", True)
+        self.last_processed_log_id: int | None = persisted.get("last_processed_log_id")
+        # If previously stored small incremental IDs, reset to None so we don't skip timestamp_ms logs
+        if self.last_processed_log_id and self.last_processed_log_id < 10_000_000_000:
+            self.last_processed_log_id = None
+        self._log_cursor: LogCursor | None = (
+            LogCursor(self.last_processed_log_id) if self.last_processed_log_id else None
+        )
 
     async def get_cached_gamestate(self, *, force: bool = False) -> dict | None:
         now_ts = asyncio.get_running_loop().time()
         if not force and (now_ts - self._last_gamestate_ts) < GAMESTATE_FETCH_INTERVAL:
             return self._last_gamestate
 
-        gs = await fetch_gamestate()
+        gs = await fetch_gamestate(fresh=force)
         self._last_gamestate = gs
         self._last_gamestate_ts = now_ts
         return gs
 
+    async def _poll_match_logs(self) -> list[dict] | None:
+        """Return match log entries added since the last poll and advance the cursor."""
+        try:
+            logs, cursor = await _get_mapvote_backend().get_logs_since(self._log_cursor, actions=MATCH_LOG_ACTIONS)
+        except HLLBackendError as e:
+            print(f"[MapVote] match log poll failed: {e}")
+            return None
+
+        self._log_cursor = cursor
+        if cursor.timestamp_ms and cursor.timestamp_ms != self.last_processed_log_id:
+            self.last_processed_log_id = cursor.timestamp_ms
+            self._save_state_file()
+        return logs
+
     async def _fast_forward_match_log_cursor(self):
-        """Advance last_processed_log_id to the newest match log entry.
+        """Advance the log cursor past everything the server currently holds.
 
         This prevents replaying a backlog of Match Start/Ended logs after the
         bot has been disabled/offline for a while.
         """
-        logs_data = await rcon_get_recent_logs(["Match Start", "Match Ended", "Match"], limit=1)
-        if not logs_data or logs_data.get("error") or logs_data.get("failed"):
-            return
-
-        logs = logs_data.get("result", {}).get("logs", []) or []
-        if not logs:
-            return
-
-        latest_id = 0
-        for log in logs:
-            log_id = log.get("timestamp_ms") or log.get("id") or 0
-            if isinstance(log_id, (int, float)) and log_id > latest_id:
-                latest_id = int(log_id)
-
-        if latest_id and (self.last_processed_log_id is None or latest_id > self.last_processed_log_id):
-            self.last_processed_log_id = latest_id
-            self._save_state_file()
+        await self._poll_match_logs()
 
     # ---------------- Persistence helpers ----------------
 
-    def _save_state_file(self):
-        data = {
+    def _state_file_snapshot(self) -> dict:
+        return {
             "message_id": self.saved_message_id,
             "channel_id": self.saved_channel_id,
             "mapvote_enabled": self.mapvote_enabled,
             "last_processed_log_id": self.last_processed_log_id,
         }
-        save_persistent_state(data)
+
+    def _save_state_file(self):
+        # Debounced: match-event processing can advance the log cursor many
+        # times per check, and only the latest snapshot needs to reach disk.
+        mark_dirty(MAPVOTE_STATE_FILE, self._state_file_snapshot, indent=4)
 
     # ---------------- Lifecycle ----------------
 
-    def cog_unload(self):
+    async def cog_unload(self):
         if self.tick_task.is_running():
             self.tick_task.cancel()
+        await flush_pending_async(MAPVOTE_STATE_FILE)
 
         self._cancel_task("_broadcast_start_task", extra_reset_attrs=["_broadcast_start_scheduled_for_match_id"])
         self._cancel_task("_set_next_map_task")
+        self._cancel_task("_vote_deadline_task")
 
     def _cancel_task(self, task_attr: str, *, extra_reset_attrs: list[str] | None = None):
         task = getattr(self, task_attr, None)
@@ -865,6 +886,51 @@ class MapVote(commands.Cog, name="[API] MapVote"):
         except Exception as e:
             print(f"[MapVote] set next map delayed task error: {e}")
 
+    def _ending_soon_threshold(self) -> float:
+        return float(BROADCAST_SCHEDULE.get("ENDING_SOON", {}).get("vote_remaining_seconds", 120) or 120)
+
+    async def _vote_deadlines(self, vote_end_at: datetime):
+        """Sleep until the ENDING_SOON warning and then the vote close for this vote."""
+        try:
+            warn_in = (vote_end_at - datetime.now(timezone.utc)).total_seconds() - self._ending_soon_threshold()
+            if warn_in > 0:
+                await asyncio.sleep(warn_in)
+            if self.state.active and self.state.vote_end_at == vote_end_at and not self.state.warning_sent:
+                self.state.warning_sent = True
+                await self.send_broadcast("ENDING_SOON")
+                self._embed_vote_notice = "⏳ Vote closes in 2 minutes!"
+                # Refresh immediately so the notice appears right away
+                await self.refresh_active_embed()
+
+            end_in = (vote_end_at - datetime.now(timezone.utc)).total_seconds()
+            if end_in > 0:
+                await asyncio.sleep(end_in)
+            if self.state.active and self.state.vote_end_at == vote_end_at:
+                gs = await self.get_cached_gamestate(force=False)
+                await self.end_vote_and_queue(gs)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            print(f"[MapVote] vote deadline task error: {e}")
+
+    def _schedule_vote_deadlines(self):
+        self._cancel_task("_vote_deadline_task")
+        if self.state.vote_end_at is None:
+            return
+        self._vote_deadline_task = asyncio.create_task(self._vote_deadlines(self.state.vote_end_at))
+
+    def _tick_interval(self, status: str) -> float:
+        if status in ("OFFLINE", "DISABLED"):
+            return IDLE_TICK_INTERVAL
+        if status == "ACTIVE" and self.state.active:
+            return EMBED_UPDATE_INTERVAL
+        return MATCH_TICK_INTERVAL
+
+    def _set_tick_interval(self, seconds: float):
+        # A shorter interval also cuts short the loop's current sleep.
+        if self.tick_task.seconds != seconds:
+            self.tick_task.change_interval(seconds=seconds)
+
     def _schedule_set_next_map(
         self,
         *,
@@ -982,6 +1048,7 @@ class MapVote(commands.Cog, name="[API] MapVote"):
 
         self.mapvote_enabled = True
         self._save_state_file()
+        self._set_tick_interval(MATCH_TICK_INTERVAL)
 
         gs = await fetch_gamestate()
         if gs:
@@ -1022,6 +1089,7 @@ class MapVote(commands.Cog, name="[API] MapVote"):
         
         self.mapvote_enabled = False
         self._cancel_task("_broadcast_start_task", extra_reset_attrs=["_broadcast_start_scheduled_for_match_id"])
+        self._cancel_task("_vote_deadline_task")
         self.state.active = False
         self.state.warning_sent = False
         self._save_state_file()
@@ -1196,12 +1264,22 @@ class MapVote(commands.Cog, name="[API] MapVote"):
                 print("[MapVote] Vote channel invalid")
                 return None
 
+            embed = self.build_embed(status, gs)
+
+            # Attach view only when voting is active
+            view = None
+            if status == "ACTIVE" and self.state.active and self.state.options:
+                if self.vote_view is None:
+                    self.vote_view = MapVoteView(self.state, self)
+                view = self.vote_view
+
             msg = None
             if self.saved_message_id:
                 try:
                     msg = await channel.fetch_message(self.saved_message_id)
                 except discord.NotFound:
                     # Truly gone, allow re-creation below
+                    live_messages.forget(self.saved_message_id)
                     msg = None
                 except discord.HTTPException as e:
                     # Transient API error — skip this tick to avoid reposting
@@ -1212,15 +1290,6 @@ class MapVote(commands.Cog, name="[API] MapVote"):
                     print("[MapVote] Failed to fetch existing mapvote message:", e)
                     return None
 
-            embed = self.build_embed(status, gs)
-
-            # Attach view only when voting is active
-            view = None
-            if status == "ACTIVE" and self.state.active and self.state.options:
-                if self.vote_view is None:
-                    self.vote_view = MapVoteView(self.state, self)
-                view = self.vote_view
-
             if msg is None:
                 # Creation cooldown: avoid rapid double-creates (e.g., overlapping ticks)
                 now_ts = asyncio.get_event_loop().time()
@@ -1233,6 +1302,7 @@ class MapVote(commands.Cog, name="[API] MapVote"):
                 except Exception as e:
                     print("[MapVote] Failed to send mapvote message:", e)
                     return None
+                live_messages.record(msg, embed=embed, view=view)
 
                 self.saved_message_id = msg.id
                 self.saved_channel_id = channel.id
@@ -1240,7 +1310,8 @@ class MapVote(commands.Cog, name="[API] MapVote"):
                 self._save_state_file()
             else:
                 try:
-                    await msg.edit(embed=embed, view=view)
+                    # No PATCH when nothing visible changed since the last edit
+                    await live_messages.edit(msg, embed=embed, view=view)
                 except discord.HTTPException as e:
                     # Skip on transient edit errors (do not repost)
                     print("[MapVote] Failed to edit mapvote message (HTTP):", e)
@@ -1291,6 +1362,8 @@ class MapVote(commands.Cog, name="[API] MapVote"):
 
         # Refresh embed into ACTIVE mode (with dropdown)
         await self.ensure_embed("ACTIVE", gs)
+        self._schedule_vote_deadlines()
+        self._set_tick_interval(EMBED_UPDATE_INTERVAL)
 
         print(f"[MapVote] Vote started for {gs['current_map_pretty']}")
         # Schedule the in-game broadcast for X minutes into the match.
@@ -1364,13 +1437,19 @@ class MapVote(commands.Cog, name="[API] MapVote"):
         await self.refresh_status_embed()
 
     # --------------------------------------------------
-    # Background loop — updates every second
+    # Background loop — cadence follows the match phase
     # --------------------------------------------------
     @tasks.loop(seconds=EMBED_UPDATE_INTERVAL)
     async def tick_task(self):
         gs = await self.get_cached_gamestate(force=False)
         status = classify_status(gs, self.mapvote_enabled)
+        try:
+            await self._tick(status, gs)
+        finally:
+            self._set_tick_interval(self._tick_interval(status))
 
+    async def _tick(self, status: str, gs: dict | None):
+        """Redraw the embed and react to the status classified for this tick."""
         # Status-based behaviour
         if status == "OFFLINE":
             await self.ensure_embed("OFFLINE", None)
@@ -1407,54 +1486,21 @@ class MapVote(commands.Cog, name="[API] MapVote"):
             self._last_match_log_check_ts = now_ts
             await self.check_match_events(gs)
 
-        # Update embed
+        # Update embed; the ENDING_SOON warning and vote close run from _vote_deadlines
         await self.ensure_embed("ACTIVE", gs)
 
-        # If a vote is active, handle countdown / end
-        if self.state.active and self.state.vote_end_at:
-            now = datetime.now(timezone.utc)
-            remaining = (self.state.vote_end_at - now).total_seconds()
-
-            if remaining <= 0:
-                await self.end_vote_and_queue(gs)
-                return
-
-            # 2-minute warning
-            warn_threshold = float(BROADCAST_SCHEDULE.get("ENDING_SOON", {}).get("vote_remaining_seconds", 120) or 120)
-            if remaining <= warn_threshold and not self.state.warning_sent:
-                self.state.warning_sent = True
-                await self.send_broadcast("ENDING_SOON")
-                self._embed_vote_notice = "⏳ Vote closes in 2 minutes!"
-
-                # Force an immediate embed refresh so the notice appears right away
-                await self.ensure_embed("ACTIVE", gs)
-
     async def check_match_events(self, gs: dict):
         """Check audit logs for match start/end events."""
-        logs_data = await rcon_get_recent_logs(["Match Start", "Match Ended", "Match"], limit=100)
-        if not logs_data or logs_data.get("error") or logs_data.get("failed"):
-            return
-
-        logs = logs_data.get("result", {}).get("logs", [])
+        logs = await self._poll_match_logs()
         if not logs:
             return
 
-        # Use timestamp_ms as stable ordering/identifier
-        logs.sort(key=lambda x: x.get("timestamp_ms", 0))
-
+        # Only entries newer than the cursor arrive here, oldest first
         for log in logs:
             # Fallback to timestamp_ms when 'id' is not present
             log_id = log.get("timestamp_ms") or log.get("id") or 0
             action = (log.get("action") or "").strip().upper()
 
-            # Skip already processed logs
-            if self.last_processed_log_id and log_id <= self.last_processed_log_id:
-                continue
-
-            # Update last processed ID first to avoid double-processing
-            self.last_processed_log_id = log_id
-            self._save_state_file()
-
             # Normalize actions: API returns "MATCH START"/"MATCH ENDED" (sometimes "MATCH")
             if "MATCH START" in action or action == "MATCH":
                 if not self.state.active and self.mapvote_enabled and gs:
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import html
 import io
 import json
@@ -10,7 +11,8 @@ from typing import Optional
 
 import discord
 from discord.ext import commands
-from state_io import atomic_json_dump
+from live_message import live_messages
+from state_io import atomic_json_dump_async
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
@@ -33,6 +35,10 @@ BEHIND_AFTER_DAYS = 14
 # Set to 0 to disable.
 BACKSTOP_REFRESH_HOURS = 24
 
+# Reuse the last HTML upload while the trainee rows are unchanged, but no longer
+# than this: Discord attachment links are signed and expire.
+HTML_REUSE_MAX_HOURS = 12
+
 # Where we store message IDs + last HTML link so we can edit across restarts
 STATE_PATH = data_path("multi_trainee_tracker_state.json")
 
@@ -131,10 +137,10 @@ class MultiTraineeTracker(commands.Cog):
             logger.warning("Failed to load multi trainee tracker state; starting fresh.", exc_info=True)
             return {"version": 1, "tracks": {}}
 
-    def _save_state(self) -> None:
+    async def _save_state(self) -> None:
         try:
             self._state["updated_at"] = datetime.utcnow().isoformat()
-            atomic_json_dump(STATE_PATH, self._state, ensure_ascii=False)
+            await atomic_json_dump_async(STATE_PATH, self._state, ensure_ascii=False)
         except Exception:
             logger.warning("Failed to save multi trainee tracker state.", exc_info=True)
 
@@ -146,6 +152,8 @@ class MultiTraineeTracker(commands.Cog):
         state.setdefault("html_message_id", None)
         state.setdefault("html_channel_id", None)
         state.setdefault("html_url", None)
+        state.setdefault("html_rows_digest", None)
+        state.setdefault("html_posted_at", None)
         return state
 
     async def _get_text_channel(self, channel_id: int) -> Optional[discord.TextChannel]:
@@ -237,7 +245,7 @@ class MultiTraineeTracker(commands.Cog):
                 except Exception:
                     logger.exception("Failed refreshing track %s", cfg.key)
 
-            self._save_state()
+            await self._save_state()
 
     async def _refresh_track(self, guild: discord.Guild, cfg: TrackConfig, *, reason: str) -> None:
         embed_channel = await self._get_text_channel(cfg.channel_id)
@@ -283,8 +291,31 @@ class MultiTraineeTracker(commands.Cog):
         rows.sort(key=lambda r: r["join_date"])
         return rows
 
+    @staticmethod
+    def _rows_digest(rows: list[dict]) -> str:
+        payload = [
+            [r["member_id"], r["display_name"], r["username"], r["join_date"].isoformat(), sorted(r["checks"].items())]
+            for r in rows
+        ]
+        return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _html_is_reusable(state: dict, channel_id: int, digest: str) -> bool:
+        if not state.get("html_url") or state.get("html_rows_digest") != digest:
+            return False
+        if state.get("html_channel_id") != channel_id:
+            return False
+        try:
+            posted_at = datetime.fromisoformat(str(state.get("html_posted_at")))
+        except ValueError:
+            return False
+        return datetime.utcnow() - posted_at < timedelta(hours=HTML_REUSE_MAX_HOURS)
+
     async def _post_html(self, channel: discord.TextChannel | discord.Thread, cfg: TrackConfig, rows: list[dict]) -> Optional[str]:
         state = self._track_state(cfg.key)
+        digest = self._rows_digest(rows)
+        if self._html_is_reusable(state, channel.id, digest):
+            return state["html_url"]
 
         # Delete previous HTML message to keep the channel clean (attachments can't be edited reliably).
         old_html_message_id = state.get("html_message_id")
@@ -315,6 +346,8 @@ class MultiTraineeTracker(commands.Cog):
         state["html_message_id"] = msg.id
         state["html_channel_id"] = channel.id
         state["html_url"] = msg.attachments[0].url if msg.attachments else None
+        state["html_rows_digest"] = digest
+        state["html_posted_at"] = datetime.utcnow().isoformat()
         return state["html_url"]
 
     async def _post_embed(self, channel: discord.TextChannel, cfg: TrackConfig, rows: list[dict], html_url: Optional[str], *, reason: str) -> None:
@@ -425,10 +458,14 @@ class MultiTraineeTracker(commands.Cog):
         if isinstance(existing_channel_id, int) and existing_channel_id != channel.id:
             existing_id = None
 
+        # The footer names the refresh reason and the timestamp is "now"; neither is a change.
+        volatile = ("footer", "timestamp")
         if isinstance(existing_id, int):
             try:
+                # Fetched every time so a deleted embed is reposted; the edit itself
+                # is skipped when nothing but the volatile keys changed.
                 msg = await channel.fetch_message(existing_id)
-                await msg.edit(embed=embed)
+                await live_messages.edit(msg, embed=embed, volatile=volatile)
                 return
             except discord.NotFound:
                 pass
@@ -436,8 +473,10 @@ class MultiTraineeTracker(commands.Cog):
                 logger.warning("Track %s: missing permission to edit embed message", cfg.key)
             except Exception:
                 logger.warning("Track %s: failed to edit embed message", cfg.key, exc_info=True)
+            live_messages.forget(existing_id)
 
         msg = await channel.send(embed=embed)
+        live_messages.record(msg, embed=embed, volatile=volatile)
         state["embed_message_id"] = msg.id
         state["embed_channel_id"] = channel.id
 
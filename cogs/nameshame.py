@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 
 import discord
 from discord.ext import commands
-from state_io import atomic_json_dump
+from state_io import flush_pending_async, mark_dirty, run_state_io
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
@@ -85,10 +85,8 @@ def _load_state() -> dict:
 
 
 def _save_state(state: dict) -> None:
-	try:
-		atomic_json_dump(NAMESHAME_STATE_FILE, state)
-	except Exception as e:
-		print(f"[NameShame] Failed to save state: {e}")
+	# Written by the state_io write-behind flusher on its I/O thread.
+	mark_dirty(NAMESHAME_STATE_FILE, state)
 
 
 def _reason_options(selected_reason: str | None) -> list[discord.SelectOption]:
@@ -575,15 +573,25 @@ class NameShame(commands.Cog):
 		self.bot = bot
 		self._lock = asyncio.Lock()
 
-		self.state = _load_state()
-		self.main_message_id: int | None = self.state.get("message_id")
-		self.main_channel_id: int | None = NAMESHAME_MAIN_CHANNEL_ID or self.state.get("channel_id")
-		self.approval_channel_id: int | None = NAMESHAME_APPROVAL_CHANNEL_ID or self.state.get("approval_channel_id")
+		# Loaded off the event loop in cog_load.
+		self.state: dict = {}
+		self.main_message_id: int | None = None
+		self.main_channel_id: int | None = NAMESHAME_MAIN_CHANNEL_ID or None
+		self.approval_channel_id: int | None = NAMESHAME_APPROVAL_CHANNEL_ID or None
+
+	async def cog_load(self) -> None:
+		self.state = await run_state_io(_load_state)
+		self.main_message_id = self.state.get("message_id")
+		self.main_channel_id = NAMESHAME_MAIN_CHANNEL_ID or self.state.get("channel_id")
+		self.approval_channel_id = NAMESHAME_APPROVAL_CHANNEL_ID or self.state.get("approval_channel_id")
 
 		# Ensure defaults exist
 		_get_reports_root(self.state)
 		_save_state(self.state)
 
+	async def cog_unload(self) -> None:
+		await flush_pending_async(NAMESHAME_STATE_FILE)
+
 	# ----------------- helpers -----------------
 
 	async def is_approver(self, interaction: discord.Interaction) -> bool:
@@ -1,16 +1,18 @@
+import functools
 import json
 import os
 import uuid
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, time as dt_time, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 import discord
 from discord import app_commands
 from discord.ext import commands, tasks
-from state_io import atomic_json_dump
+from state_io import flush_pending_async, mark_dirty, run_state_io
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
+from deadline_scheduler import DeadlineScheduler
 
 GUILD_ID = MAIN_GUILD_ID
 
@@ -31,6 +33,8 @@ OFFLINE_REPLY_DELAY = timedelta(hours=6)
 MAX_SHORT_LOA_DURATION = timedelta(hours=10)
 MIN_FORM_LOA_DURATION = timedelta(hours=10)
 LOA_CHANNEL_ID = 1099608133267095612
+# Safety-net sweep; bounds how long a missed or failed transition leaves roles wrong.
+RECONCILE_INTERVAL = timedelta(minutes=10)
 
 LOCAL_TZ = ZoneInfo(TIMEZONE_NAME)
 DEFAULT_WEEKDAYS = [0, 1, 2, 3, 4, 5, 6]
@@ -153,13 +157,19 @@ def _can_manage_out_of_office(interaction: discord.Interaction) -> bool:
 class OutOfOffice(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.state = self._load_state()
+        self.state: dict = {"version": 1, "users": {}, "preferences": {}}
         self.dm_sessions: dict[int, dict] = {}
         self.reply_cooldowns: dict[str, str] = {}
+        self._transitions = DeadlineScheduler("OutOfOffice")
+
+    async def cog_load(self) -> None:
+        self.state = await run_state_io(self._load_state)
         self.reconcile_roles.start()
 
-    def cog_unload(self) -> None:
+    async def cog_unload(self) -> None:
         self.reconcile_roles.cancel()
+        await self._transitions.close()
+        await flush_pending_async(STATE_FILE)
 
     def _load_state(self) -> dict:
         try:
@@ -178,7 +188,7 @@ class OutOfOffice(commands.Cog):
 
     def _save_state(self) -> None:
         self.state["updated_at"] = utc_now().isoformat()
-        atomic_json_dump(STATE_FILE, self.state, ensure_ascii=False)
+        mark_dirty(STATE_FILE, self.state, ensure_ascii=False)
 
     def _user_entries(self, user_id: int) -> list[dict]:
         return self.state.setdefault("users", {}).setdefault(str(user_id), [])
@@ -311,6 +321,51 @@ class OutOfOffice(commands.Cog):
 
         return active
 
+    def _next_transition(self, user_id: int) -> datetime | None:
+        """The next time one of the user's schedules starts or ends, in UTC."""
+        now_utc = utc_now()
+        today_local = now_utc.astimezone(LOCAL_TZ).date()
+        upcoming: list[datetime] = []
+
+        for entry in self.state.get("users", {}).get(str(user_id), []):
+            if not entry.get("enabled", True):
+                continue
+
+            if entry["kind"] == "one_off":
+                upcoming.extend((parse_iso_utc(entry["start_at"]), parse_iso_utc(entry["end_at"])))
+                continue
+
+            weekdays = self._entry_weekdays(entry)
+            duration = self._entry_duration(entry)
+            for offset in range(-1, 8):
+                day = today_local + timedelta(days=offset)
+                if day.weekday() not in weekdays:
+                    continue
+                start_local = datetime.combine(
+                    day, dt_time(entry["start_hour"], entry["start_minute"]), tzinfo=LOCAL_TZ
+                )
+                upcoming.append(start_local.astimezone(timezone.utc))
+                upcoming.append((start_local + duration).astimezone(timezone.utc))
+
+        future = [moment for moment in upcoming if moment > now_utc]
+        return min(future) if future else None
+
+    def _schedule_transition(self, user_id: int) -> None:
+        next_transition = self._next_transition(user_id)
+        if next_transition is None:
+            self._transitions.cancel(user_id)
+            return
+        self._transitions.schedule(
+            user_id, next_transition.timestamp(), functools.partial(self._run_transition, user_id)
+        )
+
+    async def _run_transition(self, user_id: int) -> None:
+        guild = self.bot.get_guild(GUILD_ID)
+        if guild is None:
+            return
+        self._prune_expired_one_offs()
+        await self._sync_member_roles(guild, user_id)
+
     def _role_for_active_entries(self, entries: list[dict]) -> int | None:
         if not entries:
             return None
@@ -437,6 +492,7 @@ class OutOfOffice(commands.Cog):
             return None
 
     async def _sync_member_roles(self, guild: discord.Guild, user_id: int) -> None:
+        self._schedule_transition(user_id)
         member = await self._get_member(guild, user_id)
         if member is None or member.bot:
             return
@@ -709,7 +765,10 @@ class OutOfOffice(commands.Cog):
                 f"Saved LOA schedule `{entry['id']}`."
             )
 
-    @tasks.loop(minutes=1)
+    # Schedule starts and ends are applied by the per-user transition deadlines;
+    # this sweep repairs roles changed by hand or left behind by a missed or
+    # failed transition, and (re)arms those deadlines.
+    @tasks.loop(seconds=RECONCILE_INTERVAL.total_seconds())
     async def reconcile_roles(self) -> None:
         guild = self.bot.get_guild(GUILD_ID)
         if guild is None:
@@ -4,6 +4,7 @@ import json
 import logging
 import random
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -11,12 +12,14 @@ from typing import Optional
 import aiohttp
 import discord
 from discord import app_commands
-from PIL import Image, ImageDraw, ImageFont, ImageOps
+from PIL import Image, ImageDraw, ImageOps
 from discord.ext import commands
 
 from config.common import CERTIFICATE_BOLD_FONT_PATH, CERTIFICATE_REGULAR_FONT_PATH, MAIN_GUILD_ID
 from data_paths import data_path
-from state_io import atomic_json_dump
+from image_render import RENDER_WORKERS, Font, fitted_background, load_font, register_warmup, render as render_image, start_render_workers, unregister_warmup
+from state_io import atomic_json_dump, atomic_json_dump_async, run_state_io
+from text_layout import fit_font, glyph_width
 
 # ================== CONFIG ==================
 
@@ -33,9 +36,121 @@ TARGET_GUILD = discord.Object(id=MAIN_GUILD_ID)
 LEAVE_MESSAGE = "**{display} ({name})** has just left the server, fuck em"
 
 MAP_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp", ".avif"}
+# Map images picked once (kept in the welcome state across restarts and
+# reloads) and pre-fitted in every render worker; cards draw from these.
+WELCOME_BACKGROUND_POOL_SIZE = 8
+AVATAR_CACHE_SIZE = 128
+AVATAR_FETCH_TIMEOUT_SECONDS = 20
+# Cards render at most this many at a time; the rest of a join burst waits its turn.
+WELCOME_RENDER_CONCURRENCY = RENDER_WORKERS
 WELCOME_TARGET_RE = re.compile(r"<@(?!&!?)(!?)(\d+)>")
 
 
+def _tracked_text_width(text: str, font: Font, tracking: int) -> int:
+    width = 0
+    for index, char in enumerate(text):
+        width += glyph_width(font, char)
+        if index < len(text) - 1:
+            width += tracking
+    return width
+
+
+def _draw_centered_tracked_text(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    y: int,
+    font: Font,
+    fill: tuple[int, int, int, int],
+    tracking: int,
+) -> None:
+    x = (WELCOME_IMAGE_SIZE[0] - _tracked_text_width(text, font, tracking)) / 2
+    for char in text:
+        draw.text((x, y), char, font=font, fill=fill)
+        x += glyph_width(font, char) + tracking
+
+
+def _build_fallback_background() -> Image.Image:
+    background = Image.new("RGBA", WELCOME_IMAGE_SIZE, (8, 12, 20, 255))
+    gradient = Image.new("RGBA", WELCOME_IMAGE_SIZE, (0, 0, 0, 0))
+    gradient_draw = ImageDraw.Draw(gradient)
+    for index in range(WELCOME_IMAGE_SIZE[1]):
+        alpha = int(190 * (index / WELCOME_IMAGE_SIZE[1]))
+        gradient_draw.line((0, index, WELCOME_IMAGE_SIZE[0], index), fill=(0, 0, 0, alpha))
+    background.alpha_composite(gradient)
+    return background
+
+
+def _render_avatar(avatar_bytes: bytes, diameter: int) -> Image.Image:
+    with Image.open(io.BytesIO(avatar_bytes)).convert("RGBA") as avatar_src:
+        avatar = ImageOps.fit(avatar_src, (diameter, diameter), Image.Resampling.LANCZOS)
+    mask = Image.new("L", (diameter, diameter), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, diameter - 1, diameter - 1), fill=255)
+    avatar.putalpha(mask)
+    return avatar
+
+
+def _load_background_image(background_paths: tuple[str, ...]) -> Image.Image:
+    for image_path in background_paths:
+        try:
+            return fitted_background(image_path, WELCOME_IMAGE_SIZE)
+        except Exception:
+            logger.warning("Failed to load welcome background image %s", image_path, exc_info=True)
+
+    logger.warning("No usable welcome background images found in %s; using fallback background.", MAP_IMAGES_DIR)
+    return _build_fallback_background()
+
+
+def preload_welcome_backgrounds(background_paths: tuple[str, ...]) -> None:
+    """Fit the background pool into a render worker's cache ahead of the first join."""
+
+    for image_path in background_paths:
+        try:
+            fitted_background(image_path, WELCOME_IMAGE_SIZE)
+        except Exception:
+            logger.warning("Failed to preload welcome background image %s", image_path, exc_info=True)
+
+
+def render_welcome_card(
+    *,
+    avatar_bytes: bytes,
+    background_paths: tuple[str, ...],
+    display_name: str,
+    detail_line: str,
+    member_text: str,
+) -> bytes:
+    """Render the welcome card as PNG bytes; runs in the shared render pool.
+
+    ``background_paths`` are tried in order and the first that loads is used.
+    """
+
+    background = _load_background_image(background_paths)
+
+    overlay = Image.new("RGBA", WELCOME_IMAGE_SIZE, (0, 0, 0, 0))
+    overlay_draw = ImageDraw.Draw(overlay)
+    overlay_draw.rectangle((0, 58, 1200, 616), fill=(5, 8, 14, 146))
+    background.alpha_composite(overlay)
+
+    draw = ImageDraw.Draw(background)
+    title_font = fit_font(CERTIFICATE_BOLD_FONT_PATH, "WELCOME TO 7DR!", 840, 74, 48)
+    name_font = fit_font(CERTIFICATE_BOLD_FONT_PATH, display_name, 790, 58, 34)
+    subtitle_font = fit_font(CERTIFICATE_REGULAR_FONT_PATH, detail_line, 820, 34, 22)
+    member_font = load_font(CERTIFICATE_REGULAR_FONT_PATH, 28)
+
+    avatar = _render_avatar(avatar_bytes, 220)
+    avatar_x = (WELCOME_IMAGE_SIZE[0] - avatar.width) // 2
+    avatar_y = 187
+    background.alpha_composite(avatar, (avatar_x, avatar_y))
+
+    _draw_centered_tracked_text(draw, "WELCOME TO 7DR!", 62, title_font, (248, 243, 233, 255), 4)
+    _draw_centered_tracked_text(draw, display_name, 450, name_font, (248, 243, 233, 255), 3)
+    _draw_centered_tracked_text(draw, detail_line.upper(), 519, subtitle_font, (205, 213, 225, 255), 2)
+    _draw_centered_tracked_text(draw, member_text.upper(), 566, member_font, (248, 243, 233, 255), 1)
+
+    output = io.BytesIO()
+    background.save(output, format="PNG")
+    return output.getvalue()
+
+
 class WelcomeWaveView(discord.ui.View):
     def __init__(self, cog: "QuickExit"):
         super().__init__(timeout=None)
@@ -57,14 +172,35 @@ class QuickExit(commands.Cog):
         self._pending_member_ids: set[int] = set()
         self._backfill_complete = False
         self._last_wave_sticker_id_by_guild: dict[int, int] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._avatar_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._background_pool: tuple[str, ...] = ()
+        self._preload_task: Optional[asyncio.Task] = None
+        self._render_slots = asyncio.Semaphore(WELCOME_RENDER_CONCURRENCY)
         self._wave_view = WelcomeWaveView(self)
         self.bot.add_view(self._wave_view)
-        self._load_state()
 
-    def cog_unload(self) -> None:
+    async def cog_load(self) -> None:
+        await run_state_io(self._load_state)
+        background_pool = await run_state_io(self._pick_background_pool)
+        if background_pool != self._background_pool:
+            self._background_pool = background_pool
+            async with self._state_lock:
+                await self._write_state_locked()
+        if self._background_pool:
+            # Each render worker fits the pool into its own cache as it starts.
+            register_warmup(preload_welcome_backgrounds, background_paths=self._background_pool)
+            self._preload_task = asyncio.create_task(self._preload_backgrounds())
+
+    async def cog_unload(self) -> None:
         for task in self._welcome_tasks.values():
             if not task.done():
                 task.cancel()
+        if self._preload_task and not self._preload_task.done():
+            self._preload_task.cancel()
+        unregister_warmup(preload_welcome_backgrounds)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
 
     def _load_state(self) -> None:
         default_state = {
@@ -103,33 +239,37 @@ class QuickExit(commands.Cog):
             for member_id in state.get("pending_member_ids", [])
             if str(member_id).isdigit()
         }
+        self._background_pool = tuple(
+            str(path) for path in state.get("background_pool", []) if isinstance(path, str)
+        )
 
-    def _write_state_locked(self) -> None:
+    async def _write_state_locked(self) -> None:
         state = {
             "feature_started_at": self._feature_started_at.isoformat(),
             "welcomed_member_ids": sorted(self._welcomed_member_ids),
             "pending_member_ids": sorted(self._pending_member_ids),
+            "background_pool": list(self._background_pool),
         }
-        atomic_json_dump(WELCOME_STATE_PATH, state)
+        await atomic_json_dump_async(WELCOME_STATE_PATH, state)
 
     async def _queue_welcome(self, member_id: int) -> None:
         async with self._state_lock:
             if member_id in self._welcomed_member_ids:
                 return
             self._pending_member_ids.add(member_id)
-            self._write_state_locked()
+            await self._write_state_locked()
 
     async def _mark_welcomed(self, member_id: int) -> None:
         async with self._state_lock:
             self._pending_member_ids.discard(member_id)
             self._welcomed_member_ids.add(member_id)
-            self._write_state_locked()
+            await self._write_state_locked()
 
     async def _forget_member(self, member_id: int) -> None:
         async with self._state_lock:
             self._pending_member_ids.discard(member_id)
             self._welcomed_member_ids.discard(member_id)
-            self._write_state_locked()
+            await self._write_state_locked()
 
     def _cancel_welcome_task(self, member_id: int) -> None:
         task = self._welcome_tasks.pop(member_id, None)
@@ -140,56 +280,28 @@ class QuickExit(commands.Cog):
         self._cancel_welcome_task(member_id)
         self._welcome_tasks[member_id] = asyncio.create_task(self._deliver_welcome(member_id))
 
-    async def _fetch_bytes(self, url: str) -> bytes:
-        timeout = aiohttp.ClientTimeout(total=20)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                return await response.read()
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=AVATAR_FETCH_TIMEOUT_SECONDS))
+        return self._session
 
-    def _load_font(self, path: str, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        try:
-            return ImageFont.truetype(path, size=size)
-        except OSError:
-            return ImageFont.load_default()
-
-    def _fit_text(self, draw: ImageDraw.ImageDraw, text: str, font_path: str, max_width: int, start_size: int, min_size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
-        for size in range(start_size, min_size - 1, -2):
-            font = self._load_font(font_path, size)
-            bbox = draw.textbbox((0, 0), text, font=font)
-            if bbox[2] - bbox[0] <= max_width:
-                return font
-        return self._load_font(font_path, min_size)
-
-    def _tracked_text_width(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
-        tracking: int,
-    ) -> int:
-        width = 0
-        for index, char in enumerate(text):
-            bbox = draw.textbbox((0, 0), char, font=font)
-            width += bbox[2] - bbox[0]
-            if index < len(text) - 1:
-                width += tracking
-        return width
-
-    def _draw_centered_tracked_text(
-        self,
-        draw: ImageDraw.ImageDraw,
-        text: str,
-        y: int,
-        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
-        fill: tuple[int, int, int, int],
-        tracking: int,
-    ) -> None:
-        x = (WELCOME_IMAGE_SIZE[0] - self._tracked_text_width(draw, text, font, tracking)) / 2
-        for char in text:
-            draw.text((x, y), char, font=font, fill=fill)
-            bbox = draw.textbbox((0, 0), char, font=font)
-            x += (bbox[2] - bbox[0]) + tracking
+    async def _fetch_bytes(self, url: str) -> bytes:
+        async with self._get_session().get(url) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _fetch_avatar(self, member: discord.Member) -> bytes:
+        avatar = member.display_avatar
+        cached = self._avatar_cache.get(avatar.key)
+        if cached is not None:
+            self._avatar_cache.move_to_end(avatar.key)
+            return cached
+
+        avatar_bytes = await self._fetch_bytes(avatar.replace(format="png", size=256).url)
+        self._avatar_cache[avatar.key] = avatar_bytes
+        while len(self._avatar_cache) > AVATAR_CACHE_SIZE:
+            self._avatar_cache.popitem(last=False)
+        return avatar_bytes
 
     async def _resolve_member(self, member_id: int) -> Optional[discord.Member]:
         guild = self.bot.get_guild(MAIN_GUILD_ID)
@@ -271,80 +383,49 @@ class QuickExit(commands.Cog):
 
         await interaction.response.send_message("Wave sent.", ephemeral=True)
 
-    def _build_fallback_background(self) -> Image.Image:
-        background = Image.new("RGBA", WELCOME_IMAGE_SIZE, (8, 12, 20, 255))
-        gradient = Image.new("RGBA", WELCOME_IMAGE_SIZE, (0, 0, 0, 0))
-        gradient_draw = ImageDraw.Draw(gradient)
-        for index in range(WELCOME_IMAGE_SIZE[1]):
-            alpha = int(190 * (index / WELCOME_IMAGE_SIZE[1]))
-            gradient_draw.line((0, index, WELCOME_IMAGE_SIZE[0], index), fill=(0, 0, 0, alpha))
-        background.alpha_composite(gradient)
-        return background
-
-    def _render_avatar(self, avatar_bytes: bytes, diameter: int) -> Image.Image:
-        with Image.open(io.BytesIO(avatar_bytes)).convert("RGBA") as avatar_src:
-            avatar = ImageOps.fit(avatar_src, (diameter, diameter), Image.Resampling.LANCZOS)
-        mask = Image.new("L", (diameter, diameter), 0)
-        ImageDraw.Draw(mask).ellipse((0, 0, diameter - 1, diameter - 1), fill=255)
-        avatar.putalpha(mask)
-        return avatar
-
-    async def _load_background_image(self) -> tuple[Image.Image, str]:
-        map_paths = [
-            path for path in MAP_IMAGES_DIR.iterdir()
-            if path.is_file() and path.suffix.lower() in MAP_IMAGE_SUFFIXES
-        ]
-        random.shuffle(map_paths)
-
-        for image_path in map_paths:
-            try:
-                with Image.open(image_path).convert("RGBA") as background_src:
-                    background = ImageOps.fit(background_src, WELCOME_IMAGE_SIZE, Image.Resampling.LANCZOS)
-                return background, image_path.stem
-            except Exception:
-                logger.warning("Failed to load welcome background image %s", image_path, exc_info=True)
+    def _pick_background_pool(self) -> tuple[str, ...]:
+        try:
+            map_paths = [
+                str(path) for path in MAP_IMAGES_DIR.iterdir()
+                if path.is_file() and path.suffix.lower() in MAP_IMAGE_SUFFIXES
+            ]
+        except OSError:
+            logger.warning("Failed to list welcome background images in %s", MAP_IMAGES_DIR, exc_info=True)
+            return ()
+        pool_size = min(WELCOME_BACKGROUND_POOL_SIZE, len(map_paths))
+        # Keep the saved pool while every image in it still exists, so a
+        # reload warms the same images instead of a fresh sample.
+        if len(self._background_pool) == pool_size and set(self._background_pool) <= set(map_paths):
+            return self._background_pool
+        return tuple(random.sample(map_paths, pool_size))
+
+    async def _preload_backgrounds(self) -> None:
+        try:
+            await start_render_workers()
+        except Exception:
+            logger.warning("Failed to start render workers for welcome backgrounds", exc_info=True)
 
-        logger.warning("No usable welcome background images found in %s; using fallback background.", MAP_IMAGES_DIR)
-        return self._build_fallback_background(), "7DR Welcome"
+    def _background_candidates(self) -> tuple[str, ...]:
+        return tuple(random.sample(self._background_pool, len(self._background_pool)))
 
     async def _build_welcome_image(self, member: discord.Member, display_name: str, detail_line: str) -> discord.File:
-        avatar_url = member.display_avatar.replace(format="png", size=256).url
-
         try:
-            avatar_bytes = await self._fetch_bytes(avatar_url)
+            avatar_bytes = await self._fetch_avatar(member)
         except Exception:
             logger.warning("Failed to fetch quick-exit welcome avatar for %s (%s)", member, member.id, exc_info=True)
             raise
 
-        background, _map_name = await self._load_background_image()
-
-        overlay = Image.new("RGBA", WELCOME_IMAGE_SIZE, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
-        overlay_draw.rectangle((0, 58, 1200, 616), fill=(5, 8, 14, 146))
-        background.alpha_composite(overlay)
-
-        draw = ImageDraw.Draw(background)
-        title_font = self._fit_text(draw, "WELCOME TO 7DR!", CERTIFICATE_BOLD_FONT_PATH, 840, 74, 48)
-        name_font = self._fit_text(draw, display_name, CERTIFICATE_BOLD_FONT_PATH, 790, 58, 34)
-        subtitle_font = self._fit_text(draw, detail_line, CERTIFICATE_REGULAR_FONT_PATH, 820, 34, 22)
-        member_font = self._load_font(CERTIFICATE_REGULAR_FONT_PATH, 28)
-
-        avatar = self._render_avatar(avatar_bytes, 220)
-        avatar_x = (WELCOME_IMAGE_SIZE[0] - avatar.width) // 2
-        avatar_y = 187
-        background.alpha_composite(avatar, (avatar_x, avatar_y))
-
-        self._draw_centered_tracked_text(draw, "WELCOME TO 7DR!", 62, title_font, (248, 243, 233, 255), 4)
-        self._draw_centered_tracked_text(draw, display_name, 450, name_font, (248, 243, 233, 255), 3)
-        self._draw_centered_tracked_text(draw, detail_line.upper(), 519, subtitle_font, (205, 213, 225, 255), 2)
-
         member_text = f"Member #{member.guild.member_count or len(member.guild.members)}"
-        self._draw_centered_tracked_text(draw, member_text.upper(), 566, member_font, (248, 243, 233, 255), 1)
-
-        output = io.BytesIO()
-        background.save(output, format="PNG")
-        output.seek(0)
-        return discord.File(output, filename=f"welcome-{member.id}.png")
+        async with self._render_slots:
+            image_bytes = await render_image(
+                render_welcome_card,
+                avatar_bytes=avatar_bytes,
+                background_paths=self._background_candidates(),
+                display_name=display_name,
+                detail_line=detail_line,
+                member_text=member_text,
+            )
+        return discord.File(io.BytesIO(image_bytes), filename=f"welcome-{member.id}.png")
 
     async def _send_welcome_preview(
         self,
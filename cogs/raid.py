@@ -21,7 +21,8 @@ from discord.ext import commands
 from clan_t17_lookup import ClanT17Lookup
 from config import MAIN_GUILD_ID
 from data_paths import data_path
-from state_io import atomic_json_dump
+from live_message import live_messages
+from state_io import atomic_json_dump_async, flush_pending_async, mark_dirty, run_state_io
 
 
 LOGGER = logging.getLogger("Raid")
@@ -42,6 +43,7 @@ HOME_SERVER_STATS_URL = "https://frostbite.bifrostgaming.com/hll/leaderboards/se
 HOME_SERVER_ANNOUNCEMENT = "7DR server is seeding! Hop in for VIP!"
 MAX_VISIBLE_RAIDERS = 28
 LIVE_REFRESH_SECONDS = 60
+LIVE_REFRESH_CONCURRENCY = 4
 LIVE_REFRESH_MAX_AGE_SECONDS = 8 * 60 * 60
 RAID_PURGE_SECONDS = 12 * 60 * 60
 RAID_MEDIA_EXTENSIONS = {".gif", ".png"}
@@ -184,7 +186,7 @@ class RaidModal(discord.ui.Modal, title="Initiate Raid"):
                 ephemeral=True,
             )
             return
-        stats_url = self.cog.resolve_clan_stats_url(
+        stats_url = await self.cog.resolve_clan_stats_url(
             self.clan_name.value,
             supplied_stats_url,
         ) or ""
@@ -485,9 +487,11 @@ class Raid(commands.Cog):
         self._frostbite_token_expires_at = 0.0
         self._bifrost_server_ids: dict[str, str] = {}
         self._t17_lookup = ClanT17Lookup(logger=LOGGER)
-        self._clan_links = self._load_clan_links()
-        self._control_state = self._load_control_state()
-        self._posts = self._load_posts()
+        # Loaded off the event loop in cog_load; the background loops below
+        # wait for the bot to be ready, which is after cog_load has finished.
+        self._clan_links: dict[str, dict[str, str]] = {}
+        self._control_state: dict[str, object] = {}
+        self._posts: dict[str, dict[str, object]] = {}
         bot.add_view(RaidLauncherView())
         bot.add_view(RaidSignupView())
         bot.add_view(ScheduledSeedSignupView())
@@ -495,10 +499,16 @@ class Raid(commands.Cog):
         self._live_refresh_task = bot.loop.create_task(self._live_refresh_loop())
         self._scheduled_seed_task = bot.loop.create_task(self._scheduled_seed_loop())
 
-    def cog_unload(self) -> None:
+    async def cog_load(self) -> None:
+        self._clan_links = await run_state_io(self._load_clan_links)
+        self._control_state = await run_state_io(self._load_control_state)
+        self._posts = await run_state_io(self._load_posts)
+
+    async def cog_unload(self) -> None:
         self._panel_task.cancel()
         self._live_refresh_task.cancel()
         self._scheduled_seed_task.cancel()
+        await flush_pending_async(STATE_PATH)
 
     def _load_posts(self) -> dict[str, dict[str, object]]:
         if not STATE_PATH.exists():
@@ -518,7 +528,7 @@ class Raid(commands.Cog):
             return {}
 
     def _save_posts(self) -> None:
-        atomic_json_dump(STATE_PATH, self._posts, ensure_ascii=False)
+        mark_dirty(STATE_PATH, self._posts, ensure_ascii=False)
 
     def _load_control_state(self) -> dict[str, object]:
         if not CONTROL_STATE_PATH.exists():
@@ -531,8 +541,8 @@ class Raid(commands.Cog):
             LOGGER.exception("Could not load raid control state")
             return {}
 
-    def _save_control_state(self) -> None:
-        atomic_json_dump(CONTROL_STATE_PATH, self._control_state, ensure_ascii=False)
+    async def _save_control_state(self) -> None:
+        await atomic_json_dump_async(CONTROL_STATE_PATH, self._control_state, ensure_ascii=False)
 
     @staticmethod
     def can_initiate_raid(user: discord.abc.User) -> bool:
@@ -597,7 +607,7 @@ class Raid(commands.Cog):
             )
             return
         self._control_state["everyone_ping_enabled"] = enabled
-        self._save_control_state()
+        await self._save_control_state()
         status = "on" if enabled else "off"
         await interaction.response.send_message(
             f"Raid @everyone pings are now {status}.",
@@ -640,15 +650,15 @@ class Raid(commands.Cog):
             LOGGER.exception("Could not load saved raid clan links")
             return {}
 
-    def _save_clan_links(self) -> None:
-        atomic_json_dump(
+    async def _save_clan_links(self) -> None:
+        await atomic_json_dump_async(
             CLAN_LINKS_PATH,
             self._clan_links,
             ensure_ascii=False,
             sort_keys=True,
         )
 
-    def resolve_clan_stats_url(self, clan_name: str, supplied_url: str) -> str | None:
+    async def resolve_clan_stats_url(self, clan_name: str, supplied_url: str) -> str | None:
         key = self._clan_key(clan_name)
         if supplied_url:
             self._clan_links[key] = {
@@ -656,7 +666,7 @@ class Raid(commands.Cog):
                 "stats_url": supplied_url,
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
-            self._save_clan_links()
+            await self._save_clan_links()
             return supplied_url
         entry = self._clan_links.get(key)
         if not isinstance(entry, dict):
@@ -675,8 +685,8 @@ class Raid(commands.Cog):
             LOGGER.warning("Could not load the saved raid panel message ID")
             return None
 
-    def _save_panel_message_id(self, message_id: int) -> None:
-        atomic_json_dump(
+    async def _save_panel_message_id(self, message_id: int) -> None:
+        await atomic_json_dump_async(
             PANEL_STATE_PATH,
             {"channel_id": RAID_CHANNEL_ID, "message_id": message_id},
         )
@@ -709,7 +719,7 @@ class Raid(commands.Cog):
 
         try:
             message = await channel.send(embed=self.build_launcher_embed(), view=RaidLauncherView())
-            self._save_panel_message_id(message.id)
+            await self._save_panel_message_id(message.id)
         except (OSError, discord.Forbidden, discord.HTTPException):
             LOGGER.exception("Could not create the raid panel in channel %s", RAID_CHANNEL_ID)
 
@@ -1254,17 +1264,27 @@ class Raid(commands.Cog):
             "updated_at": updated_at,
         }
 
-    async def _fetch_live_state(self, stats_url: str, guild_id: int | None = None) -> dict[str, object]:
+    async def _fetch_server_state(self, stats_url: str) -> dict[str, object] | None:
         hostname = (urlparse(stats_url).hostname or "").lower()
         if hostname == "frostbite.bifrostgaming.com" or hostname.endswith(".bifrostgaming.com"):
-            state = await self._fetch_bifrost_live_state(stats_url)
-        else:
-            state = await self._fetch_crcon_live_state(stats_url)
-        if state is None:
+            return await self._fetch_bifrost_live_state(stats_url)
+        return await self._fetch_crcon_live_state(stats_url)
+
+    async def _fetch_live_state(self, stats_url: str, guild_id: int | None = None) -> dict[str, object]:
+        return self._live_state_for_guild(await self._fetch_server_state(stats_url), guild_id)
+
+    def _live_state_for_guild(
+        self,
+        server_state: dict[str, object] | None,
+        guild_id: int | None,
+    ) -> dict[str, object]:
+        """Turn one server fetch into a post's live state; safe to call once per post sharing the server."""
+        if server_state is None:
             return {
                 "available": False,
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
+        state = dict(server_state)
         player_records = [
             record
             for record in state.pop("player_records", [])
@@ -1281,6 +1301,8 @@ class Raid(commands.Cog):
         channel_id = self._integer(post.get("channel_id"))
         if channel_id is None:
             return
+        embed = self.build_post_embed(post)
+        view = RaidSignupView()
         channel = self.bot.get_channel(channel_id)
         if channel is None:
             try:
@@ -1293,10 +1315,12 @@ class Raid(commands.Cog):
             message = await channel.fetch_message(message_id)
             if message.webhook_id is not None:
                 replacement = await channel.send(
-                    embed=self.build_post_embed(post),
-                    view=RaidSignupView(),
+                    embed=embed,
+                    view=view,
                     allowed_mentions=discord.AllowedMentions.none(),
                 )
+                live_messages.forget(message_id)
+                live_messages.record(replacement, embed=embed, view=view)
                 async with self._lock:
                     current = self._posts.pop(str(message_id), None)
                     if current is not None:
@@ -1319,9 +1343,11 @@ class Raid(commands.Cog):
                         replacement.id,
                     )
                 return
-            await message.edit(embed=self.build_post_embed(post), view=RaidSignupView())
+            # No PATCH when the rendered post is unchanged.
+            await live_messages.edit(message, embed=embed, view=view)
         except discord.NotFound as exc:
             LOGGER.info("Raid message %s no longer exists: %s", message_id, exc)
+            live_messages.forget(message_id)
             async with self._lock:
                 if self._posts.pop(str(message_id), None) is not None:
                     self._save_posts()
@@ -1338,71 +1364,126 @@ class Raid(commands.Cog):
         await self.bot.wait_until_ready()
         while not self.bot.is_closed():
             await asyncio.sleep(LIVE_REFRESH_SECONDS)
-            now = datetime.now(timezone.utc)
-            snapshot = list(self._posts.items())
-            for message_id, post in snapshot:
-                if str(post.get("status") or "active") != "active":
-                    continue
-                try:
-                    created_at = datetime.fromisoformat(str(post.get("created_at", "")))
-                    if created_at.tzinfo is None:
-                        created_at = created_at.replace(tzinfo=timezone.utc)
-                except ValueError:
-                    continue
-                age_seconds = (now - created_at).total_seconds()
-                if age_seconds >= RAID_PURGE_SECONDS:
-                    await self._purge_raid_message(int(message_id), post)
-                    continue
-                if age_seconds > LIVE_REFRESH_MAX_AGE_SECONDS:
-                    continue
-                stats_url = str(post.get("stats_url") or "")
-                if not stats_url:
-                    continue
-                try:
-                    live_state = await self._fetch_live_state(
-                        stats_url,
-                        self._integer(post.get("guild_id")),
+            try:
+                await self._refresh_live_posts()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                LOGGER.exception("Unexpected error during raid live refresh")
+
+    async def _refresh_live_posts(self) -> None:
+        """Fetch each raided server once and refresh every post on it.
+
+        Posts are grouped by ``_server_key`` so raids on the same server share
+        one fetch, and up to ``LIVE_REFRESH_CONCURRENCY`` servers are fetched
+        at a time, keeping the cycle time flat as the number of raids grows.
+        """
+        now = datetime.now(timezone.utc)
+        by_server: dict[str, list[tuple[str, dict[str, object]]]] = {}
+        for message_id, post in list(self._posts.items()):
+            if str(post.get("status") or "active") != "active":
+                continue
+            try:
+                created_at = datetime.fromisoformat(str(post.get("created_at", "")))
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+            age_seconds = (now - created_at).total_seconds()
+            if age_seconds >= RAID_PURGE_SECONDS:
+                await self._purge_raid_message(int(message_id), post)
+                continue
+            if age_seconds > LIVE_REFRESH_MAX_AGE_SECONDS:
+                continue
+            stats_url = str(post.get("stats_url") or "")
+            if not stats_url:
+                continue
+            by_server.setdefault(self._server_key(stats_url), []).append((message_id, post))
+
+        if not by_server:
+            return
+        fetch_slots = asyncio.Semaphore(LIVE_REFRESH_CONCURRENCY)
+        await asyncio.gather(
+            *(
+                self._refresh_server_posts(server_key, posts, fetch_slots)
+                for server_key, posts in by_server.items()
+            )
+        )
+
+    async def _refresh_server_posts(
+        self,
+        server_key: str,
+        posts: list[tuple[str, dict[str, object]]],
+        fetch_slots: asyncio.Semaphore,
+    ) -> None:
+        try:
+            async with fetch_slots:
+                server_state = await self._fetch_server_state(str(posts[0][1].get("stats_url") or ""))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            LOGGER.exception("Unexpected error fetching live state for %s", server_key)
+            return
+
+        refreshed: list[tuple[int, dict[str, object]]] = []
+        for message_id, post in posts:
+            try:
+                live_state = self._live_state_for_guild(server_state, self._integer(post.get("guild_id")))
+                refreshed_post = await self._apply_live_state(message_id, live_state)
+            except Exception:
+                LOGGER.exception("Unexpected error applying live state to raid message %s", message_id)
+                continue
+            if refreshed_post is not None:
+                refreshed.append((int(message_id), refreshed_post))
+
+        results = await asyncio.gather(
+            *(self._refresh_post_message(message_id, post) for message_id, post in refreshed),
+            return_exceptions=True,
+        )
+        for (message_id, _post), result in zip(refreshed, results):
+            if isinstance(result, Exception):
+                LOGGER.error(
+                    "Unexpected error refreshing raid message %s",
+                    message_id,
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+
+    async def _apply_live_state(self, message_id: str, live_state: dict[str, object]) -> dict[str, object] | None:
+        async with self._lock:
+            current = self._posts.get(message_id)
+            if current is None:
+                return None
+            participants = [int(user_id) for user_id in current.get("participants", [])]
+            if live_state.get("player_detection_available"):
+                previous_detected = {
+                    int(member_id)
+                    for member_id in current.get(
+                        "detected_member_ids",
+                        (
+                            current.get("live_state", {}).get("clan_member_ids", [])
+                            if isinstance(current.get("live_state"), dict)
+                            else []
+                        ),
                     )
-                    async with self._lock:
-                        current = self._posts.get(message_id)
-                        if current is None:
-                            continue
-                        participants = [int(user_id) for user_id in current.get("participants", [])]
-                        if live_state.get("player_detection_available"):
-                            previous_detected = {
-                                int(member_id)
-                                for member_id in current.get(
-                                    "detected_member_ids",
-                                    (
-                                        current.get("live_state", {}).get("clan_member_ids", [])
-                                        if isinstance(current.get("live_state"), dict)
-                                        else []
-                                    ),
-                                )
-                            }
-                            currently_detected = {
-                                int(member_id)
-                                for member_id in live_state.get("clan_member_ids", [])
-                            }
-                            dropped_members = previous_detected - currently_detected
-                            participants = [
-                                user_id
-                                for user_id in participants
-                                if user_id not in dropped_members
-                            ]
-                            for detected_member_id in currently_detected:
-                                if detected_member_id not in participants:
-                                    participants.append(detected_member_id)
-                            current["detected_member_ids"] = list(currently_detected)
-                        current["live_state"] = live_state
-                        current["participants"] = participants
-                        self._save_posts()
-                        refreshed_post = dict(current)
-                    await self._refresh_post_message(int(message_id), refreshed_post)
-                except asyncio.CancelledError:
-                    raise
-                except Exception:
-                    LOGGER.exception("Unexpected error refreshing raid message %s", message_id)
+                }
+                currently_detected = {
+                    int(member_id)
+                    for member_id in live_state.get("clan_member_ids", [])
+                }
+                dropped_members = previous_detected - currently_detected
+                participants = [
+                    user_id
+                    for user_id in participants
+                    if user_id not in dropped_members
+                ]
+                for detected_member_id in currently_detected:
+                    if detected_member_id not in participants:
+                        participants.append(detected_member_id)
+                current["detected_member_ids"] = list(currently_detected)
+            current["live_state"] = live_state
+            current["participants"] = participants
+            self._save_posts()
+            return dict(current)
 
     async def _scheduled_seed_loop(self) -> None:
         await self.bot.wait_until_ready()
@@ -1639,6 +1720,7 @@ class Raid(commands.Cog):
                     LOGGER.warning("Could not purge raid message %s: %s", message_id, exc)
                     return
 
+        live_messages.forget(message_id)
         async with self._lock:
             if self._posts.pop(str(message_id), None) is not None:
                 self._save_posts()
@@ -1930,7 +2012,7 @@ class Raid(commands.Cog):
                 self._posts[str(message.id)] = post
                 self._save_posts()
             self._control_state["last_raid_created_at"] = created_at.isoformat()
-            self._save_control_state()
+            await self._save_control_state()
 
         unix_time = int(scheduled_for.timestamp())
         await interaction.followup.send(
@@ -1978,7 +2060,7 @@ class Raid(commands.Cog):
                 stats_url=stats_url,
             )
             self._control_state["last_raid_created_at"] = datetime.now(timezone.utc).isoformat()
-            self._save_control_state()
+            await self._save_control_state()
 
     async def _create_post_unchecked(
         self,
@@ -1989,7 +2071,7 @@ class Raid(commands.Cog):
         stats_url: str,
     ) -> None:
         if stats_url:
-            self.resolve_clan_stats_url(clan_name, stats_url)
+            await self.resolve_clan_stats_url(clan_name, stats_url)
         created_at = datetime.now(timezone.utc).isoformat()
         post: dict[str, object] = {
             "guild_id": interaction.guild_id,
@@ -2142,7 +2224,7 @@ class Raid(commands.Cog):
 
         if changed:
             try:
-                await interaction.message.edit(embed=embed, view=view)
+                await live_messages.edit(interaction.message, embed=embed, view=view)
             except discord.HTTPException:
                 LOGGER.exception("Could not update raid message %s", message_id)
                 await interaction.followup.send("Your signup was saved, but I could not refresh the embed.", ephemeral=True)
@@ -5,7 +5,6 @@ import json
 import logging
 import random
 import re
-import sqlite3
 from datetime import date, datetime, time
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -15,7 +14,8 @@ from discord.ext import commands, tasks
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
-from state_io import atomic_json_dump
+from database_service import get_database
+from state_io import atomic_json_dump_async
 
 
 logger = logging.getLogger(__name__)
@@ -259,29 +259,27 @@ class ReactionRoles(commands.Cog):
         self._sync_lock = asyncio.Lock()
         self._view = ReactionRoleView(self)
         self.bot.add_view(self._view)
-        self._birthday_db = sqlite3.connect(BIRTHDAY_DB_PATH)
-        self._birthday_db.execute(
-            "CREATE TABLE IF NOT EXISTS birthdays ("
-            "guild_id INTEGER, user_id INTEGER, date TEXT, display_age INTEGER DEFAULT 0, "
-            "PRIMARY KEY (guild_id, user_id))"
-        )
-        self._birthday_db.commit()
-        columns = {
-            str(row[1])
-            for row in self._birthday_db.execute("PRAGMA table_info(birthdays)").fetchall()
-        }
-        if "display_age" not in columns:
-            self._birthday_db.execute(
-                "ALTER TABLE birthdays ADD COLUMN display_age INTEGER DEFAULT 0"
+        self._birthday_db = get_database(BIRTHDAY_DB_PATH)
+
+    async def cog_load(self) -> None:
+        async with self._birthday_db.write() as db:
+            await db.execute(
+                "CREATE TABLE IF NOT EXISTS birthdays ("
+                "guild_id INTEGER, user_id INTEGER, date TEXT, display_age INTEGER DEFAULT 0, "
+                "PRIMARY KEY (guild_id, user_id))"
             )
-            self._birthday_db.commit()
+            cursor = await db.execute("PRAGMA table_info(birthdays)")
+            columns = {str(row[1]) for row in await cursor.fetchall()}
+            if "display_age" not in columns:
+                await db.execute(
+                    "ALTER TABLE birthdays ADD COLUMN display_age INTEGER DEFAULT 0"
+                )
 
     def cog_unload(self) -> None:
         if self.check_birthdays.is_running():
             self.check_birthdays.cancel()
         if self.post_monthly_birthday_summary.is_running():
             self.post_monthly_birthday_summary.cancel()
-        self._birthday_db.close()
 
     @staticmethod
     def build_embed() -> discord.Embed:
@@ -388,36 +386,34 @@ class ReactionRoles(commands.Cog):
                 return False
 
             self.state = {"channel_id": channel.id, "message_id": message.id}
-            atomic_json_dump(STATE_PATH, self.state, indent=2)
+            await atomic_json_dump_async(STATE_PATH, self.state, indent=2)
             return True
 
-    def _set_birthday(
+    async def _set_birthday(
         self,
         guild_id: int,
         user_id: int,
         date_str: str,
         display_age: bool,
     ) -> None:
-        self._birthday_db.execute(
+        await self._birthday_db.execute(
             "INSERT OR REPLACE INTO birthdays (guild_id, user_id, date, display_age) "
             "VALUES (?, ?, ?, ?)",
             (guild_id, user_id, date_str, int(display_age)),
         )
-        self._birthday_db.commit()
 
-    def _remove_birthday(self, guild_id: int, user_id: int) -> bool:
-        cursor = self._birthday_db.execute(
+    async def _remove_birthday(self, guild_id: int, user_id: int) -> bool:
+        removed = await self._birthday_db.execute(
             "DELETE FROM birthdays WHERE guild_id = ? AND user_id = ?",
             (guild_id, user_id),
         )
-        self._birthday_db.commit()
-        return cursor.rowcount > 0
+        return removed > 0
 
-    def _month_birthdays(self, guild_id: int, month: int) -> list[tuple[int, str, bool]]:
-        rows = self._birthday_db.execute(
+    async def _month_birthdays(self, guild_id: int, month: int) -> list[tuple[int, str, bool]]:
+        rows = await self._birthday_db.fetchall(
             "SELECT user_id, date, display_age FROM birthdays WHERE guild_id = ?",
             (guild_id,),
-        ).fetchall()
+        )
         birthdays: list[tuple[int, str, bool]] = []
         for user_id, date_str, display_age in rows:
             try:
@@ -447,7 +443,7 @@ class ReactionRoles(commands.Cog):
             await interaction.response.send_message(error, ephemeral=True)
             return
 
-        self._set_birthday(interaction.guild.id, interaction.user.id, date_str, display_age)
+        await self._set_birthday(interaction.guild.id, interaction.user.id, date_str, display_age)
         day_value, month_value, year_value = _birthday_parts(date_str)
         birthday = date(year_value or 2000, month_value, day_value)
         saved_date = birthday.strftime("%d %B")
@@ -470,7 +466,7 @@ class ReactionRoles(commands.Cog):
                 ephemeral=True,
             )
             return
-        removed = self._remove_birthday(interaction.guild.id, interaction.user.id)
+        removed = await self._remove_birthday(interaction.guild.id, interaction.user.id)
         message = "Your saved birthday has been removed." if removed else "You do not have a saved birthday."
         await interaction.response.send_message(message, ephemeral=True)
 
@@ -483,7 +479,7 @@ class ReactionRoles(commands.Cog):
             return
 
         today = datetime.now(BIRTHDAY_TIMEZONE).date()
-        birthdays = self._month_birthdays(interaction.guild.id, today.month)
+        birthdays = await self._month_birthdays(interaction.guild.id, today.month)
         lines = self._birthday_lines(interaction.guild, birthdays, today=today)
         if not lines:
             await interaction.response.send_message("📭 No birthdays this month.", ephemeral=True)
@@ -635,7 +631,7 @@ class ReactionRoles(commands.Cog):
     async def check_birthdays(self) -> None:
         today = datetime.now(BIRTHDAY_TIMEZONE).date()
         for guild in self.bot.guilds:
-            birthdays = self._month_birthdays(guild.id, today.month)
+            birthdays = await self._month_birthdays(guild.id, today.month)
             birthdays_today = [
                 item
                 for item in birthdays
@@ -664,7 +660,7 @@ class ReactionRoles(commands.Cog):
         if today.day != 1:
             return
         for guild in self.bot.guilds:
-            birthdays = self._month_birthdays(guild.id, today.month)
+            birthdays = await self._month_birthdays(guild.id, today.month)
             lines = self._birthday_lines(guild, birthdays, today=today)
             if not lines:
                 continue
@@ -15,10 +15,12 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from discord.ext import commands
 from openpyxl import Workbook, load_workbook
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
+from database_service import get_database
+from rollcall_store import RollCallAttendance, WorkbookExporter
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +52,18 @@ ROLLCALL_EMOJI = "✅"
 # Set to 0 or None to disable locking.
 ROLLCALL_LOCK_HOURS: Optional[float] = 144.0
 
-# Where to store the attendance workbook.
-# The bot writes to .xlsx. If you have a legacy .xls, see IMPORT_LEGACY_XLS_PATH.
+# Attendance is stored per roll call, week and member in this SQLite database.
+ATTENDANCE_DB_PATH = data_path("rollcall_attendance.db")
+
+# Where the attendance workbook is exported to before it is uploaded.
+# An existing .xlsx here is imported into the attendance store once, when the store is empty.
+# If you have a legacy .xls, see IMPORT_LEGACY_XLS_PATH.
 WORKBOOK_PATH = data_path("rollcall.xlsx")
 
+# The exported workbook stays loaded in memory; changes are written to WORKBOOK_PATH by a
+# background thread once no change has arrived for this many seconds.
+WORKBOOK_EXPORT_DEBOUNCE_SECONDS = 10.0
+
 # Optional: path to a legacy .xls workbook to import once (only if WORKBOOK_PATH doesn't exist yet).
 # Requires pandas + xlrd==1.2.0 installed.
 IMPORT_LEGACY_XLS_PATH: Optional[str] = None
@@ -142,6 +152,8 @@ class RollCallCog(commands.Cog):
 		self.bot = bot
 		self._lock = asyncio.Lock()
 		self._state = self._load_state()
+		self._attendance = RollCallAttendance(get_database(ATTENDANCE_DB_PATH))
+		self._workbook_export = WorkbookExporter(WORKBOOK_PATH, debounce=WORKBOOK_EXPORT_DEBOUNCE_SECONDS)
 		self._scheduler: Optional[AsyncIOScheduler] = None
 		self._backstop_task: Optional[asyncio.Task] = None
 		self._refresh_task: Optional[asyncio.Task] = None
@@ -152,6 +164,7 @@ class RollCallCog(commands.Cog):
 
 	async def cog_load(self) -> None:
 		# Called by discord.py when the cog is loaded (event loop is running).
+		await self._load_attendance()
 		self._start_scheduler()
 		if BACKSTOP_REFRESH_MINUTES and BACKSTOP_REFRESH_MINUTES > 0:
 			if self._backstop_task is None or self._backstop_task.done():
@@ -183,7 +196,7 @@ class RollCallCog(commands.Cog):
 			logger.exception("/forcerollcall failed")
 			await interaction.followup.send("Force roll call failed; check logs.", ephemeral=True)
 
-	def cog_unload(self):
+	async def cog_unload(self):
 		if self._scheduler:
 			try:
 				self._scheduler.shutdown(wait=False)
@@ -195,6 +208,7 @@ class RollCallCog(commands.Cog):
 			self._refresh_task.cancel()
 		if self._debounce_task and not self._debounce_task.done():
 			self._debounce_task.cancel()
+		await self._workbook_export.close()
 
 	# -----------------
 	# State
@@ -215,10 +229,10 @@ class RollCallCog(commands.Cog):
 			logger.warning("Failed to load rollcall state; starting fresh.", exc_info=True)
 			return {"version": 1, "rollcalls": {}, "workbook": {}}
 
-	def _save_state(self) -> None:
+	async def _save_state(self) -> None:
 		try:
 			self._state["updated_at"] = datetime.utcnow().isoformat()
-			atomic_json_dump(STATE_PATH, self._state, ensure_ascii=False)
+			await atomic_json_dump_async(STATE_PATH, self._state, ensure_ascii=False)
 		except Exception:
 			logger.warning("Failed to save rollcall state.", exc_info=True)
 
@@ -290,7 +304,10 @@ class RollCallCog(commands.Cog):
 		channel = await self._get_message_channel(channel_id)
 		if not channel:
 			return state.get("url")
-		if not os.path.exists(WORKBOOK_PATH):
+		try:
+			await self._export_workbook()
+		except Exception:
+			logger.warning("RollCall: failed exporting workbook", exc_info=True)
 			return state.get("url")
 
 		old_id = state.get("message_id")
@@ -476,7 +493,7 @@ class RollCallCog(commands.Cog):
 			return ""
 		return "".join(f"<@&{rid}> " for rid in ids)
 
-	def _apply_partial_tick_markers(self, guild: discord.Guild, wb: Workbook, *, week_label: str) -> None:
+	async def _apply_partial_tick_markers(self, guild: discord.Guild, *, week_label: str) -> None:
 		"""If a member ticks at least one roll call this week, mark 🅾️ on other roll calls they missed."""
 		PARTIAL = "🅾️"
 
@@ -493,33 +510,33 @@ class RollCallCog(commands.Cog):
 		# Who has ticked *any* roll call this week?
 		ticked_anywhere: set[int] = set()
 		for cfg in active_cfgs:
-			ws = self._get_or_create_sheet(wb, cfg)
-			status = self._get_week_status(ws, week_label)
+			status = self._get_week_status(cfg, week_label)
 			for uid, v in status.items():
 				if v == "✅":
 					ticked_anywhere.add(uid)
 
 		for cfg in active_cfgs:
-			ws = self._get_or_create_sheet(wb, cfg)
-			headers = self._sheet_headers(ws)
-			if week_label not in headers:
+			key = self._sheet_key(cfg)
+			if week_label not in self._attendance.weeks(key):
 				continue
-			week_col = headers.index(week_label) + 1
 
 			expected = self._expected_members(guild, cfg)
 			if not expected:
 				continue
 
+			status = self._get_week_status(cfg, week_label)
+			changes: dict[int, str] = {}
 			for m in expected:
-				row = self._upsert_member_row(ws, m.id, m.display_name)
-				cur = ws.cell(row=row, column=week_col).value
-				cur_s = str(cur) if cur is not None else ""
+				cur_s = status.get(m.id, "")
 
 				# Only replace explicit misses (❌) with partial marker.
 				if cur_s == "❌" and m.id in ticked_anywhere:
-					ws.cell(row=row, column=week_col, value=PARTIAL)
+					changes[m.id] = PARTIAL
 				elif cur_s == PARTIAL and m.id not in ticked_anywhere:
-					ws.cell(row=row, column=week_col, value="❌")
+					changes[m.id] = "❌"
+			await self._attendance.upsert_members(key, {m.id: m.display_name for m in expected})
+			await self._attendance.set_statuses(key, week_label, changes)
+
 	async def _get_message_channel(self, channel_id: int) -> Optional[discord.TextChannel | discord.Thread]:
 		ch = self.bot.get_channel(channel_id)
 		if isinstance(ch, (discord.TextChannel, discord.Thread)):
@@ -614,31 +631,65 @@ class RollCallCog(commands.Cog):
 			logger.exception("Failed importing legacy .xls")
 
 	# -----------------
-	# Workbook (.xlsx)
+	# Attendance store + workbook (.xlsx) export
 	# -----------------
-	def _load_or_create_workbook(self) -> Workbook:
+	def _sheet_key(self, cfg: RollCallConfig) -> str:
+		# Attendance is keyed by sheet name so exports and legacy imports line up.
+		return cfg.key[:31]
+
+	async def _load_attendance(self) -> None:
+		await self._attendance.load()
+		if self._attendance.is_empty:
+			await self._import_workbook()
+		self._attendance.attach_exporter(self._workbook_export, [self._sheet_key(cfg) for cfg in ROLLCALLS])
+
+	async def _import_workbook(self) -> None:
+		# First run on the store: import the workbook that used to be the source of truth.
 		self._maybe_import_legacy_xls()
-
-		if os.path.exists(WORKBOOK_PATH):
-			return load_workbook(WORKBOOK_PATH)
-
-		wb = Workbook()
-		# Keep the default sheet but rename it to something sane.
-		wb.active.title = "README"
-		wb.active.append(["This workbook is managed by the bot."])
-		os.makedirs(os.path.dirname(WORKBOOK_PATH) or ".", exist_ok=True)
-		wb.save(WORKBOOK_PATH)
-		return wb
-
-	def _get_or_create_sheet(self, wb: Workbook, cfg: RollCallConfig):
-		name = cfg.key[:31]
-		if name in wb.sheetnames:
-			ws = wb[name]
-		else:
-			ws = wb.create_sheet(title=name)
-			ws.append(["User ID", "Nickname"])
-		self._migrate_week_headers_to_ddmmyyyy(ws)
-		return ws
+		if not os.path.exists(WORKBOOK_PATH):
+			return
+		try:
+			sheets = await asyncio.to_thread(self._read_workbook_sheets, WORKBOOK_PATH)
+		except Exception:
+			logger.exception("RollCall: failed reading %s for import", WORKBOOK_PATH)
+			return
+		for key, week_labels, rows in sheets:
+			imported = await self._attendance.import_sheet(key, week_labels, rows)
+			logger.info("RollCall: imported %d member row(s) and %d week(s) for %s", imported, len(week_labels), key)
+
+	def _read_workbook_sheets(self, path: str) -> list[tuple[str, list[str], list[tuple[int, str, list[str]]]]]:
+		wb = load_workbook(path)
+		sheets = []
+		for ws in wb.worksheets:
+			if ws.title == "README":
+				continue
+			self._migrate_week_headers_to_ddmmyyyy(ws)
+			headers = self._sheet_headers(ws)
+			week_columns: dict[str, int] = {}
+			for idx, header in enumerate(headers[2:], start=2):
+				if header and header not in week_columns:
+					week_columns[header] = idx
+
+			rows: list[tuple[int, str, list[str]]] = []
+			for values in ws.iter_rows(min_row=2, values_only=True):
+				if not values or values[0] is None:
+					continue
+				try:
+					uid = int(str(values[0]).strip())
+				except Exception:
+					continue
+				nick = str(values[1]) if len(values) > 1 and values[1] is not None else ""
+				cells = [
+					str(values[idx]) if idx < len(values) and values[idx] is not None else ""
+					for idx in week_columns.values()
+				]
+				rows.append((uid, nick, cells))
+			sheets.append((ws.title, list(week_columns), rows))
+		return sheets
+
+	async def _export_workbook(self) -> None:
+		# The background exporter already holds every change; just make sure it is on disk.
+		await self._workbook_export.flush()
 
 	def _sheet_headers(self, ws) -> list[str]:
 		headers: list[str] = []
@@ -673,55 +724,24 @@ class RollCallCog(commands.Cog):
 			return (week, date(yy, mm, dd))
 		return None
 
-	def _ensure_week_column(self, ws, week_label: str) -> int:
-		headers = self._sheet_headers(ws)
+	async def _ensure_week(self, key: str, week_label: str) -> None:
+		weeks = self._attendance.weeks(key)
 		canonical = week_label.strip() if isinstance(week_label, str) else str(week_label)
-		if canonical in headers:
-			return headers.index(canonical) + 1
+		if canonical in weeks:
+			return
 
 		# Match by normalized (week, date) to avoid duplicate columns when formats differ.
 		wanted = self._parse_week_header(canonical)
 		if wanted:
-			for idx, h in enumerate(headers):
-				parsed = self._parse_week_header(h)
+			for existing in weeks:
+				parsed = self._parse_week_header(existing)
 				if parsed and parsed == wanted:
-					col = idx + 1
-					# Rename header to canonical to prevent future duplicates
-					ws.cell(row=1, column=col, value=canonical)
-					return col
-
-		# No match: create new column
-		ws.cell(row=1, column=len(headers) + 1, value=canonical)
-		return len(headers) + 1
-
-	def _index_user_rows(self, ws) -> dict[str, int]:
-		idx: dict[str, int] = {}
-		for r in range(2, ws.max_row + 1):
-			v = ws.cell(row=r, column=1).value
-			if v is None:
-				continue
-			idx[str(v)] = r
-		return idx
-
-	def _upsert_member_row(self, ws, user_id: int, nickname: str) -> int:
-		idx = self._index_user_rows(ws)
-		key = str(user_id)
-		if key in idx:
-			row = idx[key]
-			ws.cell(row=row, column=2, value=nickname)
-			return row
-		row = ws.max_row + 1
-		ws.cell(row=row, column=1, value=key)
-		ws.cell(row=row, column=2, value=nickname)
-		return row
-
-	def _set_cell(self, ws, row: int, col: int, value: str) -> None:
-		ws.cell(row=row, column=col, value=value)
-
-	def _save_workbook(self, wb: Workbook) -> None:
-		tmp_path = f"{WORKBOOK_PATH}.tmp"
-		wb.save(tmp_path)
-		os.replace(tmp_path, WORKBOOK_PATH)
+					# Rename to canonical to prevent future duplicates
+					await self._attendance.rename_week(key, existing, canonical)
+					return
+
+		# No match: add a new week column
+		await self._attendance.add_week(key, canonical)
 
 	# -----------------
 	# Core flows
@@ -740,15 +760,12 @@ class RollCallCog(commands.Cog):
 			rollcall_d = self._rollcall_date_for_now()
 			week_label = self._week_label(rollcall_d)
 
-			wb = self._load_or_create_workbook()
-
 			for cfg in ROLLCALLS:
 				try:
-					await self._send_rollcall_for_cfg(guild, wb, cfg, week_label=week_label, rollcall_d=rollcall_d, reason=reason)
+					await self._send_rollcall_for_cfg(guild, cfg, week_label=week_label, rollcall_d=rollcall_d, reason=reason)
 				except Exception:
 					logger.exception("RollCall: failed sending for %s", cfg.key)
 
-			self._save_workbook(wb)
 			# Upload workbook for download link, then refresh embeds to include latest URL.
 			workbook_url = await self._post_workbook()
 			if workbook_url:
@@ -756,7 +773,6 @@ class RollCallCog(commands.Cog):
 					try:
 						await self._update_outputs_for_cfg(
 							guild,
-							wb,
 							cfg,
 							week_label=week_label,
 							reason="workbook_link",
@@ -764,7 +780,7 @@ class RollCallCog(commands.Cog):
 						)
 					except Exception:
 						logger.exception("RollCall: failed workbook embed refresh for %s", cfg.key)
-			self._save_state()
+			await self._save_state()
 
 	async def _refresh_all(self, *, reason: str) -> None:
 		async with self._lock:
@@ -772,15 +788,13 @@ class RollCallCog(commands.Cog):
 			if not guild:
 				return
 			week_label = self._week_label(self._rollcall_date_for_now())
-			wb = self._load_or_create_workbook()
-			self._apply_partial_tick_markers(guild, wb, week_label=week_label)
+			await self._apply_partial_tick_markers(guild, week_label=week_label)
 			prev_workbook_url = self._workbook_state().get("url")
 			update_html = (reason != "reaction") or UPDATE_HTML_ON_REACTION
 			for cfg in ROLLCALLS:
 				try:
 					await self._update_outputs_for_cfg(
 						guild,
-						wb,
 						cfg,
 						week_label=week_label,
 						reason=reason,
@@ -788,7 +802,6 @@ class RollCallCog(commands.Cog):
 					)
 				except Exception:
 					logger.exception("RollCall: failed refresh for %s", cfg.key)
-			self._save_workbook(wb)
 
 			should_upload_workbook = True
 			if reason == "reaction" and not UPLOAD_WORKBOOK_ON_REACTION:
@@ -800,7 +813,6 @@ class RollCallCog(commands.Cog):
 						try:
 							await self._update_outputs_for_cfg(
 								guild,
-								wb,
 								cfg,
 								week_label=week_label,
 								reason="workbook_link",
@@ -808,12 +820,11 @@ class RollCallCog(commands.Cog):
 							)
 						except Exception:
 							logger.exception("RollCall: failed workbook embed refresh for %s", cfg.key)
-			self._save_state()
+			await self._save_state()
 
 	async def _send_rollcall_for_cfg(
 		self,
 		guild: discord.Guild,
-		wb: Workbook,
 		cfg: RollCallConfig,
 		*,
 		week_label: str,
@@ -838,22 +849,24 @@ class RollCallCog(commands.Cog):
 				state["html_channel_id"] = None
 				state["html_url"] = None
 			else:
-				await self._update_outputs_for_cfg(guild, wb, cfg, week_label=week_label, reason="already_sent", update_html=True)
+				await self._update_outputs_for_cfg(guild, cfg, week_label=week_label, reason="already_sent", update_html=True)
 				return
 
-		ws = self._get_or_create_sheet(wb, cfg)
-		week_col = self._ensure_week_column(ws, week_label)
+		key = self._sheet_key(cfg)
+		await self._ensure_week(key, week_label)
 
 		expected_members = self._expected_members(guild, cfg)
-		for m in expected_members:
-			row = self._upsert_member_row(ws, m.id, m.display_name)
-			self._set_cell(ws, row, week_col, "❌")
+		await self._attendance.set_statuses(
+			key,
+			week_label,
+			{m.id: "❌" for m in expected_members},
+			nicknames={m.id: m.display_name for m in expected_members},
+		)
 
 		ping = self._ping_mentions(cfg)
 		workbook_url = self._workbook_state().get("url")
 		embed = await self._build_status_embed(
 			guild,
-			ws,
 			cfg,
 			week_label=week_label,
 			rollcall_d=rollcall_d,
@@ -873,7 +886,7 @@ class RollCallCog(commands.Cog):
 		state["last_sent_at"] = datetime.utcnow().isoformat()
 
 		# Post HTML + refresh embed to include latest HTML link
-		await self._update_outputs_for_cfg(guild, wb, cfg, week_label=week_label, reason=reason, update_html=True)
+		await self._update_outputs_for_cfg(guild, cfg, week_label=week_label, reason=reason, update_html=True)
 
 	def _expected_members(self, guild: discord.Guild, cfg: RollCallConfig) -> list[discord.Member]:
 		role_ids = self._tracked_role_ids(cfg)
@@ -892,7 +905,6 @@ class RollCallCog(commands.Cog):
 	async def _update_outputs_for_cfg(
 		self,
 		guild: discord.Guild,
-		wb: Workbook,
 		cfg: RollCallConfig,
 		*,
 		week_label: str,
@@ -904,21 +916,20 @@ class RollCallCog(commands.Cog):
 		if not channel:
 			return
 
-		ws = self._get_or_create_sheet(wb, cfg)
 		rollcall_d = self._parse_week_label_date(week_label) or self._rollcall_date_for_now()
 
-		# Ensure member nicknames stay up to date in the sheet.
-		for m in self._expected_members(guild, cfg):
-			self._upsert_member_row(ws, m.id, m.display_name)
+		# Ensure member nicknames stay up to date in the attendance store.
+		await self._attendance.upsert_members(
+			self._sheet_key(cfg), {m.id: m.display_name for m in self._expected_members(guild, cfg)}
+		)
 
 		if update_html:
-			await self._post_html_for_cfg(guild, ws, cfg, week_label=week_label)
+			await self._post_html_for_cfg(guild, cfg, week_label=week_label)
 		html_url = self._rc_state(cfg.key).get("html_url")
 
 		workbook_url = self._workbook_state().get("url")
 		embed = await self._build_status_embed(
 			guild,
-			ws,
 			cfg,
 			week_label=week_label,
 			rollcall_d=rollcall_d,
@@ -956,7 +967,6 @@ class RollCallCog(commands.Cog):
 	async def _build_status_embed(
 		self,
 		guild: discord.Guild,
-		ws,
 		cfg: RollCallConfig,
 		*,
 		week_label: str,
@@ -966,7 +976,7 @@ class RollCallCog(commands.Cog):
 	) -> discord.Embed:
 		expected = self._expected_members(guild, cfg)
 		expected_ids = {m.id for m in expected}
-		status = self._get_week_status(ws, week_label)
+		status = self._get_week_status(cfg, week_label)
 
 		ticked_ids = {uid for uid, v in status.items() if v == "✅"}
 		missing_ids = (expected_ids - ticked_ids) if expected_ids else set()
@@ -1041,24 +1051,10 @@ class RollCallCog(commands.Cog):
 
 		return out
 
-	def _get_week_status(self, ws, week_label: str) -> dict[int, str]:
-		headers = self._sheet_headers(ws)
-		if week_label not in headers:
-			return {}
-		col = headers.index(week_label) + 1
-		out: dict[int, str] = {}
-		for r in range(2, ws.max_row + 1):
-			uid = ws.cell(row=r, column=1).value
-			if uid is None:
-				continue
-			v = ws.cell(row=r, column=col).value
-			try:
-				out[int(str(uid))] = str(v) if v is not None else ""
-			except Exception:
-				continue
-		return out
+	def _get_week_status(self, cfg: RollCallConfig, week_label: str) -> dict[int, str]:
+		return self._attendance.week_status(self._sheet_key(cfg), week_label)
 
-	async def _post_html_for_cfg(self, guild: discord.Guild, ws, cfg: RollCallConfig, *, week_label: str) -> None:
+	async def _post_html_for_cfg(self, guild: discord.Guild, cfg: RollCallConfig, *, week_label: str) -> None:
 		state = self._rc_state(cfg.key)
 		target_channel_id = HTML_CHANNEL_ID if HTML_CHANNEL_ID else cfg.channel_id
 		channel = await self._get_message_channel(int(target_channel_id))
@@ -1084,7 +1080,7 @@ class RollCallCog(commands.Cog):
 			except Exception:
 				logger.warning("RollCall %s: failed deleting old HTML message", cfg.key, exc_info=True)
 
-		html_text = self._render_html(guild, ws, cfg, highlight_week=week_label)
+		html_text = self._render_html(guild, cfg, highlight_week=week_label)
 		file_bytes = html_text.encode("utf-8")
 		file = discord.File(fp=io.BytesIO(file_bytes), filename=f"{cfg.key}_rollcall.html")
 
@@ -1093,8 +1089,9 @@ class RollCallCog(commands.Cog):
 		state["html_channel_id"] = channel.id
 		state["html_url"] = msg.attachments[0].url if msg.attachments else None
 
-	def _render_html(self, guild: discord.Guild, ws, cfg: RollCallConfig, *, highlight_week: Optional[str]) -> str:
-		headers = self._sheet_headers(ws)
+	def _render_html(self, guild: discord.Guild, cfg: RollCallConfig, *, highlight_week: Optional[str]) -> str:
+		sheet = self._attendance.sheet_rows(self._sheet_key(cfg))
+		headers = sheet[0]
 		if not headers or headers[0] != "User ID":
 			headers = ["User ID", "Nickname"] + headers[2:]
 
@@ -1122,9 +1119,9 @@ class RollCallCog(commands.Cog):
 		main_rows: list[str] = []
 		excluded_rows: list[str] = []
 
-		for r in range(2, ws.max_row + 1):
-			uid_val = ws.cell(row=r, column=1).value
-			nick_val = ws.cell(row=r, column=2).value
+		for sheet_row in sheet[1:]:
+			uid_val = sheet_row[0]
+			nick_val = sheet_row[1]
 			if uid_val is None and nick_val is None:
 				continue
 			uid_int = parse_uid(uid_val)
@@ -1134,8 +1131,7 @@ class RollCallCog(commands.Cog):
 			# Use stored nickname (keeps history) but it should be kept up-to-date by refresh.
 			nick = str(nick_val or "")
 			cells = [html.escape(nick), html.escape(flags_str)]
-			for c in range(3, len(headers) + 1):
-				v = ws.cell(row=r, column=c).value
+			for v in sheet_row[2:]:
 				cells.append(html.escape(str(v or "")))
 			row_html = "<tr>" + "".join(f"<td>{v}</td>" for v in cells) + "</tr>"
 
@@ -1339,16 +1335,18 @@ class RollCallCog(commands.Cog):
 						pass
 				return
 
-		async with self._lock:
-			wb = self._load_or_create_workbook()
-			ws = self._get_or_create_sheet(wb, match_cfg)
-			col = self._ensure_week_column(ws, week_label)
-			row = self._upsert_member_row(ws, payload.user_id, member.display_name if member else str(payload.user_id))
-			self._set_cell(ws, row, col, "✅" if marked else "❌")
-			self._save_workbook(wb)
-			self._save_state()
-
-		# Outside lock: update outputs (debounced).
+		# One attendance row per reaction; the workbook is only exported when it is uploaded.
+		key = self._sheet_key(match_cfg)
+		await self._ensure_week(key, week_label)
+		await self._attendance.set_status(
+			key,
+			week_label,
+			payload.user_id,
+			"✅" if marked else "❌",
+			nickname=member.display_name if member else str(payload.user_id),
+		)
+
+		# Update outputs (debounced).
 		self._debounced_refresh(reason="reaction", delay_seconds=REACTION_REFRESH_DEBOUNCE_SECONDS)
 
 	@commands.Cog.listener()
@@ -16,7 +16,7 @@ from discord.ext import commands, tasks
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 
 
 LOGGER = logging.getLogger(__name__)
@@ -265,8 +265,8 @@ class StrategicReviewNote(commands.Cog):
     def cog_unload(self) -> None:
         self.monday_digest.cancel()
 
-    def _save_state(self) -> None:
-        atomic_json_dump(STATE_PATH, self.state, indent=2, ensure_ascii=False)
+    async def _save_state(self) -> None:
+        await atomic_json_dump_async(STATE_PATH, self.state, indent=2, ensure_ascii=False)
 
     async def _target_channel(self) -> discord.TextChannel | None:
         channel = self.bot.get_channel(STRATEGIC_REVIEW_CHANNEL_ID)
@@ -500,7 +500,7 @@ class StrategicReviewNote(commands.Cog):
         )
         async with self._state_lock:
             self.state["notes"][str(thread.id)] = note
-            self._save_state()
+            await self._save_state()
 
         await interaction.followup.send(
             f"Created strategic review note {thread.mention} with {message_count} message(s) in its transcript.",
@@ -592,7 +592,7 @@ class StrategicReviewNote(commands.Cog):
                 return
 
             note.update(closed_note)
-            self._save_state()
+            await self._save_state()
 
         await interaction.followup.send(f"Closed and locked **{note['title']}**.", ephemeral=True)
 
@@ -625,7 +625,7 @@ class StrategicReviewNote(commands.Cog):
                     removed.get("title"),
                     key,
                 )
-            self._save_state()
+            await self._save_state()
 
     @commands.Cog.listener()
     async def on_thread_delete(self, thread: discord.Thread) -> None:
@@ -743,7 +743,7 @@ class StrategicReviewNote(commands.Cog):
                 return
             async with self._state_lock:
                 self.state["last_digest_week"] = week_key
-                self._save_state()
+                await self._save_state()
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -3,7 +3,7 @@ import os
 
 import discord
 from discord.ext import commands
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 
 from config import MAIN_GUILD_ID
 from data_paths import data_path
@@ -27,8 +27,8 @@ def load_data() -> dict:
         return json.load(file_handle)
 
 
-def save_data(data: dict) -> None:
-    atomic_json_dump(DATA_FILE, data, indent=4)
+async def save_data(data: dict) -> None:
+    await atomic_json_dump_async(DATA_FILE, data, indent=4)
 
 
 class SupportersEmbed(commands.Cog):
@@ -145,7 +145,7 @@ class SupportersEmbed(commands.Cog):
             "channel_id": channel.id,
             "message_id": message.id,
         }
-        save_data(self.data)
+        await save_data(self.data)
         return message
 
     async def sync_embed(self) -> bool:
@@ -172,7 +172,7 @@ class SupportersEmbed(commands.Cog):
 
         if self.data.get("channel_id") != channel.id:
             self.data["channel_id"] = channel.id
-            save_data(self.data)
+            await save_data(self.data)
 
         if message.embeds and message.embeds[0].to_dict() == embed.to_dict():
             return True
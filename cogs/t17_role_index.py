@@ -9,10 +9,10 @@ import discord
 from discord.ext import commands
 from state_io import atomic_json_dump
 
-from clan_t17_lookup import ClanT17Lookup
+from clan_t17_lookup import ClanT17Lookup, ClanT17Mapping
 from config import MAIN_GUILD_ID
 from data_paths import data_path
-from hll_API_backend import HLLBackendError
+from hll_API_backend import HLLBackendBatchError, HLLBackendError
 
 GUILD_ID = MAIN_GUILD_ID
 FORUM_CHANNEL_ID = 1388644379211862096
@@ -22,7 +22,6 @@ THREAD_NAME = "T17 Member Index"
 THREAD_INTRO = "Auto-updated index of tracked members, Discord names, nicknames, and T17 IDs."
 SYNC_DEBOUNCE_SECONDS = 2.0
 MEMBERSHIP_SYNC_COOLDOWN_SECONDS = 300
-MEMBERSHIP_ADD_PACING_SECONDS = 1.0
 TRACKED_ROLE_NAMES = [
     "Basic Trained",
 ]
@@ -125,7 +124,7 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
         cooldown_until = asyncio.get_running_loop().time() + cooldown_seconds
         self._set_membership_sync_cooldown(cooldown_until)
 
-    def _is_bifrost_high_error_rate_lockout(self, error: BaseException) -> bool:
+    def _is_bifrost_high_error_rate_lockout(self, error: BaseException | str) -> bool:
         message = str(error or "").casefold()
         return "high error rate" in message and "restored automatically" in message
 
@@ -171,7 +170,7 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
             parts.append(current)
         return parts or ["No members currently have this role."]
 
-    def _build_role_embeds(self, guild: discord.Guild, role_name: str, mapping: dict[str, Any]) -> list[discord.Embed]:
+    def _build_role_embeds(self, guild: discord.Guild, role_name: str, mapping: ClanT17Mapping | dict[str, Any]) -> list[discord.Embed]:
         role = discord.utils.get(guild.roles, name=role_name)
         if role is None:
             embed = discord.Embed(
@@ -351,7 +350,7 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
         active_member_ids: set[int] = set()
         for role_name in TRACKED_ROLE_NAMES:
             role = discord.utils.get(guild.roles, name=role_name)
-            mapping: dict[str, Any] = self.lookup.empty_mapping()
+            mapping: ClanT17Mapping | dict[str, Any] = self.lookup.empty_mapping()
             if role is not None and role.members:
                 active_member_ids.update(member.id for member in role.members)
                 targets, mapping, _unresolved = await self.lookup.resolve_members_for_role(role.members, role_name=role_name)
@@ -445,17 +444,33 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
 
         self._clear_membership_sync_cooldown()
 
-        for index, (member_id, entry, previous_entry) in enumerate(members_to_upsert):
-            if index > 0:
-                await asyncio.sleep(MEMBERSHIP_ADD_PACING_SECONDS)
-            try:
-                if previous_entry is not None and previous_entry.get("t17_id") != entry.get("t17_id"):
-                    await backend.remove_guild_member(previous_entry["t17_id"])
-                await backend.add_guild_member(
-                    entry["t17_id"],
-                    entry["player_name"],
-                    platform="Xbox",
-                )
+        # Member add/remove mutations are packed into batched GraphQL documents
+        # and run in the Bifrost client's bulk lane, behind interactive commands.
+        upserts = {
+            member_id: {
+                "player_id": entry["t17_id"],
+                "player_name": entry["player_name"],
+                "platform": "Xbox",
+                "previous_player_id": previous_entry["t17_id"] if previous_entry is not None else "",
+            }
+            for member_id, entry, previous_entry in members_to_upsert
+        }
+        removals = {member_id: entry["t17_id"] for member_id, entry in members_to_remove}
+        batch_error: HLLBackendError | None = None
+        try:
+            batch_results = await backend.bulk_sync_guild_members(upserts, removals)
+        except HLLBackendBatchError as exc:
+            batch_error = exc
+            batch_results = exc.results
+        except HLLBackendError as exc:
+            batch_error = exc
+            batch_results = {}
+
+        for member_id, entry, _previous in members_to_upsert:
+            if member_id not in batch_results:
+                continue
+            error = batch_results[member_id]
+            if error is None:
                 self.logger.info(
                     "t17_role_index_member_added member_id=%s player_id=%s player_name=%r",
                     member_id,
@@ -467,33 +482,20 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
                     True,
                     f"Synchronized with Bifrost as T17 `{entry['t17_id']}`.",
                 )
-            except Exception as exc:
+            else:
                 self.logger.warning(
                     "t17_role_index_member_add_failed member_id=%s player_id=%s error=%s",
                     member_id,
                     entry["t17_id"],
-                    exc,
+                    error,
                 )
-                results[member_id] = (False, f"Bifrost add/update failed: {exc}")
-                retry_after = getattr(exc, "retry_after", None)
-                if retry_after is not None:
-                    self._trigger_membership_sync_cooldown(retry_after)
-                    self.logger.warning(
-                        "Pausing T17 guild member sync for %s seconds to honor the Bifrost retry window",
-                        retry_after,
-                    )
-                    break
-                if self._is_bifrost_high_error_rate_lockout(exc):
-                    self._trigger_membership_sync_cooldown()
-                    self.logger.warning(
-                        "Pausing T17 guild member sync for %s seconds to let the Bifrost error-rate lockout clear",
-                        MEMBERSHIP_SYNC_COOLDOWN_SECONDS,
-                    )
-                    break
+                results[member_id] = (False, f"Bifrost add/update failed: {error}")
 
         for member_id, entry in members_to_remove:
-            try:
-                await backend.remove_guild_member(entry["t17_id"])
+            if member_id not in batch_results:
+                continue
+            error = batch_results[member_id]
+            if error is None:
                 self.logger.info(
                     "t17_role_index_member_removed member_id=%s player_id=%s",
                     member_id,
@@ -504,14 +506,33 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
                     True,
                     f"Removed T17 `{entry['t17_id']}` from Bifrost membership.",
                 )
-            except Exception as exc:
+            else:
                 self.logger.warning(
                     "t17_role_index_member_remove_failed member_id=%s player_id=%s error=%s",
                     member_id,
                     entry["t17_id"],
-                    exc,
+                    error,
                 )
-                results[member_id] = (False, f"Bifrost removal failed: {exc}")
+                results[member_id] = (False, f"Bifrost removal failed: {error}")
+
+        lockout_detected = batch_error is not None and self._is_bifrost_high_error_rate_lockout(batch_error)
+        lockout_detected = lockout_detected or any(
+            error is not None and self._is_bifrost_high_error_rate_lockout(error)
+            for error in batch_results.values()
+        )
+        retry_after = getattr(batch_error, "retry_after", None)
+        if retry_after is not None:
+            self._trigger_membership_sync_cooldown(retry_after)
+            self.logger.warning(
+                "Pausing T17 guild member sync for %s seconds to honor the Bifrost retry window",
+                retry_after,
+            )
+        elif lockout_detected:
+            self._trigger_membership_sync_cooldown()
+            self.logger.warning(
+                "Pausing T17 guild member sync for %s seconds to let the Bifrost error-rate lockout clear",
+                MEMBERSHIP_SYNC_COOLDOWN_SECONDS,
+            )
 
         for member_id, _entry, _previous in members_to_upsert:
             results.setdefault(
@@ -525,6 +546,9 @@ class T17RoleIndex(commands.Cog, name="[API] T17RoleIndex"):
             )
 
         self._save_synced_members_state(next_state)
+        rate_limit_stats = getattr(backend, "rate_limit_stats", None)
+        if callable(rate_limit_stats):
+            self.logger.info("t17_role_index_membership_sync_scheduler stats=%s", rate_limit_stats())
         return results
 
     async def _post_role_change_results(
@@ -34,7 +34,7 @@ class T17Lookup(commands.Cog):
             return
 
         await interaction.response.defer(ephemeral=True, thinking=True)
-        self.lookup.set_manual_override(interaction.guild.id, member.id, clean_t17_id, updated_by=interaction.user.id)
+        await self.lookup.set_manual_override(interaction.guild.id, member.id, clean_t17_id, updated_by=interaction.user.id)
 
         refresh_failures: list[str] = []
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+import functools
 import json
 import logging
 import os
@@ -16,6 +16,7 @@ from clan_t17_lookup import ClanT17Lookup
 from config import MAIN_GUILD_ID
 from config.hll_API_config import get_hll_backend_status
 from data_paths import data_path
+from deadline_scheduler import DeadlineScheduler
 from hll_API_backend import HLLBackendError, get_hll_backend_client
 
 
@@ -42,15 +43,13 @@ class T17ServerAdmin(commands.Cog, name="[API] T17ServerAdmin"):
         self.bot = bot
         self.logger = logging.getLogger("T17ServerAdmin")
         self.lookup = ClanT17Lookup(logger=self.logger)
-        self._removal_tasks: dict[str, asyncio.Task[None]] = {}
+        self._removals = DeadlineScheduler("T17ServerAdmin admin cam")
 
     async def cog_load(self) -> None:
         await self._restore_pending_grants()
 
     async def cog_unload(self) -> None:
-        for task in self._removal_tasks.values():
-            task.cancel()
-        self._removal_tasks.clear()
+        await self._removals.close()
 
     def _grant_key(self, guild_id: int, user_id: int, server_name: str = "main") -> str:
         return f"{guild_id}:{user_id}:{server_name}"
@@ -97,56 +96,40 @@ class T17ServerAdmin(commands.Cog, name="[API] T17ServerAdmin"):
         grant = state.get("grants", {}).get(grant_key)
         return grant if isinstance(grant, dict) else None
 
-    def _cancel_removal_task(self, grant_key: str) -> None:
-        task = self._removal_tasks.pop(grant_key, None)
-        if task is not None:
-            task.cancel()
-
-    def _schedule_removal(self, grant_key: str) -> None:
-        self._cancel_removal_task(grant_key)
-        self._removal_tasks[grant_key] = asyncio.create_task(self._run_removal(grant_key))
+    def _schedule_removal(self, grant_key: str, when: float) -> None:
+        self._removals.schedule(grant_key, when, functools.partial(self._run_removal, grant_key))
 
     async def _restore_pending_grants(self) -> None:
         state = self._load_state()
         for grant_key, grant in state.get("grants", {}).items():
             if not isinstance(grant, dict):
                 continue
-            self._schedule_removal(grant_key)
+            self._schedule_removal(grant_key, float(grant.get("expires_at", 0)))
 
     async def _run_removal(self, grant_key: str) -> None:
+        grant = self._get_grant(grant_key)
+        if grant is None:
+            return
+
+        expires_at = float(grant.get("expires_at", 0))
+        if expires_at > time.time():
+            # The grant was extended after this removal was scheduled
+            self._schedule_removal(grant_key, expires_at)
+            return
+
         try:
-            while True:
-                grant = self._get_grant(grant_key)
-                if grant is None:
-                    return
-
-                expires_at = float(grant.get("expires_at", 0))
-                delay_seconds = max(0.0, expires_at - time.time())
-                if delay_seconds > 0:
-                    await asyncio.sleep(delay_seconds)
-
-                try:
-                    await self._remove_admin_cam(grant)
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
-                    self.logger.exception(
-                        "t17admincam_remove_failed grant_key=%s player_id=%s error=%s",
-                        grant_key,
-                        grant.get("player_id"),
-                        exc,
-                    )
-                    await asyncio.sleep(REMOVAL_RETRY_SECONDS)
-                    continue
-
-                self._remove_grant_record(grant_key)
-                return
-        except asyncio.CancelledError:
-            raise
-        finally:
-            current = self._removal_tasks.get(grant_key)
-            if current is asyncio.current_task():
-                self._removal_tasks.pop(grant_key, None)
+            await self._remove_admin_cam(grant)
+        except Exception as exc:
+            self.logger.exception(
+                "t17admincam_remove_failed grant_key=%s player_id=%s error=%s",
+                grant_key,
+                grant.get("player_id"),
+                exc,
+            )
+            self._schedule_removal(grant_key, time.time() + REMOVAL_RETRY_SECONDS)
+            return
+
+        self._remove_grant_record(grant_key)
 
     async def _add_admin_cam(self, server_name: str, player_id: str, description: str) -> None:
         await get_hll_backend_client(server_name).grant_admin_cam(player_id, description)
@@ -209,7 +192,7 @@ class T17ServerAdmin(commands.Cog, name="[API] T17ServerAdmin"):
         }
         grant_key = self._grant_key(guild_id, user_id, server_name)
         self._upsert_grant(grant)
-        self._schedule_removal(grant_key)
+        self._schedule_removal(grant_key, expires_at)
         return grant
 
     @app_commands.command(name="hll_backend_status", description="Show the active HLL backend configuration status.")
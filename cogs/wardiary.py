@@ -3,16 +3,19 @@ import io
 import json
 import logging
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Optional
 
 import discord
 from discord.ext import commands
-from state_io import atomic_json_dump
+from state_io import atomic_json_dump_async
 
 from config.common import CLAN_NAMES_PATH, SCOREBOARD_FONT_PATH
 from data_paths import data_path
+from image_render import fitted_background, render as render_image
+from text_layout import fit_font
 
 
 log = logging.getLogger(__name__)
@@ -51,6 +54,18 @@ RESULT_BACKGROUND_PATH: str = os.path.join(os.path.dirname(__file__), "scoreboar
 BACKGROUND_GIF_PATH: str = os.path.join(os.path.dirname(__file__), "scoreboard_gif.gif")
 BACKGROUND_IMAGE_PATH: str = os.path.join(os.path.dirname(__file__), "scoreboard_blank.jpg")
 GIF_WIN_INTERVAL: int = 5
+# Budgets for animated results: source frames beyond GIF_MAX_FRAMES are merged
+# (durations kept), and the encoded GIF is thinned further until it fits
+# GIF_MAX_BYTES, which leaves headroom under Discord's base upload limit.
+GIF_MAX_FRAMES: int = 60
+GIF_MAX_BYTES: int = 8 * 1024 * 1024
+GIF_PALETTE_COLORS: int = 256
+# Decoded GIF frame stacks are cached in each render worker, palettised (one
+# byte per pixel), so a 1600x900 frame is ~1.4 MB and a full GIF_MAX_FRAMES
+# stack ~86 MB. The cache is capped at GIF_FRAME_CACHE_MAX_BYTES per worker:
+# worst case 96 MB each, 192 MB across image_render's two workers. A stack
+# larger than the cap is rendered without being cached.
+GIF_FRAME_CACHE_MAX_BYTES: int = 96 * 1024 * 1024
 OTHER_MAP_OPTION: str = "Other"
 MATCH_TYPE_OPTIONS: list[str] = ["Competitive", "Friendly"]
 
@@ -166,6 +181,180 @@ def _media_extension(path: str) -> str:
 	return os.path.splitext(path)[1].lower()
 
 
+RESULT_IMAGE_SIZE = (1600, 900)
+RESULT_SHADE_RGBA = (8, 12, 20, 140)
+
+
+def _shaded(frame, size: tuple[int, int]):
+	"""Fit ``frame`` to ``size`` and darken it under the result text."""
+	from PIL import Image, ImageOps
+
+	base = ImageOps.fit(frame.convert("RGBA"), size, method=Image.Resampling.LANCZOS)
+	base.alpha_composite(Image.new("RGBA", size, RESULT_SHADE_RGBA))
+	return base.convert("RGB")
+
+
+def _merge_frames(frames: list, durations: list[int], max_frames: int) -> tuple[list, list[int]]:
+	"""Keep every n-th frame so at most ``max_frames`` remain, folding dropped frames' durations into the kept ones."""
+	step = -(-len(frames) // max(1, max_frames))
+	if step <= 1:
+		return list(frames), list(durations)
+	return (
+		[frames[index] for index in range(0, len(frames), step)],
+		[sum(durations[index:index + step]) for index in range(0, len(frames), step)],
+	)
+
+
+_gif_frame_cache: OrderedDict[tuple, tuple[tuple, tuple[int, ...], int]] = OrderedDict()
+
+
+def _load_shaded_gif_frames(path: str, size: tuple[int, int], max_frames: int) -> tuple[tuple, tuple[int, ...]]:
+	from PIL import Image, ImageSequence
+
+	frames = []
+	durations = []
+	with Image.open(path) as source:
+		default_duration = source.info.get("duration", 100)
+		for frame in ImageSequence.Iterator(source):
+			durations.append(frame.info.get("duration", default_duration) or default_duration)
+			frames.append(frame.convert("RGB"))
+	frames, durations = _merge_frames(frames, durations, max_frames)
+	shaded = [_shaded(frame, size) for frame in frames]
+	# The encoder quantizes to one shared palette anyway; doing it here keeps
+	# the cached stack at a quarter of its RGB size.
+	palette = shaded[0].quantize(colors=GIF_PALETTE_COLORS)
+	return tuple(frame.quantize(palette=palette, dither=Image.Dither.NONE) for frame in shaded), tuple(durations)
+
+
+def shaded_gif_frames(path: str, size: tuple[int, int], max_frames: int) -> tuple[tuple, tuple[int, ...]]:
+	"""Return the decoded, fitted and darkened frames of a GIF background with their durations.
+
+	Frames are palettised and cached per file (invalidated by mtime) within
+	GIF_FRAME_CACHE_MAX_BYTES, so repeated GIF results only pay for the text
+	composite and the encode. The returned frames are shared; callers must
+	copy before drawing.
+	"""
+	key = (path, os.stat(path).st_mtime_ns, tuple(size), max_frames)
+	cached = _gif_frame_cache.get(key)
+	if cached is not None:
+		_gif_frame_cache.move_to_end(key)
+		return cached[0], cached[1]
+
+	frames, durations = _load_shaded_gif_frames(path, tuple(size), max_frames)
+	size_bytes = sum(frame.width * frame.height for frame in frames)
+	if size_bytes > GIF_FRAME_CACHE_MAX_BYTES:
+		log.info("wardiary_gif_frames_not_cached bytes=%s budget=%s", size_bytes, GIF_FRAME_CACHE_MAX_BYTES)
+		return frames, durations
+	_gif_frame_cache[key] = (frames, durations, size_bytes)
+	while sum(entry[2] for entry in _gif_frame_cache.values()) > GIF_FRAME_CACHE_MAX_BYTES:
+		_gif_frame_cache.popitem(last=False)
+	return frames, durations
+
+
+def _composed(frame, text_layer):
+	"""RGB copy of ``frame`` with ``text_layer`` pasted over it."""
+	composed = frame.convert("RGB")
+	composed.paste(text_layer, (0, 0), text_layer)
+	return composed
+
+
+def _encode_gif(frames: list, durations: list[int], max_bytes: int) -> bytes:
+	"""Encode palettised frames, merging frames until the file fits ``max_bytes``."""
+	while True:
+		out = io.BytesIO()
+		frames[0].save(
+			out,
+			format="GIF",
+			save_all=True,
+			append_images=frames[1:],
+			duration=durations,
+			loop=0,
+			disposal=1,
+			# Frames already share one palette; Pillow's optimize pass only
+			# re-scans every frame in Python.
+			optimize=False,
+		)
+		if out.tell() <= max_bytes or len(frames) == 1:
+			return out.getvalue()
+		log.info("wardiary_gif_over_budget bytes=%s frames=%s", out.tell(), len(frames))
+		frames, durations = _merge_frames(frames, durations, len(frames) // 2)
+
+
+def render_result_image(
+	*,
+	background_source: Optional[str],
+	output_extension: str,
+	submitter_clan_name: str,
+	opponent_clan_name: str,
+	submitter_score: int,
+	opponent_score: int,
+	match_type: str,
+	match_date: str,
+	max_frames: int = GIF_MAX_FRAMES,
+	max_bytes: int = GIF_MAX_BYTES,
+) -> tuple[bytes, str]:
+	"""Render the war diary result card; runs in the shared render pool.
+
+	GIF backgrounds are limited to ``max_frames`` frames and the encoded GIF
+	to ``max_bytes``; frames are merged (durations kept) to stay within both.
+	"""
+	from PIL import Image, ImageDraw
+
+	width, height = RESULT_IMAGE_SIZE
+
+	frames = []
+	durations = [100]
+	if background_source:
+		try:
+			if _media_extension(background_source) == ".gif":
+				frames, durations = shaded_gif_frames(background_source, RESULT_IMAGE_SIZE, max_frames)
+				frames, durations = list(frames), list(durations)
+			else:
+				frames = [_shaded(fitted_background(background_source, RESULT_IMAGE_SIZE), RESULT_IMAGE_SIZE)]
+		except Exception:
+			log.warning("Failed to render war diary background from %s", background_source, exc_info=True)
+			frames, durations = [], [100]
+
+	if not frames:
+		frames = [_shaded(Image.new("RGB", RESULT_IMAGE_SIZE, (18, 24, 38)), RESULT_IMAGE_SIZE)]
+
+	text_fill = (255, 255, 255, 255)
+
+	score_font = fit_font(FONT_PATH, f"{submitter_score} - {opponent_score}", int(width * 0.35), 170, 48)
+	clan_font = fit_font(
+		FONT_PATH,
+		submitter_clan_name if len(submitter_clan_name) >= len(opponent_clan_name) else opponent_clan_name,
+		int(width * 0.28),
+		80,
+		24,
+	)
+	date_font = fit_font(FONT_PATH, match_date, int(width * 0.28), 80, 24)
+	match_type_font = fit_font(FONT_PATH, match_type, int(width * 0.28), 80, 24)
+
+	center_y = height // 2
+	text_layer = Image.new("RGBA", RESULT_IMAGE_SIZE, (0, 0, 0, 0))
+	draw = ImageDraw.Draw(text_layer)
+	draw.text((width * 0.24, center_y), submitter_clan_name, font=clan_font, fill=text_fill, anchor="lm")
+	draw.text((width // 2, center_y), f"{submitter_score} - {opponent_score}", font=score_font, fill=text_fill, anchor="mm")
+	draw.text((width * 0.76, center_y), opponent_clan_name, font=clan_font, fill=text_fill, anchor="rm")
+	draw.text((width // 2, center_y - 190), match_type, font=match_type_font, fill=text_fill, anchor="mm")
+	draw.text((width // 2, center_y + 190), match_date, font=date_font, fill=text_fill, anchor="mm")
+
+	first = _composed(frames[0], text_layer)
+	if output_extension == ".gif":
+		# Quantize each frame as it is composed so only one RGB frame is
+		# alive at a time, not the whole stack.
+		palette = first.quantize(colors=GIF_PALETTE_COLORS)
+		rendered_frames = [first.quantize(palette=palette, dither=Image.Dither.NONE)]
+		for frame in frames[1:]:
+			rendered_frames.append(_composed(frame, text_layer).quantize(palette=palette, dither=Image.Dither.NONE))
+		return _encode_gif(rendered_frames, durations, max_bytes), output_extension
+
+	out = io.BytesIO()
+	first.save(out, format="PNG")
+	return out.getvalue(), output_extension
+
+
 @dataclass(frozen=True)
 class ClanConfig:
 	name: str
@@ -526,7 +715,6 @@ class WarDiaryCog(commands.Cog):
 		self._state = self._load_state()
 		self._ensure_lock = asyncio.Lock()
 		self._match_lock = asyncio.Lock()
-		self._background_cache: dict[str, bytes] = {}
 		self._missing_background_sources: set[str] = set()
 
 	def _load_state(self) -> dict[str, Any]:
@@ -540,10 +728,10 @@ class WarDiaryCog(commands.Cog):
 			log.warning("Failed to load war diary state; starting fresh.", exc_info=True)
 			return {}
 
-	def _save_state(self) -> None:
+	async def _save_state(self) -> None:
 		try:
 			self._state["updated_at"] = _utcnow().isoformat()
-			atomic_json_dump(STATE_PATH, self._state)
+			await atomic_json_dump_async(STATE_PATH, self._state)
 		except Exception:
 			log.warning("Failed to save war diary state.", exc_info=True)
 
@@ -620,10 +808,10 @@ class WarDiaryCog(commands.Cog):
 		if thread is not None:
 			return thread
 		if self._remove_match_record_by_thread_id(thread_id):
-			self._save_state()
+			await self._save_state()
 		return None
 
-	def _clear_deleted_thread_state(self, thread_id: int) -> bool:
+	async def _clear_deleted_thread_state(self, thread_id: int) -> bool:
 		changed = False
 		if _safe_int(self._state.get("submission_thread_id")) == thread_id:
 			self._state.pop("submission_thread_id", None)
@@ -632,7 +820,7 @@ class WarDiaryCog(commands.Cog):
 		if self._remove_match_record_by_thread_id(thread_id):
 			changed = True
 		if changed:
-			self._save_state()
+			await self._save_state()
 		return changed
 
 	def _is_submission_thread_message(self, message: discord.Message) -> bool:
@@ -692,7 +880,7 @@ class WarDiaryCog(commands.Cog):
 
 	@commands.Cog.listener()
 	async def on_thread_delete(self, thread: discord.Thread) -> None:
-		self._clear_deleted_thread_state(thread.id)
+		await self._clear_deleted_thread_state(thread.id)
 
 	@commands.Cog.listener()
 	async def on_message(self, message: discord.Message) -> None:
@@ -854,7 +1042,7 @@ class WarDiaryCog(commands.Cog):
 					except discord.NotFound:
 						self._state.pop("submission_thread_id", None)
 						self._state.pop("submission_message_id", None)
-						self._save_state()
+						await self._save_state()
 					except Exception:
 						log.exception("Failed updating existing war diary submission post")
 						return
@@ -880,7 +1068,7 @@ class WarDiaryCog(commands.Cog):
 			self._state["submission_thread_id"] = thread.id
 			if message is not None:
 				self._state["submission_message_id"] = message.id
-			self._save_state()
+			await self._save_state()
 
 	def _build_result_embed(
 		self,
@@ -916,27 +1104,14 @@ class WarDiaryCog(commands.Cog):
 		embed.set_image(url=f"attachment://{filename}")
 		return embed
 
-	def _load_background_bytes(self, source: str) -> Optional[bytes]:
-		cached = self._background_cache.get(source)
-		if cached is not None:
-			return cached
+	def _background_available(self, source: str) -> bool:
 		if source in self._missing_background_sources:
-			return None
-
-		try:
-			with open(source, "rb") as handle:
-				data = handle.read()
-		except FileNotFoundError:
+			return False
+		if not os.path.isfile(source):
 			self._missing_background_sources.add(source)
 			log.info("War diary background file not found at %s; falling back to local background.", source)
-			return None
-		except Exception:
-			self._missing_background_sources.add(source)
-			log.warning("Failed to load war diary background from %s; falling back to local background.", source, exc_info=True)
-			return None
-
-		self._background_cache[source] = data
-		return data
+			return False
+		return True
 
 	def _fallback_background_sources(self) -> list[str]:
 		sources: list[str] = []
@@ -967,7 +1142,7 @@ class WarDiaryCog(commands.Cog):
 		configured_ext = _media_extension(RESULT_BACKGROUND_PATH)
 		return RESULT_BACKGROUND_PATH, ".gif" if configured_ext == ".gif" else ".png"
 
-	def _render_result_image(
+	async def _render_result_image(
 		self,
 		*,
 		submitter_clan_name: str,
@@ -979,100 +1154,27 @@ class WarDiaryCog(commands.Cog):
 		map_name: str,
 		prefer_gif: bool,
 	) -> tuple[bytes, str]:
-		from PIL import Image, ImageDraw, ImageFont, ImageOps, ImageSequence
-
-		width = 1600
-		height = 900
 		background_source, output_extension = self._select_result_background(prefer_gif=prefer_gif, map_name=map_name)
-		use_gif_background = _media_extension(background_source) == ".gif"
-		background_bytes = self._load_background_bytes(background_source)
-		if background_bytes is None:
+		if not self._background_available(background_source):
 			for fallback_source in self._fallback_background_sources():
-				if fallback_source == background_source:
-					continue
-				background_bytes = self._load_background_bytes(fallback_source)
-				if background_bytes is not None:
+				if fallback_source != background_source and self._background_available(fallback_source):
 					background_source = fallback_source
-					use_gif_background = _media_extension(background_source) == ".gif"
-					output_extension = ".gif" if use_gif_background else ".png"
+					output_extension = ".gif" if _media_extension(background_source) == ".gif" else ".png"
 					break
-
-		source_frames = []
-		durations = []
-		if background_bytes:
-			try:
-				with Image.open(io.BytesIO(background_bytes)) as source_media:
-					if use_gif_background:
-						source_frames = [frame.copy() for frame in ImageSequence.Iterator(source_media)]
-						durations = [frame.info.get("duration", source_media.info.get("duration", 100)) for frame in ImageSequence.Iterator(source_media)]
-					else:
-						source_frames = [source_media.convert("RGBA")]
-						durations = [100]
-			except Exception:
-				log.warning("Failed to render war diary background from %s", background_source, exc_info=True)
-
-		if not source_frames:
-			source_frames = [Image.new("RGBA", (width, height), (18, 24, 38, 255))]
-			durations = [100]
-
-		def load_font(size: int):
-			try:
-				return ImageFont.truetype(FONT_PATH, size)
-			except Exception:
-				return ImageFont.load_default()
-
-		def fit_font(text: str, max_width: int, start_size: int, min_size: int):
-			for size in range(start_size, min_size - 1, -2):
-				font = load_font(size)
-				bbox = reference_draw.textbbox((0, 0), text, font=font)
-				if (bbox[2] - bbox[0]) <= max_width:
-					return font
-			return load_font(min_size)
-
-		reference_frame = ImageOps.fit(source_frames[0].convert("RGBA"), (width, height), method=Image.Resampling.LANCZOS)
-		reference_draw = ImageDraw.Draw(reference_frame)
-		text_fill = (255, 255, 255, 255)
-
-		score_font = fit_font(f"{submitter_score} - {opponent_score}", int(width * 0.35), 170, 48)
-		clan_font = fit_font(
-			submitter_clan_name if len(submitter_clan_name) >= len(opponent_clan_name) else opponent_clan_name,
-			int(width * 0.28),
-			80,
-			24,
+			else:
+				background_source = None
+
+		return await render_image(
+			render_result_image,
+			background_source=background_source,
+			output_extension=output_extension,
+			submitter_clan_name=submitter_clan_name,
+			opponent_clan_name=opponent_clan_name,
+			submitter_score=submitter_score,
+			opponent_score=opponent_score,
+			match_type=match_type,
+			match_date=match_date,
 		)
-		date_font = fit_font(match_date, int(width * 0.28), 80, 24)
-		match_type_font = fit_font(match_type, int(width * 0.28), 80, 24)
-
-		center_y = height // 2
-		rendered_frames: list[Image.Image] = []
-		for frame in source_frames:
-			base = ImageOps.fit(frame.convert("RGBA"), (width, height), method=Image.Resampling.LANCZOS)
-			overlay = Image.new("RGBA", (width, height), (8, 12, 20, 140))
-			base = Image.alpha_composite(base, overlay)
-			draw = ImageDraw.Draw(base)
-			draw.text((width * 0.24, center_y), submitter_clan_name, font=clan_font, fill=text_fill, anchor="lm")
-			draw.text((width // 2, center_y), f"{submitter_score} - {opponent_score}", font=score_font, fill=text_fill, anchor="mm")
-			draw.text((width * 0.76, center_y), opponent_clan_name, font=clan_font, fill=text_fill, anchor="rm")
-			draw.text((width // 2, center_y - 190), match_type, font=match_type_font, fill=text_fill, anchor="mm")
-			draw.text((width // 2, center_y + 190), match_date, font=date_font, fill=text_fill, anchor="mm")
-			rendered_frames.append(base)
-
-		out = io.BytesIO()
-		first_frame = rendered_frames[0]
-		if output_extension == ".gif":
-			first_frame.save(
-				out,
-				format="GIF",
-				save_all=True,
-				append_images=rendered_frames[1:],
-				duration=durations[: len(rendered_frames)] or 100,
-				loop=0,
-				disposal=2,
-			)
-		else:
-			first_frame.save(out, format="PNG")
-		out.seek(0)
-		return out.getvalue(), output_extension
 
 	async def create_result_post(
 		self,
@@ -1108,7 +1210,7 @@ class WarDiaryCog(commands.Cog):
 			thread_name = _truncate_thread_name(
 				f"{clan_name} {submitter_score} - {opponent_score} {opponent_clan_name}"
 			)
-			image_bytes, output_extension = self._render_result_image(
+			image_bytes, output_extension = await self._render_result_image(
 				submitter_clan_name=clan_name,
 				opponent_clan_name=opponent_clan_name,
 				submitter_score=submitter_score,
@@ -1166,7 +1268,7 @@ class WarDiaryCog(commands.Cog):
 				match_date=match_date,
 				is_7dr_win=is_7dr_win,
 			)
-			self._save_state()
+			await self._save_state()
 			return thread, None
 
 
@@ -13,6 +13,11 @@ BIFROST_GRAPHQL_URL = os.getenv("BIFROST_GRAPHQL_URL", "https://api.dev.bifrostg
 BIFROST_CLIENT_ID_ENV = "BIFROST_CLIENT_ID"
 BIFROST_CLIENT_SECRET_ENV = "BIFROST_CLIENT_SECRET"
 
+# Client-side request budget for Bifrost GraphQL, shared by every request a
+# client makes. A server entry can override either value with the same keys.
+BIFROST_REQUESTS_PER_SECOND = float(os.getenv("BIFROST_REQUESTS_PER_SECOND", "1.0") or 1.0)
+BIFROST_REQUEST_BURST = int(os.getenv("BIFROST_REQUEST_BURST", "5") or 5)
+
 HLL_BACKEND_SERVERS: dict[str, dict[str, Any]] = {
     "main": {
         "crcon": {
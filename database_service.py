@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Sequence
+
+import aiosqlite
+
+
+DEFAULT_READER_CONNECTIONS = 2
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256
+
+logger = logging.getLogger("DatabaseService")
+
+
+class SharedDatabase:
+    """Long-lived aiosqlite connections for one SQLite file.
+
+    Writes share a single connection behind an asyncio lock, so cogs queue
+    for it inside the bot instead of contending for SQLite's file lock.
+    Reads borrow one of a few reader connections, which WAL mode lets run
+    alongside the writer. Connections stay open for the life of the bot, so
+    each one keeps its prepared statements cached between interactions.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, readers: int = DEFAULT_READER_CONNECTIONS) -> None:
+        self.path = Path(path)
+        self.reader_count = max(1, readers)
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: asyncio.Queue[aiosqlite.Connection] | None = None
+        self._reader_connections: list[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    async def _connect(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            str(self.path),
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        await connection.execute("PRAGMA journal_mode=WAL")
+        await connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        await connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    async def open(self) -> None:
+        if self._writer is not None:
+            return
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            writer = await self._connect()
+            readers = [await self._connect() for _ in range(self.reader_count)]
+            queue: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+            for reader in readers:
+                queue.put_nowait(reader)
+            self._reader_connections = readers
+            self._readers = queue
+            self._writer = writer
+            logger.info("Opened %s with %d reader connection(s)", self.path.name, len(readers))
+
+    @asynccontextmanager
+    async def write(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Hold the writer connection; commits on success, rolls back on error.
+
+        Do not await anything that writes to the same database inside the
+        block: the writer lock is not re-entrant.
+        """
+
+        await self.open()
+        async with self._write_lock:
+            writer = self._writer
+            assert writer is not None
+            try:
+                yield writer
+            except BaseException:
+                await writer.rollback()
+                raise
+            await writer.commit()
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        await self.open()
+        readers = self._readers
+        assert readers is not None
+        connection = await readers.get()
+        try:
+            yield connection
+        finally:
+            readers.put_nowait(connection)
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> Any:
+        async with self.read() as db:
+            cursor = await db.execute(sql, tuple(params))
+            return await cursor.fetchone()
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> list[Any]:
+        async with self.read() as db:
+            cursor = await db.execute(sql, tuple(params))
+            return list(await cursor.fetchall())
+
+    async def migrate(self, migrations: Sequence[Sequence[str]]) -> int:
+        """Bring the schema up to ``len(migrations)`` using ``PRAGMA user_version``.
+
+        Each entry holds the statements for one version and is applied in its
+        own transaction, so a failed step leaves the previous version intact.
+        Returns the schema version afterwards.
+        """
+
+        async with self.write() as db:
+            cursor = await db.execute("PRAGMA user_version")
+            (version,) = await cursor.fetchone()
+            for target in range(version + 1, len(migrations) + 1):
+                await db.execute("BEGIN IMMEDIATE")
+                for statement in migrations[target - 1]:
+                    await db.execute(statement)
+                await db.execute(f"PRAGMA user_version = {target}")
+                await db.commit()
+                logger.info("Migrated %s to schema version %d", self.path.name, target)
+                version = target
+        return version
+
+    async def execute(self, sql: str, params: Iterable[Any] = ()) -> int:
+        """Run one write statement in its own transaction and return its rowcount."""
+
+        async with self.write() as db:
+            cursor = await db.execute(sql, tuple(params))
+            return cursor.rowcount
+
+    async def close(self) -> None:
+        async with self._open_lock, self._write_lock:
+            connections = [self._writer, *self._reader_connections] if self._writer is not None else []
+            self._writer = None
+            self._readers = None
+            self._reader_connections = []
+            for connection in connections:
+                await connection.close()
+
+
+_databases: dict[str, SharedDatabase] = {}
+
+
+def get_database(path: str | os.PathLike[str]) -> SharedDatabase:
+    """Return the shared service for ``path``; connections open on first use."""
+
+    key = str(Path(path).resolve())
+    database = _databases.get(key)
+    if database is None:
+        database = _databases[key] = SharedDatabase(key)
+    return database
+
+
+async def close_databases() -> None:
+    for database in list(_databases.values()):
+        if database.is_open:
+            await database.close()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Awaitable, Callable, Hashable
+
+
+logger = logging.getLogger("DeadlineScheduler")
+
+DeadlineCallback = Callable[[], Awaitable[None]]
+
+
+class DeadlineScheduler:
+    """Runs async callbacks at wall-clock deadlines from a single timer task.
+
+    Pending deadlines sit in a min-heap keyed by ``time.time()`` timestamps.
+    One task sleeps until the earliest deadline and is woken early only when
+    an earlier one is scheduled, so an idle scheduler never wakes up.
+    Scheduling a key that is already pending replaces its deadline;
+    superseded heap entries are skipped when they surface.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._pending: dict[Hashable, tuple[float, int, DeadlineCallback]] = {}
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        self._running: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def next_deadline(self) -> float | None:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def schedule(self, key: Hashable, when: float, callback: DeadlineCallback) -> None:
+        """Run ``callback`` at ``when`` (a ``time.time()`` timestamp), replacing any pending deadline for ``key``."""
+
+        if self._closed:
+            raise RuntimeError(f"Deadline scheduler {self.name} is closed")
+        sequence = next(self._sequence)
+        self._pending[key] = (when, sequence, callback)
+        earliest = self.next_deadline()
+        heapq.heappush(self._heap, (when, sequence, key))
+        if earliest is None or when < earliest:
+            self._wakeup.set()
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run(), name=f"deadlines:{self.name}")
+
+    def cancel(self, key: Hashable) -> bool:
+        """Forget the pending deadline for ``key``; returns False if none was pending."""
+
+        return self._pending.pop(key, None) is not None
+
+    async def close(self) -> None:
+        self._closed = True
+        self._pending.clear()
+        self._heap.clear()
+        tasks = [task for task in (self._runner, *self._running) if task is not None]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._runner = None
+        self._running.clear()
+
+    def _discard_stale(self) -> None:
+        heap = self._heap
+        while heap:
+            _when, sequence, key = heap[0]
+            pending = self._pending.get(key)
+            if pending is not None and pending[1] == sequence:
+                return
+            heapq.heappop(heap)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            earliest = self.next_deadline()
+            if earliest is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = earliest - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _when, _sequence, key = heapq.heappop(self._heap)
+            _when, _sequence, callback = self._pending.pop(key)
+            task = asyncio.create_task(self._fire(key, callback))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _fire(self, key: Hashable, callback: DeadlineCallback) -> None:
+        try:
+            await callback()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("deadline_callback_failed scheduler=%s key=%s", self.name, key)
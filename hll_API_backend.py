@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import heapq
+import itertools
 import json
 import logging
 import os
 import time
 import urllib.parse
+from collections import deque
 from datetime import datetime
 from typing import Any, Protocol
 
-import requests
+import aiohttp
 
 from config.hll_API_config import (
     BIFROST_CLIENT_ID_ENV,
     BIFROST_CLIENT_SECRET_ENV,
     BIFROST_GRAPHQL_URL,
     BIFROST_OAUTH_URL,
+    BIFROST_REQUEST_BURST,
+    BIFROST_REQUESTS_PER_SECOND,
     get_hll_backend_provider,
     get_hll_backend_server_config,
 )
@@ -23,6 +29,38 @@ from config.hll_API_config import (
 
 logger = logging.getLogger("HLLBackend")
 ADMIN_CAM_ROLE = "Spectator"
+HTTP_CONNECTIONS_PER_HOST = 8
+HTTP_KEEPALIVE_SECONDS = 60.0
+HTTP_DNS_CACHE_SECONDS = 300
+
+# Scheduler lanes: lower values are dispatched first when requests queue up.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BULK = 2
+PRIORITY_LANE_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_DEFAULT: "default",
+    PRIORITY_BULK: "bulk",
+}
+SCHEDULER_SLOW_WAIT_SECONDS = 5.0
+
+# Aliased guild member mutations packed into one GraphQL document.
+GUILD_MEMBER_BATCH_SIZE = 20
+
+# Shared read-cache lifetimes per (provider, operation). Bifrost allows
+# guildGetGameState once every 30 seconds per server, so cached reads never
+# outpace that budget however many cogs poll the same server.
+READ_CACHE_TTL_SECONDS: dict[tuple[str, str], float] = {
+    ("bifrost", "get_mapvote_game_state"): 30.0,
+    ("bifrost", "get_mapvote_logs"): 15.0,
+    ("crcon", "get_mapvote_game_state"): 5.0,
+    ("crcon", "get_mapvote_logs"): 5.0,
+}
+
+# Fingerprints of already-returned log entries kept per cursor. Neither backend
+# gives log lines a unique id and several can share a timestamp, so entries at
+# the cursor's timestamp are told apart by content.
+LOG_CURSOR_DEDUP_SIZE = 256
 
 
 class HLLBackendError(RuntimeError):
@@ -35,6 +73,20 @@ class HLLBackendConfigError(HLLBackendError):
     pass
 
 
+class HLLBackendBatchError(HLLBackendError):
+    """A batch stopped early; ``results`` holds the outcomes already known."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        results: dict[Any, str | None],
+        retry_after: float | None = None,
+    ) -> None:
+        super().__init__(message, retry_after=retry_after)
+        self.results = results
+
+
 class HLLBackendClient(Protocol):
     provider: str
 
@@ -47,6 +99,17 @@ class HLLBackendClient(Protocol):
     async def get_mapvote_logs(self) -> list[dict[str, Any]]:
         ...
 
+    async def get_logs_since(
+        self,
+        cursor: LogCursor | None,
+        *,
+        actions: tuple[str, ...] | list[str] = (),
+    ) -> tuple[list[dict[str, Any]], LogCursor]:
+        ...
+
+    def invalidate_cached_reads(self) -> None:
+        ...
+
     async def set_mapvote_rotation(self, map_ids: list[str]) -> dict[str, Any]:
         ...
 
@@ -157,16 +220,95 @@ def _extract_retry_after_seconds(payload: Any) -> float | None:
     return None
 
 
-def _parse_response_payload(response: requests.Response) -> Any:
-    body = response.text or ""
+def _parse_response_payload(body: str) -> Any:
     if not body.strip():
         return None
     try:
-        return response.json()
+        return json.loads(body)
     except json.JSONDecodeError:
         return body
 
 
+# One keep-alive session per backend origin. Sessions are created lazily on the
+# running loop so every client sharing an origin reuses the same TCP/TLS pool,
+# and are closed by close_hll_backend_sessions() when the bot shuts down.
+_http_sessions: dict[str, tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+
+def _http_origin(url: str) -> str:
+    parsed = urllib.parse.urlsplit(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def _close_stale_session(origin: str, loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession) -> None:
+    # A session's connector belongs to the loop that created it, so it can
+    # only be closed there. Sessions on a loop that has stopped cannot be
+    # closed cleanly; log them so the leak is visible.
+    if session.closed:
+        return
+    if loop.is_running():
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        logger.info("hll_backend_http_session_replaced origin=%s old_session=scheduled_close", origin)
+    else:
+        logger.warning("hll_backend_http_session_replaced origin=%s old_session=leaked loop_stopped=true", origin)
+
+
+def _get_http_session(url: str) -> aiohttp.ClientSession:
+    loop = asyncio.get_running_loop()
+    origin = _http_origin(url)
+    cached = _http_sessions.get(origin)
+    if cached is not None:
+        cached_loop, session = cached
+        if cached_loop is loop and not session.closed:
+            return session
+        _close_stale_session(origin, cached_loop, session)
+
+    connector = aiohttp.TCPConnector(
+        limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+    )
+    session = aiohttp.ClientSession(connector=connector)
+    _http_sessions[origin] = (loop, session)
+    logger.debug("hll_backend_http_session_created origin=%s", origin)
+    return session
+
+
+async def _http_request(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str],
+    json_payload: Any = None,
+    form: dict[str, str] | None = None,
+    timeout: float,
+) -> tuple[int, Any]:
+    session = _get_http_session(url)
+    async with session.request(
+        method,
+        url,
+        headers=headers,
+        json=json_payload,
+        data=form,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    ) as response:
+        body = await response.text()
+        return response.status, _parse_response_payload(body)
+
+
+def _describe_transport_error(exc: BaseException) -> str:
+    # aiohttp timeouts carry no message; fall back to the exception name.
+    return str(exc) or type(exc).__name__
+
+
+async def close_hll_backend_sessions() -> None:
+    sessions = list(_http_sessions.values())
+    _http_sessions.clear()
+    for _loop, session in sessions:
+        if not session.closed:
+            await session.close()
+
+
 def _iso_to_timestamp_ms(value: str | None) -> int:
     raw_value = str(value or "").strip()
     if not raw_value:
@@ -177,6 +319,80 @@ def _iso_to_timestamp_ms(value: str | None) -> int:
         return 0
 
 
+class LogCursor:
+    """Opaque position in a server's log stream, returned by ``get_logs_since``.
+
+    Holds the newest timestamp handed out plus a small ring buffer of entry
+    fingerprints at or near it. Only ``timestamp_ms`` is worth persisting; a
+    cursor rebuilt from it alone may repeat entries that share that exact
+    millisecond, never older ones.
+    """
+
+    __slots__ = ("timestamp_ms", "_seen")
+
+    def __init__(self, timestamp_ms: int = 0, seen: Any = ()) -> None:
+        self.timestamp_ms = int(timestamp_ms or 0)
+        self._seen: deque[str] = deque(seen, maxlen=LOG_CURSOR_DEDUP_SIZE)
+
+    def __repr__(self) -> str:
+        return f"LogCursor(timestamp_ms={self.timestamp_ms}, seen={len(self._seen)})"
+
+
+def _log_timestamp_ms(entry: dict[str, Any]) -> int:
+    try:
+        return int(entry.get("timestamp_ms") or entry.get("id") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _log_fingerprint(entry: dict[str, Any]) -> str:
+    return json.dumps(
+        [_log_timestamp_ms(entry), entry.get("action"), entry.get("raw") or entry.get("data") or entry.get("message")],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _log_matches(entry: dict[str, Any], actions: set[str]) -> bool:
+    if not actions:
+        return True
+    action = str(entry.get("action") or "").strip().upper()
+    return any(selected in action for selected in actions)
+
+
+def _logs_since(
+    logs: list[dict[str, Any]],
+    cursor: LogCursor | None,
+    actions: tuple[str, ...] | list[str],
+) -> tuple[list[dict[str, Any]], LogCursor]:
+    """Split a fetched log window into entries newer than ``cursor`` and the advanced cursor.
+
+    The cursor advances over every new entry, subscribed or not, so later
+    polls never rescan lines the caller chose to ignore. ``actions`` match
+    case-insensitively as substrings of the entry's action.
+    """
+
+    floor = cursor.timestamp_ms if cursor is not None else 0
+    seen = set(cursor._seen) if cursor is not None else set()
+    advanced = LogCursor(floor, cursor._seen if cursor is not None else ())
+    selected = {str(action or "").strip().upper() for action in actions if str(action or "").strip()}
+
+    fresh: list[dict[str, Any]] = []
+    for entry in sorted(logs, key=_log_timestamp_ms):
+        timestamp_ms = _log_timestamp_ms(entry)
+        if timestamp_ms < floor:
+            continue
+        fingerprint = _log_fingerprint(entry)
+        if fingerprint in seen:
+            continue
+        seen.add(fingerprint)
+        advanced._seen.append(fingerprint)
+        advanced.timestamp_ms = max(advanced.timestamp_ms, timestamp_ms)
+        if _log_matches(entry, selected):
+            fresh.append(entry)
+    return fresh, advanced
+
+
 def _infer_rotation_game_mode(map_id: str) -> str:
     normalized = str(map_id or "").strip().casefold()
     if "offensive" in normalized:
@@ -188,6 +404,193 @@ def _infer_rotation_game_mode(map_id: str) -> str:
     return "Warfare"
 
 
+class _TokenBucketScheduler:
+    """Pace requests to a provider budget with priority lanes.
+
+    Tokens refill at ``rate`` per second up to ``burst``. When no token is
+    available, callers queue by priority (then arrival order) and a single
+    dispatcher hands out tokens as they refill. A provider retry window pauses
+    every lane until it has passed.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = max(0.01, float(rate))
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._wait_totals: dict[int, float] = {lane: 0.0 for lane in PRIORITY_LANE_NAMES}
+        self._wait_counts: dict[int, int] = {lane: 0 for lane in PRIORITY_LANE_NAMES}
+        self._max_waits: dict[int, float] = {lane: 0.0 for lane in PRIORITY_LANE_NAMES}
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _try_take(self, now: float) -> bool:
+        if now < self._blocked_until:
+            return False
+        self._refill(now)
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def _next_ready_delay(self, now: float) -> float:
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        return max(0.0, (1.0 - self._tokens) / self.rate)
+
+    async def acquire(self, priority: int = PRIORITY_DEFAULT) -> float:
+        started = time.monotonic()
+        if not self._waiters and self._try_take(started):
+            self._record_wait(priority, 0.0)
+            return 0.0
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+        waited = time.monotonic() - started
+        self._record_wait(priority, waited)
+        return waited
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            now = time.monotonic()
+            if not self._try_take(now):
+                await asyncio.sleep(self._next_ready_delay(now))
+                continue
+            while self._waiters:
+                _priority, _sequence, future = heapq.heappop(self._waiters)
+                if not future.done():
+                    future.set_result(None)
+                    break
+            else:
+                # Every queued caller was cancelled; return the unused token.
+                self._tokens = min(float(self.burst), self._tokens + 1.0)
+
+    def penalize(self, retry_after: float) -> None:
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + max(0.0, retry_after))
+
+    def _record_wait(self, priority: int, waited: float) -> None:
+        self._wait_totals[priority] = self._wait_totals.get(priority, 0.0) + waited
+        self._wait_counts[priority] = self._wait_counts.get(priority, 0) + 1
+        self._max_waits[priority] = max(self._max_waits.get(priority, 0.0), waited)
+
+    def queue_depth(self, priority: int | None = None) -> int:
+        return sum(
+            1
+            for lane, _sequence, future in self._waiters
+            if not future.done() and (priority is None or lane == priority)
+        )
+
+    def stats(self) -> dict[str, Any]:
+        lanes: dict[str, dict[str, Any]] = {}
+        for lane, name in PRIORITY_LANE_NAMES.items():
+            count = self._wait_counts.get(lane, 0)
+            lanes[name] = {
+                "queued": self.queue_depth(lane),
+                "requests": count,
+                "avg_wait_seconds": round(self._wait_totals.get(lane, 0.0) / count, 3) if count else 0.0,
+                "max_wait_seconds": round(self._max_waits.get(lane, 0.0), 3),
+            }
+        now = time.monotonic()
+        self._refill(now)
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3),
+            "blocked_for_seconds": round(max(0.0, self._blocked_until - now), 3),
+            "lanes": lanes,
+        }
+
+
+ReadCacheKey = tuple[str, str, str, str]
+
+
+class _CoalescingReadCache:
+    """Share backend reads between callers polling the same server.
+
+    Concurrent identical reads are merged into one upstream request and
+    successful results are served from memory until their TTL expires.
+    Failures are never cached so the next caller retries immediately.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[ReadCacheKey, tuple[float, Any]] = {}
+        self._in_flight: dict[ReadCacheKey, asyncio.Future[Any]] = {}
+        # Bumped by invalidate(); a read that started under an older
+        # generation may have seen pre-write state, so it is not cached.
+        self._generations: dict[tuple[str, str], int] = {}
+
+    async def get(self, key: ReadCacheKey, ttl: float, fetch: Any) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return copy.deepcopy(entry[1])
+
+        future = self._in_flight.get(key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            generation = self._generations.get((key[0], key[1]), 0)
+            future = asyncio.ensure_future(fetch())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, ttl, generation, done))
+
+        # Shield the shared request so one cancelled waiter does not cancel it
+        # for every other cog awaiting the same read.
+        result = await asyncio.shield(future)
+        return copy.deepcopy(result)
+
+    def _finish(self, key: ReadCacheKey, ttl: float, generation: int, future: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is future:
+            self._in_flight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        if ttl > 0 and self._generations.get((key[0], key[1]), 0) == generation:
+            self._entries[key] = (time.monotonic() + ttl, future.result())
+
+    def invalidate(self, provider: str, server: str) -> None:
+        """Drop cached and in-flight reads for one server.
+
+        Reads already in flight still complete for their current waiters, but
+        new callers start a fresh read and the old result is not cached.
+        """
+
+        self._generations[(provider, server)] = self._generations.get((provider, server), 0) + 1
+        for store in (self._entries, self._in_flight):
+            for key in [key for key in store if key[0] == provider and key[1] == server]:
+                store.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._in_flight.clear()
+        self._generations.clear()
+
+
+_read_cache = _CoalescingReadCache()
+
+
+async def _cached_read(
+    provider: str,
+    server: str,
+    operation: str,
+    variables: dict[str, Any],
+    fetch: Any,
+) -> Any:
+    key = (provider, server, operation, json.dumps(variables, sort_keys=True, default=str))
+    ttl = READ_CACHE_TTL_SECONDS.get((provider, operation), 0.0)
+    return await _read_cache.get(key, ttl, fetch)
+
+
 class CRCONBackendClient:
     provider = "crcon"
 
@@ -213,20 +616,10 @@ class CRCONBackendClient:
         headers = self._auth_headers()
         url = self.panel_url + endpoint
 
-        def do_request() -> tuple[int, Any]:
-            response = requests.request(method, url, headers=headers, json=payload, timeout=15)
-            body = response.text or ""
-            if not body.strip():
-                return response.status_code, None
-            try:
-                return response.status_code, response.json()
-            except json.JSONDecodeError:
-                return response.status_code, body
-
         try:
-            return await asyncio.to_thread(do_request)
-        except requests.RequestException as exc:
-            raise HLLBackendError(str(exc)) from exc
+            return await _http_request(method, url, headers=headers, json_payload=payload, timeout=15)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise HLLBackendError(_describe_transport_error(exc)) from exc
 
     async def resolve_player_id_by_name(self, player_name: str) -> str | None:
         endpoint = f"get_players_history?player_name={urllib.parse.quote(player_name, safe='')}&page_size=1"
@@ -238,6 +631,15 @@ class CRCONBackendClient:
         return _extract_first_player_id(payload.get("result", payload))
 
     async def get_mapvote_game_state(self) -> dict[str, Any] | None:
+        return await _cached_read(
+            self.provider,
+            self.panel_url,
+            "get_mapvote_game_state",
+            {},
+            self._fetch_mapvote_game_state,
+        )
+
+    async def _fetch_mapvote_game_state(self) -> dict[str, Any] | None:
         status, payload = await self._request("GET", "get_gamestate")
         if status >= 400:
             raise HLLBackendError(_extract_error_message(payload))
@@ -247,6 +649,15 @@ class CRCONBackendClient:
         return result if isinstance(result, dict) else None
 
     async def get_mapvote_logs(self) -> list[dict[str, Any]]:
+        return await _cached_read(
+            self.provider,
+            self.panel_url,
+            "get_mapvote_logs",
+            {},
+            self._fetch_mapvote_logs,
+        )
+
+    async def _fetch_mapvote_logs(self) -> list[dict[str, Any]]:
         status, payload = await self._request("GET", "get_recent_logs")
         if status >= 400:
             raise HLLBackendError(_extract_error_message(payload))
@@ -256,8 +667,24 @@ class CRCONBackendClient:
         logs = result.get("logs") if isinstance(result, dict) else None
         return [item for item in logs if isinstance(item, dict)] if isinstance(logs, list) else []
 
+    async def get_logs_since(
+        self,
+        cursor: LogCursor | None,
+        *,
+        actions: tuple[str, ...] | list[str] = (),
+    ) -> tuple[list[dict[str, Any]], LogCursor]:
+        """Return log entries newer than ``cursor`` for the given actions, plus the next cursor."""
+
+        return _logs_since(await self.get_mapvote_logs(), cursor, actions)
+
+    def invalidate_cached_reads(self) -> None:
+        """Drop coalesced reads for this server so the next read goes upstream."""
+
+        _read_cache.invalidate(self.provider, self.panel_url)
+
     async def set_mapvote_rotation(self, map_ids: list[str]) -> dict[str, Any]:
         status, payload = await self._request("POST", "set_map_rotation", {"map_names": map_ids})
+        _read_cache.invalidate(self.provider, self.panel_url)
         if status >= 400:
             raise HLLBackendError(_extract_error_message(payload))
         if isinstance(payload, dict):
@@ -349,6 +776,10 @@ class BifrostBackendClient:
         self._access_token: str | None = None
         self._access_token_expires_at = 0.0
         self._token_lock = asyncio.Lock()
+        self.scheduler = _TokenBucketScheduler(
+            float(bifrost_server.get("requests_per_second") or BIFROST_REQUESTS_PER_SECOND),
+            int(bifrost_server.get("request_burst") or BIFROST_REQUEST_BURST),
+        )
 
         if not self.server_id:
             raise HLLBackendConfigError("BIFROST_SERVER_ID is not configured for the selected HLL backend")
@@ -374,25 +805,24 @@ class BifrostBackendClient:
 
             client_id, client_secret = self._client_credentials()
 
-            def do_request() -> tuple[int, Any]:
-                response = requests.post(
-                    self.oauth_url,
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                    data={
-                        "grant_type": "client_credentials",
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                    },
-                    timeout=15,
-                )
-                return response.status_code, _parse_response_payload(response)
-
             payload: Any = None
             for attempt in range(1, self.max_rate_limit_retries + 1):
                 try:
-                    status_code, payload = await asyncio.to_thread(do_request)
-                except requests.RequestException as exc:
-                    raise HLLBackendError(f"Failed to fetch Bifrost access token: {exc}") from exc
+                    status_code, payload = await _http_request(
+                        "POST",
+                        self.oauth_url,
+                        headers={"Content-Type": "application/x-www-form-urlencoded"},
+                        form={
+                            "grant_type": "client_credentials",
+                            "client_id": client_id,
+                            "client_secret": client_secret,
+                        },
+                        timeout=15,
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    raise HLLBackendError(
+                        f"Failed to fetch Bifrost access token: {_describe_transport_error(exc)}"
+                    ) from exc
 
                 if status_code == 429:
                     retry_after = _extract_retry_after_seconds(payload)
@@ -425,27 +855,53 @@ class BifrostBackendClient:
             self._access_token_expires_at = time.time() + expires_in
             return access_token
 
-    async def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
-        def do_request(access_token: str) -> tuple[int, Any]:
-            response = requests.post(
-                self.graphql_url,
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json",
-                },
-                json={"query": query, "variables": variables},
-                timeout=20,
+    def rate_limit_stats(self) -> dict[str, Any]:
+        return self.scheduler.stats()
+
+    async def _schedule_request(self, priority: int) -> None:
+        queue_depth = self.scheduler.queue_depth()
+        waited = await self.scheduler.acquire(priority)
+        lane = PRIORITY_LANE_NAMES.get(priority, str(priority))
+        if waited >= SCHEDULER_SLOW_WAIT_SECONDS:
+            logger.info(
+                "bifrost_graphql_scheduled lane=%s waited=%.2f queue_depth=%s",
+                lane,
+                waited,
+                queue_depth,
+            )
+        else:
+            logger.debug(
+                "bifrost_graphql_scheduled lane=%s waited=%.2f queue_depth=%s",
+                lane,
+                waited,
+                queue_depth,
             )
-            return response.status_code, _parse_response_payload(response)
 
+    async def _graphql_payload(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        *,
+        priority: int = PRIORITY_DEFAULT,
+    ) -> dict[str, Any]:
         payload: Any = None
         refreshed_expired_token = False
         for attempt in range(1, self.max_rate_limit_retries + 1):
             access_token = await self._get_access_token()
+            await self._schedule_request(priority)
             try:
-                status_code, payload = await asyncio.to_thread(do_request, access_token)
-            except requests.RequestException as exc:
-                raise HLLBackendError(f"Bifrost request failed: {exc}") from exc
+                status_code, payload = await _http_request(
+                    "POST",
+                    self.graphql_url,
+                    headers={
+                        "Authorization": f"Bearer {access_token}",
+                        "Content-Type": "application/json",
+                    },
+                    json_payload={"query": query, "variables": variables},
+                    timeout=20,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                raise HLLBackendError(f"Bifrost request failed: {_describe_transport_error(exc)}") from exc
 
             # A cached token can be revoked or expire before its advertised
             # lifetime. Refresh it once and replay only the rejected request;
@@ -459,6 +915,8 @@ class BifrostBackendClient:
 
             if status_code == 429:
                 retry_after = _extract_retry_after_seconds(payload)
+                if retry_after is not None:
+                    self.scheduler.penalize(retry_after)
                 if retry_after is None or attempt >= self.max_rate_limit_retries:
                     raise HLLBackendError(
                         f"Bifrost rate limited: {_extract_error_message(payload)}",
@@ -469,7 +927,7 @@ class BifrostBackendClient:
                     retry_after,
                     attempt,
                 )
-                await asyncio.sleep(retry_after)
+                # The scheduler now holds every lane until the retry window ends.
                 continue
 
             if status_code >= 400:
@@ -481,6 +939,16 @@ class BifrostBackendClient:
                 raise HLLBackendError("Bifrost returned an unexpected response payload")
             break
 
+        return payload
+
+    async def _graphql(
+        self,
+        query: str,
+        variables: dict[str, Any],
+        *,
+        priority: int = PRIORITY_DEFAULT,
+    ) -> dict[str, Any]:
+        payload = await self._graphql_payload(query, variables, priority=priority)
         errors = payload.get("errors")
         if isinstance(errors, list) and errors:
             messages = []
@@ -508,6 +976,15 @@ class BifrostBackendClient:
         return None
 
     async def get_mapvote_game_state(self) -> dict[str, Any] | None:
+        return await _cached_read(
+            self.provider,
+            self.server_id,
+            "get_mapvote_game_state",
+            {"gameType": self.game_type},
+            self._fetch_mapvote_game_state,
+        )
+
+    async def _fetch_mapvote_game_state(self) -> dict[str, Any] | None:
         query = (
             "query GuildGetGameState($serverId: ID!, $gameType: String) {"
             " guildGetGameState(serverId: $serverId, gameType: $gameType) {"
@@ -529,6 +1006,15 @@ class BifrostBackendClient:
         return payload if isinstance(payload, dict) else None
 
     async def get_mapvote_logs(self) -> list[dict[str, Any]]:
+        return await _cached_read(
+            self.provider,
+            self.server_id,
+            "get_mapvote_logs",
+            {"gameType": self.game_type},
+            self._fetch_mapvote_logs,
+        )
+
+    async def _fetch_mapvote_logs(self) -> list[dict[str, Any]]:
         query = (
             "query GuildGetLogs($serverId: ID!, $gameType: String) {"
             " guildGetLogs(serverId: $serverId, gameType: $gameType) {"
@@ -571,6 +1057,21 @@ class BifrostBackendClient:
             )
         return normalized_logs
 
+    async def get_logs_since(
+        self,
+        cursor: LogCursor | None,
+        *,
+        actions: tuple[str, ...] | list[str] = (),
+    ) -> tuple[list[dict[str, Any]], LogCursor]:
+        """Return log entries newer than ``cursor`` for the given actions, plus the next cursor."""
+
+        return _logs_since(await self.get_mapvote_logs(), cursor, actions)
+
+    def invalidate_cached_reads(self) -> None:
+        """Drop coalesced reads for this server so the next read goes upstream."""
+
+        _read_cache.invalidate(self.provider, self.server_id)
+
     async def set_mapvote_rotation(self, map_ids: list[str]) -> dict[str, Any]:
         query = (
             "mutation GuildSetServerRotation($serverId: ID!, $rotation: [MapRotationInput!]!, $gameType: String) {"
@@ -592,6 +1093,7 @@ class BifrostBackendClient:
                 "gameType": self.game_type,
             },
         )
+        _read_cache.invalidate(self.provider, self.server_id)
         payload = data.get("guildSetServerRotation") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
             raise HLLBackendError(_extract_error_message(payload))
@@ -613,6 +1115,7 @@ class BifrostBackendClient:
                 }
             },
         )
+        _read_cache.invalidate(self.provider, self.server_id)
         payload = data.get("guildSetNextMap") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
             raise HLLBackendError(_extract_error_message(payload))
@@ -684,6 +1187,7 @@ class BifrostBackendClient:
                 }
             },
         )
+        _read_cache.invalidate(self.provider, self.server_id)
         payload = data.get("guildChangeMap") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
             raise HLLBackendError(_extract_error_message(payload))
@@ -718,6 +1222,7 @@ class BifrostBackendClient:
             {
                 "input": input_payload
             },
+            priority=PRIORITY_BULK,
         )
         payload = data.get("guildAddMember") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
@@ -736,11 +1241,113 @@ class BifrostBackendClient:
                     "playerId": player_id,
                 }
             },
+            priority=PRIORITY_BULK,
         )
         payload = data.get("guildRemoveMember") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
             raise HLLBackendError(_extract_error_message(payload))
 
+    async def bulk_sync_guild_members(
+        self,
+        upserts: dict[Any, dict[str, str]],
+        removals: dict[Any, str],
+    ) -> dict[Any, str | None]:
+        """Add, update and remove guild members with batched aliased mutations.
+
+        ``upserts`` maps a caller key to ``player_id``, ``player_name`` and
+        optional ``platform`` / ``previous_player_id`` (removed first when the
+        ID changed). ``removals`` maps a caller key to a player ID. Returns each
+        key's error message, or ``None`` when every mutation for it succeeded.
+        """
+
+        operations: list[tuple[Any, str, dict[str, Any]]] = []
+        for key, player_id in removals.items():
+            operations.append((key, "guildRemoveMember", {"playerId": player_id}))
+        for key, entry in upserts.items():
+            previous_player_id = str(entry.get("previous_player_id") or "").strip()
+            if previous_player_id and previous_player_id != entry["player_id"]:
+                operations.append((key, "guildRemoveMember", {"playerId": previous_player_id}))
+            operations.append(
+                (
+                    key,
+                    "guildAddMember",
+                    {
+                        "playerId": entry["player_id"],
+                        "playerName": entry["player_name"],
+                        "platform": entry.get("platform") or "PC",
+                    },
+                )
+            )
+
+        results: dict[Any, str | None] = {}
+        for start in range(0, len(operations), GUILD_MEMBER_BATCH_SIZE):
+            batch = operations[start:start + GUILD_MEMBER_BATCH_SIZE]
+            try:
+                batch_errors, retry_after = await self._run_guild_member_batch(batch)
+            except HLLBackendError as exc:
+                for key, _field, _input in batch:
+                    results[key] = str(exc)
+                raise HLLBackendBatchError(str(exc), results=results, retry_after=exc.retry_after) from exc
+
+            for index, (key, _field, _input) in enumerate(batch):
+                error = batch_errors.get(index)
+                if error is not None:
+                    results[key] = error
+                else:
+                    results.setdefault(key, None)
+
+            if retry_after is not None:
+                message = "Bifrost asked to retry guild member sync later"
+                raise HLLBackendBatchError(message, results=results, retry_after=retry_after)
+
+        return results
+
+    async def _run_guild_member_batch(
+        self,
+        batch: list[tuple[Any, str, dict[str, Any]]],
+    ) -> tuple[dict[int, str], float | None]:
+        input_types = {
+            "guildAddMember": "GuildAddMemberInput!",
+            "guildRemoveMember": "GuildRemoveMemberInput!",
+        }
+        declarations: list[str] = []
+        selections: list[str] = []
+        variables: dict[str, Any] = {}
+        for index, (_key, field, input_payload) in enumerate(batch):
+            alias = f"op{index}"
+            declarations.append(f"${alias}: {input_types[field]}")
+            selections.append(f" {alias}: {field}(input: ${alias}) {{ success message error }}")
+            variables[alias] = input_payload
+        query = "mutation GuildBulkSyncMembers(" + ", ".join(declarations) + ") {" + "".join(selections) + " }"
+
+        payload = await self._graphql_payload(query, variables, priority=PRIORITY_BULK)
+        data = payload.get("data") if isinstance(payload.get("data"), dict) else {}
+        errors_by_alias: dict[str, list[dict[str, Any]]] = {}
+        unattributed: list[dict[str, Any]] = []
+        for item in payload.get("errors") or []:
+            if not isinstance(item, dict):
+                continue
+            path = item.get("path")
+            if isinstance(path, list) and path and isinstance(path[0], str):
+                errors_by_alias.setdefault(path[0], []).append(item)
+            else:
+                unattributed.append(item)
+
+        batch_errors: dict[int, str] = {}
+        retry_after: float | None = None
+        for index in range(len(batch)):
+            alias = f"op{index}"
+            item_errors = errors_by_alias.get(alias, []) + unattributed
+            result = data.get(alias)
+            if item_errors:
+                batch_errors[index] = _extract_error_message({"errors": item_errors})
+                item_retry_after = _extract_retry_after_seconds({"errors": item_errors})
+                if item_retry_after is not None:
+                    retry_after = max(retry_after or 0.0, item_retry_after)
+            elif not isinstance(result, dict) or not result.get("success"):
+                batch_errors[index] = _extract_error_message(result)
+        return batch_errors, retry_after
+
     async def grant_admin_cam(self, player_id: str, player_name: str) -> None:
         query = (
             "mutation GuildGrantAdminCam($input: GuildGrantAdminCamInput!) {"
@@ -756,6 +1363,7 @@ class BifrostBackendClient:
                     "playerName": player_name,
                 }
             },
+            priority=PRIORITY_INTERACTIVE,
         )
         payload = data.get("guildGrantAdminCam") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
@@ -775,6 +1383,7 @@ class BifrostBackendClient:
                     "playerId": player_id,
                 }
             },
+            priority=PRIORITY_INTERACTIVE,
         )
         payload = data.get("guildRevokeAdminCam") or {}
         if not isinstance(payload, dict) or not payload.get("success"):
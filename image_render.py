@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, TypeVar
+
+from PIL import Image, ImageFont, ImageOps
+
+
+RENDER_WORKERS = 2
+FONT_CACHE_SIZE = 64
+# Fitted backgrounds are kept as RGB (a 1600x900 one is ~4 MB), per process.
+BACKGROUND_CACHE_SIZE = 16
+
+logger = logging.getLogger("ImageRender")
+
+T = TypeVar("T")
+Font = ImageFont.FreeTypeFont | ImageFont.ImageFont
+
+_render_pool: ProcessPoolExecutor | None = None
+# Jobs every render worker runs once at start-up, one per function
+# (module, qualname), so a reloaded cog replaces its warm-up instead of
+# adding another. _pool_warmups records what the running pool started with.
+_warmups: dict[tuple[str, str], functools.partial] = {}
+_pool_warmups: dict[tuple[str, str], dict[str, Any]] = {}
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(path: str, size: int) -> Font:
+    """Return the TrueType font at ``path`` and ``size``, or Pillow's default if it cannot be loaded.
+
+    Fonts are cached per process, so a render worker loads each (path, size)
+    once for its lifetime instead of once per image.
+    """
+
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=BACKGROUND_CACHE_SIZE)
+def _fitted_background(path: str, modified_ns: int, size: tuple[int, int]) -> Image.Image:
+    with Image.open(path) as source:
+        return ImageOps.fit(source.convert("RGB"), size, method=Image.Resampling.LANCZOS)
+
+
+def fitted_background(path: str, size: tuple[int, int]) -> Image.Image:
+    """Return the image at ``path`` cropped and LANCZOS-resized to ``size`` as a fresh RGBA copy.
+
+    The decoded, fitted image is cached per (path, size) and invalidated when
+    the file changes on disk. Raises like ``Image.open`` if the file is
+    missing or unreadable.
+    """
+
+    fitted = _fitted_background(path, os.stat(path).st_mtime_ns, tuple(size))
+    return fitted.convert("RGBA")
+
+
+@functools.lru_cache(maxsize=BACKGROUND_CACHE_SIZE)
+def _decoded_image(path: str, modified_ns: int) -> Image.Image:
+    with Image.open(path) as source:
+        return source.convert("RGBA")
+
+
+def load_image(path: str) -> Image.Image:
+    """Return the image at ``path`` as a fresh RGBA copy, decoded once per file version."""
+
+    return _decoded_image(path, os.stat(path).st_mtime_ns).copy()
+
+
+def _run_warmups(jobs: tuple[functools.partial, ...]) -> None:
+    for job in jobs:
+        try:
+            job()
+        except Exception:
+            logger.warning("render_warmup_failed func=%s", job.func.__qualname__, exc_info=True)
+
+
+def _warmup_key(func: Callable[..., Any]) -> tuple[str, str]:
+    return func.__module__, func.__qualname__
+
+
+def _get_render_pool() -> ProcessPoolExecutor:
+    global _render_pool, _pool_warmups
+    if _render_pool is None:
+        _pool_warmups = {key: dict(job.keywords) for key, job in _warmups.items()}
+        _render_pool = ProcessPoolExecutor(
+            max_workers=RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_run_warmups,
+            initargs=(tuple(_warmups.values()),),
+        )
+    return _render_pool
+
+
+def register_warmup(func: Callable[..., Any], /, **kwargs: Any) -> None:
+    """Run ``func(**kwargs)`` in every render worker when it starts, before its first job.
+
+    Same pickling rules as ``render``. Each function has one warm-up:
+    registering it again replaces its arguments. If the running pool was
+    started without this exact warm-up, it is replaced once its in-flight
+    jobs finish, so no worker misses it.
+    """
+
+    global _render_pool
+    key = _warmup_key(func)
+    _warmups[key] = functools.partial(func, **kwargs)
+    if _render_pool is None or _pool_warmups.get(key) == kwargs:
+        return
+    pool, _render_pool = _render_pool, None
+    pool.shutdown(wait=False)
+
+
+def unregister_warmup(func: Callable[..., Any]) -> None:
+    """Stop running ``func``'s warm-up in workers started from now on.
+
+    Running workers keep what it cached; their LRU caches age it out.
+    """
+
+    _warmups.pop(_warmup_key(func), None)
+
+
+def _started() -> None:
+    return None
+
+
+async def start_render_workers() -> None:
+    """Start all ``RENDER_WORKERS`` processes now, so their warm-ups run before the first real job.
+
+    One job is submitted per worker. Spawn pools only start a process when
+    no idle one exists, so the concurrent jobs start every worker.
+    """
+
+    await asyncio.gather(*(render(_started) for _ in range(RENDER_WORKERS)))
+
+
+async def render(func: Callable[..., T], /, **kwargs: Any) -> T:
+    """Run ``func(**kwargs)`` in the shared render process pool.
+
+    The job is pickled: ``func`` must be a module-level function and every
+    argument plain data (str, int, bytes, tuples). Workers keep their font
+    and background caches between jobs. If the pool breaks, the job runs in
+    a worker thread instead so the event loop is still never blocked.
+    """
+
+    global _render_pool
+    job = functools.partial(func, **kwargs)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_render_pool(), job)
+    except BrokenProcessPool:
+        logger.warning("render_pool_broken func=%s falling back to a worker thread", func.__qualname__)
+        _render_pool = None
+        return await asyncio.to_thread(job)
+
+
+def close_render_pool() -> None:
+    global _render_pool
+    pool, _render_pool = _render_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
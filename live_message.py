@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict, deque
+from typing import Any, Iterable
+
+import discord
+
+
+EDIT_BUCKET_CAPACITY = 5
+EDIT_BUCKET_WINDOW_SECONDS = 5.0
+DEFAULT_VOLATILE_EMBED_KEYS = ("timestamp",)
+# Remembered payload hashes; the least recently written ones are dropped
+# first, so ids whose owners never call ``forget`` cannot grow without bound.
+HASH_CACHE_SIZE = 1024
+
+
+def _embed_payload(embed: discord.Embed, volatile: Iterable[str]) -> dict[str, Any]:
+    data = embed.to_dict()
+    for key in volatile:
+        data.pop(key, None)
+    return data
+
+
+def payload_hash(
+    *,
+    content: str | None = None,
+    embed: discord.Embed | None = None,
+    embeds: Iterable[discord.Embed] | None = None,
+    view: discord.ui.View | None = None,
+    volatile: Iterable[str] = DEFAULT_VOLATILE_EMBED_KEYS,
+) -> str:
+    """Digest of what a message edit would render.
+
+    Embed keys listed in ``volatile`` (by default the timestamp, which most
+    live embeds stamp with "now") are left out so they alone never count as
+    a change. The view contributes its component layout.
+    """
+
+    volatile = tuple(volatile)
+    all_embeds = ([embed] if embed is not None else []) + list(embeds or ())
+    payload = {
+        "content": content,
+        "embeds": [_embed_payload(item, volatile) for item in all_embeds],
+        "components": view.to_components() if view is not None else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class _EditBucket:
+    """Sliding-window pacing for message edits in one channel.
+
+    Discord buckets ``PATCH /channels/{channel_id}/messages/{message_id}``
+    by channel, so every live message in a channel shares this allowance.
+    """
+
+    def __init__(self, capacity: int, window: float) -> None:
+        self.capacity = capacity
+        self.window = window
+        self._sent: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.window:
+                    self._sent.popleft()
+                if len(self._sent) < self.capacity:
+                    self._sent.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self._sent[0]))
+
+
+class _MessageSlot:
+    __slots__ = ("lock", "generation")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.generation = 0
+
+
+class LiveMessageEditor:
+    """Edits long-lived status messages only when their rendered payload changes.
+
+    The editor remembers the payload hash last sent to each message id, so a
+    refresh that renders the same embed sends no edit. Edits to one
+    message are serialised; while one is in flight or waiting for the
+    channel's rate-limit bucket, newer payloads replace older queued ones and
+    only the latest is sent. Errors from ``message.edit`` propagate to the
+    caller, which keeps its existing NotFound/Forbidden handling.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_capacity: int = EDIT_BUCKET_CAPACITY,
+        bucket_window: float = EDIT_BUCKET_WINDOW_SECONDS,
+        hash_cache_size: int = HASH_CACHE_SIZE,
+    ) -> None:
+        self._bucket_capacity = bucket_capacity
+        self._bucket_window = bucket_window
+        self._hash_cache_size = hash_cache_size
+        self._hashes: OrderedDict[int, str] = OrderedDict()
+        self._slots: dict[int, _MessageSlot] = {}
+        self._buckets: dict[int, _EditBucket] = {}
+
+    def unchanged(self, message_id: int, *, volatile: Iterable[str] = DEFAULT_VOLATILE_EMBED_KEYS, **fields: Any) -> bool:
+        """True when ``fields`` match what was last sent to ``message_id``.
+
+        This says nothing about whether the message still exists, so it must
+        not be used to skip fetching it: a message deleted by hand would never
+        be reposted. ``edit`` already skips an unchanged PATCH.
+        """
+
+        return self._hashes.get(message_id) == payload_hash(volatile=volatile, **fields)
+
+    def record(self, message: discord.abc.Snowflake, *, volatile: Iterable[str] = DEFAULT_VOLATILE_EMBED_KEYS, **fields: Any) -> None:
+        """Remember the payload a message was just sent with."""
+
+        self._remember(message.id, payload_hash(volatile=volatile, **fields))
+
+    def forget(self, message_id: int) -> None:
+        """Drop everything remembered about ``message_id`` (call when it is deleted or retired)."""
+
+        self._hashes.pop(message_id, None)
+        slot = self._slots.get(message_id)
+        if slot is not None and not slot.lock.locked():
+            del self._slots[message_id]
+
+    async def edit(
+        self,
+        message: discord.Message | discord.PartialMessage,
+        *,
+        volatile: Iterable[str] = DEFAULT_VOLATILE_EMBED_KEYS,
+        **fields: Any,
+    ) -> bool:
+        """Edit ``message`` with ``fields`` unless nothing rendered would change.
+
+        ``fields`` are passed to ``message.edit``; ``content``, ``embed``,
+        ``embeds`` and ``view`` also feed the payload hash. Returns True if
+        this call sent the edit, False if it was a no-op or was superseded by
+        a newer payload for the same message.
+        """
+
+        message_id = message.id
+        digest = payload_hash(
+            volatile=volatile,
+            **{key: fields[key] for key in ("content", "embed", "embeds", "view") if key in fields},
+        )
+        slot = self._slots.get(message_id)
+        if slot is None:
+            if self._hashes.get(message_id) == digest:
+                return False
+            slot = self._slots[message_id] = _MessageSlot()
+        slot.generation += 1
+        generation = slot.generation
+
+        async with slot.lock:
+            if slot.generation != generation:
+                return False
+            if self._hashes.get(message_id) != digest:
+                await self._bucket(message.channel.id).acquire()
+                if slot.generation != generation:
+                    return False
+                try:
+                    await message.edit(**fields)
+                except Exception:
+                    self._hashes.pop(message_id, None)
+                    if slot.generation == generation:
+                        self._slots.pop(message_id, None)
+                    raise
+                self._remember(message_id, digest)
+                sent = True
+            else:
+                sent = False
+            if slot.generation == generation:
+                self._slots.pop(message_id, None)
+            return sent
+
+    def _remember(self, message_id: int, digest: str) -> None:
+        self._hashes[message_id] = digest
+        self._hashes.move_to_end(message_id)
+        while len(self._hashes) > self._hash_cache_size:
+            self._hashes.popitem(last=False)
+
+    def _bucket(self, channel_id: int) -> _EditBucket:
+        bucket = self._buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._buckets[channel_id] = _EditBucket(self._bucket_capacity, self._bucket_window)
+        return bucket
+
+
+live_messages = LiveMessageEditor()
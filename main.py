@@ -6,10 +6,20 @@ from discord.ext import commands
 from dotenv import load_dotenv
 import asyncio
 
-load_dotenv()
+# Render and parse pools use "spawn", so their workers import this module as
+# __mp_main__. They inherit the parent's environment; everything below that
+# touches global state (.env, logging handlers, the bot) only runs here or in
+# main().
+if __name__ == "__main__":
+    load_dotenv()
 
 from config import BOT_LOG_PATH, MAIN_GUILD_ID
 from config.hll_API_config import get_hll_backend_status
+from database_service import close_databases
+from hll_API_backend import close_hll_backend_sessions
+from image_render import close_render_pool
+from state_io import flush_pending, flush_pending_async
+from state_store import close_state_store
 
 TOKEN = os.getenv("DISCORD_BOT_TOKEN")
 
@@ -80,24 +90,24 @@ def validate_runtime_configuration() -> None:
             ", ".join(missing),
         )
 
-# Setup logging (console + file)
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
-formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+def setup_logging() -> None:
+    """Console + rotating file logging on the root logger."""
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
 
-# Console logging
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(formatter)
+    # Console logging
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
 
-# Rotating file logging (.txt) - 5 MB per file, keep 3 backups
-log_file_path = BOT_LOG_PATH
-file_handler = RotatingFileHandler(log_file_path, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8')
-file_handler.setFormatter(formatter)
+    # Rotating file logging (.txt) - 5 MB per file, keep 3 backups
+    file_handler = RotatingFileHandler(BOT_LOG_PATH, maxBytes=5 * 1024 * 1024, backupCount=3, encoding='utf-8')
+    file_handler.setFormatter(formatter)
 
-# Apply handlers
-logger.handlers.clear()
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+    # Apply handlers
+    logger.handlers.clear()
+    logger.addHandler(console_handler)
+    logger.addHandler(file_handler)
 
 # Intents setup
 intents = discord.Intents.default()
@@ -143,45 +153,63 @@ class RatBot(commands.Bot):
         except Exception:
             logging.exception("Failed to sync commands to guild %s", main_guild.id)
 
-
-# Command prefix does not affect slash commands.
-bot = RatBot(command_prefix="!", intents=intents)
-
-@bot.event
-async def on_ready():
-    logging.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
-    logging.info("------")
-    print(f"Bot is ready! Logged in as {bot.user} (ID: {bot.user.id})")
-
-# Only process commands in guild channels, NOT in DMs
-@bot.event
-async def on_message(message):
-    if message.author.bot:
-        return
-    if not isinstance(message.channel, discord.DMChannel):
-        await bot.process_commands(message)
-    # Do NOT process commands in DMs; your cogs handle DMs
-
-@bot.event
-async def on_command_error(ctx, error):
-    if isinstance(error, commands.CommandNotFound) and isinstance(ctx.channel, discord.DMChannel):
-        return  # Silently ignore CommandNotFound in DMs
-    
-    # Add logging for other errors
-    if isinstance(error, commands.MissingPermissions):
-        await ctx.send("You don't have permission to use this command.")
-    elif isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(f"Missing required argument: {error.param.name}")
-    else:
-        logging.error(f"Error in command {ctx.command}: {error}", exc_info=error)
+    async def close(self) -> None:
+        try:
+            await super().close()
+        finally:
+            await flush_pending_async()
+            await close_hll_backend_sessions()
+            close_render_pool()
+            close_state_store()
+            await close_databases()
+
+
+def create_bot() -> RatBot:
+    # Command prefix does not affect slash commands.
+    bot = RatBot(command_prefix="!", intents=intents)
+
+    @bot.event
+    async def on_ready():
+        logging.info(f"Logged in as {bot.user} (ID: {bot.user.id})")
+        logging.info("------")
+        print(f"Bot is ready! Logged in as {bot.user} (ID: {bot.user.id})")
+
+    # Only process commands in guild channels, NOT in DMs
+    @bot.event
+    async def on_message(message):
+        if message.author.bot:
+            return
+        if not isinstance(message.channel, discord.DMChannel):
+            await bot.process_commands(message)
+        # Do NOT process commands in DMs; your cogs handle DMs
+
+    @bot.event
+    async def on_command_error(ctx, error):
+        if isinstance(error, commands.CommandNotFound) and isinstance(ctx.channel, discord.DMChannel):
+            return  # Silently ignore CommandNotFound in DMs
+
+        # Add logging for other errors
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("You don't have permission to use this command.")
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send(f"Missing required argument: {error.param.name}")
+        else:
+            logging.error(f"Error in command {ctx.command}: {error}", exc_info=error)
+
+    return bot
 
 async def main():
     validate_runtime_configuration()
+    bot = create_bot()
     async with bot:
         await bot.start(TOKEN)
 
 if __name__ == "__main__":
+    setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         print("Bot shut down manually.")
+    finally:
+        # The loop has stopped; anything marked dirty since close() is written here.
+        flush_pending()
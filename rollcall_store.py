@@ -0,0 +1,483 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+from typing import Any, Iterable, Mapping, Sequence
+
+from openpyxl import Workbook
+
+from database_service import SharedDatabase
+
+
+logger = logging.getLogger("RollCallStore")
+
+DEFAULT_EXPORT_DEBOUNCE_SECONDS = 10.0
+
+SCHEMA_MIGRATIONS: list[list[str]] = [
+    [
+        """
+        CREATE TABLE IF NOT EXISTS rollcall_members (
+            config_key TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            nickname TEXT NOT NULL DEFAULT '',
+            position INTEGER NOT NULL,
+            PRIMARY KEY (config_key, user_id)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rollcall_weeks (
+            config_key TEXT NOT NULL,
+            week_label TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            PRIMARY KEY (config_key, week_label)
+        ) WITHOUT ROWID
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS rollcall_attendance (
+            config_key TEXT NOT NULL,
+            week_label TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            PRIMARY KEY (config_key, week_label, user_id)
+        ) WITHOUT ROWID
+        """,
+    ],
+]
+
+MEMBER_UPSERT_SQL = (
+    "INSERT INTO rollcall_members (config_key, user_id, nickname, position) VALUES (?, ?, ?, ?)"
+    " ON CONFLICT(config_key, user_id) DO UPDATE SET nickname = excluded.nickname"
+)
+STATUS_UPSERT_SQL = (
+    "INSERT INTO rollcall_attendance (config_key, week_label, user_id, status) VALUES (?, ?, ?, ?)"
+    " ON CONFLICT(config_key, week_label, user_id) DO UPDATE SET status = excluded.status"
+)
+
+
+class RollCallAttendance:
+    """Roll-call attendance stored per config, week and user.
+
+    The whole history is held in memory after ``load()``, so embeds and HTML
+    tables are built without touching the disk, and every change writes only
+    the rows it affects. Member and week order is kept so exports keep the
+    familiar sheet layout: one row per member, one column per week.
+    """
+
+    def __init__(self, database: SharedDatabase) -> None:
+        self.database = database
+        self._members: dict[str, dict[int, str]] = {}
+        self._weeks: dict[str, list[str]] = {}
+        self._status: dict[tuple[str, str], dict[int, str]] = {}
+        self._exporter: WorkbookExporter | None = None
+
+    def attach_exporter(self, exporter: WorkbookExporter, config_keys: Sequence[str] = ()) -> None:
+        """Mirror every later change into ``exporter``, starting from the current contents."""
+        keys = list(dict.fromkeys([*config_keys, *self.config_keys()]))
+        exporter.rebuild([(key, self.sheet_rows(key)) for key in keys])
+        self._exporter = exporter
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._members and not self._weeks
+
+    async def load(self) -> None:
+        await self.database.migrate(SCHEMA_MIGRATIONS)
+        members: dict[str, dict[int, str]] = {}
+        weeks: dict[str, list[str]] = {}
+        status: dict[tuple[str, str], dict[int, str]] = {}
+
+        for key, user_id, nickname in await self.database.fetchall(
+            "SELECT config_key, user_id, nickname FROM rollcall_members ORDER BY config_key, position"
+        ):
+            members.setdefault(key, {})[int(user_id)] = nickname
+        for key, week_label in await self.database.fetchall(
+            "SELECT config_key, week_label FROM rollcall_weeks ORDER BY config_key, position"
+        ):
+            weeks.setdefault(key, []).append(week_label)
+        for key, week_label, user_id, value in await self.database.fetchall(
+            "SELECT config_key, week_label, user_id, status FROM rollcall_attendance"
+        ):
+            status.setdefault((key, week_label), {})[int(user_id)] = value
+
+        self._members, self._weeks, self._status = members, weeks, status
+
+    # ---------- Reads ----------
+    def config_keys(self) -> list[str]:
+        return list(dict.fromkeys([*self._members, *self._weeks]))
+
+    def members(self, key: str) -> dict[int, str]:
+        """User id -> stored nickname, in sheet row order. Treat as read-only."""
+        return self._members.get(key, {})
+
+    def weeks(self, key: str) -> list[str]:
+        return list(self._weeks.get(key, ()))
+
+    def week_status(self, key: str, week_label: str) -> dict[int, str]:
+        return dict(self._status.get((key, week_label), {}))
+
+    def status(self, key: str, week_label: str, user_id: int) -> str:
+        return self._status.get((key, week_label), {}).get(user_id, "")
+
+    # ---------- Writes ----------
+    async def add_week(self, key: str, week_label: str) -> None:
+        weeks = self._weeks.setdefault(key, [])
+        if week_label in weeks:
+            return
+        async with self.database.write() as db:
+            await db.execute(
+                "INSERT OR IGNORE INTO rollcall_weeks (config_key, week_label, position) VALUES (?, ?, ?)",
+                (key, week_label, len(weeks)),
+            )
+            weeks.append(week_label)
+        if self._exporter is not None:
+            self._exporter.add_week(key, week_label)
+
+    async def rename_week(self, key: str, old_label: str, new_label: str) -> None:
+        weeks = self._weeks.get(key, [])
+        if old_label not in weeks or new_label in weeks:
+            return
+        async with self.database.write() as db:
+            await db.execute(
+                "UPDATE rollcall_weeks SET week_label = ? WHERE config_key = ? AND week_label = ?",
+                (new_label, key, old_label),
+            )
+            await db.execute(
+                "UPDATE rollcall_attendance SET week_label = ? WHERE config_key = ? AND week_label = ?",
+                (new_label, key, old_label),
+            )
+            weeks[weeks.index(old_label)] = new_label
+            moved = self._status.pop((key, old_label), None)
+            if moved is not None:
+                self._status[(key, new_label)] = moved
+        if self._exporter is not None:
+            self._exporter.rename_week(key, old_label, new_label)
+
+    async def upsert_members(self, key: str, nicknames: Mapping[int, str]) -> int:
+        """Add new members and refresh changed nicknames; returns the rows written."""
+        members = self._members.setdefault(key, {})
+        changed = {user_id: nickname for user_id, nickname in nicknames.items() if members.get(user_id) != nickname}
+        if not changed:
+            return 0
+        async with self.database.write() as db:
+            await db.executemany(MEMBER_UPSERT_SQL, self._member_rows(key, members, changed))
+            members.update(changed)
+        if self._exporter is not None:
+            for user_id, nickname in changed.items():
+                self._exporter.set_member(key, user_id, nickname)
+        return len(changed)
+
+    async def set_status(self, key: str, week_label: str, user_id: int, value: str, *, nickname: str) -> bool:
+        return bool(await self.set_statuses(key, week_label, {user_id: value}, nicknames={user_id: nickname}))
+
+    async def set_statuses(
+        self,
+        key: str,
+        week_label: str,
+        statuses: Mapping[int, str],
+        *,
+        nicknames: Mapping[int, str] | None = None,
+    ) -> int:
+        """Write the statuses that differ for one week; returns the rows changed.
+
+        Members that have no row yet are added, named from ``nicknames``.
+        Known members keep their stored nickname unless a new one is given.
+        """
+
+        nicknames = nicknames or {}
+        members = self._members.setdefault(key, {})
+        current = self._status.get((key, week_label), {})
+        changed = {user_id: value for user_id, value in statuses.items() if current.get(user_id) != value}
+        member_changes = {
+            user_id: nicknames.get(user_id, members.get(user_id, str(user_id)))
+            for user_id in statuses
+            if user_id not in members or (user_id in nicknames and members[user_id] != nicknames[user_id])
+        }
+        if not changed and not member_changes:
+            return 0
+
+        weeks = self._weeks.setdefault(key, [])
+        async with self.database.write() as db:
+            if week_label not in weeks:
+                await db.execute(
+                    "INSERT OR IGNORE INTO rollcall_weeks (config_key, week_label, position) VALUES (?, ?, ?)",
+                    (key, week_label, len(weeks)),
+                )
+            if member_changes:
+                await db.executemany(MEMBER_UPSERT_SQL, self._member_rows(key, members, member_changes))
+            if changed:
+                await db.executemany(
+                    STATUS_UPSERT_SQL,
+                    [(key, week_label, user_id, value) for user_id, value in changed.items()],
+                )
+            new_week = week_label not in weeks
+            if new_week:
+                weeks.append(week_label)
+            members.update(member_changes)
+            self._status.setdefault((key, week_label), {}).update(changed)
+        if self._exporter is not None:
+            if new_week:
+                self._exporter.add_week(key, week_label)
+            for user_id, nickname in member_changes.items():
+                self._exporter.set_member(key, user_id, nickname)
+            for user_id, value in changed.items():
+                self._exporter.set_status(key, week_label, user_id, value)
+        return len(changed)
+
+    async def import_sheet(
+        self,
+        key: str,
+        week_labels: Sequence[str],
+        rows: Iterable[tuple[int, str, Sequence[str]]],
+    ) -> int:
+        """Replace ``key`` with a sheet's contents: week headers plus (user_id, nickname, cells) rows."""
+        rows = list(rows)
+        members: dict[int, str] = {}
+        status: dict[str, dict[int, str]] = {week_label: {} for week_label in week_labels}
+        for user_id, nickname, cells in rows:
+            members[user_id] = nickname
+            for week_label, value in zip(week_labels, cells):
+                if value:
+                    status[week_label][user_id] = value
+
+        async with self.database.write() as db:
+            for table in ("rollcall_members", "rollcall_weeks", "rollcall_attendance"):
+                await db.execute(f"DELETE FROM {table} WHERE config_key = ?", (key,))
+            await db.executemany(
+                "INSERT INTO rollcall_weeks (config_key, week_label, position) VALUES (?, ?, ?)",
+                [(key, week_label, position) for position, week_label in enumerate(week_labels)],
+            )
+            await db.executemany(
+                "INSERT INTO rollcall_members (config_key, user_id, nickname, position) VALUES (?, ?, ?, ?)",
+                [(key, user_id, nickname, position) for position, (user_id, nickname) in enumerate(members.items())],
+            )
+            await db.executemany(
+                "INSERT INTO rollcall_attendance (config_key, week_label, user_id, status) VALUES (?, ?, ?, ?)",
+                [
+                    (key, week_label, user_id, value)
+                    for week_label, cells in status.items()
+                    for user_id, value in cells.items()
+                ],
+            )
+            self._members[key] = members
+            self._weeks[key] = list(week_labels)
+            for stale in [entry for entry in self._status if entry[0] == key]:
+                del self._status[stale]
+            for week_label, cells in status.items():
+                self._status[(key, week_label)] = cells
+        if self._exporter is not None:
+            self._exporter.replace_sheet(key, self.sheet_rows(key))
+        return len(members)
+
+    @staticmethod
+    def _member_rows(key: str, members: Mapping[int, str], changes: Mapping[int, str]) -> list[tuple]:
+        rows = []
+        position = len(members)
+        for user_id, nickname in changes.items():
+            if user_id in members:
+                rows.append((key, user_id, nickname, 0))  # position is kept on conflict
+            else:
+                rows.append((key, user_id, nickname, position))
+                position += 1
+        return rows
+
+    # ---------- Export ----------
+    def sheet_rows(self, key: str) -> list[list[str]]:
+        """The sheet for ``key`` as rows of cell values, header row first."""
+        weeks = self._weeks.get(key, [])
+        columns = [self._status.get((key, week_label), {}) for week_label in weeks]
+        rows = [["User ID", "Nickname", *weeks]]
+        for user_id, nickname in self._members.get(key, {}).items():
+            rows.append([str(user_id), nickname, *(column.get(user_id) for column in columns)])
+        return rows
+
+    def to_workbook(self, config_keys: Sequence[str] = ()) -> Workbook:
+        """Build the attendance workbook: a README sheet, then one sheet per config."""
+        keys = dict.fromkeys([*config_keys, *self.config_keys()])
+        return build_workbook([(key, self.sheet_rows(key)) for key in keys])
+
+
+def build_workbook(sheets: Sequence[tuple[str, Sequence[Sequence[Any]]]]) -> Workbook:
+    wb = Workbook()
+    wb.active.title = "README"
+    wb.active.append(["This workbook is generated by the bot from its attendance store."])
+    for key, rows in sheets:
+        ws = wb.create_sheet(title=key[:31])
+        for row in rows:
+            ws.append(list(row))
+    return wb
+
+
+class WorkbookExporter:
+    """Keeps the exported workbook resident and saves it from a background thread.
+
+    The event loop only queues small change records; the worker thread owns
+    the openpyxl ``Workbook``, applies the changes to the cached sheets through
+    per-sheet row/column indexes and writes the file once no change has
+    arrived for ``debounce`` seconds. ``flush()`` forces a write and waits for it.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, debounce: float = DEFAULT_EXPORT_DEBOUNCE_SECONDS) -> None:
+        self.path = os.fspath(path)
+        self.debounce = debounce
+        self.saves = 0
+        self._queue: queue.SimpleQueue[tuple[Any, ...]] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._wb: Workbook | None = None
+        self._rows: dict[str, dict[int, int]] = {}
+        self._cols: dict[str, dict[str, int]] = {}
+        self._dirty = False
+
+    # ---------- Event loop side ----------
+    def rebuild(self, sheets: Sequence[tuple[str, Sequence[Sequence[Any]]]]) -> None:
+        self._submit("rebuild", [(key, [list(row) for row in rows]) for key, rows in sheets])
+
+    def replace_sheet(self, key: str, rows: Sequence[Sequence[Any]]) -> None:
+        self._submit("sheet", key, [list(row) for row in rows])
+
+    def add_week(self, key: str, week_label: str) -> None:
+        self._submit("week", key, week_label)
+
+    def rename_week(self, key: str, old_label: str, new_label: str) -> None:
+        self._submit("rename", key, old_label, new_label)
+
+    def set_member(self, key: str, user_id: int, nickname: str) -> None:
+        self._submit("member", key, user_id, nickname)
+
+    def set_status(self, key: str, week_label: str, user_id: int, value: str) -> None:
+        self._submit("status", key, week_label, user_id, value)
+
+    async def flush(self) -> None:
+        """Write any pending changes now and wait until the file is on disk."""
+        done: concurrent.futures.Future[None] = concurrent.futures.Future()
+        self._submit("flush", done)
+        await asyncio.wrap_future(done)
+
+    async def close(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(("stop",))
+        await asyncio.to_thread(thread.join)
+        self._thread = None
+
+    def _submit(self, *op: Any) -> None:
+        self._queue.put(op)
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker, name="rollcall-export", daemon=True)
+            self._thread.start()
+
+    # ---------- Worker thread ----------
+    def _worker(self) -> None:
+        while True:
+            try:
+                op = self._queue.get(timeout=self.debounce if self._dirty else None)
+            except queue.Empty:
+                self._save()
+                continue
+
+            kind = op[0]
+            if kind == "stop":
+                self._save()
+                return
+            if kind == "flush":
+                done = op[1]
+                error = self._save(force=not os.path.exists(self.path))
+                if error is None:
+                    done.set_result(None)
+                else:
+                    done.set_exception(error)
+                continue
+            try:
+                getattr(self, f"_apply_{kind}")(*op[1:])
+            except Exception:
+                logger.exception("rollcall_export_change_failed kind=%s", kind)
+            self._dirty = True
+
+    def _save(self, *, force: bool = False) -> Exception | None:
+        if not (self._dirty or force) or self._wb is None:
+            return None
+        self._dirty = False
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._wb.save(tmp_path)
+            os.replace(tmp_path, self.path)
+        except Exception as exc:
+            self._dirty = True
+            logger.exception("rollcall_export_save_failed path=%s", self.path)
+            return exc
+        self.saves += 1
+        return None
+
+    def _sheet(self, key: str):
+        if self._wb is None:
+            self._apply_rebuild([])
+        title = key[:31]
+        if title not in self._wb.sheetnames:
+            self._apply_sheet(key, [["User ID", "Nickname"]])
+        return self._wb[title]
+
+    def _index_sheet(self, key: str, ws) -> None:
+        self._cols[key] = {
+            str(cell.value): cell.column for cell in ws[1][2:] if cell.value is not None
+        }
+        self._rows[key] = {
+            int(values[0]): row
+            for row, values in enumerate(ws.iter_rows(min_row=2, max_col=1, values_only=True), start=2)
+            if values[0] is not None
+        }
+
+    def _apply_rebuild(self, sheets: list[tuple[str, list[list[Any]]]]) -> None:
+        self._wb = build_workbook(sheets)
+        self._rows.clear()
+        self._cols.clear()
+        for key, _rows in sheets:
+            self._index_sheet(key, self._wb[key[:31]])
+
+    def _apply_sheet(self, key: str, rows: list[list[Any]]) -> None:
+        if self._wb is None:
+            self._apply_rebuild([])
+        title = key[:31]
+        if title in self._wb.sheetnames:
+            del self._wb[title]
+        ws = self._wb.create_sheet(title=title)
+        for row in rows:
+            ws.append(row)
+        self._index_sheet(key, ws)
+
+    def _week_column(self, key: str, week_label: str) -> int:
+        ws = self._sheet(key)
+        cols = self._cols[key]
+        if week_label not in cols:
+            cols[week_label] = max(2, ws.max_column) + 1
+            ws.cell(row=1, column=cols[week_label], value=week_label)
+        return cols[week_label]
+
+    def _member_row(self, key: str, user_id: int) -> int:
+        ws = self._sheet(key)
+        rows = self._rows[key]
+        if user_id not in rows:
+            rows[user_id] = ws.max_row + 1
+            ws.cell(row=rows[user_id], column=1, value=str(user_id))
+        return rows[user_id]
+
+    def _apply_week(self, key: str, week_label: str) -> None:
+        self._week_column(key, week_label)
+
+    def _apply_rename(self, key: str, old_label: str, new_label: str) -> None:
+        ws = self._sheet(key)
+        col = self._cols[key].pop(old_label, None)
+        if col is not None:
+            self._cols[key][new_label] = col
+            ws.cell(row=1, column=col, value=new_label)
+
+    def _apply_member(self, key: str, user_id: int, nickname: str) -> None:
+        self._sheet(key).cell(row=self._member_row(key, user_id), column=2, value=nickname)
+
+    def _apply_status(self, key: str, week_label: str, user_id: int, value: str) -> None:
+        col = self._week_column(key, week_label)
+        self._sheet(key).cell(row=self._member_row(key, user_id), column=col, value=value)
@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TypeVar
 
+T = TypeVar("T")
 
-def atomic_json_dump(
-    path: str | os.PathLike[str],
+
+def _encode_json(
     data: Any,
     *,
     indent: int = 2,
     ensure_ascii: bool = True,
     sort_keys: bool = False,
-) -> None:
-    """Write JSON without exposing a partially written destination file."""
+) -> str:
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, sort_keys=sort_keys) + "\n"
 
+
+def _write_text_atomic(path: str | os.PathLike[str], text: str) -> None:
     destination = Path(path)
     destination.parent.mkdir(parents=True, exist_ok=True)
     temporary_path: Path | None = None
@@ -31,14 +39,7 @@ def atomic_json_dump(
             delete=False,
         ) as handle:
             temporary_path = Path(handle.name)
-            json.dump(
-                data,
-                handle,
-                indent=indent,
-                ensure_ascii=ensure_ascii,
-                sort_keys=sort_keys,
-            )
-            handle.write("\n")
+            handle.write(text)
             handle.flush()
             os.fsync(handle.fileno())
 
@@ -47,3 +48,203 @@ def atomic_json_dump(
     finally:
         if temporary_path is not None:
             temporary_path.unlink(missing_ok=True)
+
+
+def atomic_json_dump(
+    path: str | os.PathLike[str],
+    data: Any,
+    *,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+) -> None:
+    """Write JSON without exposing a partially written destination file."""
+
+    _write_text_atomic(path, _encode_json(data, indent=indent, ensure_ascii=ensure_ascii, sort_keys=sort_keys))
+
+
+# Every off-loop state read and write runs on this single thread, so writes to
+# one file land in the order they were issued and a read issued after a write
+# sees its result.
+_state_io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-io")
+
+
+async def run_state_io(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking state load/save helper on the state I/O thread."""
+
+    return await asyncio.get_running_loop().run_in_executor(_state_io_executor, partial(func, *args))
+
+
+async def atomic_json_dump_async(
+    path: str | os.PathLike[str],
+    data: Any,
+    *,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    sort_keys: bool = False,
+) -> None:
+    """Off-loop ``atomic_json_dump``.
+
+    The data is encoded before returning to the caller's next await, so the
+    written snapshot is consistent even if the caller keeps mutating it;
+    the file write and fsync happen on the state I/O thread.
+    """
+
+    text = _encode_json(data, indent=indent, ensure_ascii=ensure_ascii, sort_keys=sort_keys)
+    await run_state_io(_write_text_atomic, path, text)
+
+DEFAULT_WRITE_BEHIND_DELAY_SECONDS = 2.0
+
+logger = logging.getLogger("StateIO")
+
+
+class WriteBehindFlusher:
+    """Coalesce JSON state writes per file and flush them in the background.
+
+    ``mark_dirty`` records the latest data (or a zero-argument callable that
+    returns it) for a path. A single background task writes each dirty file
+    once its delay has passed, so many mutations in quick succession cost one
+    write. ``flush_async`` writes pending files immediately from the event
+    loop, for example in ``cog_unload``; ``flush`` does the same blocking,
+    for code that has no running loop.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, tuple[float, Any, dict[str, Any]]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    def mark_dirty(
+        self,
+        path: str | os.PathLike[str],
+        data: Any,
+        *,
+        delay: float = DEFAULT_WRITE_BEHIND_DELAY_SECONDS,
+        **dump_kwargs: Any,
+    ) -> None:
+        key = os.fspath(path)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to flush from (startup or tests): write straight away.
+            self._pending.pop(key, None)
+            atomic_json_dump(key, _resolve(data), **dump_kwargs)
+            return
+
+        due_at = time.monotonic() + max(0.0, delay)
+        existing = self._pending.get(key)
+        if existing is not None:
+            due_at = min(due_at, existing[0])
+        self._pending[key] = (due_at, data, dump_kwargs)
+
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        elif self._wakeup is not None and existing is None:
+            self._wakeup.set()
+
+    def is_dirty(self, path: str | os.PathLike[str]) -> bool:
+        return os.fspath(path) in self._pending
+
+    def _take(self, path: str | os.PathLike[str] | None) -> list[tuple[str, str]]:
+        """Pop and encode the pending files to flush now."""
+
+        keys = list(self._pending) if path is None else [os.fspath(path)]
+        encoded = []
+        for key in keys:
+            pending = self._pending.pop(key, None)
+            if pending is None:
+                continue
+            _due_at, data, dump_kwargs = pending
+            try:
+                encoded.append((key, _encode_json(_resolve(data), **dump_kwargs)))
+            except Exception:
+                logger.exception("Failed to flush state file %s", key)
+        return encoded
+
+    def flush(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Write pending files now, blocking until the state I/O thread is done.
+
+        Only for callers without a running event loop; on the loop use
+        ``flush_async``.
+        """
+
+        for key, text in self._take(path):
+            try:
+                # Queue behind any in-flight background write to the same file.
+                _state_io_executor.submit(_write_text_atomic, key, text).result()
+            except Exception:
+                logger.exception("Failed to flush state file %s", key)
+
+    async def flush_async(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Write pending files now without blocking the event loop."""
+
+        for key, text in self._take(path):
+            try:
+                await run_state_io(_write_text_atomic, key, text)
+            except Exception:
+                logger.exception("Failed to flush state file %s", key)
+
+    async def _write(self, key: str) -> None:
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        _due_at, data, dump_kwargs = pending
+        try:
+            await atomic_json_dump_async(key, _resolve(data), **dump_kwargs)
+        except Exception:
+            logger.exception("Failed to flush state file %s; retrying later", key)
+            if key not in self._pending:
+                retry_at = time.monotonic() + DEFAULT_WRITE_BEHIND_DELAY_SECONDS
+                self._pending[key] = (retry_at, data, dump_kwargs)
+
+    async def _run(self) -> None:
+        wakeup = self._wakeup or asyncio.Event()
+        while self._pending:
+            now = time.monotonic()
+            for key, (due_at, _data, _kwargs) in list(self._pending.items()):
+                if due_at <= now:
+                    await self._write(key)
+            if not self._pending:
+                break
+            next_due = min(due_at for due_at, _data, _kwargs in self._pending.values())
+            wakeup.clear()
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout=max(0.0, next_due - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+
+def _resolve(data: Any) -> Any:
+    return data() if callable(data) else data
+
+
+_write_behind = WriteBehindFlusher()
+
+
+def mark_dirty(
+    path: str | os.PathLike[str],
+    data: Any,
+    *,
+    delay: float = DEFAULT_WRITE_BEHIND_DELAY_SECONDS,
+    **dump_kwargs: Any,
+) -> None:
+    """Schedule a debounced ``atomic_json_dump`` of ``data`` to ``path``."""
+
+    _write_behind.mark_dirty(path, data, delay=delay, **dump_kwargs)
+
+
+def flush_pending(path: str | os.PathLike[str] | None = None) -> None:
+    """Write pending state for ``path`` (or every dirty file) immediately, blocking.
+
+    For shutdown after the event loop has stopped; coroutines use
+    ``flush_pending_async``.
+    """
+
+    _write_behind.flush(path)
+
+
+async def flush_pending_async(path: str | os.PathLike[str] | None = None) -> None:
+    """Write pending state for ``path`` (or every dirty file) now, off the event loop."""
+
+    await _write_behind.flush_async(path)
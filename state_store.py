@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from data_paths import data_path
+from state_io import run_state_io
+
+
+STATE_STORE_FILE = data_path("bot_state.sqlite3")
+
+logger = logging.getLogger("StateStore")
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+class StateStore:
+    """Namespaced key/value state persisted in SQLite (WAL mode).
+
+    Each key is its own row, so saving a change rewrites only the rows that
+    changed instead of serialising a whole JSON document.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA busy_timeout=5000")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS state_entries ("
+            " namespace TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, key)"
+            ") WITHOUT ROWID"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS state_migrations ("
+            " namespace TEXT NOT NULL,"
+            " source TEXT NOT NULL,"
+            " migrated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,"
+            " PRIMARY KEY (namespace, source)"
+            ")"
+        )
+
+    def namespace(self, name: str) -> StateNamespace:
+        return StateNamespace(self, name)
+
+    def _transaction(self, statements: Iterable[tuple[str, tuple[Any, ...]]]) -> None:
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                for sql, params in statements:
+                    cursor.execute(sql, params)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class StateNamespace:
+    def __init__(self, store: StateStore, name: str) -> None:
+        self.store = store
+        self.name = name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        rows = self.store._query(
+            "SELECT value FROM state_entries WHERE namespace = ? AND key = ?",
+            (self.name, str(key)),
+        )
+        if not rows:
+            return default
+        return json.loads(rows[0][0])
+
+    def items(self) -> dict[str, Any]:
+        rows = self.store._query(
+            "SELECT key, value FROM state_entries WHERE namespace = ?",
+            (self.name,),
+        )
+        return {key: json.loads(value) for key, value in rows}
+
+    def _upsert_statements(self, values: dict[str, Any]) -> list[tuple[str, tuple[Any, ...]]]:
+        # Encoded eagerly so the rows are a snapshot of ``values`` as passed.
+        return [
+            (
+                "INSERT INTO state_entries (namespace, key, value) VALUES (?, ?, ?)"
+                " ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                (self.name, str(key), _encode(value)),
+            )
+            for key, value in values.items()
+        ]
+
+    def _delete_statements(self, keys: Iterable[str]) -> list[tuple[str, tuple[Any, ...]]]:
+        return [
+            ("DELETE FROM state_entries WHERE namespace = ? AND key = ?", (self.name, str(key)))
+            for key in keys
+        ]
+
+    def set(self, key: str, value: Any) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, values: dict[str, Any]) -> None:
+        if values:
+            self.store._transaction(self._upsert_statements(values))
+
+    def delete(self, key: str) -> None:
+        self.delete_many([key])
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        statements = self._delete_statements(keys)
+        if statements:
+            self.store._transaction(statements)
+
+    async def set_async(self, key: str, value: Any) -> None:
+        await self.set_many_async({key: value})
+
+    async def set_many_async(self, values: dict[str, Any]) -> None:
+        """``set_many`` from the event loop: values are encoded here, the commit runs on the state I/O thread."""
+
+        if values:
+            await run_state_io(self.store._transaction, self._upsert_statements(values))
+
+    async def delete_many_async(self, keys: Iterable[str]) -> None:
+        """``delete_many`` with the commit on the state I/O thread."""
+
+        statements = self._delete_statements(keys)
+        if statements:
+            await run_state_io(self.store._transaction, statements)
+
+    def sync(self, values: dict[str, Any]) -> int:
+        """Make the namespace match ``values``, writing only changed keys.
+
+        Returns the number of rows inserted, updated or deleted.
+        """
+
+        current = dict(
+            self.store._query(
+                "SELECT key, value FROM state_entries WHERE namespace = ?",
+                (self.name,),
+            )
+        )
+        encoded = {str(key): _encode(value) for key, value in values.items()}
+        statements: list[tuple[str, tuple[Any, ...]]] = [
+            (
+                "INSERT INTO state_entries (namespace, key, value) VALUES (?, ?, ?)"
+                " ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                (self.name, key, value),
+            )
+            for key, value in encoded.items()
+            if current.get(key) != value
+        ]
+        statements.extend(
+            ("DELETE FROM state_entries WHERE namespace = ? AND key = ?", (self.name, key))
+            for key in current
+            if key not in encoded
+        )
+        if statements:
+            self.store._transaction(statements)
+        return len(statements)
+
+    def migrate_from_json(
+        self,
+        path: str | os.PathLike[str],
+        extract: Callable[[Any], dict[str, Any]] | None = None,
+    ) -> bool:
+        """Import a legacy JSON file into this namespace once.
+
+        ``extract`` selects the key/value mapping from the parsed document;
+        by default the top-level object is imported as-is. The JSON file is
+        left in place as a backup. Returns True when a migration ran.
+        """
+
+        source = str(Path(path).resolve())
+        already_migrated = self.store._query(
+            "SELECT 1 FROM state_migrations WHERE namespace = ? AND source = ?",
+            (self.name, source),
+        )
+        if already_migrated:
+            return False
+
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except FileNotFoundError:
+            data = {}
+        except json.JSONDecodeError:
+            logger.warning("Skipping unreadable legacy state file %s", path)
+            data = {}
+
+        values = extract(data) if extract is not None else data
+        if not isinstance(values, dict):
+            values = {}
+
+        statements: list[tuple[str, tuple[Any, ...]]] = [
+            (
+                "INSERT INTO state_entries (namespace, key, value) VALUES (?, ?, ?)"
+                " ON CONFLICT(namespace, key) DO UPDATE SET value = excluded.value",
+                (self.name, str(key), _encode(value)),
+            )
+            for key, value in values.items()
+        ]
+        statements.append(
+            (
+                "INSERT INTO state_migrations (namespace, source) VALUES (?, ?)",
+                (self.name, source),
+            )
+        )
+        self.store._transaction(statements)
+        if values:
+            logger.info("Migrated %d entries from %s into state namespace %s", len(values), path, self.name)
+        return True
+
+
+_shared_store: StateStore | None = None
+_shared_store_lock = threading.Lock()
+
+
+def get_state_store() -> StateStore:
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is None:
+            _shared_store = StateStore(STATE_STORE_FILE)
+        return _shared_store
+
+
+def close_state_store() -> None:
+    global _shared_store
+    with _shared_store_lock:
+        if _shared_store is not None:
+            _shared_store.close()
+            _shared_store = None
@@ -0,0 +1,58 @@
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+from PIL import Image
+
+import cogs.certify as certify
+import image_render
+
+
+class CertificateBatchTests(unittest.TestCase):
+    def test_pasted_names_are_split_and_deduplicated(self) -> None:
+        self.assertEqual(
+            certify.parse_names("Able, Baker\nCharlie;; Able\n  "),
+            ["Able", "Baker", "Charlie"],
+        )
+
+    def test_filenames_are_unique_and_safe(self) -> None:
+        used: set[str] = set()
+
+        self.assertEqual(certify.certificate_filename("Pte. Able/Smith", used), "certificate_Pte_Able_Smith.png")
+        self.assertEqual(certify.certificate_filename("Pte Able Smith", used), "certificate_Pte_Able_Smith_2.png")
+        self.assertEqual(certify.certificate_filename("✦", used), "certificate_unnamed.png")
+
+    def test_attachments_respect_count_and_size_limits(self) -> None:
+        files = [(f"{index}.png", b"x" * 40) for index in range(12)]
+
+        self.assertEqual([len(group) for group in certify.group_attachments(files, 10_000)], [10, 2])
+        self.assertEqual([len(group) for group in certify.group_attachments(files, 100)], [2] * 6)
+
+    def test_zip_holds_every_certificate(self) -> None:
+        archive = certify.zip_certificates([("a.png", b"one"), ("b.png", b"two")])
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as opened:
+            self.assertEqual(opened.namelist(), ["a.png", "b.png"])
+            self.assertEqual(opened.read("b.png"), b"two")
+
+
+class CertificateRenderTests(unittest.TestCase):
+    def test_template_is_decoded_once_and_never_drawn_on(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            template = os.path.join(tmp, "certificate_template.png")
+            Image.new("RGB", (1400, 1600), (255, 255, 255)).save(template)
+            image_render._decoded_image.cache_clear()
+
+            first = certify.render_certificate(template, "Able", "Rifleman", "Sgt Baker")
+            second = certify.render_certificate(template, "Able", "Rifleman", "Sgt Baker")
+
+        self.assertEqual(first, second)
+        self.assertEqual(image_render._decoded_image.cache_info().misses, 1)
+        with Image.open(io.BytesIO(first)) as image:
+            self.assertEqual(image.size, (1400, 1600))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import clan_t17_lookup
+from clan_t17_lookup import ClanT17Lookup, normalize_discord_username
+from state_store import StateStore
+
+_LOGGER = logging.getLogger("ClanT17LookupTests")
+
+
+def _member(guild_id: int, user_id: int, name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        guild=SimpleNamespace(id=guild_id),
+        id=user_id,
+        name=name,
+        display_name=name,
+        global_name=None,
+    )
+
+
+class ClanT17MappingTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self._tmp.name, "state.sqlite3")
+        self.legacy_path = os.path.join(self._tmp.name, "clan_t17_map.json")
+        patcher = patch.object(clan_t17_lookup, "CLAN_T17_MAP_FILE", self.legacy_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.store = StateStore(self.store_path)
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self._tmp.cleanup()
+
+    def _reopen(self) -> ClanT17Lookup:
+        self.store.close()
+        self.store = StateStore(self.store_path)
+        return ClanT17Lookup(logger=_LOGGER, store=self.store)
+
+    def test_mapping_is_loaded_once_and_shared(self) -> None:
+        lookup = ClanT17Lookup(logger=_LOGGER, store=self.store)
+
+        with patch.object(self.store, "_query", wraps=self.store._query) as query:
+            first = lookup.load_mapping()
+            loads = query.call_count
+            second = lookup.load_mapping()
+
+        self.assertIs(first, second)
+        self.assertEqual(query.call_count, loads)
+
+    async def test_flush_writes_only_changed_entries(self) -> None:
+        lookup = ClanT17Lookup(logger=_LOGGER, store=self.store)
+        mapping = lookup.load_mapping()
+        alice = _member(1, 10, "Alice")
+        lookup.store_resolved_member(mapping, alice, role_name="Clan", t17_id="t17-a", source="backend", queries=["alice"])
+        self.assertEqual(await mapping.flush(), 1)
+
+        lookup.store_resolved_member(mapping, alice, role_name="Clan", t17_id="t17-a", source="backend", queries=["alice"])
+        self.assertEqual(await mapping.flush(), 0)
+
+        resolved = self._reopen().resolved_members_for_role(1, "Clan")
+        self.assertEqual([entry["t17_id"] for entry in resolved], ["t17-a"])
+
+    async def test_role_index_tracks_updates_and_pruning(self) -> None:
+        lookup = ClanT17Lookup(logger=_LOGGER, store=self.store)
+        mapping = lookup.load_mapping()
+        for user_id, name in ((10, "Alice"), (11, "Bob"), (12, "Cara")):
+            lookup.store_resolved_member(
+                mapping, _member(1, user_id, name), role_name="Clan", t17_id=f"t17-{user_id}", source="backend", queries=[]
+            )
+        lookup.store_resolved_member(
+            mapping, _member(2, 10, "Alice"), role_name="Clan", t17_id="t17-10", source="backend", queries=[]
+        )
+
+        lookup.prune_resolved_members(mapping, 1, "Clan", {10, 12})
+        await mapping.flush()
+
+        names = [entry["username"] for entry in lookup.resolved_members_for_role(1, "Clan")]
+        self.assertEqual(names, ["Alice", "Cara"])
+        self.assertEqual(len(mapping.resolved_entries_for_user(10)), 2)
+        self.assertEqual(len(self._reopen().resolved_members_for_role(1, "Clan")), 2)
+
+    def test_legacy_name_cache_is_migrated_and_matched_case_insensitively(self) -> None:
+        with open(self.legacy_path, "w", encoding="utf-8") as handle:
+            json.dump({"Alice": "t17-a"}, handle)
+        lookup = ClanT17Lookup(logger=_LOGGER, store=self.store)
+
+        mapping = lookup.load_mapping()
+
+        self.assertEqual(lookup.read_name_cache(mapping, "alice"), "t17-a")
+        self.assertIsNotNone(mapping.get("updated_at"))
+
+
+class NameNormalisationTests(unittest.TestCase):
+    def test_rank_prefixes_are_stripped(self) -> None:
+        cases = {
+            "Lt Col Bravo": "Bravo",
+            "lt.col  Bravo": "Bravo",
+            "Sergeant Major Smith #12": "Smith",
+            "2nd Lt. Jones": "Jones",
+            "Pte. Doe": "Doe",
+            "Colonel": "Colonel",
+            "Captainbob": "Captainbob",
+        }
+        for raw, expected in cases.items():
+            with self.subTest(raw=raw):
+                self.assertEqual(normalize_discord_username(raw, strip_rank_prefix=True), expected)
+
+    def test_prefix_is_kept_unless_requested(self) -> None:
+        lookup = ClanT17Lookup(logger=_LOGGER)
+
+        self.assertEqual(lookup.normalize_discord_username("Cpl  Ada%Lovelace #1"), "Cpl Ada Lovelace")
+        self.assertEqual(lookup.normalize_discord_username(None), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from database_service import SharedDatabase
+
+
+class SharedDatabaseTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "test.db"))
+        async with self.database.write() as db:
+            await db.execute("CREATE TABLE scores (id INTEGER PRIMARY KEY AUTOINCREMENT, value INTEGER)")
+
+    async def asyncTearDown(self) -> None:
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def test_connections_are_reused_in_wal_mode(self) -> None:
+        writer = self.database._writer
+        await self.database.execute("INSERT INTO scores(value) VALUES (?)", (1,))
+        row = await self.database.fetchone("PRAGMA journal_mode")
+
+        self.assertIs(self.database._writer, writer)
+        self.assertEqual(row[0], "wal")
+        self.assertEqual(await self.database.fetchall("SELECT value FROM scores"), [(1,)])
+
+    async def test_failed_write_block_is_rolled_back(self) -> None:
+        with self.assertRaises(RuntimeError):
+            async with self.database.write() as db:
+                await db.execute("INSERT INTO scores(value) VALUES (?)", (5,))
+                raise RuntimeError("boom")
+
+        self.assertEqual(await self.database.fetchall("SELECT value FROM scores"), [])
+
+    async def test_concurrent_read_modify_writes_are_serialised(self) -> None:
+        await self.database.execute("INSERT INTO scores(value) VALUES (0)")
+
+        async def increment() -> None:
+            async with self.database.write() as db:
+                cursor = await db.execute("SELECT value FROM scores WHERE id = 1")
+                (value,) = await cursor.fetchone()
+                await asyncio.sleep(0)
+                await db.execute("UPDATE scores SET value = ? WHERE id = 1", (value + 1,))
+
+        await asyncio.gather(*(increment() for _ in range(10)))
+
+        self.assertEqual(await self.database.fetchone("SELECT value FROM scores WHERE id = 1"), (10,))
+
+    async def test_reopens_after_close(self) -> None:
+        await self.database.execute("INSERT INTO scores(value) VALUES (3)")
+        await self.database.close()
+
+        self.assertFalse(self.database.is_open)
+        self.assertEqual(await self.database.fetchone("SELECT COUNT(*) FROM scores"), (1,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import time
+import unittest
+
+from deadline_scheduler import DeadlineScheduler
+
+
+class DeadlineSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.scheduler = DeadlineScheduler("test")
+        self.fired: list[str] = []
+        self.done = asyncio.Event()
+
+    async def asyncTearDown(self) -> None:
+        await self.scheduler.close()
+
+    def _callback(self, name: str, *, last: bool = False):
+        async def callback() -> None:
+            self.fired.append(name)
+            if last:
+                self.done.set()
+
+        return callback
+
+    async def test_deadlines_fire_in_order(self) -> None:
+        now = time.time()
+        self.scheduler.schedule("late", now + 0.06, self._callback("late", last=True))
+        self.scheduler.schedule("early", now + 0.02, self._callback("early"))
+        self.scheduler.schedule("overdue", now - 5, self._callback("overdue"))
+
+        await asyncio.wait_for(self.done.wait(), 1)
+
+        self.assertEqual(self.fired, ["overdue", "early", "late"])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.next_deadline())
+
+    async def test_earlier_deadline_wakes_a_sleeping_timer(self) -> None:
+        self.scheduler.schedule("far", time.time() + 60, self._callback("far"))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        self.scheduler.schedule("soon", time.time() + 0.02, self._callback("soon", last=True))
+
+        await asyncio.wait_for(self.done.wait(), 1)
+
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(self.fired, ["soon"])
+        self.assertIn("far", self.scheduler)
+
+    async def test_cancel_and_reschedule_replace_pending_deadlines(self) -> None:
+        now = time.time()
+        self.scheduler.schedule("cancelled", now + 0.01, self._callback("cancelled"))
+        self.scheduler.schedule("moved", now + 0.01, self._callback("moved-early"))
+        self.scheduler.schedule("moved", now + 0.03, self._callback("moved", last=True))
+        self.assertTrue(self.scheduler.cancel("cancelled"))
+        self.assertFalse(self.scheduler.cancel("cancelled"))
+
+        await asyncio.wait_for(self.done.wait(), 1)
+        await asyncio.sleep(0.02)
+
+        self.assertEqual(self.fired, ["moved"])
+
+    async def test_failing_callback_does_not_stop_the_timer(self) -> None:
+        async def explode() -> None:
+            raise RuntimeError("boom")
+
+        now = time.time()
+        self.scheduler.schedule("broken", now, explode)
+        self.scheduler.schedule("after", now + 0.02, self._callback("after", last=True))
+
+        with self.assertLogs("DeadlineScheduler", "ERROR"):
+            await asyncio.wait_for(self.done.wait(), 1)
+
+        self.assertEqual(self.fired, ["after"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ import discord
 from PIL import Image
 
 from cogs.eventscalendar import EVENT_NOTIFICATION_BACKGROUND_DIR, EventDisplayCog
+from image_render import close_render_pool
 
 
 class EventCalendarNotificationTests(unittest.IsolatedAsyncioTestCase):
@@ -112,6 +113,7 @@ class EventCalendarNotificationTests(unittest.IsolatedAsyncioTestCase):
     async def test_cover_renderer_reads_a_local_map_image(self) -> None:
         event = self._event()
         background = Path(EVENT_NOTIFICATION_BACKGROUND_DIR, "Carentan.png")
+        self.addCleanup(close_render_pool)
 
         rendered = await self.cog._render_event_cover_image(
             title=event.name,
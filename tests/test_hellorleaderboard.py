@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import cogs.hellorleaderboard as hellor
+from cogs.hellorleaderboard import HellorLeaderboard, RequestPacer
+
+
+def _cog() -> HellorLeaderboard:
+    cog = HellorLeaderboard.__new__(HellorLeaderboard)
+    cog.logger = logging.getLogger("HellorLeaderboardTests")
+    cog.logger.addHandler(logging.NullHandler())
+    cog.logger.propagate = False
+    cog._state = {}
+    cog._pacer = RequestPacer(0)
+    return cog
+
+
+def _target(index: int) -> dict[str, object]:
+    return {"member_id": index, "display_name": f"Player {index}", "t17_id": f"t17-{index}", "source": "test", "queries": []}
+
+
+def _scores(value: str) -> dict[str, dict[str, str]]:
+    return {label: {"score": value, "top": "N/A"} for label in hellor.LEADERBOARD_LABELS}
+
+
+class FetchPipelineTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        patcher = patch.object(hellor, "mark_dirty")
+        self.mark_dirty = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_fetches_are_bounded_and_streamed_into_the_cache(self) -> None:
+        cog = _cog()
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(t17_id: str, cached: object = None) -> tuple[str, dict[str, None]]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if t17_id == "t17-3":
+                raise RuntimeError("boom")
+            return t17_id, {"etag": f'"{t17_id}"', "last_modified": None}
+
+        cached = [{**_target(3), "scores": _scores("7"), "etag": None}]
+        targets = [_target(index) for index in range(10)]
+        with (
+            patch.object(cog, "_fetch_hellor_page", fetch_page),
+            patch.object(cog, "_parse_scores", AsyncMock(return_value=_scores("1"))),
+        ):
+            results = await cog._fetch_member_scores(targets, cached)
+
+        self.assertLessEqual(peak, hellor.FETCH_CONCURRENCY)
+        self.assertEqual([item["member_id"] for item in results], list(range(10)))
+        self.assertEqual(results[3]["scores"], _scores("7"))
+        self.assertEqual(results[0]["etag"], '"t17-0"')
+        self.assertEqual(len(cog._state["member_scores"]), 9)
+        self.assertEqual(self.mark_dirty.call_count, 9)
+
+    async def test_not_modified_reuses_cached_scores_without_parsing(self) -> None:
+        cog = _cog()
+        cached = {**_target(1), "scores": _scores("42"), "etag": '"abc"', "last_modified": None}
+        parse = AsyncMock()
+
+        with (
+            patch.object(cog, "_fetch_hellor_page", AsyncMock(return_value=(None, {"etag": '"abc"', "last_modified": None}))),
+            patch.object(cog, "_parse_scores", parse),
+        ):
+            result = await cog._fetch_target_score(_target(1), cached)
+
+        parse.assert_not_awaited()
+        self.assertEqual(result["scores"], _scores("42"))
+        self.assertEqual(result["etag"], '"abc"')
+
+
+class RequestPacerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_request_starts_are_spaced_across_workers(self) -> None:
+        pacer = RequestPacer(0.02)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        await asyncio.gather(*(pacer.wait() for _ in range(4)))
+
+        self.assertGreaterEqual(loop.time() - started, 0.055)
+
+
+class RetryAfterTests(unittest.TestCase):
+    def test_seconds_and_http_dates_are_supported(self) -> None:
+        self.assertEqual(hellor.retry_after_seconds("12"), 12.0)
+        self.assertEqual(hellor.retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(hellor.retry_after_seconds("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import hll_API_backend
+from hll_API_backend import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    BifrostBackendClient,
+    CRCONBackendClient,
+    HLLBackendBatchError,
+    HLLBackendError,
+    LogCursor,
+    _TokenBucketScheduler,
+)
+
+
+def _bifrost_client() -> BifrostBackendClient:
+    return BifrostBackendClient({"bifrost": {"server_id": "server-1"}})
+
+
+class CoalescingReadCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        hll_API_backend._read_cache.clear()
+
+    def tearDown(self) -> None:
+        hll_API_backend._read_cache.clear()
+
+    async def test_concurrent_reads_share_one_upstream_request(self) -> None:
+        client = _bifrost_client()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fetch() -> dict[str, object]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"timestamp": "now"}
+
+        with patch.object(client, "_fetch_mapvote_game_state", fetch):
+            waiters = [asyncio.create_task(client.get_mapvote_game_state()) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*waiters)
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(results, [{"timestamp": "now"}] * 5)
+
+    async def test_cached_result_is_served_until_invalidated(self) -> None:
+        client = _bifrost_client()
+        fetch = AsyncMock(return_value=[{"action": "MATCH START"}])
+
+        with patch.object(client, "_fetch_mapvote_logs", fetch):
+            first = await client.get_mapvote_logs()
+            first.clear()
+            second = await client.get_mapvote_logs()
+            client.invalidate_cached_reads()
+            await client.get_mapvote_logs()
+
+        self.assertEqual(second, [{"action": "MATCH START"}])
+        self.assertEqual(fetch.await_count, 2)
+
+    async def test_read_in_flight_during_invalidation_is_not_cached(self) -> None:
+        client = _bifrost_client()
+        release = asyncio.Event()
+        results = iter([{"map": "before write"}, {"map": "after write"}])
+
+        async def fetch() -> dict[str, object]:
+            value = next(results)
+            if value["map"] == "before write":
+                await release.wait()
+            return value
+
+        with patch.object(client, "_fetch_mapvote_game_state", fetch):
+            stale = asyncio.create_task(client.get_mapvote_game_state())
+            await asyncio.sleep(0)
+            client.invalidate_cached_reads()
+            fresh = await client.get_mapvote_game_state()
+            release.set()
+            self.assertEqual(await stale, {"map": "before write"})
+            cached = await client.get_mapvote_game_state()
+
+        self.assertEqual(fresh, {"map": "after write"})
+        self.assertEqual(cached, {"map": "after write"})
+
+    async def test_failures_are_not_cached(self) -> None:
+        client = _bifrost_client()
+        fetch = AsyncMock(side_effect=[HLLBackendError("boom"), {"timestamp": "later"}])
+
+        with patch.object(client, "_fetch_mapvote_game_state", fetch):
+            with self.assertRaises(HLLBackendError):
+                await client.get_mapvote_game_state()
+            result = await client.get_mapvote_game_state()
+
+        self.assertEqual(result, {"timestamp": "later"})
+        self.assertEqual(fetch.await_count, 2)
+
+
+class HttpSessionTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        await hll_API_backend.close_hll_backend_sessions()
+
+    async def test_session_from_another_loop_is_closed_when_replaced(self) -> None:
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(other_loop.close)
+        self.addCleanup(thread.join)
+        self.addCleanup(other_loop.call_soon_threadsafe, other_loop.stop)
+
+        async def make_session():
+            return hll_API_backend._get_http_session("https://rcon.example/api")
+
+        stale = asyncio.run_coroutine_threadsafe(make_session(), other_loop).result(1)
+
+        current = hll_API_backend._get_http_session("https://rcon.example/other")
+        for _ in range(50):
+            if stale.closed:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertIsNot(current, stale)
+        self.assertTrue(stale.closed)
+
+
+class LogCursorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_only_new_subscribed_entries_are_returned(self) -> None:
+        client = CRCONBackendClient({"crcon": {"panel_url": "https://panel.example"}})
+        window = [
+            {"action": "MATCH ENDED", "timestamp_ms": 2000, "raw": "ended"},
+            {"action": "KILL", "timestamp_ms": 1000, "raw": "a killed b"},
+            {"action": "MATCH START", "timestamp_ms": 3000, "raw": "started foy"},
+        ]
+        fetch = AsyncMock(side_effect=lambda: list(window))
+
+        with patch.object(client, "get_mapvote_logs", fetch):
+            first, cursor = await client.get_logs_since(None, actions=("Match",))
+            window.append({"action": "KILL", "timestamp_ms": 3000, "raw": "c killed d"})
+            window.append({"action": "MATCH START", "timestamp_ms": 3000, "raw": "started carentan"})
+            second, cursor = await client.get_logs_since(cursor, actions=("Match",))
+            third, cursor = await client.get_logs_since(cursor, actions=("Match",))
+
+        self.assertEqual([entry["raw"] for entry in first], ["ended", "started foy"])
+        self.assertEqual([entry["raw"] for entry in second], ["started carentan"])
+        self.assertEqual(third, [])
+        self.assertEqual(cursor.timestamp_ms, 3000)
+
+    async def test_restored_cursor_skips_older_entries(self) -> None:
+        client = _bifrost_client()
+        logs = [
+            {"action": "Match Start", "timestamp_ms": 1000, "data": "old"},
+            {"action": "Match Start", "timestamp_ms": 5000, "data": "new"},
+        ]
+
+        with patch.object(client, "get_mapvote_logs", AsyncMock(return_value=logs)):
+            fresh, cursor = await client.get_logs_since(LogCursor(2000))
+
+        self.assertEqual([entry["data"] for entry in fresh], ["new"])
+        self.assertEqual(cursor.timestamp_ms, 5000)
+
+
+class TokenBucketSchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_is_served_without_waiting(self) -> None:
+        scheduler = _TokenBucketScheduler(rate=1.0, burst=3)
+
+        waits = [await scheduler.acquire() for _ in range(3)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.0])
+        self.assertEqual(scheduler.stats()["lanes"]["default"]["requests"], 3)
+
+    async def test_interactive_lane_is_served_before_queued_bulk_requests(self) -> None:
+        scheduler = _TokenBucketScheduler(rate=50.0, burst=1)
+        await scheduler.acquire(PRIORITY_BULK)
+        order: list[str] = []
+
+        async def request(name: str, priority: int) -> None:
+            await scheduler.acquire(priority)
+            order.append(name)
+
+        bulk = [asyncio.create_task(request(f"bulk-{index}", PRIORITY_BULK)) for index in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(request("interactive", PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+        self.assertEqual(scheduler.queue_depth(), 4)
+
+        await asyncio.gather(*bulk, interactive)
+
+        self.assertEqual(order[0], "interactive")
+        self.assertEqual(scheduler.queue_depth(), 0)
+
+    async def test_retry_window_pauses_every_lane(self) -> None:
+        scheduler = _TokenBucketScheduler(rate=100.0, burst=5)
+        scheduler.penalize(0.05)
+
+        waited = await scheduler.acquire(PRIORITY_INTERACTIVE)
+
+        self.assertGreaterEqual(waited, 0.04)
+
+
+class BulkGuildMemberSyncTests(unittest.IsolatedAsyncioTestCase):
+    async def test_batch_results_map_back_to_caller_keys(self) -> None:
+        client = _bifrost_client()
+        graphql = AsyncMock(
+            return_value={
+                "data": {
+                    "op0": {"success": True},
+                    "op1": {"success": True},
+                    "op2": None,
+                    "op3": {"success": False, "message": "unknown player"},
+                },
+                "errors": [{"message": "already a member", "path": ["op2"]}],
+            }
+        )
+
+        with patch.object(client, "_graphql_payload", graphql):
+            results = await client.bulk_sync_guild_members(
+                {
+                    1: {"player_id": "new-1", "player_name": "Alice", "previous_player_id": "old-1"},
+                    2: {"player_id": "new-2", "player_name": "Bob"},
+                },
+                {3: "gone-3"},
+            )
+
+        self.assertEqual(results, {3: None, 1: "already a member", 2: "unknown player"})
+        graphql.assert_awaited_once()
+        query, variables = graphql.await_args.args
+        self.assertIn("op0: guildRemoveMember(input: $op0)", query)
+        self.assertIn("op2: guildAddMember(input: $op2)", query)
+        self.assertEqual(variables["op0"], {"playerId": "gone-3"})
+        self.assertEqual(variables["op1"], {"playerId": "old-1"})
+        self.assertEqual(variables["op2"]["playerId"], "new-1")
+
+    async def test_operations_are_split_into_batches(self) -> None:
+        client = _bifrost_client()
+        calls: list[dict[str, object]] = []
+
+        async def graphql(query: str, variables: dict[str, object], **_kwargs: object) -> dict[str, object]:
+            calls.append(variables)
+            return {"data": {alias: {"success": True} for alias in variables}}
+
+        upserts = {
+            index: {"player_id": f"p-{index}", "player_name": f"Player {index}"}
+            for index in range(hll_API_backend.GUILD_MEMBER_BATCH_SIZE + 5)
+        }
+        with patch.object(client, "_graphql_payload", graphql):
+            results = await client.bulk_sync_guild_members(upserts, {})
+
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(results), len(upserts))
+        self.assertTrue(all(error is None for error in results.values()))
+
+    async def test_failed_batch_reports_partial_results(self) -> None:
+        client = _bifrost_client()
+        graphql = AsyncMock(side_effect=HLLBackendError("Bifrost rate limited", retry_after=30.0))
+
+        with patch.object(client, "_graphql_payload", graphql):
+            with self.assertRaises(HLLBackendBatchError) as caught:
+                await client.bulk_sync_guild_members({1: {"player_id": "p-1", "player_name": "Alice"}}, {})
+
+        self.assertEqual(caught.exception.retry_after, 30.0)
+        self.assertEqual(caught.exception.results, {1: "Bifrost rate limited"})
+
+
+if __name__ == "__main__":
+    unittest.main()
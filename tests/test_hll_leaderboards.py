@@ -0,0 +1,242 @@
+import asyncio
+import datetime
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import cogs.HLLArmLeaderboard as arm
+import cogs.HLLInfLeaderboard as inf
+from database_service import SharedDatabase
+from live_message import LiveMessageEditor
+
+
+class InfantryBestScoresTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "leaderboard.db"))
+        patcher = patch.object(inf, "database", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self) -> None:
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def _submit(self, user_id: int, value: int, submitted_at: str, verified: int = 1) -> int:
+        async with self.database.write() as db:
+            cursor = await db.execute(
+                "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, 'Most Kills', ?, ?, 0, ?)",
+                (user_id, value, submitted_at, verified),
+            )
+            return cursor.lastrowid
+
+    async def _bests(self) -> list[tuple]:
+        return await self.database.fetchall(
+            "SELECT user_id, best, first_achieved_at FROM best_scores WHERE stat = 'Most Kills' ORDER BY best DESC, user_id"
+        )
+
+    async def test_migration_backfills_existing_submissions_once(self) -> None:
+        async with self.database.write() as db:
+            await db.execute(
+                "CREATE TABLE submissions (id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INTEGER, stat TEXT, value INTEGER, submitted_at TEXT)"
+            )
+            await db.executemany(
+                "INSERT INTO submissions(user_id, stat, value, submitted_at) VALUES(?, 'Most Kills', ?, ?)",
+                [(1, 10, "2026-01-02"), (1, 30, "2026-01-05"), (1, 30, "2026-01-03"), (2, 20, "2026-01-01")],
+            )
+
+        await inf.init_db()
+        await inf.init_db()
+
+        self.assertEqual(await self._bests(), [(1, 30, "2026-01-03"), (2, 20, "2026-01-01")])
+        self.assertEqual(await self.database.fetchone("PRAGMA user_version"), (len(inf.SCHEMA_MIGRATIONS),))
+
+    async def test_triggers_follow_verification_and_expiry(self) -> None:
+        await inf.init_db()
+        await self._submit(1, 15, "2026-02-01")
+        pending = await self._submit(1, 40, "2026-02-02", verified=0)
+        self.assertEqual(await self._bests(), [(1, 15, "2026-02-01")])
+
+        await self.database.execute("UPDATE submissions SET needs_proof=0, proof_verified=1 WHERE id=?", (pending,))
+        self.assertEqual(await self._bests(), [(1, 40, "2026-02-02")])
+
+        await self.database.execute("DELETE FROM submissions WHERE id=?", (pending,))
+        self.assertEqual(await self._bests(), [(1, 15, "2026-02-01")])
+
+        await self.database.execute("DELETE FROM submissions WHERE user_id=1")
+        self.assertEqual(await self._bests(), [])
+
+    async def test_top_scores_are_an_index_range_read(self) -> None:
+        await inf.init_db()
+
+        plan = await self.database.fetchall(
+            "EXPLAIN QUERY PLAN SELECT user_id, best, first_achieved_at FROM best_scores "
+            "WHERE stat = ? ORDER BY best DESC, first_achieved_at ASC, user_id ASC LIMIT 5",
+            ("Most Kills",),
+        )
+
+        details = " ".join(str(row[-1]) for row in plan)
+        self.assertIn("idx_best_scores_rank", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+
+class InfantryLeaderboardRenderTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "leaderboard.db"))
+        patcher = patch.object(inf, "database", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        await inf.init_db()
+        self.cog = inf.HLLInfLeaderboard(SimpleNamespace(get_user=lambda _user_id: None))
+
+    async def asyncTearDown(self) -> None:
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def test_one_query_ranks_every_stat(self) -> None:
+        this_month = datetime.datetime.utcnow().replace(day=1, hour=1).isoformat()
+        rows = [(user_id, "Most Kills", user_id * 10, this_month) for user_id in range(1, 8)]
+        rows += [(1, "Most Melee Kills", 3, "2020-01-01"), (2, "Most Melee Kills", 3, "2019-01-01")]
+        async with self.database.write() as db:
+            await db.executemany(
+                "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified) VALUES(?, ?, ?, ?, 0, 1)",
+                rows,
+            )
+
+        all_time = await self.cog.fetch_top_scores(monthly=False)
+        monthly = await self.cog.fetch_top_scores(monthly=True)
+
+        self.assertEqual([row[0] for row in all_time["Most Kills"]], [7, 6, 5, 4, 3])
+        self.assertEqual(len(all_time["Most Kills"]), inf.LEADERBOARD_TOP_N)
+        self.assertEqual([row[0] for row in all_time["Most Melee Kills"]], [2, 1])
+        self.assertEqual([row[0] for row in monthly["Most Kills"]], [7, 6, 5, 4, 3])
+        self.assertNotIn("Most Melee Kills", monthly)
+
+    async def test_all_time_query_reads_the_rank_index_per_stat(self) -> None:
+        with patch.object(self.database, "fetchall", wraps=self.database.fetchall) as fetchall:
+            await self.cog.fetch_top_scores(monthly=False)
+        query, params = fetchall.call_args.args
+
+        plan = await self.database.fetchall("EXPLAIN QUERY PLAN " + query, params)
+
+        details = [str(row[-1]) for row in plan]
+        self.assertEqual(sum("idx_best_scores_rank" in detail for detail in details), len(inf.STATS))
+        self.assertFalse(any("TEMP B-TREE" in detail or detail.startswith("SCAN best_scores") for detail in details))
+
+    async def test_unchanged_leaderboard_is_not_edited(self) -> None:
+        await self.cog.set_leaderboard_message(42)
+        message = SimpleNamespace(id=42, channel=SimpleNamespace(id=7), edit=AsyncMock())
+        with patch.object(self.cog, "_get_leaderboard_target", AsyncMock(return_value=object())), patch.object(
+            self.cog, "get_leaderboard_message", AsyncMock(return_value=message)
+        ) as get_message, patch.object(inf, "LeaderboardView", lambda _cog: None), patch.object(
+            inf, "live_messages", LiveMessageEditor()
+        ):
+            await self.cog.update_leaderboard()
+            await self.cog.update_leaderboard()
+            await self.database.execute(
+                "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified) VALUES(1, 'Most Kills', 5, '2026-01-01', 0, 1)"
+            )
+            await self.cog.update_leaderboard()
+
+        self.assertEqual(message.edit.await_count, 2)
+        self.assertEqual(get_message.await_count, 3)
+
+    async def test_deleted_leaderboard_is_reposted(self) -> None:
+        await self.cog.set_leaderboard_message(42)
+        message = SimpleNamespace(id=42, channel=SimpleNamespace(id=7), edit=AsyncMock())
+        replacement = SimpleNamespace(id=43, channel=SimpleNamespace(id=7))
+        channel = SimpleNamespace(send=AsyncMock(return_value=replacement))
+        editor = LiveMessageEditor()
+        with patch.object(self.cog, "_get_leaderboard_target", AsyncMock(return_value=channel)), patch.object(
+            self.cog, "get_leaderboard_message", AsyncMock(side_effect=[message, None])
+        ), patch.object(inf, "LeaderboardView", lambda _cog: None), patch.object(inf, "live_messages", editor):
+            await self.cog.update_leaderboard()
+            await self.cog.update_leaderboard()
+
+        channel.send.assert_awaited_once()
+        self.assertEqual(await self.cog._leaderboard_message_id(), 43)
+        self.assertNotIn(42, editor._hashes)
+
+
+class InfantryProofExpiryTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "leaderboard.db"))
+        patcher = patch.object(inf, "database", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        await inf.init_db()
+        self.cog = inf.HLLInfLeaderboard(SimpleNamespace(get_channel=lambda _channel_id: None))
+        self.cog.update_leaderboard = AsyncMock()
+
+    async def asyncTearDown(self) -> None:
+        await self.cog.cog_unload()
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def _pending(self, user_id: int, deadline: datetime.datetime) -> int:
+        async with self.database.write() as db:
+            cursor = await db.execute(
+                "INSERT INTO submissions(user_id, stat, value, submitted_at, needs_proof, proof_verified, proof_deadline) "
+                "VALUES(?, 'Most Kills', 50, '2026-01-01', 1, 0, ?)",
+                (user_id, deadline.isoformat()),
+            )
+            return cursor.lastrowid
+
+    async def test_startup_schedules_pending_proofs_and_expires_them(self) -> None:
+        now = datetime.datetime.utcnow()
+        overdue = await self._pending(1, now - datetime.timedelta(minutes=1))
+        later = await self._pending(2, now + datetime.timedelta(minutes=5))
+
+        with patch.object(self.cog, "_get_channel", AsyncMock(return_value=None)):
+            await self.cog._schedule_pending_proofs()
+            self.assertEqual(len(self.cog._proof_expiries), 2)
+            for _ in range(20):
+                await asyncio.sleep(0.01)
+                if overdue not in self.cog._proof_expiries and self.cog.update_leaderboard.await_count:
+                    break
+
+        remaining = await self.database.fetchall("SELECT id FROM submissions")
+        self.assertEqual(remaining, [(later,)])
+        self.assertIn(later, self.cog._proof_expiries)
+        self.cog.update_leaderboard.assert_awaited_once()
+
+    async def test_verified_submission_survives_its_deadline(self) -> None:
+        submission_id = await self._pending(1, datetime.datetime.utcnow())
+        await self.database.execute("UPDATE submissions SET needs_proof=0, proof_verified=1 WHERE id=?", (submission_id,))
+
+        await self.cog._expire_proof(submission_id)
+
+        self.assertEqual(await self.database.fetchall("SELECT id FROM submissions"), [(submission_id,)])
+        self.cog.update_leaderboard.assert_not_awaited()
+
+class ArmourBestScoresTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "armleaderboard.db"))
+        patcher = patch.object(arm, "database", self.database)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self) -> None:
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def test_life_stat_migration_moves_crew_bests(self) -> None:
+        await arm.init_db()
+        await self.database.execute(
+            "INSERT INTO submissions_arm(submitter_id, crew_key, stat, value, submitted_at) VALUES(1, '1,2', ?, 90, '2026-03-01')",
+            (arm.OLD_LIFE_STAT_NAME,),
+        )
+
+        await arm.migrate_life_stat_to_seconds()
+
+        rows = await self.database.fetchall("SELECT stat, crew_key, best FROM best_scores_arm")
+        self.assertEqual(rows, [(arm.LIFE_STAT_NAME, "1,2", 5400)])
+
+
+if __name__ == "__main__":
+    unittest.main()
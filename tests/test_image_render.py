@@ -0,0 +1,119 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+import image_render
+from image_render import (
+    close_render_pool,
+    fitted_background,
+    load_font,
+    register_warmup,
+    render,
+    start_render_workers,
+    unregister_warmup,
+)
+
+
+def solid_png(size: tuple[int, int], color: tuple[int, int, int]) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color).save(output, format="PNG")
+    return output.getvalue()
+
+
+def mark_worker(directory: str) -> None:
+    open(os.path.join(directory, str(os.getpid())), "w").close()
+
+
+def image_size(payload: bytes) -> tuple[int, int]:
+    with Image.open(io.BytesIO(payload)) as image:
+        return image.size
+
+
+class FontCacheTests(unittest.TestCase):
+    def test_fonts_are_loaded_once_per_path_and_size(self) -> None:
+        self.assertIs(load_font("missing-font.ttf", 20), load_font("missing-font.ttf", 20))
+
+
+class FittedBackgroundTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = os.path.join(self._tmp.name, "map.png")
+        Image.new("RGB", (400, 300), (200, 10, 10)).save(self.path)
+        image_render._fitted_background.cache_clear()
+
+    def test_repeat_calls_reuse_the_fitted_image_and_return_copies(self) -> None:
+        first = fitted_background(self.path, (160, 90))
+        first.paste((0, 0, 0, 255), (0, 0, 160, 90))
+        second = fitted_background(self.path, (160, 90))
+
+        self.assertEqual(second.size, (160, 90))
+        self.assertEqual(second.mode, "RGBA")
+        self.assertEqual(second.getpixel((0, 0)), (200, 10, 10, 255))
+        self.assertEqual(image_render._fitted_background.cache_info().hits, 1)
+
+    def test_a_changed_file_is_decoded_again(self) -> None:
+        fitted_background(self.path, (160, 90))
+        Image.new("RGB", (400, 300), (10, 10, 200)).save(self.path)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(fitted_background(self.path, (160, 90)).getpixel((0, 0)), (10, 10, 200, 255))
+
+
+class RenderPoolTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self) -> None:
+        close_render_pool()
+
+    async def test_jobs_run_in_the_pool(self) -> None:
+        payload = await render(solid_png, size=(32, 16), color=(1, 2, 3))
+
+        self.assertEqual(image_size(payload), (32, 16))
+
+    async def test_every_worker_runs_the_registered_warmups(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, patch.dict(image_render._warmups, clear=True):
+            register_warmup(mark_worker, directory=directory)
+            register_warmup(mark_worker, directory=directory)
+            await start_render_workers()
+            await asyncio.to_thread(image_render._get_render_pool().shutdown, wait=True)
+
+            self.assertEqual(len(image_render._warmups), 1)
+            self.assertEqual(len(os.listdir(directory)), image_render.RENDER_WORKERS)
+
+
+class WarmupRegistryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = Mock()
+        for patcher in (
+            patch.dict(image_render._warmups, clear=True),
+            patch.object(image_render, "_render_pool", self.pool),
+            patch.object(image_render, "_pool_warmups", {image_render._warmup_key(mark_worker): {"directory": "a"}}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_reregistering_the_running_warmup_keeps_the_pool(self) -> None:
+        register_warmup(mark_worker, directory="a")
+        unregister_warmup(mark_worker)
+        register_warmup(mark_worker, directory="a")
+
+        self.assertEqual(len(image_render._warmups), 1)
+        self.pool.shutdown.assert_not_called()
+        self.assertIs(image_render._render_pool, self.pool)
+
+    def test_new_arguments_replace_the_warmup_and_the_pool(self) -> None:
+        register_warmup(mark_worker, directory="a")
+        register_warmup(mark_worker, directory="b")
+
+        self.assertEqual(list(image_render._warmups.values())[0].keywords, {"directory": "b"})
+        self.pool.shutdown.assert_called_once_with(wait=False)
+        self.assertIsNone(image_render._render_pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
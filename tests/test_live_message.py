@@ -0,0 +1,114 @@
+import asyncio
+import datetime
+import time
+import unittest
+from types import SimpleNamespace
+
+import discord
+
+from live_message import LiveMessageEditor, payload_hash
+
+
+class FakeMessage:
+    def __init__(self, message_id: int, channel_id: int = 1, *, delay: float = 0) -> None:
+        self.id = message_id
+        self.channel = SimpleNamespace(id=channel_id)
+        self.delay = delay
+        self.edits: list[dict] = []
+
+    async def edit(self, **fields) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.edits.append(fields)
+
+
+def status_embed(text: str, *, footer: str = "Updated") -> discord.Embed:
+    embed = discord.Embed(title="Status", description=text, timestamp=datetime.datetime.now(datetime.timezone.utc))
+    embed.set_footer(text=footer)
+    return embed
+
+
+class PayloadHashTests(unittest.TestCase):
+    def test_volatile_keys_are_ignored(self) -> None:
+        first = status_embed("ok", footer="Updated (startup)")
+        second = status_embed("ok", footer="Updated (role change)")
+
+        self.assertNotEqual(payload_hash(embed=first), payload_hash(embed=second))
+        self.assertEqual(
+            payload_hash(embed=first, volatile=("footer", "timestamp")),
+            payload_hash(embed=second, volatile=("footer", "timestamp")),
+        )
+        self.assertNotEqual(payload_hash(embed=first), payload_hash(embed=first, content="hello"))
+
+
+class LiveMessageEditorTests(unittest.IsolatedAsyncioTestCase):
+    async def test_unchanged_payloads_are_not_sent(self) -> None:
+        editor = LiveMessageEditor()
+        message = FakeMessage(10)
+
+        self.assertTrue(await editor.edit(message, embed=status_embed("one")))
+        self.assertFalse(await editor.edit(message, embed=status_embed("one")))
+        self.assertTrue(editor.unchanged(10, embed=status_embed("one")))
+        self.assertTrue(await editor.edit(message, embed=status_embed("two")))
+
+        editor.forget(10)
+        self.assertTrue(await editor.edit(message, embed=status_embed("two")))
+        self.assertEqual(len(message.edits), 3)
+
+    async def test_recorded_sends_count_as_the_current_payload(self) -> None:
+        editor = LiveMessageEditor()
+        message = FakeMessage(11)
+
+        editor.record(message, embed=status_embed("posted"))
+
+        self.assertFalse(await editor.edit(message, embed=status_embed("posted")))
+        self.assertEqual(message.edits, [])
+
+    async def test_rapid_edits_collapse_to_the_latest_payload(self) -> None:
+        editor = LiveMessageEditor()
+        message = FakeMessage(12, delay=0.02)
+
+        results = await asyncio.gather(*(editor.edit(message, content=f"tick {tick}") for tick in range(5)))
+
+        self.assertEqual(results, [True, False, False, False, True])
+        self.assertEqual([edit["content"] for edit in message.edits], ["tick 0", "tick 4"])
+
+    async def test_failed_edits_are_retried_next_time(self) -> None:
+        editor = LiveMessageEditor()
+        message = FakeMessage(13)
+        message.edit = self._failing_edit
+
+        with self.assertRaises(RuntimeError):
+            await editor.edit(message, content="hello")
+
+        self.assertFalse(editor.unchanged(13, content="hello"))
+
+    async def test_remembered_hashes_are_bounded(self) -> None:
+        editor = LiveMessageEditor(hash_cache_size=2)
+        for message_id in (20, 21, 22):
+            editor.record(FakeMessage(message_id), content="hello")
+
+        self.assertFalse(editor.unchanged(20, content="hello"))
+        self.assertTrue(editor.unchanged(21, content="hello"))
+        self.assertTrue(editor.unchanged(22, content="hello"))
+
+    @staticmethod
+    async def _failing_edit(**_fields) -> None:
+        raise RuntimeError("boom")
+
+    async def test_edits_in_one_channel_share_a_bucket(self) -> None:
+        editor = LiveMessageEditor(bucket_capacity=2, bucket_window=0.1)
+        messages = [FakeMessage(20 + index, channel_id=5) for index in range(3)]
+        other_channel = FakeMessage(30, channel_id=6)
+
+        started = time.monotonic()
+        await asyncio.gather(*(editor.edit(message, content="go") for message in messages[:2]))
+        await editor.edit(other_channel, content="go")
+        self.assertLess(time.monotonic() - started, 0.05)
+
+        await editor.edit(messages[2], content="go")
+        self.assertGreaterEqual(time.monotonic() - started, 0.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import logging
+import os
+import runpy
+import unittest
+from unittest.mock import patch
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+class SpawnedWorkerImportTests(unittest.TestCase):
+    def test_worker_import_does_not_set_up_the_bot(self) -> None:
+        # "spawn" pool workers import the entry script as __mp_main__.
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        with patch("dotenv.load_dotenv") as load_dotenv, patch(
+            "logging.handlers.RotatingFileHandler"
+        ) as file_handler:
+            namespace = runpy.run_path(MAIN_PATH, run_name="__mp_main__")
+
+        load_dotenv.assert_not_called()
+        file_handler.assert_not_called()
+        self.assertEqual(root.handlers, handlers)
+        self.assertNotIn("bot", namespace)
+        self.assertTrue(callable(namespace["create_bot"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
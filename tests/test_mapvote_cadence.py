@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import cogs.mapvote as mapvote
+
+
+def make_cog() -> mapvote.MapVote:
+    cog = mapvote.MapVote.__new__(mapvote.MapVote)
+    cog.state = mapvote.VoteState()
+    cog._embed_vote_notice = None
+    cog._vote_deadline_task = None
+    cog.mapvote_enabled = True
+    return cog
+
+
+class MapVoteCadenceTests(unittest.TestCase):
+    def test_only_an_open_vote_polls_fast(self) -> None:
+        cog = make_cog()
+
+        self.assertEqual(cog._tick_interval("OFFLINE"), mapvote.IDLE_TICK_INTERVAL)
+        self.assertEqual(cog._tick_interval("DISABLED"), mapvote.IDLE_TICK_INTERVAL)
+        self.assertEqual(cog._tick_interval("STANDBY"), mapvote.MATCH_TICK_INTERVAL)
+        self.assertEqual(cog._tick_interval("ACTIVE"), mapvote.MATCH_TICK_INTERVAL)
+
+        cog.state.active = True
+        self.assertEqual(cog._tick_interval("ACTIVE"), mapvote.EMBED_UPDATE_INTERVAL)
+
+
+class MapVoteDeadlineTests(unittest.IsolatedAsyncioTestCase):
+    async def test_warning_and_close_follow_vote_end_at(self) -> None:
+        cog = make_cog()
+        cog.state.active = True
+        cog.state.vote_end_at = datetime.now(timezone.utc) + timedelta(seconds=0.05)
+        cog.send_broadcast = AsyncMock()
+        cog.refresh_active_embed = AsyncMock()
+        cog.get_cached_gamestate = AsyncMock(return_value={"current_map_id": "foy"})
+        cog.end_vote_and_queue = AsyncMock()
+
+        with patch.dict(mapvote.BROADCAST_SCHEDULE["ENDING_SOON"], {"vote_remaining_seconds": 0.03}):
+            cog._schedule_vote_deadlines()
+            await asyncio.wait_for(cog._vote_deadline_task, 1)
+
+        cog.send_broadcast.assert_awaited_once_with("ENDING_SOON")
+        self.assertTrue(cog.state.warning_sent)
+        cog.end_vote_and_queue.assert_awaited_once_with({"current_map_id": "foy"})
+
+    async def test_superseded_vote_does_not_close(self) -> None:
+        cog = make_cog()
+        cog.state.active = True
+        cog.state.vote_end_at = datetime.now(timezone.utc) + timedelta(seconds=0.02)
+        cog.send_broadcast = AsyncMock()
+        cog.refresh_active_embed = AsyncMock()
+        cog.end_vote_and_queue = AsyncMock()
+
+        cog._schedule_vote_deadlines()
+        cog.state.vote_end_at += timedelta(minutes=30)
+        await asyncio.wait_for(cog._vote_deadline_task, 1)
+
+        cog.send_broadcast.assert_not_awaited()
+        cog.end_vote_and_queue.assert_not_awaited()
+
+
+class MapVoteGamestateTests(unittest.IsolatedAsyncioTestCase):
+    async def test_forced_read_bypasses_the_backend_cache(self) -> None:
+        cog = make_cog()
+        cog._last_gamestate = None
+        cog._last_gamestate_ts = 0.0
+        backend = Mock()
+        backend.get_mapvote_game_state = AsyncMock(return_value=None)
+
+        with patch.object(mapvote, "_get_mapvote_backend", return_value=backend):
+            await cog.get_cached_gamestate(force=False)
+            backend.invalidate_cached_reads.assert_not_called()
+            await cog.get_cached_gamestate(force=True)
+
+        backend.invalidate_cached_reads.assert_called_once_with()
+        self.assertEqual(backend.get_mapvote_game_state.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
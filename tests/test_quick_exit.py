@@ -0,0 +1,110 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import cogs.quick_exit as quick_exit
+
+
+class FakeAvatar:
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def replace(self, **_kwargs) -> SimpleNamespace:
+        return SimpleNamespace(url=f"https://cdn.example/{self.key}.png")
+
+
+def make_member(member_id: int, avatar_key: str) -> SimpleNamespace:
+    guild = SimpleNamespace(member_count=100, members=[])
+    return SimpleNamespace(id=member_id, display_avatar=FakeAvatar(avatar_key), guild=guild)
+
+
+def make_cog() -> quick_exit.QuickExit:
+    cog = quick_exit.QuickExit.__new__(quick_exit.QuickExit)
+    cog._avatar_cache = OrderedDict()
+    cog._background_pool = ()
+    cog._render_slots = asyncio.Semaphore(quick_exit.WELCOME_RENDER_CONCURRENCY)
+    return cog
+
+
+class WelcomeAvatarCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_avatars_are_fetched_once_per_hash(self) -> None:
+        cog = make_cog()
+        cog._fetch_bytes = AsyncMock(side_effect=lambda url: url.encode())
+
+        with patch.object(quick_exit, "AVATAR_CACHE_SIZE", 2):
+            await cog._fetch_avatar(make_member(1, "a"))
+            await cog._fetch_avatar(make_member(2, "a"))
+            await cog._fetch_avatar(make_member(3, "b"))
+            await cog._fetch_avatar(make_member(1, "a"))
+            await cog._fetch_avatar(make_member(4, "c"))
+
+        self.assertEqual(cog._fetch_bytes.await_count, 3)
+        self.assertEqual(list(cog._avatar_cache), ["a", "c"])
+
+
+class WelcomeRenderQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_bursts_queue_for_the_worker_count_and_all_get_cards(self) -> None:
+        cog = make_cog()
+        cog._fetch_avatar = AsyncMock(return_value=b"avatar")
+        running = 0
+        peak = 0
+
+        async def fake_render(_func, **_kwargs) -> bytes:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return b"png"
+
+        with patch.object(quick_exit, "render_image", fake_render):
+            files = await asyncio.gather(
+                *(cog._build_welcome_image(make_member(index, "a"), "Able", "just joined") for index in range(30))
+            )
+
+        self.assertEqual(len(files), 30)
+        self.assertTrue(all(file is not None for file in files))
+        self.assertEqual(peak, quick_exit.WELCOME_RENDER_CONCURRENCY)
+
+
+class WelcomeBackgroundPoolTests(unittest.TestCase):
+    def test_pool_is_a_sample_of_map_images(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for index in range(12):
+                Path(tmp, f"map{index}.png").touch()
+            Path(tmp, "notes.txt").touch()
+
+            with patch.object(quick_exit, "MAP_IMAGES_DIR", Path(tmp)):
+                pool = make_cog()._pick_background_pool()
+
+        self.assertEqual(len(pool), quick_exit.WELCOME_BACKGROUND_POOL_SIZE)
+        self.assertEqual(len(set(pool)), len(pool))
+        self.assertTrue(all(os.path.basename(path).startswith("map") for path in pool))
+
+    def test_saved_pool_is_kept_while_its_images_exist(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            for index in range(12):
+                Path(tmp, f"map{index}.png").touch()
+            cog = make_cog()
+            cog._background_pool = tuple(str(Path(tmp, f"map{index}.png")) for index in range(8))
+
+            with patch.object(quick_exit, "MAP_IMAGES_DIR", Path(tmp)):
+                self.assertEqual(cog._pick_background_pool(), cog._background_pool)
+                Path(tmp, "map0.png").unlink()
+                repicked = cog._pick_background_pool()
+
+        self.assertNotIn(str(Path(tmp, "map0.png")), repicked)
+        self.assertEqual(len(repicked), quick_exit.WELCOME_BACKGROUND_POOL_SIZE)
+
+    def test_missing_directory_gives_an_empty_pool(self) -> None:
+        with patch.object(quick_exit, "MAP_IMAGES_DIR", Path("/nonexistent/map_images")):
+            self.assertEqual(make_cog()._pick_background_pool(), ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,13 @@
+import asyncio
 import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
+
+import cogs.raid as raid
+from live_message import LiveMessageEditor
 from cogs.raid import Raid
 
 
@@ -124,5 +132,79 @@ class CRCONLiveStateTests(unittest.TestCase):
         )
 
 
+
+class LiveRefreshFanOutTests(unittest.IsolatedAsyncioTestCase):
+    def _raid(self, stats_urls: list[str]) -> Raid:
+        cog = _raid_parser()
+        cog._lock = asyncio.Lock()
+        cog._save_posts = lambda: None
+        now = datetime.now(timezone.utc).isoformat()
+        cog._posts = {
+            str(index): {"status": "active", "created_at": now, "stats_url": url, "participants": []}
+            for index, url in enumerate(stats_urls, start=1)
+        }
+        cog._refresh_post_message = AsyncMock()
+        return cog
+
+    async def test_posts_on_one_server_share_a_single_fetch(self) -> None:
+        cog = self._raid(
+            [
+                "https://stats.example.com/api/get_live_game_stats",
+                "https://STATS.example.com/api/get_public_info",
+                "https://other.example.com/api/get_public_info",
+            ]
+        )
+        fetch = AsyncMock(return_value={"available": True, "players": 50})
+
+        with patch.object(cog, "_fetch_server_state", fetch):
+            await cog._refresh_live_posts()
+
+        self.assertEqual(fetch.await_count, 2)
+        self.assertEqual(cog._refresh_post_message.await_count, 3)
+        self.assertEqual({post["live_state"]["players"] for post in cog._posts.values()}, {50})
+
+    async def test_servers_are_fetched_concurrently_within_the_bound(self) -> None:
+        cog = self._raid([f"https://server-{index}.example.com/api/get_public_info" for index in range(6)])
+        running = 0
+        peak = 0
+
+        async def fetch(_stats_url: str) -> dict[str, object]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"available": True}
+
+        with patch.object(cog, "_fetch_server_state", fetch), patch.object(raid, "LIVE_REFRESH_CONCURRENCY", 3):
+            await cog._refresh_live_posts()
+
+        self.assertEqual(peak, 3)
+        self.assertEqual(cog._refresh_post_message.await_count, 6)
+
+
+class PostRefreshTests(unittest.IsolatedAsyncioTestCase):
+    async def test_deleted_post_is_dropped_even_when_its_embed_is_unchanged(self) -> None:
+        cog = _raid_parser()
+        cog._lock = asyncio.Lock()
+        cog._save_posts = lambda: None
+        cog._posts = {"42": {"channel_id": 7}}
+        embed = discord.Embed(title="Raid")
+        channel = MagicMock(spec=discord.TextChannel)
+        channel.fetch_message = AsyncMock(side_effect=discord.NotFound(SimpleNamespace(status=404, reason="Not Found"), "gone"))
+        cog.bot = SimpleNamespace(get_channel=lambda _channel_id: channel)
+        editor = LiveMessageEditor()
+        editor.record(SimpleNamespace(id=42), embed=embed, view=None)
+
+        with patch.object(cog, "build_post_embed", return_value=embed), patch.object(
+            raid, "RaidSignupView", lambda: None
+        ), patch.object(raid, "live_messages", editor):
+            await cog._refresh_post_message(42, cog._posts["42"])
+
+        channel.fetch_message.assert_awaited_once_with(42)
+        self.assertEqual(cog._posts, {})
+        self.assertFalse(editor.unchanged(42, embed=embed, view=None))
+
+
 if __name__ == "__main__":
     unittest.main()
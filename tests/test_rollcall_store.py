@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from openpyxl import Workbook, load_workbook
+
+import cogs.rollcall as rollcall
+from database_service import SharedDatabase
+from rollcall_store import RollCallAttendance, WorkbookExporter
+
+
+class RollCallAttendanceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "rollcall.db"))
+        self.store = RollCallAttendance(self.database)
+        await self.store.load()
+
+    async def asyncTearDown(self) -> None:
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def _reloaded(self) -> RollCallAttendance:
+        store = RollCallAttendance(self.database)
+        await store.load()
+        return store
+
+    async def test_changes_write_only_their_rows_and_survive_reload(self) -> None:
+        written = await self.store.set_statuses("8th", "W01 05/01/2026", {1: "❌", 2: "❌"}, nicknames={1: "Able", 2: "Baker"})
+        self.assertEqual(written, 2)
+        self.assertTrue(await self.store.set_status("8th", "W01 05/01/2026", 2, "✅", nickname="Baker"))
+        self.assertFalse(await self.store.set_status("8th", "W01 05/01/2026", 2, "✅", nickname="Baker"))
+        self.assertEqual(await self.store.upsert_members("8th", {1: "Able", 3: "Charlie"}), 1)
+
+        store = await self._reloaded()
+
+        self.assertEqual(store.week_status("8th", "W01 05/01/2026"), {1: "❌", 2: "✅"})
+        self.assertEqual(list(store.members("8th").items()), [(1, "Able"), (2, "Baker"), (3, "Charlie")])
+        self.assertEqual(
+            store.sheet_rows("8th"),
+            [["User ID", "Nickname", "W01 05/01/2026"], ["1", "Able", "❌"], ["2", "Baker", "✅"], ["3", "Charlie", None]],
+        )
+
+    async def test_rename_week_moves_its_attendance(self) -> None:
+        await self.store.set_status("22nd", "W02 2026-01-12", 1, "✅", nickname="Able")
+
+        await self.store.rename_week("22nd", "W02 2026-01-12", "W02 12/01/2026")
+
+        store = await self._reloaded()
+        self.assertEqual(store.weeks("22nd"), ["W02 12/01/2026"])
+        self.assertEqual(store.status("22nd", "W02 12/01/2026", 1), "✅")
+
+    async def test_workbook_export_keeps_sheet_layout(self) -> None:
+        await self.store.import_sheet("8th", ["W01 05/01/2026", "W02 12/01/2026"], [(1, "Able", ["✅", ""]), (2, "Baker", ["❌", "✅"])])
+
+        wb = self.store.to_workbook(["22nd", "8th"])
+
+        self.assertEqual(wb.sheetnames, ["README", "22nd", "8th"])
+        rows = [list(row) for row in wb["8th"].iter_rows(values_only=True)]
+        self.assertEqual(rows[0], ["User ID", "Nickname", "W01 05/01/2026", "W02 12/01/2026"])
+        self.assertEqual(rows[2], ["2", "Baker", "❌", "✅"])
+
+
+class WorkbookExporterTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "rollcall.db"))
+        self.path = os.path.join(self._tmp.name, "rollcall.xlsx")
+        self.store = RollCallAttendance(self.database)
+        await self.store.load()
+        await self.store.import_sheet("8th", ["W01 05/01/2026"], [(1, "Able", ["✅"]), (2, "Baker", ["❌"])])
+        self.exporter = WorkbookExporter(self.path, debounce=60)
+        self.store.attach_exporter(self.exporter, ["22nd", "8th"])
+
+    async def asyncTearDown(self) -> None:
+        await self.exporter.close()
+        await self.database.close()
+        self._tmp.cleanup()
+
+    def _saved_rows(self, sheet: str) -> list[list]:
+        return [list(row) for row in load_workbook(self.path)[sheet].iter_rows(values_only=True)]
+
+    async def test_changes_are_applied_to_the_cached_sheet(self) -> None:
+        await self.store.rename_week("8th", "W01 05/01/2026", "W01 06/01/2026")
+        await self.store.set_status("8th", "W01 06/01/2026", 2, "✅", nickname="Baker")
+        await self.store.set_statuses("8th", "W02 13/01/2026", {3: "❌"}, nicknames={3: "Charlie"})
+        await self.store.upsert_members("22nd", {9: "Zulu"})
+
+        await self.exporter.flush()
+
+        self.assertEqual(self._saved_rows("8th"), [list(row) for row in self.store.to_workbook()["8th"].iter_rows(values_only=True)])
+        self.assertEqual(self._saved_rows("22nd"), [["User ID", "Nickname"], ["9", "Zulu"]])
+
+    async def test_bursts_of_changes_are_saved_once(self) -> None:
+        for user_id in range(3, 40):
+            await self.store.set_status("8th", "W01 05/01/2026", user_id, "✅", nickname=f"Member {user_id}")
+
+        await self.exporter.flush()
+        await self.exporter.flush()
+
+        self.assertEqual(self.exporter.saves, 1)
+        self.assertEqual(len(self._saved_rows("8th")), 40)
+
+
+class RollCallWorkbookImportTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.database = SharedDatabase(os.path.join(self._tmp.name, "rollcall.db"))
+        self.workbook_path = os.path.join(self._tmp.name, "rollcall.xlsx")
+        patcher = patch.object(rollcall, "WORKBOOK_PATH", self.workbook_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.cog = rollcall.RollCallCog.__new__(rollcall.RollCallCog)
+        self.cog._attendance = RollCallAttendance(self.database)
+        self.cog._workbook_export = WorkbookExporter(self.workbook_path)
+
+    async def asyncTearDown(self) -> None:
+        await self.cog._workbook_export.close()
+        await self.database.close()
+        self._tmp.cleanup()
+
+    async def test_existing_workbook_is_imported_once(self) -> None:
+        wb = Workbook()
+        wb.active.title = "README"
+        ws = wb.create_sheet("8th")
+        ws.append(["User ID", "Nickname", "W01 2026-01-05"])
+        ws.append(["1", "Able", "✅"])
+        ws.append(["not-a-user", "Ghost", "❌"])
+        wb.save(self.workbook_path)
+
+        await self.cog._load_attendance()
+        await self.cog._ensure_week("8th", "W01 05/01/2026")
+        await self.cog._load_attendance()
+
+        self.assertEqual(self.cog._attendance.weeks("8th"), ["W01 05/01/2026"])
+        self.assertEqual(self.cog._attendance.week_status("8th", "W01 05/01/2026"), {1: "✅"})
+
+
+if __name__ == "__main__":
+    unittest.main()
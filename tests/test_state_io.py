@@ -0,0 +1,90 @@
+import asyncio
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import state_io
+from state_io import WriteBehindFlusher
+
+
+class WriteBehindFlusherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "state.json"
+        self.flusher = WriteBehindFlusher()
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    async def test_repeated_marks_coalesce_into_one_write(self) -> None:
+        state = {"count": 0}
+        with patch.object(state_io, "_write_text_atomic", wraps=state_io._write_text_atomic) as write:
+            for count in range(1, 6):
+                state["count"] = count
+                self.flusher.mark_dirty(self.path, state, delay=0.01)
+            self.assertFalse(self.path.exists())
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"count": 5})
+        self.assertFalse(self.flusher.is_dirty(self.path))
+
+    async def test_flush_writes_pending_state_immediately(self) -> None:
+        self.flusher.mark_dirty(self.path, lambda: {"saved": True}, delay=60)
+
+        self.flusher.flush(self.path)
+
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"saved": True})
+        self.assertFalse(self.flusher.is_dirty(self.path))
+
+    async def test_async_flush_writes_on_the_state_io_thread(self) -> None:
+        self.flusher.mark_dirty(self.path, {"saved": "async"}, delay=60)
+        write = state_io._write_text_atomic
+        threads: list[str] = []
+
+        def record_thread(path, text) -> None:
+            threads.append(threading.current_thread().name)
+            write(path, text)
+
+        with patch.object(state_io, "_write_text_atomic", record_thread):
+            await self.flusher.flush_async(self.path)
+
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"saved": "async"})
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith("state-io"))
+        self.assertFalse(self.flusher.is_dirty(self.path))
+
+    def test_marks_without_an_event_loop_write_synchronously(self) -> None:
+        self.flusher.mark_dirty(self.path, {"sync": 1}, delay=60)
+
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"sync": 1})
+
+
+class OffLoopStateIOTests(unittest.IsolatedAsyncioTestCase):
+    async def test_async_dump_snapshots_data_before_writing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+            state = {"value": 1}
+
+            pending = asyncio.ensure_future(state_io.atomic_json_dump_async(path, state))
+            await asyncio.sleep(0)
+            state["value"] = 2
+            await pending
+
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"value": 1})
+
+    async def test_writes_to_one_file_keep_their_order(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state.json"
+
+            await asyncio.gather(*(state_io.atomic_json_dump_async(path, {"value": value}) for value in range(20)))
+            loaded = await state_io.run_state_io(lambda: json.loads(path.read_text(encoding="utf-8")))
+
+            self.assertEqual(loaded, {"value": 19})
+
+
+if __name__ == "__main__":
+    unittest.main()
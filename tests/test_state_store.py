@@ -0,0 +1,79 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import state_store
+from state_store import StateStore
+
+
+class StateStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.store = StateStore(self.root / "state.sqlite3")
+
+    def tearDown(self) -> None:
+        self.store.close()
+        self._tmp.cleanup()
+
+    def test_namespaces_are_isolated(self) -> None:
+        first = self.store.namespace("first")
+        second = self.store.namespace("second")
+
+        first.set("key", {"value": 1})
+        second.set("key", [2])
+
+        self.assertEqual(first.get("key"), {"value": 1})
+        self.assertEqual(second.items(), {"key": [2]})
+        self.assertIsNone(first.get("missing"))
+
+    def test_sync_writes_only_changed_keys(self) -> None:
+        namespace = self.store.namespace("entries")
+        namespace.set_many({"a": 1, "b": 2, "c": 3})
+
+        changed = namespace.sync({"a": 1, "b": 20, "d": 4})
+
+        self.assertEqual(changed, 3)
+        self.assertEqual(namespace.items(), {"a": 1, "b": 20, "d": 4})
+        self.assertEqual(namespace.sync({"a": 1, "b": 20, "d": 4}), 0)
+
+    def test_legacy_json_is_migrated_once(self) -> None:
+        legacy_path = self.root / "legacy.json"
+        legacy_path.write_text(json.dumps({"messages": {"1": {"game": "HLL"}}}), encoding="utf-8")
+        namespace = self.store.namespace("feed")
+
+        migrated = namespace.migrate_from_json(legacy_path, lambda data: data["messages"])
+        namespace.delete("1")
+        migrated_again = namespace.migrate_from_json(legacy_path, lambda data: data["messages"])
+
+        self.assertTrue(migrated)
+        self.assertFalse(migrated_again)
+        self.assertEqual(namespace.items(), {})
+        self.assertTrue(legacy_path.exists())
+
+
+class AsyncStateNamespaceTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = StateStore(Path(self._tmp.name) / "state.sqlite3")
+
+    async def asyncTearDown(self) -> None:
+        self.store.close()
+        self._tmp.cleanup()
+
+    async def test_async_writes_run_through_the_state_io_thread(self) -> None:
+        namespace = self.store.namespace("feed")
+
+        with patch.object(state_store, "run_state_io", wraps=state_store.run_state_io) as run:
+            await namespace.set_async("a", {"count": 1})
+            await namespace.set_many_async({"b": 2, "c": 3})
+            await namespace.delete_many_async(key for key in ("b",))
+
+        self.assertEqual(run.await_count, 3)
+        self.assertEqual(namespace.items(), {"a": {"count": 1}, "c": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,7 @@ import asyncio
 import unittest
 from datetime import datetime, timezone
 from types import SimpleNamespace
-from unittest.mock import Mock
+from unittest.mock import AsyncMock
 
 from cogs.strategic_review_note import (
     StrategicReviewNote,
@@ -161,28 +161,28 @@ class StrategicReviewNoteDeletionTests(unittest.IsolatedAsyncioTestCase):
             }
         }
         self.cog._state_lock = asyncio.Lock()
-        self.cog._save_state = Mock()
+        self.cog._save_state = AsyncMock()
 
     async def test_removes_entry_when_thread_is_deleted(self) -> None:
         await self.cog._remove_deleted_note(thread_id=100)
 
         self.assertNotIn("100", self.cog.state["notes"])
         self.assertIn("101", self.cog.state["notes"])
-        self.cog._save_state.assert_called_once_with()
+        self.cog._save_state.assert_awaited_once_with()
 
     async def test_removes_entry_when_header_is_deleted(self) -> None:
         await self.cog._remove_deleted_note(message_ids={201})
 
         self.assertNotIn("101", self.cog.state["notes"])
         self.assertIn("100", self.cog.state["notes"])
-        self.cog._save_state.assert_called_once_with()
+        self.cog._save_state.assert_awaited_once_with()
 
     async def test_removes_entry_when_parent_transcript_is_deleted(self) -> None:
         await self.cog._remove_deleted_note(message_ids={300})
 
         self.assertNotIn("100", self.cog.state["notes"])
         self.assertIn("101", self.cog.state["notes"])
-        self.cog._save_state.assert_called_once_with()
+        self.cog._save_state.assert_awaited_once_with()
 
 
 if __name__ == "__main__":
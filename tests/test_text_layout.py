@@ -0,0 +1,50 @@
+import unittest
+
+from config.common import CERTIFICATE_BOLD_FONT_PATH
+from image_render import load_font
+from text_layout import fit_font, fit_wrapped_font, largest_fitting_size, text_width, wrap_text
+
+
+class LargestFittingSizeTests(unittest.TestCase):
+    def test_search_probes_logarithmically(self) -> None:
+        probes: list[int] = []
+
+        def fits(size: int) -> bool:
+            probes.append(size)
+            return size <= 57
+
+        self.assertEqual(largest_fitting_size(fits, 110, 20), 57)
+        self.assertLessEqual(len(probes), 7)
+
+    def test_nothing_fitting_returns_the_minimum(self) -> None:
+        self.assertEqual(largest_fitting_size(lambda size: False, 80, 24), 24)
+
+
+class FitFontTests(unittest.TestCase):
+    def test_fitted_font_is_the_largest_that_fits(self) -> None:
+        font = fit_font(CERTIFICATE_BOLD_FONT_PATH, "WELCOME TO 7DR!", 400, 120, 10)
+
+        self.assertLessEqual(text_width(font, "WELCOME TO 7DR!"), 400)
+        self.assertGreater(text_width(load_font(CERTIFICATE_BOLD_FONT_PATH, font.size + 1), "WELCOME TO 7DR!"), 400)
+
+    def test_wrapped_text_stays_inside_the_box(self) -> None:
+        title = "Tuesday night training with the whole company and guests"
+
+        font, lines, spacing = fit_wrapped_font(
+            CERTIFICATE_BOLD_FONT_PATH, title, 600, 300, 110, 20, spacing=lambda size: max(10, size // 5)
+        )
+
+        self.assertGreater(len(lines), 1)
+        self.assertEqual(" ".join(lines), title)
+        self.assertTrue(all(text_width(font, line) <= 600 for line in lines))
+        self.assertEqual(spacing, max(10, font.size // 5))
+
+    def test_wrap_keeps_overlong_words_on_their_own_line(self) -> None:
+        font = load_font(CERTIFICATE_BOLD_FONT_PATH, 40)
+
+        self.assertEqual(wrap_text(font, "a Supercalifragilistic b", 60), ["a", "Supercalifragilistic", "b"])
+        self.assertEqual(wrap_text(font, "   ", 60), [""])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from PIL import Image, ImageDraw
+
+import cogs.wardiary as wardiary
+
+
+RESULT = {
+	"submitter_clan_name": "7DR",
+	"opponent_clan_name": "Other Clan",
+	"submitter_score": 5,
+	"opponent_score": 0,
+	"match_type": "Competitive",
+	"match_date": "01/01/26",
+}
+
+
+class WarDiaryGifRenderTests(unittest.TestCase):
+	def setUp(self) -> None:
+		self._tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self._tmp.cleanup)
+		self.path = os.path.join(self._tmp.name, "background.gif")
+		frames = []
+		for index in range(12):
+			frame = Image.new("RGB", (320, 180), (20 * index, 40, 200 - 10 * index))
+			ImageDraw.Draw(frame).rectangle((index * 20, 40, index * 20 + 40, 80), fill=(255, 200, 0))
+			frames.append(frame)
+		frames[0].save(self.path, save_all=True, append_images=frames[1:], duration=50, loop=0)
+		wardiary._gif_frame_cache.clear()
+		self.addCleanup(wardiary._gif_frame_cache.clear)
+
+	def _render(self, **overrides) -> Image.Image:
+		payload, extension = wardiary.render_result_image(
+			background_source=self.path,
+			output_extension=".gif",
+			**{**RESULT, **overrides},
+		)
+		self.assertEqual(extension, ".gif")
+		return Image.open(io.BytesIO(payload))
+
+	def test_frames_are_decoded_once_per_background(self) -> None:
+		with patch.object(wardiary, "_load_shaded_gif_frames", wraps=wardiary._load_shaded_gif_frames) as load:
+			with self._render() as first:
+				self.assertEqual(first.size, wardiary.RESULT_IMAGE_SIZE)
+				self.assertEqual(first.n_frames, 12)
+			with self._render(match_type="Friendly"):
+				pass
+
+		self.assertEqual(load.call_count, 1)
+		frames, _durations, size_bytes = next(iter(wardiary._gif_frame_cache.values()))
+		self.assertTrue(all(frame.mode == "P" for frame in frames))
+		self.assertEqual(size_bytes, 12 * wardiary.RESULT_IMAGE_SIZE[0] * wardiary.RESULT_IMAGE_SIZE[1])
+
+	def test_stacks_over_the_byte_budget_are_not_cached(self) -> None:
+		with patch.object(wardiary, "GIF_FRAME_CACHE_MAX_BYTES", 1024):
+			with self._render() as image:
+				self.assertEqual(image.n_frames, 12)
+
+		self.assertEqual(len(wardiary._gif_frame_cache), 0)
+
+	def test_frame_budget_merges_frames_and_keeps_total_duration(self) -> None:
+		with self._render(max_frames=5) as image:
+			durations = []
+			for index in range(image.n_frames):
+				image.seek(index)
+				durations.append(image.info["duration"])
+
+		self.assertEqual(len(durations), 4)
+		self.assertEqual(sum(durations), 12 * 50)
+
+	def test_byte_budget_thins_the_animation(self) -> None:
+		with self._render() as full:
+			full_frames = full.n_frames
+		with self._render(max_bytes=1) as thinned:
+			self.assertLess(thinned.n_frames, full_frames)
+			self.assertEqual(thinned.n_frames, 1)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import functools
+from typing import Callable
+
+from image_render import Font, load_font
+
+
+TEXT_WIDTH_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=TEXT_WIDTH_CACHE_SIZE)
+def text_width(font: Font, text: str) -> float:
+    """Advance width of ``text`` in ``font``, memoised per (font, text).
+
+    Fonts come from ``load_font``, which returns one object per (path, size),
+    so this is effectively a per-(font, size) cache of measured words.
+    """
+
+    return font.getlength(text)
+
+
+@functools.lru_cache(maxsize=TEXT_WIDTH_CACHE_SIZE)
+def glyph_width(font: Font, char: str) -> int:
+    """Ink width of a single glyph, as ``ImageDraw.textbbox`` would measure it."""
+
+    left, _top, right, _bottom = font.getbbox(char)
+    return right - left
+
+
+def wrap_text(font: Font, text: str, max_width: float) -> list[str]:
+    """Greedy word-wrap of ``text`` to ``max_width`` using cached word widths.
+
+    A single word wider than ``max_width`` stays on its own line.
+    """
+
+    words = text.split()
+    if not words:
+        return [""]
+
+    space = text_width(font, " ")
+    lines: list[str] = []
+    current = [words[0]]
+    current_width = text_width(font, words[0])
+    for word in words[1:]:
+        word_width = text_width(font, word)
+        if current_width + space + word_width <= max_width:
+            current.append(word)
+            current_width += space + word_width
+        else:
+            lines.append(" ".join(current))
+            current = [word]
+            current_width = word_width
+    lines.append(" ".join(current))
+    return lines
+
+
+def largest_fitting_size(fits: Callable[[int], bool], start_size: int, min_size: int) -> int:
+    """Binary-search the largest size in ``[min_size, start_size]`` for which ``fits`` holds.
+
+    ``fits`` must be monotonic (if a size fits, every smaller one does).
+    Returns ``min_size`` when nothing fits.
+    """
+
+    low, high = min_size, start_size
+    best = min_size
+    while low <= high:
+        size = (low + high) // 2
+        if fits(size):
+            best = size
+            low = size + 1
+        else:
+            high = size - 1
+    return best
+
+
+def fit_font(font_path: str, text: str, max_width: float, start_size: int, min_size: int) -> Font:
+    """Largest font (at most ``start_size``) that fits ``text`` on one line."""
+
+    size = largest_fitting_size(
+        lambda candidate: text_width(load_font(font_path, candidate), text) <= max_width,
+        start_size,
+        min_size,
+    )
+    return load_font(font_path, size)
+
+
+def _block_height(font: Font, line_count: int, spacing: int) -> int:
+    # Pillow spaces multiline text by the height of "A" plus ``spacing``.
+    line_height = font.getbbox("A")[3]
+    ascent, descent = font.getmetrics()
+    return (line_count - 1) * (line_height + spacing) + ascent + descent
+
+
+def fit_wrapped_font(
+    font_path: str,
+    text: str,
+    max_width: float,
+    max_height: int,
+    start_size: int,
+    min_size: int,
+    *,
+    spacing: Callable[[int], int],
+) -> tuple[Font, list[str], int]:
+    """Largest font that word-wraps ``text`` into a ``max_width`` x ``max_height`` box.
+
+    ``spacing`` maps a font size to the line spacing used at that size.
+    Returns the font, the wrapped lines and the spacing.
+    """
+
+    def fits(size: int) -> bool:
+        font = load_font(font_path, size)
+        lines = wrap_text(font, text, max_width)
+        if any(text_width(font, line) > max_width for line in lines):
+            return False
+        return _block_height(font, len(lines), spacing(size)) <= max_height
+
+    size = largest_fitting_size(fits, start_size, min_size)
+    font = load_font(font_path, size)
+    return font, wrap_text(font, text, max_width), spacing(size)